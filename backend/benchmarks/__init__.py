@@ -0,0 +1,11 @@
+"""
+Offline benchmarks.
+
+These drive the real backend (routers, orchestration, MCP tools, SQLite) with
+the Claude Code CLI replaced by a ScriptedTransport, so they need no network,
+API key or CLI install and can run in CI.
+
+    cd backend && python -m benchmarks.turn_throughput --worlds 4 --turns 5
+    cd backend && python -m benchmarks.replay check fixture.json
+    cd backend && python -m benchmarks.session_affinity --tasks 8 --rounds 20
+"""
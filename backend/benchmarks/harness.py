@@ -0,0 +1,196 @@
+"""
+Shared harness for offline benchmarks and replays.
+
+Runs the real app in-process (lifespan included) against a temporary SQLite
+database and worlds directory, with SDK clients built by a transport factory
+instead of the CLI. ``prepare_environment`` must run before any backend module
+is imported, since settings and the engine are created at import time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+import resource
+import sys
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Optional
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# INSERT INTO t / UPDATE t / DELETE FROM t
+_WRITE_RE = re.compile(r"^\s*(INSERT|UPDATE|DELETE)\s+(?:OR\s+\w+\s+)?(?:INTO\s+|FROM\s+)?\"?(\w+)", re.IGNORECASE)
+
+
+def prepare_environment(workdir: Path, verbose: bool = False) -> None:
+    """Point the backend at a database under workdir (call before importing backend modules)."""
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{workdir / 'bench.db'}"
+    os.environ.setdefault("JWT_SECRET", "benchmark-secret")
+    sys.path.insert(0, str(BACKEND_DIR))
+    if not verbose:
+        logging.disable(logging.WARNING)
+
+
+def rss_mb() -> dict[str, float]:
+    """Current (from /proc when available) and peak resident set size in MB."""
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_kb //= 1024  # ru_maxrss is in bytes on macOS
+    current_mb = None
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        current_mb = round(pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024, 1)
+    except (OSError, ValueError, IndexError):
+        pass
+    return {"current": current_mb, "peak": round(peak_kb / 1024, 1)}
+
+
+def seed_world(name: str) -> None:
+    """Write an active world with one location straight to the worlds directory."""
+    from services.location_storage import LocationStorage
+    from services.player_service import PlayerService
+    from services.world_reset_service import WorldResetService
+    from services.world_service import WorldService
+
+    config = WorldService.create_world(name, owner_id="admin", user_name="Bench", language="en")
+    config.phase = "active"
+    config.genre = "fantasy"
+    config.theme = "benchmark"
+    WorldService.save_world_config(name, config)
+
+    PlayerService.save_stat_definitions(
+        name,
+        {"stats": [{"name": "hp", "display": "HP", "min": 0, "max": 100, "default": 100}], "derived": []},
+    )
+    LocationStorage.create_location(name, "town_square", "Town Square", "A busy square at the heart of town.", (0, 0))
+    WorldResetService.save_initial_state(
+        name,
+        WorldResetService.create_initial_state_snapshot(
+            starting_location="town_square",
+            initial_stats={"hp": 100},
+            initial_inventory=[],
+            initial_game_time={"hour": 8, "minute": 0, "day": 1},
+        ),
+    )
+
+
+class DbWriteRecorder:
+    """Counts commits and INSERT/UPDATE/DELETE statements per table while attached."""
+
+    def __init__(self):
+        self.commits = 0
+        self.writes: Counter[str] = Counter()
+
+    def _on_commit(self, _conn) -> None:
+        self.commits += 1
+
+    def _on_execute(self, _conn, _cursor, statement, _params, _context, _executemany) -> None:
+        match = _WRITE_RE.match(statement)
+        if match:
+            self.writes[f"{match.group(1).upper()} {match.group(2)}"] += 1
+
+    def attach(self) -> None:
+        from infrastructure.database.connection import engine
+        from sqlalchemy import event
+
+        event.listen(engine.sync_engine, "commit", self._on_commit)
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def detach(self) -> None:
+        from infrastructure.database.connection import engine
+        from sqlalchemy import event
+
+        event.remove(engine.sync_engine, "commit", self._on_commit)
+        event.remove(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+
+@asynccontextmanager
+async def running_backend(workdir: Path, transport_factory: Callable) -> AsyncIterator[tuple[Any, Any]]:
+    """
+    Start the app with its worlds directory under workdir and SDK clients from transport_factory.
+
+    Yields (app, client), where client is an httpx AsyncClient authenticated as admin.
+    """
+    from core.app_factory import create_app
+    from httpx import ASGITransport, AsyncClient
+    from infrastructure.auth import generate_jwt_token
+    from infrastructure.database.connection import engine
+    from sdk.client.transports import set_transport_factory
+    from services import world_service
+    from sqlalchemy.ext.asyncio import close_all_sessions
+
+    worlds_dir = workdir / "worlds"
+    world_service._get_worlds_dir = lambda: worlds_dir
+    set_transport_factory(transport_factory)
+
+    app = create_app()
+    headers = {"X-API-Key": generate_jwt_token(user_id="admin")}
+    try:
+        async with app.router.lifespan_context(app):
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://bench", headers=headers
+            ) as client:
+                yield app, client
+    finally:
+        set_transport_factory(None)
+        # Pooled clients' MCP tools hold the session they were created with;
+        # close those too so no aiosqlite worker thread outlives the run
+        await close_all_sessions()
+        await engine.dispose()
+
+
+async def enter_world(client, name: str) -> tuple[int, int]:
+    """Import a seeded world and enter it; returns (world_id, room_id of the starting location)."""
+    import crud
+    from infrastructure.database.connection import background_session
+
+    response = await client.post(f"/worlds/import/{name}")
+    response.raise_for_status()
+    world_id = response.json()["id"]
+
+    # Enter resets the world and runs the opening scene (itself an Action Manager turn)
+    response = await client.post(f"/worlds/{world_id}/enter")
+    response.raise_for_status()
+
+    async with background_session() as db:
+        player_state = await crud.get_player_state(db, world_id)
+        location = await crud.get_location(db, player_state.current_location_id)
+        return world_id, location.room_id
+
+
+async def poll_until_settled(
+    client,
+    world_id: int,
+    since_message_id: Optional[int],
+    settled: Callable[[list[dict[str, Any]]], bool],
+    timeout: float,
+    interval: float,
+) -> tuple[int, list[dict[str, Any]]]:
+    """
+    Poll a world until settled(messages since since_message_id) holds and its turn queue is idle.
+
+    Returns (polls, messages). Raises TimeoutError after timeout seconds.
+    """
+    from orchestration.turn_scheduler import get_turn_scheduler
+
+    scheduler = get_turn_scheduler()
+    params = {"since_message_id": since_message_id} if since_message_id else {}
+    deadline = time.perf_counter() + timeout
+    polls = 0
+    while time.perf_counter() < deadline:
+        response = await client.get(f"/worlds/{world_id}/poll", params=params)
+        response.raise_for_status()
+        polls += 1
+        messages = response.json()["messages"]
+        status = scheduler.get_queue_status(world_id)
+        if settled(messages) and not status["running"] and not status["pending"]:
+            return polls, messages
+        await asyncio.sleep(interval)
+    raise TimeoutError(f"world {world_id} did not settle within {timeout}s")
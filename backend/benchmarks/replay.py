@@ -0,0 +1,333 @@
+"""
+Replay captured control-protocol traffic as regression fixtures.
+
+``JsonlLoggingSubprocessTransport`` writes the raw traffic of each SDK client
+to ``transport_logs/`` (enable ``debug.logging.transport`` with
+``include_reads: true`` in debug.yaml). ``record`` converts one of those logs
+into a fixture and replays it against the current backend; ``check`` replays a
+fixture again and compares the outcome with what was recorded:
+
+    tool calls   server, tool, arguments and result of every mcp_message call
+    DB writes    INSERT/UPDATE/DELETE statements per table
+    SSE events   event counts per type at the room's broadcaster
+    messages     role and content of the messages each turn added
+
+The recorded client's messages, tool calls and hook callbacks are played back
+verbatim by a ScriptedTransport (no model calls); everything downstream of the
+CLI (SDK, hooks, MCP tool handlers, orchestration, persistence, SSE) is the
+current code. The client that replays the log is the one whose SDK MCP servers
+cover every server the log calls (the Action Manager unless the log says
+otherwise); other clients get a short text reply.
+
+Replays run in a seeded world like the turn throughput benchmark (or a copy
+of ``--world DIR``). Entering the world plays a synthetic opening scene, then
+each recorded turn is driven by one player action. Timings are reported next
+to the fixture's baseline, so orchestration, tool and persistence changes can
+be profiled on production-shaped traffic.
+
+Usage:
+    cd backend && python -m benchmarks.replay record transport_logs/transport_room3_agent1_*.jsonl -o am.json
+    cd backend && python -m benchmarks.replay check am.json
+    cd backend && python -m benchmarks.replay check am.json --update
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from benchmarks.harness import (
+    DbWriteRecorder,
+    enter_world,
+    poll_until_settled,
+    prepare_environment,
+    running_backend,
+    seed_world,
+)
+from benchmarks.turn_throughput import action_manager_turn
+
+FIXTURE_VERSION = 1
+
+DEFAULT_SERVERS = ["action_manager"]
+
+WORLD_NAME = "replay_world"
+
+
+@dataclass
+class ReplayConfig:
+    poll_interval: float = 0.02
+    turn_timeout: float = 120.0
+    world_dir: Optional[Path] = None
+
+
+@dataclass
+class Observation:
+    """What one replay produced."""
+
+    tool_calls: list[dict[str, Any]] = field(default_factory=list)
+    db_writes: dict[str, int] = field(default_factory=dict)
+    sse_events: dict[str, int] = field(default_factory=dict)
+    messages: list[list[dict[str, Any]]] = field(default_factory=list)
+    turn_ms: list[float] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    def expected(self) -> dict[str, Any]:
+        """The comparable part, as stored in a fixture."""
+        return {
+            "tool_calls": self.tool_calls,
+            "db_writes": self.db_writes,
+            "sse_events": self.sse_events,
+            "messages": self.messages,
+        }
+
+
+def recorded_servers(script) -> list[str]:
+    """SDK MCP servers the recorded turns call."""
+    servers = {
+        step["request"].get("server_name")
+        for turn in script.turns
+        for step in turn
+        if step.get("type") == "control_request" and step["request"].get("subtype") == "mcp_message"
+    }
+    return sorted(s for s in servers if s) or list(DEFAULT_SERVERS)
+
+
+def build_fixture(log_path: Path, keep_timing: bool = False) -> dict[str, Any]:
+    """Convert a transport log into a fixture (without expectations yet)."""
+    from sdk.client.scripted_transport import load_transport_log
+
+    script = load_transport_log(log_path, keep_timing=keep_timing)
+    return {
+        "version": FIXTURE_VERSION,
+        "source": log_path.name,
+        "servers": recorded_servers(script),
+        "script": script.to_dict(),
+    }
+
+
+def compare(expected: dict[str, Any], observed: dict[str, Any]) -> list[str]:
+    """Differences between a fixture's expectations and a replay (empty when they match)."""
+    diffs: list[str] = []
+
+    want_calls, got_calls = expected.get("tool_calls", []), observed.get("tool_calls", [])
+    if len(want_calls) != len(got_calls):
+        diffs.append(f"tool calls: expected {len(want_calls)}, got {len(got_calls)}")
+    for i, (want, got) in enumerate(zip(want_calls, got_calls)):
+        for key in ("server", "tool", "arguments", "is_error", "content"):
+            if want.get(key) != got.get(key):
+                diffs.append(
+                    f"tool call {i} ({want.get('tool')}): {key} expected {want.get(key)!r}, got {got.get(key)!r}"
+                )
+
+    for section in ("db_writes", "sse_events"):
+        want_counts, got_counts = expected.get(section, {}), observed.get(section, {})
+        for key in sorted(set(want_counts) | set(got_counts)):
+            if want_counts.get(key, 0) != got_counts.get(key, 0):
+                diffs.append(f"{section} {key}: expected {want_counts.get(key, 0)}, got {got_counts.get(key, 0)}")
+
+    want_turns, got_turns = expected.get("messages", []), observed.get("messages", [])
+    for i in range(max(len(want_turns), len(got_turns))):
+        want = want_turns[i] if i < len(want_turns) else None
+        got = got_turns[i] if i < len(got_turns) else None
+        if want != got:
+            diffs.append(f"turn {i} messages: expected {want!r}, got {got!r}")
+    return diffs
+
+
+class Replay:
+    """Plays a fixture's recorded turns through the app and observes the outcome."""
+
+    def __init__(self, fixture: dict[str, Any], config: ReplayConfig):
+        from sdk.client.scripted_transport import TransportScript
+
+        self.fixture = fixture
+        self.config = config
+        self.servers = set(fixture.get("servers") or DEFAULT_SERVERS)
+        self.recorded = TransportScript.from_dict(fixture["script"])
+        # The opening scene on enter is one extra turn ahead of the recording
+        self.script = TransportScript.from_dict(
+            {**fixture["script"], "turns": [action_manager_turn(), *self.recorded.turns]}
+        )
+        self.fallback = TransportScript(turns=[[{"type": "text", "text": "..."}]])
+        self.transports: list = []
+
+    def transport_factory(self, options, task_id):
+        from sdk.client.scripted_transport import ScriptedTransport
+
+        mcp_servers = options.mcp_servers if isinstance(options.mcp_servers, dict) else {}
+        if self.servers <= set(mcp_servers):
+            transport = ScriptedTransport(options, self.script)
+            self.transports.append(transport)
+            return transport
+        return ScriptedTransport(options, self.fallback)
+
+    def turns_played(self) -> int:
+        return sum(t.turn_count for t in self.transports)
+
+    async def _count_sse(self, counts: Counter, queue: asyncio.Queue) -> None:
+        while True:
+            data = await queue.get()
+            if data is None:
+                return
+            counts[json.loads(data).get("type", "unknown")] += 1
+
+    async def run(self, workdir: Path) -> Observation:
+        observation = Observation()
+        async with running_backend(workdir, self.transport_factory) as (app, client):
+            if self.config.world_dir is not None:
+                shutil.copytree(self.config.world_dir, workdir / "worlds" / WORLD_NAME)
+            else:
+                seed_world(WORLD_NAME)
+            world_id, room_id = await enter_world(client, WORLD_NAME)
+            await poll_until_settled(
+                client,
+                world_id,
+                None,
+                lambda _: self.turns_played() >= 1,
+                timeout=self.config.turn_timeout,
+                interval=self.config.poll_interval,
+            )
+            calls_before = sum(len(t.tool_calls) for t in self.transports)
+
+            sse_counts: Counter = Counter()
+            broadcaster = app.state.event_broadcaster
+            queue = broadcaster.subscribe(room_id)
+            counter = asyncio.create_task(self._count_sse(sse_counts, queue))
+            recorder = DbWriteRecorder()
+            recorder.attach()
+            try:
+                for turn in range(len(self.recorded.turns)):
+                    await self._play_turn(client, world_id, turn, observation)
+            finally:
+                recorder.detach()
+                broadcaster.unsubscribe(room_id, queue)
+                counter.cancel()
+
+            observation.tool_calls = [c for t in self.transports for c in t.tool_calls][calls_before:]
+            observation.db_writes = dict(sorted(recorder.writes.items()))
+            observation.sse_events = dict(sorted(sse_counts.items()))
+        return observation
+
+    async def _play_turn(self, client, world_id: int, turn: int, observation: Observation) -> None:
+        start = time.perf_counter()
+        response = await client.post(f"/worlds/{world_id}/action", json={"text": f"Replayed action {turn + 1}"})
+        if response.status_code != 200:
+            observation.errors.append(f"turn {turn}: HTTP {response.status_code}")
+            observation.messages.append([])
+            return
+
+        try:
+            _, messages = await poll_until_settled(
+                client,
+                world_id,
+                response.json()["message_id"],
+                lambda _: self.turns_played() >= turn + 2,
+                timeout=self.config.turn_timeout,
+                interval=self.config.poll_interval,
+            )
+        except TimeoutError:
+            observation.errors.append(f"turn {turn}: timed out")
+            observation.messages.append([])
+            return
+        observation.turn_ms.append(round((time.perf_counter() - start) * 1000, 1))
+        observation.messages.append([{"role": m["role"], "content": m["content"]} for m in messages])
+
+
+def timing_summary(turn_ms: list[float]) -> dict[str, Any]:
+    from infrastructure.logging.perf_logger import LatencyHistogram
+
+    histogram = LatencyHistogram()
+    for ms in turn_ms:
+        histogram.record(ms)
+    return {"total_ms": round(sum(turn_ms), 1), **histogram.summary()}
+
+
+def print_report(observation: Observation, timing: dict[str, Any], baseline: Optional[dict[str, Any]]) -> None:
+    print()
+    print(f"turns replayed        {len(observation.turn_ms)} ({len(observation.errors)} errors)")
+    print(f"tool calls            {len(observation.tool_calls)}")
+    print(f"db writes             {sum(observation.db_writes.values())}")
+    print(f"sse events            {sum(observation.sse_events.values())}")
+    if timing.get("count"):
+        line = f"turn latency          p50 {timing['p50_ms']} ms | max {timing['max_ms']} ms | total {timing['total_ms']} ms"
+        if baseline and baseline.get("count"):
+            change = (
+                (timing["total_ms"] - baseline["total_ms"]) / baseline["total_ms"] * 100 if baseline["total_ms"] else 0
+            )
+            line += f" (baseline {baseline['total_ms']} ms, {change:+.1f}%)"
+        print(line)
+    for error in observation.errors[:10]:
+        print(f"  error: {error}")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay transport logs as regression fixtures")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record = sub.add_parser("record", help="Convert a transport log into a fixture and record its outcome")
+    record.add_argument("log", type=Path, help="JSONL log from transport_logs/")
+    record.add_argument("-o", "--output", type=Path, required=True, help="Fixture file to write")
+    record.add_argument("--keep-timing", action="store_true", help="Reproduce the recorded gaps between messages")
+
+    check = sub.add_parser("check", help="Replay a fixture and compare with its recorded outcome")
+    check.add_argument("fixture", type=Path)
+    check.add_argument("--update", action="store_true", help="Store this replay as the new expectation")
+    check.add_argument("--json", type=Path, help="Write the replay report to this file")
+
+    for command in (record, check):
+        command.add_argument("--world", type=Path, help="Replay in a copy of this world directory")
+        command.add_argument("--turn-timeout", type=float, default=ReplayConfig.turn_timeout)
+        command.add_argument("--verbose", action="store_true", help="Show backend logs")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        fixture = build_fixture(args.log, keep_timing=args.keep_timing)
+        output = args.output
+    else:
+        fixture = json.loads(args.fixture.read_text(encoding="utf-8"))
+        output = args.fixture
+    world_dir = args.world or (Path(fixture["world"]) if fixture.get("world") else None)
+    if world_dir is not None:
+        fixture["world"] = str(world_dir)
+
+    config = ReplayConfig(turn_timeout=args.turn_timeout, world_dir=world_dir)
+    with tempfile.TemporaryDirectory(prefix="claudeworld-replay-") as tmp:
+        workdir = Path(tmp)
+        prepare_environment(workdir, verbose=args.verbose)
+        observation = asyncio.run(Replay(fixture, config).run(workdir))
+    timing = timing_summary(observation.turn_ms)
+
+    print_report(observation, timing, fixture.get("baseline_timing"))
+    if observation.errors:
+        return 1
+
+    updating = args.command == "record" or args.update
+    diffs = [] if updating else compare(fixture["expected"], observation.expected())
+    for diff in diffs[:50]:
+        print(f"  mismatch: {diff}")
+    if args.command == "check" and args.json:
+        report = {"timing": timing, "mismatches": diffs, "observed": observation.expected()}
+        args.json.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    if diffs:
+        print(f"{len(diffs)} mismatches against {output}")
+        return 1
+
+    if updating:
+        fixture["expected"] = observation.expected()
+        fixture["baseline_timing"] = timing
+        output.write_text(json.dumps(fixture, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"wrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+"""
+Client pool session affinity benchmark.
+
+Drives ``ClientPool`` directly (no app) for N room/agent tasks through the
+session churn seen in play. Each task runs rounds of queries:
+
+    turn        query on the stored session, then store the session the CLI
+                reported (like response_generator after a response)
+    side query  query on the stored session without storing the result
+                (summarizer runs, memory rounds, chat-mode entry and exit),
+                so the stored session lags behind the pooled client's
+
+and, at configurable rates, the events that must still reconnect:
+
+    reset       the stored session is deleted (resume=None on the next turn)
+    config      the task's config hash changes (new tools, prompt, world)
+    eviction    the pooled client is cleaned up (error, room cleanup)
+
+The CLI is a ScriptedTransport that hands out a new session id for every
+query and takes ``--connect-delay`` seconds to connect, like spawning the CLI.
+A pooled client remembers its session lineage, so a query resuming a session it
+already continues is served without a reconnect. The benchmark reports the
+reconnects per cause from ``PoolMetrics`` next to the number the scenario
+requires, and exits non-zero if any cause reconnects more (or less) often.
+``--lineage 1`` keeps only the current session, reproducing the pool's
+behaviour before lineage tracking as a baseline.
+
+Usage:
+    cd backend && python -m benchmarks.session_affinity --tasks 8 --rounds 20
+    cd backend && python -m benchmarks.session_affinity --lineage 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import tempfile
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from benchmarks.harness import prepare_environment, rss_mb
+
+
+@dataclass
+class AffinityConfig:
+    tasks: int = 8
+    rounds: int = 20
+    side_queries: float = 0.6  # Probability of side queries after each turn
+    reset_rate: float = 0.05
+    config_rate: float = 0.05
+    eviction_rate: float = 0.05
+    connect_delay: float = 0.2
+    lineage: Optional[int] = None  # None keeps the pool's SESSION_LINEAGE_MAX
+    seed: int = 1
+
+
+@dataclass
+class TaskRun:
+    index: int
+    queries: int = 0
+    expected: Counter = field(default_factory=Counter)
+    acquire_ms: list[float] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+
+def build_transport_factory(config: AffinityConfig):
+    """Scripted CLI that is slow to connect and reports a new session per query."""
+    from sdk.client.scripted_transport import ScriptedTransport, TransportScript
+
+    script = TransportScript(turns=[[{"type": "text", "text": "..."}]])
+
+    class ChurningTransport(ScriptedTransport):
+        async def connect(self) -> None:
+            await asyncio.sleep(config.connect_delay)
+            await super().connect()
+
+        async def _play_turn(self, user_message: dict[str, Any]) -> None:
+            self._session_id = str(uuid.uuid4())
+            await super()._play_turn(user_message)
+
+    def factory(options, task_id):
+        return ChurningTransport(options, script, session_id=options.resume)
+
+    return factory
+
+
+class AffinityBenchmark:
+    """Plays the churn scenario for each task against one pool."""
+
+    def __init__(self, config: AffinityConfig, pool):
+        self.config = config
+        self.pool = pool
+
+    async def _query(self, run: TaskRun, task_id, resume: Optional[str], config_hash: str) -> str:
+        from claude_agent_sdk import ClaudeAgentOptions
+        from claude_agent_sdk.types import ResultMessage
+
+        start = time.perf_counter()
+        pooled, _, usage_lock = await self.pool.get_or_create(
+            task_id, ClaudeAgentOptions(resume=resume), config_hash=config_hash
+        )
+        run.acquire_ms.append((time.perf_counter() - start) * 1000)
+
+        async with usage_lock:
+            await pooled.client.query("continue")
+            while True:
+                message = await asyncio.wait_for(pooled.msg_queue.get(), timeout=10.0)
+                if message is None:
+                    raise RuntimeError("Client stream ended before the result")
+                if isinstance(message, ResultMessage):
+                    break
+        run.queries += 1
+        # As agent_manager does after each response
+        pooled.adopt_session(message.session_id)
+        return message.session_id
+
+    async def play(self, run: TaskRun) -> None:
+        from domain.value_objects.task_identifier import TaskIdentifier
+
+        rng = random.Random(self.config.seed * 1000 + run.index)
+        task_id = TaskIdentifier(room_id=run.index + 1, agent_id=1)
+        stored: Optional[str] = None
+        config_version = 0
+
+        try:
+            for round_index in range(self.config.rounds):
+                # At most one disruptive event per round, applied before its turn
+                if round_index > 0:
+                    event = rng.choices(
+                        ["reset", "config", "eviction", None],
+                        weights=[
+                            self.config.reset_rate,
+                            self.config.config_rate,
+                            self.config.eviction_rate,
+                            max(0.0, 1 - self.config.reset_rate - self.config.config_rate - self.config.eviction_rate),
+                        ],
+                    )[0]
+                    if event == "reset":
+                        stored = None
+                        run.expected["session"] += 1
+                    elif event == "config":
+                        config_version += 1
+                        run.expected["config"] += 1
+                    elif event == "eviction":
+                        await self.pool.cleanup(task_id)
+                        run.expected["eviction"] += 1
+
+                config_hash = f"config-{config_version}"
+                stored = await self._query(run, task_id, stored, config_hash)
+                while rng.random() < self.config.side_queries:
+                    await self._query(run, task_id, stored, config_hash)
+        except Exception as e:
+            run.errors.append(f"task {run.index}: {type(e).__name__}: {e}")
+
+
+def summarize(config: AffinityConfig, runs: list[TaskRun], wall_s: float, metrics) -> dict[str, Any]:
+    from infrastructure.logging.perf_logger import LatencyHistogram
+
+    histogram = LatencyHistogram()
+    for run in runs:
+        for latency in run.acquire_ms:
+            histogram.record(latency)
+    expected = sum((run.expected for run in runs), Counter())
+    reconnects = metrics.get_reconnect_stats()
+
+    return {
+        "config": vars(config),
+        "queries": sum(run.queries for run in runs),
+        "errors": [e for run in runs for e in run.errors],
+        "wall_s": round(wall_s, 2),
+        "clients_created": metrics.clients_created,
+        "reconnects": reconnects,
+        "expected_reconnects": {cause: expected[cause] for cause in ("session", "config", "eviction")},
+        "acquire_ms": histogram.summary(),
+        "rss_mb": rss_mb(),
+    }
+
+
+def print_report(report: dict[str, Any]) -> None:
+    acquire = report["acquire_ms"]
+    reconnects = report["reconnects"]
+    expected = report["expected_reconnects"]
+    print()
+    print(f"tasks x rounds        {report['config']['tasks']} x {report['config']['rounds']}")
+    print(f"queries               {report['queries']} ({len(report['errors'])} errors)")
+    print(f"wall time             {report['wall_s']} s")
+    print(f"clients created       {report['clients_created']}")
+    for cause in ("session", "config", "eviction"):
+        print(f"reconnects {cause:<10} {reconnects[cause]} (scenario requires {expected[cause]})")
+    print(f"affinity reuses       {reconnects['session_affinity_reuses']}")
+    if acquire.get("count"):
+        print(
+            f"acquire latency       p50 {acquire['p50_ms']} ms | p95 {acquire['p95_ms']} ms | "
+            f"p99 {acquire['p99_ms']} ms | max {acquire['max_ms']} ms"
+        )
+    for error in report["errors"][:10]:
+        print(f"  error: {error}")
+
+
+async def run_benchmark(config: AffinityConfig) -> dict[str, Any]:
+    """Run the scenario against a fresh pool with the scripted CLI."""
+    from sdk.client import client_pool
+    from sdk.client.transports import set_transport_factory
+
+    if config.lineage is not None:
+        client_pool.SESSION_LINEAGE_MAX = config.lineage
+    set_transport_factory(build_transport_factory(config))
+    pool = client_pool.ClientPool()
+    try:
+        bench = AffinityBenchmark(config, pool)
+        runs = [TaskRun(index=i) for i in range(config.tasks)]
+        start = time.perf_counter()
+        await asyncio.gather(*(bench.play(run) for run in runs))
+        wall_s = time.perf_counter() - start
+        return summarize(config, runs, wall_s, client_pool.get_pool_metrics())
+    finally:
+        await pool.shutdown_all()
+        set_transport_factory(None)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline client pool session affinity benchmark")
+    parser.add_argument("--tasks", type=int, default=AffinityConfig.tasks, help="Concurrent room/agent tasks")
+    parser.add_argument("--rounds", type=int, default=AffinityConfig.rounds, help="Turns per task")
+    parser.add_argument(
+        "--side-queries", type=float, default=AffinityConfig.side_queries, help="Chance of side queries per turn"
+    )
+    parser.add_argument("--reset-rate", type=float, default=AffinityConfig.reset_rate, help="Session resets per turn")
+    parser.add_argument("--config-rate", type=float, default=AffinityConfig.config_rate, help="Config changes per turn")
+    parser.add_argument("--eviction-rate", type=float, default=AffinityConfig.eviction_rate, help="Evictions per turn")
+    parser.add_argument("--connect-delay", type=float, default=AffinityConfig.connect_delay, help="Seconds per connect")
+    parser.add_argument("--lineage", type=int, help="Sessions remembered per client (1 = no lineage baseline)")
+    parser.add_argument("--seed", type=int, default=AffinityConfig.seed, help="Scenario random seed")
+    parser.add_argument("--json", type=Path, help="Write the report to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show backend logs")
+    args = parser.parse_args(argv)
+
+    config = AffinityConfig(
+        tasks=args.tasks,
+        rounds=args.rounds,
+        side_queries=args.side_queries,
+        reset_rate=args.reset_rate,
+        config_rate=args.config_rate,
+        eviction_rate=args.eviction_rate,
+        connect_delay=args.connect_delay,
+        lineage=args.lineage,
+        seed=args.seed,
+    )
+
+    with tempfile.TemporaryDirectory(prefix="claudeworld-bench-") as tmp:
+        prepare_environment(Path(tmp), verbose=args.verbose)
+        report = asyncio.run(run_benchmark(config))
+
+    print_report(report)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2, default=str))
+
+    if report["errors"]:
+        return 1
+    mismatched = [
+        cause for cause, expected in report["expected_reconnects"].items() if report["reconnects"][cause] != expected
+    ]
+    if mismatched:
+        print(f"reconnects differ from the scenario for: {', '.join(mismatched)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+"""
+Turn throughput benchmark.
+
+Runs N worlds concurrently, each playing M turns through the same path as the
+frontend:
+
+    POST /worlds/{id}/action -> turn queue -> tape -> Action Manager
+    -> narration/suggest_options MCP tools -> DB -> SSE broadcast -> GET /poll
+
+The Action Manager's model is replaced by a scripted transport (think time,
+token rate and tool calls are configurable), so the numbers isolate our own
+orchestration, tool and persistence overhead.
+
+Each world is seeded on disk in a temporary worlds directory, imported and
+entered through the API. SSE is measured at the broadcaster (the HTTP stream
+itself never ends, so it can't be read through the in-process ASGI client).
+
+Reports throughput, turn latency percentiles (submit until the narration is
+visible to /poll and the world's turn queue is idle), DB commits, SSE events
+and RSS. ``--json`` writes the report for CI artifacts.
+
+Usage:
+    cd backend && python -m benchmarks.turn_throughput --worlds 4 --turns 5
+    cd backend && python -m benchmarks.turn_throughput --tokens-per-second 80 --think-time 0.5 --json bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from benchmarks.harness import (
+    DbWriteRecorder,
+    enter_world,
+    poll_until_settled,
+    prepare_environment,
+    rss_mb,
+    running_backend,
+    seed_world,
+)
+
+NARRATIVE = (
+    "Lantern light spills across the wet cobblestones as you step forward. "
+    "A merchant packs away her stall, glancing at you with tired curiosity, "
+    "while somewhere beyond the square a bell tolls the hour."
+)
+
+
+@dataclass
+class BenchmarkConfig:
+    worlds: int = 2
+    turns: int = 3
+    tokens_per_second: float = 0.0
+    think_time: float = 0.0
+    poll_interval: float = 0.02
+    turn_timeout: float = 60.0
+
+
+@dataclass
+class WorldRun:
+    world_id: int
+    room_id: int
+    latencies_ms: list[float] = field(default_factory=list)
+    polls: int = 0
+    sse_events: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+def action_manager_turn() -> list[dict[str, Any]]:
+    """Synthetic Action Manager turn: brief reasoning, narration, two suggestions."""
+    return [
+        {"type": "thinking", "text": "The player acts in the square; describe the outcome and offer options."},
+        {"type": "tool_use", "name": "mcp__action_manager__narration", "input": {"narrative": NARRATIVE}},
+        {
+            "type": "tool_use",
+            "name": "mcp__action_manager__suggest_options",
+            "input": {"action_1": "Approach the merchant", "action_2": "Follow the bell"},
+        },
+    ]
+
+
+def build_scripts(config: BenchmarkConfig):
+    """Script selector: Action Manager clients get tool calls, everything else plain text."""
+    from sdk.client.scripted_transport import TransportScript
+
+    pacing = {"tokens_per_second": config.tokens_per_second, "think_time": config.think_time}
+    action_manager = TransportScript(turns=[action_manager_turn()], **pacing)
+    fallback = TransportScript(turns=[[{"type": "text", "text": "..."}]], **pacing)
+
+    def select(options, task_id):
+        servers = options.mcp_servers if isinstance(options.mcp_servers, dict) else {}
+        return action_manager if "action_manager" in servers else fallback
+
+    return select
+
+
+class TurnBenchmark:
+    """Drives worlds through the app in-process and collects metrics."""
+
+    def __init__(self, config: BenchmarkConfig, client, app):
+        self.config = config
+        self.client = client
+        self.app = app
+        self.runs: list[WorldRun] = []
+
+    async def setup_world(self, index: int) -> WorldRun:
+        name = f"bench_world_{index}"
+        seed_world(name)
+        world_id, room_id = await enter_world(self.client, name)
+
+        run = WorldRun(world_id=world_id, room_id=room_id)
+        self.runs.append(run)
+        return run
+
+    async def _count_sse(self, run: WorldRun, queue: asyncio.Queue) -> None:
+        while True:
+            if await queue.get() is None:
+                return
+            run.sse_events += 1
+
+    async def play(self, run: WorldRun) -> None:
+        broadcaster = self.app.state.event_broadcaster
+        queue = broadcaster.subscribe(run.room_id)
+        counter = asyncio.create_task(self._count_sse(run, queue))
+
+        try:
+            for turn in range(self.config.turns):
+                start = time.perf_counter()
+                response = await self.client.post(
+                    f"/worlds/{run.world_id}/action", json={"text": f"I look around ({turn})"}
+                )
+                if response.status_code != 200:
+                    run.errors.append(f"turn {turn}: HTTP {response.status_code}")
+                    continue
+
+                try:
+                    polls, _ = await poll_until_settled(
+                        self.client,
+                        run.world_id,
+                        response.json()["message_id"],
+                        lambda messages: any(m["role"] == "assistant" for m in messages),
+                        timeout=self.config.turn_timeout,
+                        interval=self.config.poll_interval,
+                    )
+                except TimeoutError:
+                    run.errors.append(f"turn {turn}: timed out")
+                    continue
+                run.polls += polls
+                run.latencies_ms.append((time.perf_counter() - start) * 1000)
+        finally:
+            broadcaster.unsubscribe(run.room_id, queue)
+            counter.cancel()
+
+
+def summarize(config: BenchmarkConfig, runs: list[WorldRun], wall_s: float, commits: int) -> dict[str, Any]:
+    from infrastructure.logging.perf_logger import LatencyHistogram
+    from orchestration.turn_scheduler import get_turn_scheduler
+
+    histogram = LatencyHistogram()
+    for run in runs:
+        for latency in run.latencies_ms:
+            histogram.record(latency)
+    turns = histogram.count
+
+    return {
+        "config": vars(config),
+        "turns_completed": turns,
+        "errors": [e for run in runs for e in run.errors],
+        "wall_s": round(wall_s, 2),
+        "throughput_turns_per_s": round(turns / wall_s, 2) if wall_s else 0.0,
+        "turn_latency_ms": histogram.summary(),
+        "db_commits": commits,
+        "db_commits_per_turn": round(commits / turns, 1) if turns else None,
+        "sse_events_per_turn": round(sum(r.sse_events for r in runs) / turns, 1) if turns else None,
+        "polls_per_turn": round(sum(r.polls for r in runs) / turns, 1) if turns else None,
+        "turn_queue": get_turn_scheduler().get_metrics(),
+        "rss_mb": rss_mb(),
+    }
+
+
+def print_report(report: dict[str, Any]) -> None:
+    latency = report["turn_latency_ms"]
+    print()
+    print(f"worlds x turns        {report['config']['worlds']} x {report['config']['turns']}")
+    print(f"turns completed       {report['turns_completed']} ({len(report['errors'])} errors)")
+    print(f"wall time             {report['wall_s']} s")
+    print(f"throughput            {report['throughput_turns_per_s']} turns/s")
+    if latency.get("count"):
+        print(
+            f"turn latency          p50 {latency['p50_ms']} ms | p95 {latency['p95_ms']} ms | "
+            f"p99 {latency['p99_ms']} ms | max {latency['max_ms']} ms"
+        )
+    print(f"db commits            {report['db_commits']} ({report['db_commits_per_turn']} per turn)")
+    print(f"sse events per turn   {report['sse_events_per_turn']}")
+    print(f"rss                   {report['rss_mb']['current']} MB (peak {report['rss_mb']['peak']} MB)")
+    for error in report["errors"][:10]:
+        print(f"  error: {error}")
+
+
+async def run_benchmark(config: BenchmarkConfig, workdir: Path) -> dict[str, Any]:
+    """Run the benchmark against an app using a fresh database and worlds directory under workdir."""
+    from sdk.client.scripted_transport import scripted_transport_factory
+
+    async with running_backend(workdir, scripted_transport_factory(build_scripts(config))) as (app, client):
+        bench = TurnBenchmark(config, client, app)
+        runs = await asyncio.gather(*(bench.setup_world(i) for i in range(config.worlds)))
+
+        recorder = DbWriteRecorder()
+        recorder.attach()
+        start = time.perf_counter()
+        await asyncio.gather(*(bench.play(run) for run in runs))
+        wall_s = time.perf_counter() - start
+        recorder.detach()
+
+        return summarize(config, list(runs), wall_s, recorder.commits)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline turn throughput benchmark")
+    parser.add_argument("--worlds", type=int, default=BenchmarkConfig.worlds, help="Concurrent worlds")
+    parser.add_argument("--turns", type=int, default=BenchmarkConfig.turns, help="Turns per world")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="Scripted token rate (0 = no delay)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Scripted seconds before the first token")
+    parser.add_argument("--json", type=Path, help="Write the report to this file")
+    parser.add_argument("--max-p99-ms", type=float, help="Exit non-zero if p99 turn latency exceeds this")
+    parser.add_argument("--verbose", action="store_true", help="Show backend logs")
+    args = parser.parse_args(argv)
+
+    config = BenchmarkConfig(
+        worlds=args.worlds,
+        turns=args.turns,
+        tokens_per_second=args.tokens_per_second,
+        think_time=args.think_time,
+    )
+
+    with tempfile.TemporaryDirectory(prefix="claudeworld-bench-") as tmp:
+        workdir = Path(tmp)
+        prepare_environment(workdir, verbose=args.verbose)
+        report = asyncio.run(run_benchmark(config, workdir))
+
+    print_report(report)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2, default=str))
+
+    if report["errors"] or report["turns_completed"] < config.worlds * config.turns:
+        return 1
+    p99 = report["turn_latency_ms"].get("p99_ms", 0.0)
+    if args.max_p99_ms is not None and p99 > args.max_p99_ms:
+        print(f"p99 turn latency {p99} ms exceeds {args.max_p99_ms} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
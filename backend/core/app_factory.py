@@ -5,26 +5,57 @@ This module provides functions for creating and configuring the FastAPI applicat
 with all necessary middleware, routers, and dependencies.
 """
 
+import asyncio
+import importlib
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
-from fastapi_mcp import FastApiMCP
-from infrastructure.background import drain_background_tasks
+from infrastructure.background import drain_background_tasks, spawn_background
 from infrastructure.database.connection import background_session, get_db, init_db
+from infrastructure.logging.perf_logger import get_perf_logger
+from infrastructure.logging.startup_profiler import finish_startup_profile, startup_step
 from infrastructure.scheduler import BackgroundScheduler
 from infrastructure.sse import EventBroadcaster
 from infrastructure.sse_ticket import SSETicketManager
 from orchestration import ChatOrchestrator
 from sdk import AgentManager
 from services import AgentFactory
+from services.usage_accounting import get_usage_recorder
+from utils.images import shutdown_image_pool
 
 from core import get_logger, get_settings
 
 logger = get_logger("AppFactory")
 
 
+def _mount_mcp_server(app: FastAPI) -> None:
+    """
+    Mount the MCP server - exposes simplified tools for easy LLM integration.
+
+    Only the "MCP Tools" tag is exposed, with clean, semantic tool names.
+    """
+    from fastapi_mcp import FastApiMCP
+
+    mcp = FastApiMCP(
+        app,
+        name="ClaudeWorld",
+        description="Chat with AI agents. Use 'list_agents' to see available agents, then 'chat' to talk with them.",
+        include_tags=["MCP Tools"],  # Only expose simplified MCP tools
+        headers=["authorization", "x-api-key"],  # Forward auth headers to API calls
+    )
+    mcp.mount()
+    logger.info("🔌 MCP server mounted at /mcp (5 simplified tools)")
+
+
+async def _mount_mcp_server_deferred(app: FastAPI) -> None:
+    """Mount the MCP server after startup (LAZY_STARTUP mode)."""
+    # Import off the event loop so requests keep being served meanwhile
+    await asyncio.to_thread(importlib.import_module, "fastapi_mcp")
+    _mount_mcp_server(app)
+
+
 def create_app() -> FastAPI:
     """
     Create and configure the FastAPI application.
@@ -63,23 +94,26 @@ def create_app() -> FastAPI:
         # Validate configuration files
         from sdk.loaders import log_config_validation
 
-        log_config_validation()
+        with startup_step("validate_config"):
+            log_config_validation()
 
         # Initialize database
-        await init_db()
+        with startup_step("init_db"):
+            await init_db()
 
         # Create singleton instances
-        event_broadcaster = EventBroadcaster()
-        sse_ticket_manager = SSETicketManager()
-        agent_manager = AgentManager(broadcaster=event_broadcaster)
-        priority_agent_names = settings.get_priority_agent_names()
-        chat_orchestrator = ChatOrchestrator(priority_agent_names=priority_agent_names)
-        background_scheduler = BackgroundScheduler(
-            chat_orchestrator=chat_orchestrator,
-            agent_manager=agent_manager,
-            get_db_session=get_db,
-            max_concurrent_rooms=settings.max_concurrent_rooms,
-        )
+        with startup_step("create_singletons"):
+            event_broadcaster = EventBroadcaster()
+            sse_ticket_manager = SSETicketManager()
+            agent_manager = AgentManager(broadcaster=event_broadcaster)
+            priority_agent_names = settings.get_priority_agent_names()
+            chat_orchestrator = ChatOrchestrator(priority_agent_names=priority_agent_names)
+            background_scheduler = BackgroundScheduler(
+                chat_orchestrator=chat_orchestrator,
+                agent_manager=agent_manager,
+                get_db_session=get_db,
+                max_concurrent_rooms=settings.max_concurrent_rooms,
+            )
 
         # Log priority agent configuration
         if priority_agent_names:
@@ -96,13 +130,19 @@ def create_app() -> FastAPI:
         app.state.sse_ticket_manager = sse_ticket_manager
 
         # Seed agents from config files
-        async with background_session() as db:
-            await AgentFactory.seed_from_configs(db)
+        with startup_step("seed_agents"):
+            async with background_session() as db:
+                await AgentFactory.seed_from_configs(db)
 
         # Start background scheduler
-        background_scheduler.start()
+        with startup_step("start_scheduler"):
+            background_scheduler.start()
 
         logger.info("✅ Application startup complete")
+        finish_startup_profile()
+
+        if settings.lazy_startup:
+            spawn_background(_mount_mcp_server_deferred(app), name="mount_mcp_server")
 
         yield
 
@@ -112,6 +152,9 @@ def create_app() -> FastAPI:
         background_scheduler.stop()
         await drain_background_tasks()  # Let in-flight agent turns finish writing
         await agent_manager.shutdown()
+        await get_usage_recorder().flush()  # Write buffered token usage rows
+        shutdown_image_pool()
+        get_perf_logger().close()  # Flush buffered latency.log lines
 
         logger.info("✅ Application shutdown complete")
 
@@ -155,17 +198,12 @@ def create_app() -> FastAPI:
     app.include_router(debug.router, prefix="/debug", tags=["Debug"])
     app.include_router(mcp_tools.router, tags=["MCP Tools"])
 
-    # Mount MCP server - exposes simplified tools for easy LLM integration
-    # Only expose "MCP Tools" tag with clean, semantic tool names
-    mcp = FastApiMCP(
-        app,
-        name="ClaudeWorld",
-        description="Chat with AI agents. Use 'list_agents' to see available agents, then 'chat' to talk with them.",
-        include_tags=["MCP Tools"],  # Only expose simplified MCP tools
-        headers=["authorization", "x-api-key"],  # Forward auth headers to API calls
-    )
-    mcp.mount()
-    logger.info("🔌 MCP server mounted at /mcp (5 simplified tools)")
+    # Mount MCP server (deferred until after startup in LAZY_STARTUP mode)
+    if settings.lazy_startup:
+        logger.info("💤 Lazy startup: MCP server will be mounted after startup")
+    else:
+        with startup_step("mount_mcp"):
+            _mount_mcp_server(app)
 
     # Serve static frontend files when running as PyInstaller bundle
     if getattr(sys, "frozen", False):
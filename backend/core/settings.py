@@ -93,6 +93,48 @@ class Settings(BaseSettings):
     # Background scheduler configuration
     max_concurrent_rooms: int = 5
 
+    # Max TRPG turns executing at once across all worlds
+    max_concurrent_turns: int = 4
+
+    # Concurrent tape cells (e.g. NPC reactions): max agents running at once,
+    # and seconds before unfinished agents in the cell are cancelled
+    max_concurrent_cell_agents: int = 4
+    concurrent_cell_timeout: float = 120.0
+
+    # Chat mode: run regular NPC replies in one concurrent cell instead of one
+    # after another (NPCs then don't see each other's replies within a turn)
+    chat_mode_parallel_npcs: bool = False
+
+    # Player turn queue: max turns waiting per world, and whether a new action
+    # supersedes queued ones that haven't started ("latest wins")
+    turn_queue_depth: int = 3
+    turn_queue_coalesce: bool = False
+
+    # Speculative turn preparation: the frontend asks the backend to warm the
+    # Action Manager while the player types; prepared state expires after the TTL
+    turn_prepare_enabled: bool = False
+    turn_prepare_ttl: float = 30.0
+
+    # Designer sub-agent result cache: Task calls asking for an existing item,
+    # location or character (or repeating a finished request) are answered
+    # without running the sub-agent; memoized results expire after the TTL
+    subagent_cache_enabled: bool = True
+    subagent_cache_ttl: float = 1800.0
+
+    # Background enrichment of draft locations adjacent to the player: after
+    # each gameplay turn, the top-ranked drafts get a low-priority Location
+    # Designer job (at most `concurrency` running at once across all worlds)
+    location_enrichment_enabled: bool = False
+    location_enrichment_concurrency: int = 1
+    location_enrichment_candidates: int = 2
+
+    # Token usage accounting: every agent response's token usage is written to
+    # the token_usage table (batched), for per-turn/agent/world rollups
+    usage_accounting_enabled: bool = True
+
+    # Startup configuration: defer non-essential work (MCP server mount) until after startup
+    lazy_startup: bool = False
+
     # CLI tracing configuration (for patched CLI with observability patches)
     enable_cli_tracing: bool = False
     cli_trace_output: Optional[str] = None  # Path to trace output file
@@ -127,6 +169,76 @@ class Settings(BaseSettings):
             return v.lower() == "true"
         return False
 
+    @field_validator("lazy_startup", mode="before")
+    @classmethod
+    def validate_lazy_startup(cls, v: Optional[str]) -> bool:
+        """Parse lazy_startup from string to bool."""
+        if isinstance(v, bool):
+            return v
+        if isinstance(v, str):
+            return v.lower() == "true"
+        return False
+
+    @field_validator("turn_queue_coalesce", mode="before")
+    @classmethod
+    def validate_turn_queue_coalesce(cls, v: Optional[str]) -> bool:
+        """Parse turn_queue_coalesce from string to bool."""
+        if isinstance(v, bool):
+            return v
+        if isinstance(v, str):
+            return v.lower() == "true"
+        return False
+
+    @field_validator("turn_prepare_enabled", mode="before")
+    @classmethod
+    def validate_turn_prepare_enabled(cls, v: Optional[str]) -> bool:
+        """Parse turn_prepare_enabled from string to bool."""
+        if isinstance(v, bool):
+            return v
+        if isinstance(v, str):
+            return v.lower() == "true"
+        return False
+
+    @field_validator("subagent_cache_enabled", mode="before")
+    @classmethod
+    def validate_subagent_cache_enabled(cls, v: Optional[str]) -> bool:
+        """Parse subagent_cache_enabled from string to bool."""
+        if isinstance(v, bool):
+            return v
+        if isinstance(v, str):
+            return v.lower() == "true"
+        return True
+
+    @field_validator("usage_accounting_enabled", mode="before")
+    @classmethod
+    def validate_usage_accounting_enabled(cls, v: Optional[str]) -> bool:
+        """Parse usage_accounting_enabled from string to bool."""
+        if isinstance(v, bool):
+            return v
+        if isinstance(v, str):
+            return v.lower() == "true"
+        return True
+
+    @field_validator("location_enrichment_enabled", mode="before")
+    @classmethod
+    def validate_location_enrichment_enabled(cls, v: Optional[str]) -> bool:
+        """Parse location_enrichment_enabled from string to bool."""
+        if isinstance(v, bool):
+            return v
+        if isinstance(v, str):
+            return v.lower() == "true"
+        return False
+
+    @field_validator("chat_mode_parallel_npcs", mode="before")
+    @classmethod
+    def validate_chat_mode_parallel_npcs(cls, v: Optional[str]) -> bool:
+        """Parse chat_mode_parallel_npcs from string to bool."""
+        if isinstance(v, bool):
+            return v
+        if isinstance(v, str):
+            return v.lower() == "true"
+        return False
+
     @field_validator("enable_cli_tracing", mode="before")
     @classmethod
     def validate_enable_cli_tracing(cls, v: Optional[str]) -> bool:
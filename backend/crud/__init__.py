@@ -9,9 +9,11 @@ All CRUD functions are exported at the package level for backward compatibility.
 # Agent operations
 from .agents import (
     create_agent,
+    create_agents_bulk,
     delete_agent,
     get_agent,
     get_agent_by_name,
+    get_agent_names,
     get_agents_by_world,
     get_all_agents,
     sync_agents_with_filesystem,
@@ -52,6 +54,7 @@ from .locations import (
 
 # Message operations
 from .messages import (
+    count_agent_messages,
     create_message,
     delete_room_messages,
     get_chat_session_messages,
@@ -89,11 +92,18 @@ from .rooms import (
     delete_room,
     get_or_create_direct_room,
     get_room,
+    get_room_limits,
     get_rooms,
     mark_room_as_finished,
     update_room,
 )
 
+# Turn admission (single-transaction unit of work)
+from .turns import TurnAdmission, admit_turn, retarget_turn
+
+# Token usage operations
+from .usage import detach_turn_usage, get_daily_usage, get_turn_usage, record_token_usage
+
 # World operations
 from .worlds import (
     add_gameplay_agents_to_room,
@@ -114,12 +124,15 @@ __all__ = [
     "create_room",
     "get_rooms",
     "get_room",
+    "get_room_limits",
     "update_room",
     "mark_room_as_finished",
     "delete_room",
     "get_or_create_direct_room",
     # Agent operations
     "create_agent",
+    "create_agents_bulk",
+    "get_agent_names",
     "get_all_agents",
     "get_agent",
     "get_agent_by_name",
@@ -129,6 +142,7 @@ __all__ = [
     "update_agent",
     # Message operations
     "create_message",
+    "count_agent_messages",
     "get_chat_session_messages",
     "get_messages",
     "get_messages_excluding_chat",
@@ -181,6 +195,14 @@ __all__ = [
     "exit_chat_mode",
     "get_gameplay_agents",
     "add_gameplay_agents_to_room",
+    "admit_turn",
+    "retarget_turn",
+    "TurnAdmission",
+    # Token usage operations
+    "record_token_usage",
+    "get_turn_usage",
+    "get_daily_usage",
+    "detach_turn_usage",
     "import_world_from_filesystem",
     "add_character_to_location",
     "remove_character_from_location",
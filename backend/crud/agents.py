@@ -77,6 +77,53 @@ async def create_agent(
     return db_agent
 
 
+@retry_on_db_lock(max_retries=5, initial_delay=0.1, backoff_factor=2)
+async def create_agents_bulk(db: AsyncSession, agents: List[dict]) -> List[models.Agent]:
+    """
+    Create many agents in a single transaction.
+
+    One commit (and one write lock) for the whole batch instead of one per
+    agent. Used for startup seeding.
+
+    Args:
+        db: Database session
+        agents: One dict per agent holding create_agent's keyword arguments (without db)
+
+    Returns:
+        Created Agent models, in input order
+    """
+    db_agents = [
+        models.Agent(
+            name=fields["name"],
+            world_name=fields.get("world_name"),
+            group=fields.get("group"),
+            config_file=fields.get("config_file"),
+            profile_pic=fields.get("profile_pic"),
+            in_a_nutshell=fields.get("in_a_nutshell"),
+            characteristics=fields.get("characteristics"),
+            recent_events=fields.get("recent_events"),
+            system_prompt=fields["system_prompt"],
+            interrupt_every_turn=bool(fields.get("interrupt_every_turn", False)),
+            priority=fields.get("priority", 0),
+            transparent=bool(fields.get("transparent", False)),
+        )
+        for fields in agents
+    ]
+    if not db_agents:
+        return []
+
+    db.add_all(db_agents)
+    async with serialized_write():
+        await db.commit()
+    return db_agents
+
+
+async def get_agent_names(db: AsyncSession) -> set[str]:
+    """Get the names of all agents (any world) in one query."""
+    result = await db.execute(select(models.Agent.name))
+    return set(result.scalars().all())
+
+
 async def get_all_agents(db: AsyncSession) -> List[models.Agent]:
     """Get all agents globally."""
     result = await db.execute(select(models.Agent))
@@ -13,6 +13,7 @@ from typing import List, Optional
 import schemas
 from infrastructure.database import models
 from infrastructure.database.connection import serialized_write
+from infrastructure.room_state import get_room_state
 from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
@@ -267,6 +268,8 @@ async def delete_location(
 
     async with serialized_write():
         await db.commit()
+    if room_id:
+        get_room_state().forget([room_id])
 
     logger.info(f"Deleted location {location_id} (room_id={room_id})")
     return True
@@ -10,27 +10,19 @@ import schemas
 from domain.value_objects.enums import MessageRole, ParticipantType
 from infrastructure.database import models
 from infrastructure.database.connection import retry_on_db_lock, serialized_write
-from sqlalchemy import delete
+from infrastructure.room_state import get_room_state
+from sqlalchemy import delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
 
-@retry_on_db_lock(max_retries=5, initial_delay=0.1, backoff_factor=2)
-async def create_message(
-    db: AsyncSession, room_id: int, message: schemas.MessageCreate, update_room_activity: bool = True
-) -> models.Message:
+def build_message_model(room_id: int, message: schemas.MessageCreate) -> models.Message:
     """
-    Create a new message in the database.
-
-    Args:
-        db: Database session
-        room_id: Room ID
-        message: Message to create
-        update_room_activity: Whether to update room's last_activity_at (default: True)
+    Build (but do not add or commit) a Message row from a MessageCreate schema.
 
-    Returns:
-        Created message
+    Shared by create_message and units of work that insert a message as part
+    of a larger transaction (e.g. crud.turns.admit_turn).
     """
     # Serialize anthropic_calls to JSON if present
     anthropic_calls_json = None
@@ -47,7 +39,7 @@ async def create_message(
     if message.images:
         images_json = json.dumps([{"data": img.data, "media_type": img.media_type} for img in message.images])
 
-    db_message = models.Message(
+    return models.Message(
         room_id=room_id,
         agent_id=message.agent_id,
         content=message.content,
@@ -63,6 +55,25 @@ async def create_message(
         chat_session_id=message.chat_session_id,
         game_time_snapshot=game_time_snapshot_json,
     )
+
+
+@retry_on_db_lock(max_retries=5, initial_delay=0.1, backoff_factor=2)
+async def create_message(
+    db: AsyncSession, room_id: int, message: schemas.MessageCreate, update_room_activity: bool = True
+) -> models.Message:
+    """
+    Create a new message in the database.
+
+    Args:
+        db: Database session
+        room_id: Room ID
+        message: Message to create
+        update_room_activity: Whether to update room's last_activity_at (default: True)
+
+    Returns:
+        Created message
+    """
+    db_message = build_message_model(room_id, message)
     db.add(db_message)
 
     # Update room's last_activity_at if requested (atomic with message creation)
@@ -82,6 +93,9 @@ async def create_message(
     # Invalidate all message-related cache entries for this room
     cache.invalidate_pattern(room_messages_key(room_id))
 
+    if db_message.role == MessageRole.ASSISTANT:
+        get_room_state().record_messages(room_id)
+
     return db_message
 
 
@@ -128,9 +142,22 @@ async def create_system_message(
     cache = get_cache()
     cache.invalidate_pattern(room_messages_key(room_id))
 
+    get_room_state().record_messages(room_id)
+
     return db_message
 
 
+async def count_agent_messages(db: AsyncSession, room_id: int) -> int:
+    """Count agent (assistant-role) messages in a room, the unit of room.max_interactions."""
+    result = await db.execute(
+        select(func.count(models.Message.id)).where(
+            models.Message.room_id == room_id,
+            models.Message.role == MessageRole.ASSISTANT,
+        )
+    )
+    return result.scalar() or 0
+
+
 async def get_messages(db: AsyncSession, room_id: int) -> List[models.Message]:
     """Get all messages in a room."""
     result = await db.execute(
@@ -331,4 +358,5 @@ async def delete_room_messages(db: AsyncSession, room_id: int) -> bool:
     async with serialized_write():
         await db.execute(delete(models.Message).where(models.Message.room_id == room_id))
         await db.commit()
+    get_room_state().forget([room_id])
     return True  # Success - room exists and messages cleared (even if 0)
@@ -8,11 +8,13 @@ from typing import List, Optional
 import schemas
 from infrastructure.database import models
 from infrastructure.database.connection import retry_on_db_lock, serialized_write
+from infrastructure.room_state import RoomLimits, get_room_state
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
 from .helpers import get_room_with_relationships
+from .messages import count_agent_messages
 
 logger = logging.getLogger("CRUD")
 
@@ -103,9 +105,42 @@ async def update_room(db: AsyncSession, room_id: int, room_update: schemas.RoomU
     cache = get_cache()
     cache.invalidate(room_object_key(room_id))
 
+    # Notify running tapes of pause/limit changes
+    get_room_state().room_updated(room_id, bool(room.is_paused), room.max_interactions)
+
     return room
 
 
+async def get_room_limits(db: AsyncSession, room_id: int) -> Optional[RoomLimits]:
+    """
+    Get a room's pause flag, interaction limit and agent message count.
+
+    Seeded from the database on first access, then kept current in memory by
+    message creation and room updates, so repeated checks don't query.
+
+    Args:
+        db: Database session
+        room_id: Room ID
+
+    Returns:
+        RoomLimits, or None if the room doesn't exist
+    """
+    registry = get_room_state()
+    limits = registry.get(room_id)
+    if limits is not None:
+        return limits
+
+    result = await db.execute(
+        select(models.Room.is_paused, models.Room.max_interactions).where(models.Room.id == room_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    count = await count_agent_messages(db, room_id)
+    return registry.seed(room_id, RoomLimits(bool(row.is_paused), row.max_interactions, count))
+
+
 @retry_on_db_lock(max_retries=5, initial_delay=0.1, backoff_factor=2)
 async def mark_room_as_finished(db: AsyncSession, room_id: int) -> Optional[models.Room]:
     """
@@ -141,6 +176,7 @@ async def delete_room(db: AsyncSession, room_id: int) -> bool:
         await db.delete(room)
         async with serialized_write():
             await db.commit()
+        get_room_state().forget([room_id])
         return True
     return False
 
@@ -0,0 +1,192 @@
+"""
+Turn admission unit of work for TRPG gameplay.
+
+Admitting a player action touches the world, player state, room membership
+and messages. Doing that through the per-entity CRUD helpers costs one commit
+(and one serialized-write acquisition) each; ``admit_turn`` applies all of it
+in a single transaction instead.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import schemas
+from domain.services.player_state_serializer import PlayerStateSerializer
+from domain.value_objects.enums import MessageRole, ParticipantType
+from infrastructure.database import models
+from infrastructure.database.connection import retry_on_db_lock, serialized_write
+from infrastructure.room_state import get_room_state
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from .messages import build_message_model
+from .worlds import GAMEPLAY_AGENT_NAMES
+
+logger = logging.getLogger("TurnCRUD")
+
+# Placeholder result recorded in the action history until the turn resolves
+PENDING_ACTION_RESULT = "Processing..."
+
+
+@dataclass
+class TurnAdmission:
+    """Result of admitting a player action."""
+
+    turn: int
+    message: models.Message
+    agents_added: int = 0
+
+    @property
+    def message_id(self) -> int:
+        return self.message.id
+
+
+@retry_on_db_lock(max_retries=5, initial_delay=0.1, backoff_factor=2)
+async def admit_turn(
+    db: AsyncSession,
+    world_id: int,
+    room_id: int,
+    action_text: str,
+    message: schemas.MessageCreate,
+) -> TurnAdmission:
+    """
+    Admit a player action as a new turn in one transaction.
+
+    Applies, with a single commit:
+    - world.last_played_at = now
+    - player action history entry for the new turn (result "Processing...")
+    - player turn counter + 1
+    - gameplay agents (Action_Manager, Narrator) added to the room if missing
+    - the player's message, and the room's last_activity_at
+
+    Args:
+        db: Database session
+        world_id: World ID
+        room_id: Room receiving the action (location or onboarding room)
+        action_text: Player action text (recorded in the action history)
+        message: The player's message to store in the room
+
+    Returns:
+        TurnAdmission with the new turn number and the stored message
+
+    Raises:
+        ValueError: If the world or its player state does not exist
+    """
+    now = datetime.now(timezone.utc)
+
+    world = await db.get(models.World, world_id)
+    result = await db.execute(select(models.PlayerState).where(models.PlayerState.world_id == world_id))
+    player_state = result.scalar_one_or_none()
+    if world is None or player_state is None:
+        raise ValueError(f"World {world_id} or its player state not found")
+
+    world.last_played_at = now
+
+    # Action history (last 10) and turn counter
+    new_turn = player_state.turn_count + 1
+    history = json.loads(player_state.action_history) if player_state.action_history else []
+    history.append({"turn": new_turn, "action": action_text, "result": PENDING_ACTION_RESULT})
+    player_state.action_history = PlayerStateSerializer.serialize_action_history(history[-10:])
+    player_state.turn_count = new_turn
+
+    # Player message
+    db_message = build_message_model(room_id, message)
+    db.add(db_message)
+    room = await db.get(models.Room, room_id)
+    if room:
+        room.last_activity_at = now
+
+    # Ensure gameplay agents are in the room (they might be missing if the
+    # location was created before agents were seeded)
+    added = await _add_missing_gameplay_agents(db, room_id, now)
+
+    async with serialized_write():
+        await db.commit()
+    await db.refresh(db_message)
+
+    _invalidate_room(room_id, added, 1 if db_message.role == MessageRole.ASSISTANT else 0)
+    return TurnAdmission(turn=new_turn, message=db_message, agents_added=added)
+
+
+@retry_on_db_lock(max_retries=5, initial_delay=0.1, backoff_factor=2)
+async def retarget_turn(db: AsyncSession, message_id: int, room_id: int) -> int:
+    """
+    Move an admitted turn's player message to another room in one transaction.
+
+    Used when a queued turn reaches the front of the world's queue after an
+    earlier turn moved the player: the action belongs to the new location.
+    Gameplay agents are added to the new room if missing, as in admit_turn.
+
+    Args:
+        db: Database session
+        message_id: The stored player message
+        room_id: Room the turn now runs in
+
+    Returns:
+        Number of gameplay agents added to the room
+
+    Raises:
+        ValueError: If the message does not exist
+    """
+    now = datetime.now(timezone.utc)
+    db_message = await db.get(models.Message, message_id)
+    if db_message is None:
+        raise ValueError(f"Message {message_id} not found")
+    old_room_id = db_message.room_id
+
+    db_message.room_id = room_id
+    room = await db.get(models.Room, room_id)
+    if room:
+        room.last_activity_at = now
+    added = await _add_missing_gameplay_agents(db, room_id, now)
+
+    async with serialized_write():
+        await db.commit()
+
+    _invalidate_room(old_room_id, 0, 0)
+    _invalidate_room(room_id, added, 0)
+    return added
+
+
+async def _add_missing_gameplay_agents(db: AsyncSession, room_id: int, now: datetime) -> int:
+    """Add gameplay agents missing from a room (uncommitted); returns how many were added."""
+    membership = select(models.room_agents.c.agent_id).where(
+        models.room_agents.c.room_id == room_id, models.room_agents.c.agent_id == models.Agent.id
+    )
+    missing = (
+        await db.execute(
+            select(models.Agent.id, models.Agent.name).where(
+                models.Agent.name.in_(GAMEPLAY_AGENT_NAMES), ~membership.exists()
+            )
+        )
+    ).all()
+    for agent_id, name in missing:
+        await db.execute(insert(models.room_agents).values(room_id=room_id, agent_id=agent_id, joined_at=now))
+        db.add(
+            models.Message(
+                room_id=room_id,
+                agent_id=None,
+                content=f"{name} joined the chat",
+                role=MessageRole.ASSISTANT,
+                participant_type=ParticipantType.SYSTEM,
+            )
+        )
+    return len(missing)
+
+
+def _invalidate_room(room_id: int, agents_added: int, assistant_messages: int) -> None:
+    """Invalidate caches of a room written by a committed turn transaction."""
+    from infrastructure.cache import get_cache, room_agents_key, room_messages_key
+
+    cache = get_cache()
+    cache.invalidate_pattern(room_messages_key(room_id))
+    # "joined the chat" system messages are assistant-role and count as interactions
+    agent_messages = agents_added + assistant_messages
+    if agent_messages:
+        get_room_state().record_messages(room_id, agent_messages)
+    if agents_added:
+        cache.invalidate(room_agents_key(room_id))
+        logger.info(f"Added {agents_added} gameplay agents to room {room_id}")
@@ -0,0 +1,165 @@
+"""
+Token usage CRUD operations.
+
+Rows in ``token_usage`` are one per agent response; these helpers append them
+in batches and roll them up per turn, per agent and per day on read.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from infrastructure.database import models
+from infrastructure.database.connection import retry_on_db_lock, serialized_write
+from sqlalchemy import func, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+TOKEN_COLUMNS = ("input_tokens", "output_tokens", "cache_read_tokens", "cache_creation_tokens")
+
+
+def cache_hit_ratio(input_tokens: int, cache_read_tokens: int, cache_creation_tokens: int) -> float:
+    """Share of prompt tokens served from the prompt cache."""
+    total_input = input_tokens + cache_read_tokens + cache_creation_tokens
+    return round(cache_read_tokens / total_input, 3) if total_input else 0.0
+
+
+def _totals_columns() -> list:
+    usage = models.TokenUsage
+    return [
+        func.count(usage.id).label("responses"),
+        *(func.coalesce(func.sum(getattr(usage, name)), 0).label(name) for name in TOKEN_COLUMNS),
+        func.coalesce(func.sum(usage.cost_usd), 0.0).label("cost_usd"),
+        func.coalesce(func.avg(usage.latency_ms), 0.0).label("avg_latency_ms"),
+        func.coalesce(func.max(usage.latency_ms), 0).label("max_latency_ms"),
+    ]
+
+
+def _totals(row: Any) -> Dict[str, Any]:
+    """Token totals of an aggregate row, with the prompt-cache hit ratio."""
+    totals: Dict[str, Any] = {"responses": row.responses, **{name: int(getattr(row, name)) for name in TOKEN_COLUMNS}}
+    totals["cost_usd"] = round(float(row.cost_usd), 6)
+    totals["avg_latency_ms"] = round(float(row.avg_latency_ms), 1)
+    totals["max_latency_ms"] = int(row.max_latency_ms)
+    totals["cache_hit_ratio"] = cache_hit_ratio(
+        totals["input_tokens"], totals["cache_read_tokens"], totals["cache_creation_tokens"]
+    )
+    return totals
+
+
+@retry_on_db_lock(max_retries=5, initial_delay=0.1, backoff_factor=2)
+async def record_token_usage(db: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+    """
+    Append token usage rows in one statement.
+
+    Args:
+        db: Database session
+        rows: Column dicts for models.TokenUsage
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+    await db.execute(insert(models.TokenUsage), rows)
+    async with serialized_write():
+        await db.commit()
+    return len(rows)
+
+
+@retry_on_db_lock(max_retries=5, initial_delay=0.1, backoff_factor=2)
+async def detach_turn_usage(db: AsyncSession, world_id: int) -> int:
+    """
+    Unlink a world's usage rows from their turns (the world was reset).
+
+    Turn numbers restart after a reset, so old rows would merge into the new
+    turns that reuse their numbers. They keep counting toward daily usage.
+
+    Returns:
+        Number of rows detached
+    """
+    result = await db.execute(
+        update(models.TokenUsage)
+        .where(models.TokenUsage.world_id == world_id, models.TokenUsage.turn.is_not(None))
+        .values(turn=None)
+    )
+    async with serialized_write():
+        await db.commit()
+    return result.rowcount
+
+
+async def get_turn_usage(db: AsyncSession, world_id: int, limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Token usage of a world's most recent turns, newest first.
+
+    Returns:
+        One dict per turn: turn, started_at, totals, and ``agents`` (totals per agent)
+    """
+    usage = models.TokenUsage
+    turn_rows = (
+        await db.execute(
+            select(usage.turn, func.min(usage.created_at).label("started_at"), *_totals_columns())
+            .where(usage.world_id == world_id, usage.turn.is_not(None))
+            .group_by(usage.turn)
+            .order_by(usage.turn.desc())
+            .limit(limit)
+        )
+    ).all()
+    if not turn_rows:
+        return []
+
+    agent_rows = (
+        await db.execute(
+            select(usage.turn, usage.agent_name, *_totals_columns())
+            .where(usage.world_id == world_id, usage.turn.in_([row.turn for row in turn_rows]))
+            .group_by(usage.turn, usage.agent_name)
+            .order_by(usage.agent_name)
+        )
+    ).all()
+    agents: Dict[int, List[Dict[str, Any]]] = {}
+    for row in agent_rows:
+        agents.setdefault(row.turn, []).append({"agent_name": row.agent_name, **_totals(row)})
+
+    return [
+        {"turn": row.turn, "started_at": row.started_at, **_totals(row), "agents": agents.get(row.turn, [])}
+        for row in turn_rows
+    ]
+
+
+async def get_daily_usage(db: AsyncSession, world_id: Optional[int] = None, days: int = 7) -> List[Dict[str, Any]]:
+    """
+    Daily token usage (UTC days), newest first.
+
+    Args:
+        db: Database session
+        world_id: Restrict to one world; None covers all worlds (and chat rooms)
+        days: Number of days to include, counting today
+
+    Returns:
+        One dict per day: day (YYYY-MM-DD), totals, ``agents`` (totals per agent)
+        and, across all worlds, ``worlds`` (totals per world)
+    """
+    usage = models.TokenUsage
+    day = func.date(usage.created_at).label("day")
+    since = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days - 1)
+    filters = [usage.created_at >= since]
+    if world_id is not None:
+        filters.append(usage.world_id == world_id)
+
+    async def rollup(*columns) -> List[Any]:
+        query = select(day, *columns, *_totals_columns()).where(*filters).group_by(day, *columns)
+        return (await db.execute(query)).all()
+
+    result: Dict[str, Dict[str, Any]] = {}
+    for row in await rollup():
+        result[str(row.day)] = {"day": str(row.day), **_totals(row), "agents": []}
+    for row in await rollup(usage.agent_name):
+        result[str(row.day)]["agents"].append({"agent_name": row.agent_name, **_totals(row)})
+    if world_id is None:
+        for entry in result.values():
+            entry["worlds"] = []
+        for row in await rollup(usage.world_id):
+            result[str(row.day)]["worlds"].append({"world_id": row.world_id, **_totals(row)})
+
+    for entry in result.values():
+        entry["agents"].sort(key=lambda agent: -agent["output_tokens"])
+    return sorted(result.values(), key=lambda entry: entry["day"], reverse=True)
@@ -13,6 +13,7 @@ import schemas
 from domain.value_objects.enums import WorldPhase
 from infrastructure.database import models
 from infrastructure.database.connection import serialized_write
+from infrastructure.room_state import get_room_state
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
@@ -247,12 +248,14 @@ async def delete_world(db: AsyncSession, world_id: int) -> bool:
     await db.flush()
 
     # Manually delete rooms (needed for SQLite which doesn't enforce FK CASCADE)
+    room_ids = [room.id for room in rooms_to_delete]
     for room in rooms_to_delete:
         await db.delete(room)
 
     async with serialized_write():
         await db.commit()
 
+    get_room_state().forget(room_ids)
     return True
 
 
@@ -71,6 +71,7 @@ from .value_objects import (
     SlashCommandType,
     TaskIdentifier,
     ToolResponse,
+    TurnContext,
     parse_slash_command,
 )
 from .value_objects.enums import (
@@ -131,6 +132,7 @@ __all__ = [
     "OrchestrationContext",
     "ImageAttachment",
     "AgentResponseContext",
+    "TurnContext",
     # Value objects - enums
     "ParticipantType",
     "AgentGroup",
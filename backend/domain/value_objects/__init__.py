@@ -13,6 +13,7 @@ from .contexts import (
     ImageAttachment,
     MessageContext,
     OrchestrationContext,
+    TurnContext,
 )
 from .enums import (
     ACTION_MANAGER_PATTERNS,
@@ -44,6 +45,7 @@ __all__ = [
     "OrchestrationContext",
     "ImageAttachment",
     "AgentResponseContext",
+    "TurnContext",
     # enums.py
     "ParticipantType",
     "AgentGroup",
@@ -14,6 +14,7 @@ from .task_identifier import TaskIdentifier
 
 if TYPE_CHECKING:
     from infrastructure.database import models
+    from orchestration.turn_preparation import PreparedTurn
     from sdk import AgentManager
     from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -56,6 +57,7 @@ class OrchestrationContext:
         world_id: Optional world ID (for TRPG game tools)
         world_name: Optional world name (for TRPG game tools)
         chat_session_id: Optional chat session ID for separating chat mode context
+        prepared_turn: Optional Action Manager state prepared before the action (single use)
     """
 
     db: "AsyncSession"
@@ -64,6 +66,7 @@ class OrchestrationContext:
     world_id: Optional[int] = None
     world_name: Optional[str] = None
     chat_session_id: Optional[int] = None
+    prepared_turn: Optional["PreparedTurn"] = None
 
 
 @dataclass
@@ -160,3 +163,38 @@ class AgentResponseContext:
     world_id: Optional[int] = None
     npc_reactions: Optional[List[Dict[str, Any]]] = None
     hidden: bool = False
+
+
+@dataclass
+class TurnContext:
+    """
+    Context for a player turn, resolved once when the turn is admitted.
+
+    Handed from the action endpoint to the background turn task so the
+    orchestrator does not re-query the room and agents in a new session. The
+    world itself is re-fetched when the turn starts, since its phase may change
+    (or the world may be deleted) while the turn is queued. If an earlier
+    queued turn moved the player, the room, location and agents are resolved
+    again as well.
+
+    Attributes:
+        world_id: World ID
+        world_name: World name (filesystem key)
+        room_id: Room receiving the action (location or onboarding room)
+        location_id: Current location ID (None during onboarding)
+        turn: Turn number assigned at admission
+        message_id: ID of the stored player message
+        agents: All agents in the room, including the gameplay agents
+        npcs: Character agents in the room (system agents excluded)
+        prepared: Action Manager state prepared while the player was typing, if still valid
+    """
+
+    world_id: int
+    world_name: str
+    room_id: int
+    location_id: Optional[int]
+    turn: int
+    message_id: int
+    agents: List["models.Agent"]
+    npcs: List["models.Agent"]
+    prepared: Optional["PreparedTurn"] = None
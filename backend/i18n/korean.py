@@ -3,8 +3,28 @@ Utility functions for dynamic Korean particle selection.
 
 Automatically selects the correct Korean particle (조사) based on whether
 a word ends in a consonant (받침) or vowel.
+
+Templates are compiled once into a segment list (literal text and
+placeholders) and cached, so rendering a long guideline template per agent
+is a single join instead of one string scan per particle pattern.
 """
 
+import re
+from functools import lru_cache
+from typing import Union
+
+# Particle mappings: {pattern: (consonant_form, vowel_form)}
+PARTICLES = {
+    "은는": ("은", "는"),
+    "이가": ("이", "가"),
+    "을를": ("을", "를"),
+    "과와": ("과", "와"),
+    "으로로": ("으로", "로"),
+}
+
+# A compiled template: literal strings and (var_name, particle_pattern or None) placeholders
+CompiledTemplate = tuple[Union[str, tuple[str, Union[str, None]]], ...]
+
 
 def has_final_consonant(text: str) -> bool:
     """
@@ -64,29 +84,66 @@ def format_with_particles(template: str, **kwargs) -> str:
     Returns:
         Formatted string with correct particles
     """
-    result = template
-
-    # Particle mappings: {pattern: (consonant_form, vowel_form)}
-    particles = {
-        "은는": ("은", "는"),
-        "이가": ("이", "가"),
-        "을를": ("을", "를"),
-        "과와": ("과", "와"),
-        "으로로": ("으로", "로"),
-    }
-
-    # Replace each variable with particle pattern
-    for var_name, var_value in kwargs.items():
-        for pattern, (consonant_form, vowel_form) in particles.items():
-            placeholder = f"{{{var_name}:{pattern}}}"
-
-            if placeholder in result:
-                # Choose particle based on final consonant
-                particle = consonant_form if has_final_consonant(var_value) else vowel_form
-                result = result.replace(placeholder, var_value + particle)
-
-        # Also replace simple placeholders without particles
-        simple_placeholder = f"{{{var_name}}}"
-        result = result.replace(simple_placeholder, var_value)
-
-    return result
+    return render_template(compile_template(template, tuple(kwargs)), **kwargs)
+
+
+@lru_cache(maxsize=256)
+def compile_template(template: str, var_names: tuple[str, ...]) -> CompiledTemplate:
+    """
+    Split a template into literal segments and placeholders for ``var_names``.
+
+    Only ``{var}`` and ``{var:<particle>}`` placeholders for the given names are
+    recognized; any other braces are kept as literal text. Results are cached
+    per (template, var_names).
+
+    Args:
+        template: String template with particle patterns
+        var_names: Names of the variables that will be substituted
+
+    Returns:
+        Tuple of literal strings and (var_name, particle_pattern or None) pairs
+    """
+    if not var_names:
+        return (template,)
+
+    names = "|".join(re.escape(name) for name in var_names)
+    patterns = "|".join(PARTICLES)
+    placeholder = re.compile(rf"\{{({names})(?::({patterns}))?\}}")
+
+    segments: list = []
+    pos = 0
+    for match in placeholder.finditer(template):
+        if match.start() > pos:
+            segments.append(template[pos : match.start()])
+        segments.append((match.group(1), match.group(2)))
+        pos = match.end()
+    if pos < len(template):
+        segments.append(template[pos:])
+    return tuple(segments)
+
+
+def render_template(compiled: CompiledTemplate, **kwargs) -> str:
+    """
+    Render a template compiled with ``compile_template``.
+
+    Args:
+        compiled: Segments from compile_template
+        **kwargs: Values for the variables the template was compiled with
+
+    Returns:
+        Formatted string with correct particles
+    """
+    parts = []
+    for segment in compiled:
+        if isinstance(segment, str):
+            parts.append(segment)
+            continue
+        var_name, pattern = segment
+        value = kwargs[var_name]
+        if pattern is None:
+            parts.append(value)
+        else:
+            consonant_form, vowel_form = PARTICLES[pattern]
+            # Choose particle based on final consonant
+            parts.append(value + (consonant_form if has_final_consonant(value) else vowel_form))
+    return "".join(parts)
@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 
 from domain.value_objects.enums import Language, MessageRole, WorldPhase
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Index, Integer, String, Table, Text, text
+from sqlalchemy import Boolean, Column, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Table, Text, text
 from sqlalchemy.orm import relationship
 
 from .connection import Base
@@ -300,3 +300,33 @@ class PlayerState(Base):
 
     world = relationship("World", back_populates="player_state")
     current_location = relationship("Location")
+
+
+class TokenUsage(Base):
+    """
+    Token usage of one agent response (one SDK query).
+
+    Rows are append-only and written in batches by services/usage_accounting.py;
+    per-turn, per-agent and daily rollups are computed from them on read.
+    """
+
+    __tablename__ = "token_usage"
+    __table_args__ = (
+        Index("ix_token_usage_world_turn", "world_id", "turn"),
+        Index("ix_token_usage_world_created", "world_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    world_id = Column(Integer, ForeignKey("worlds.id", ondelete="CASCADE"), nullable=True)  # NULL for chat rooms
+    room_id = Column(Integer, nullable=True)  # No FK: usage outlives recreated rooms
+    agent_id = Column(Integer, nullable=True)
+    agent_name = Column(String, nullable=False)
+    turn = Column(Integer, nullable=True)  # Player turn the response belongs to (NULL outside turns)
+
+    input_tokens = Column(Integer, nullable=False, default=0)  # Uncached input
+    output_tokens = Column(Integer, nullable=False, default=0)
+    cache_read_tokens = Column(Integer, nullable=False, default=0)
+    cache_creation_tokens = Column(Integer, nullable=False, default=0)
+    latency_ms = Column(Integer, nullable=False, default=0)  # Query sent -> response complete
+    cost_usd = Column(Float, nullable=True)  # As reported by the CLI
@@ -4,13 +4,20 @@ Performance logging utility for tracking agent interaction latencies.
 This module provides timing instrumentation for gameplay bottleneck analysis.
 Enable with PERF_LOG=true environment variable or use `make dev-perf`.
 
-Output: latency.log (in project root)
+Output: latency.log (in project root), written in batches by a background
+thread. Per-phase and per-agent percentiles are served at GET /debug/perf.
+
+Functions decorated with ``track_perf`` also record a trace span (see
+tracing.py) when PERF_TRACE=true.
 """
 
-import asyncio
+import atexit
 import logging
+import math
 import os
+import threading
 import time
+from collections import deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -18,11 +25,26 @@ from functools import wraps
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+from .tracing import get_tracer
+
 logger = logging.getLogger("PerfLogger")
 
 # Check if performance logging is enabled
 PERF_LOG_ENABLED = os.environ.get("PERF_LOG", "").lower() in ("true", "1", "yes")
 
+# Echo each latency.log line to the console (from the writer thread)
+PERF_LOG_CONSOLE = os.environ.get("PERF_LOG_CONSOLE", "true").lower() in ("true", "1", "yes")
+
+# Max log lines waiting for the background writer; oldest are dropped beyond this
+BUFFER_SIZE = 10000
+
+# Writer flushes every FLUSH_INTERVAL_S seconds, or as soon as this many lines are waiting
+FLUSH_BATCH_SIZE = 500
+FLUSH_INTERVAL_S = 0.5
+
+# Max (phase, agent) histograms; entries beyond this only count toward their phase
+MAX_AGENT_SERIES = 1000
+
 
 def _get_log_file_path() -> Path:
     """Get log file path, handling PyInstaller bundles."""
@@ -60,43 +82,213 @@ class TimingEntry:
         return f"{timestamp} | {self.phase:30}{agent_str}{room_str} | {self.duration_ms:8.2f}ms{extra_str}"
 
 
+class LatencyHistogram:
+    """
+    Streaming latency histogram with log-spaced buckets (HDR-style).
+
+    Bucket boundaries grow by a constant factor, so every percentile is
+    accurate to within ~3% relative error regardless of magnitude, and memory
+    is bounded by the value range (a few hundred buckets from 1µs to hours),
+    not by the number of samples.
+    """
+
+    # Bucket growth factor: 2^(1/24) ~ 2.9% per bucket
+    _LOG_BASE = math.log(2) / 24
+    # Values below this (ms) share bucket 0
+    _MIN_MS = 0.001
+
+    __slots__ = ("count", "total_ms", "min_ms", "max_ms", "_buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = math.inf
+        self.max_ms = 0.0
+        self._buckets: dict[int, int] = {}
+
+    def record(self, value_ms: float) -> None:
+        value_ms = max(value_ms, 0.0)
+        self.count += 1
+        self.total_ms += value_ms
+        self.min_ms = min(self.min_ms, value_ms)
+        self.max_ms = max(self.max_ms, value_ms)
+        index = 0 if value_ms <= self._MIN_MS else int(math.log(value_ms / self._MIN_MS) / self._LOG_BASE) + 1
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def _bucket_value(self, index: int) -> float:
+        """Representative value (geometric midpoint) of a bucket."""
+        if index == 0:
+            return self._MIN_MS
+        return self._MIN_MS * math.exp((index - 0.5) * self._LOG_BASE)
+
+    def percentile(self, q: float) -> float:
+        """Approximate q-th percentile (0-100) in milliseconds."""
+        if not self.count:
+            return 0.0
+        if q >= 100:
+            return self.max_ms
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                # Clamp to the observed range
+                return min(max(self._bucket_value(index), self.min_ms), self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> dict[str, float]:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "avg_ms": round(self.total_ms / self.count, 2),
+            "min_ms": round(self.min_ms, 2),
+            "max_ms": round(self.max_ms, 2),
+            "p50_ms": round(self.percentile(50), 2),
+            "p95_ms": round(self.percentile(95), 2),
+            "p99_ms": round(self.percentile(99), 2),
+        }
+
+
 class PerfLogger:
     """
     Performance logger for tracking latencies between agent interactions.
 
+    Recording an entry never touches the file: the formatted line goes into a
+    bounded ring buffer and a background thread appends buffered lines to
+    latency.log in batches (every FLUSH_INTERVAL_S, or sooner once
+    FLUSH_BATCH_SIZE lines are waiting). If the writer falls behind, the
+    oldest unwritten lines are dropped and counted. Aggregates are kept as
+    streaming histograms per phase and per (phase, agent), so memory stays
+    bounded however long the server runs.
+
     Usage:
         perf = get_perf_logger()
         async with perf.track("sdk_response", agent_name="Narrator", room_id=1):
             await some_async_operation()
     """
 
-    def __init__(self, enabled: bool = PERF_LOG_ENABLED):
+    def __init__(
+        self,
+        enabled: bool = PERF_LOG_ENABLED,
+        log_path: Optional[Path] = None,
+        buffer_size: int = BUFFER_SIZE,
+        echo: bool = PERF_LOG_CONSOLE,
+    ):
         self.enabled = enabled
-        self._lock = asyncio.Lock()
-        self._entries: list[TimingEntry] = []
+        self._log_path = log_path or _get_log_file_path()
+        self._echo = echo
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._buffer: deque[str] = deque(maxlen=buffer_size)
+        self._phases: dict[str, LatencyHistogram] = {}
+        self._series: dict[tuple[str, str], LatencyHistogram] = {}
+        self._stats = {"recorded": 0, "written": 0, "dropped": 0, "batches": 0, "write_errors": 0}
         self._interaction_count = 0
         self._session_start = datetime.now()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
 
         if self.enabled:
             self._init_log_file()
 
     def _init_log_file(self):
-        """Initialize or append to latency.log with session header."""
-        with open(_get_log_file_path(), "a") as f:
-            f.write(f"\n{'=' * 80}\n")
-            f.write(f"Performance Logging Session Started: {self._session_start.isoformat()}\n")
-            f.write(f"{'=' * 80}\n\n")
+        """Queue the session header for latency.log."""
+        rule = "=" * 80
+        self._enqueue(f"\n{rule}\nPerformance Logging Session Started: {self._session_start.isoformat()}\n{rule}\n")
+
+    # -------------------------------------------------------------------------
+    # Buffering and background writes
+    # -------------------------------------------------------------------------
+
+    def _enqueue(self, line: str) -> None:
+        """Buffer a line for the background writer (never blocks on I/O)."""
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self._stats["dropped"] += 1
+            self._buffer.append(line)
+            pending = len(self._buffer)
+        if self._writer is None:
+            self._start_writer()
+        if pending >= FLUSH_BATCH_SIZE:
+            self._wake.set()
+
+    def _start_writer(self) -> None:
+        with self._lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(target=self._writer_loop, name="perf-log-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _writer_loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(FLUSH_INTERVAL_S)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all buffered lines to latency.log in one batch. Returns lines written."""
+        with self._write_lock:
+            with self._lock:
+                lines = list(self._buffer)
+                self._buffer.clear()
+            if not lines:
+                return 0
+            try:
+                with open(self._log_path, "a") as f:
+                    f.write("\n".join(lines) + "\n")
+            except OSError as e:
+                with self._lock:
+                    self._stats["write_errors"] += 1
+                logger.warning(f"Failed to write {len(lines)} perf log lines: {e}")
+                return 0
+            with self._lock:
+                self._stats["written"] += len(lines)
+                self._stats["batches"] += 1
+        if self._echo:
+            for line in lines:
+                logger.info(f"⏱️  {line.strip()}")
+        return len(lines)
+
+    def close(self) -> None:
+        """Stop the background writer and flush what is left."""
+        self._stop.set()
+        self._wake.set()
+        writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join(timeout=2)
+        self.flush()
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def _record(self, entry: TimingEntry) -> None:
+        """Add an entry to the histograms and buffer its log line."""
+        with self._lock:
+            self._stats["recorded"] += 1
+            histogram = self._phases.get(entry.phase)
+            if histogram is None:
+                histogram = self._phases[entry.phase] = LatencyHistogram()
+            histogram.record(entry.duration_ms)
+
+            if entry.agent_name:
+                key = (entry.phase, entry.agent_name)
+                series = self._series.get(key)
+                if series is None and len(self._series) < MAX_AGENT_SERIES:
+                    series = self._series[key] = LatencyHistogram()
+                if series is not None:
+                    series.record(entry.duration_ms)
+        self._enqueue(entry.to_log_line())
 
     async def _write_entry(self, entry: TimingEntry):
-        """Write a timing entry to the log file."""
+        """Record a timing entry (kept async for existing callers)."""
         if not self.enabled:
             return
-
-        async with self._lock:
-            with open(_get_log_file_path(), "a") as f:
-                f.write(entry.to_log_line() + "\n")
-            # Log to console as well
-            logger.info(f"⏱️  {entry.to_log_line()}")
+        self._record(entry)
 
     def _create_entry(
         self,
@@ -145,23 +337,19 @@ class PerfLogger:
         try:
             yield
         finally:
-            end_perf = time.perf_counter()
-            end_time = datetime.now()
-            duration_ms = (end_perf - start_perf) * 1000
-
-            entry = TimingEntry(
-                phase=phase,
-                agent_name=agent_name,
-                duration_ms=duration_ms,
-                start_time=start_time,
-                end_time=end_time,
-                room_id=room_id,
-                extra=extra,
+            duration_ms = (time.perf_counter() - start_perf) * 1000
+            self._record(
+                TimingEntry(
+                    phase=phase,
+                    agent_name=agent_name,
+                    duration_ms=duration_ms,
+                    start_time=start_time,
+                    end_time=datetime.now(),
+                    room_id=room_id,
+                    extra=extra,
+                )
             )
 
-            self._entries.append(entry)
-            await self._write_entry(entry)
-
     def log_sync(
         self,
         phase: str,
@@ -173,8 +361,7 @@ class PerfLogger:
         """
         Log a timing entry synchronously (when duration already measured).
 
-        Use this when you've measured duration externally and need to log
-        from a synchronous context.
+        Safe on hot paths: only updates in-memory aggregates and the buffer.
 
         Args:
             phase: Name of the phase being tracked
@@ -185,22 +372,7 @@ class PerfLogger:
         """
         if not self.enabled:
             return
-
-        now = datetime.now()
-        entry = TimingEntry(
-            phase=phase,
-            agent_name=agent_name,
-            duration_ms=duration_ms,
-            start_time=now,
-            end_time=now,
-            room_id=room_id,
-            extra=extra,
-        )
-
-        self._entries.append(entry)
-        with open(_get_log_file_path(), "a") as f:
-            f.write(entry.to_log_line() + "\n")
-        logger.info(f"⏱️  {entry.to_log_line()}")
+        self._record(self._create_entry(phase, agent_name, room_id, duration_ms, **extra))
 
     async def log_async(
         self,
@@ -213,9 +385,6 @@ class PerfLogger:
         """
         Log a timing entry asynchronously (when duration already measured).
 
-        Use this when you've measured duration externally and need to log
-        from an async context.
-
         Args:
             phase: Name of the phase being tracked
             duration_ms: Pre-calculated duration in milliseconds
@@ -223,22 +392,7 @@ class PerfLogger:
             room_id: Optional room ID
             **extra: Additional metadata
         """
-        if not self.enabled:
-            return
-
-        now = datetime.now()
-        entry = TimingEntry(
-            phase=phase,
-            agent_name=agent_name,
-            duration_ms=duration_ms,
-            start_time=now,
-            end_time=now,
-            room_id=room_id,
-            extra=extra,
-        )
-
-        self._entries.append(entry)
-        await self._write_entry(entry)
+        self.log_sync(phase, duration_ms, agent_name, room_id, **extra)
 
     def track_sync(
         self,
@@ -269,27 +423,19 @@ class PerfLogger:
                 try:
                     return func(*args, **kwargs)
                 finally:
-                    end_perf = time.perf_counter()
-                    end_time = datetime.now()
-                    duration_ms = (end_perf - start_perf) * 1000
-
-                    entry = TimingEntry(
-                        phase=phase,
-                        agent_name=agent_name,
-                        duration_ms=duration_ms,
-                        start_time=start_time,
-                        end_time=end_time,
-                        room_id=room_id,
-                        extra=extra,
+                    duration_ms = (time.perf_counter() - start_perf) * 1000
+                    self._record(
+                        TimingEntry(
+                            phase=phase,
+                            agent_name=agent_name,
+                            duration_ms=duration_ms,
+                            start_time=start_time,
+                            end_time=datetime.now(),
+                            room_id=room_id,
+                            extra=extra,
+                        )
                     )
 
-                    self._entries.append(entry)
-                    # Write synchronously for sync functions
-                    with open(_get_log_file_path(), "a") as f:
-                        f.write(entry.to_log_line() + "\n")
-
-                    logger.info(f"⏱️  {entry.to_log_line()}")
-
             return wrapper
 
         return decorator
@@ -299,54 +445,65 @@ class PerfLogger:
         if not self.enabled:
             return
 
-        self._interaction_count += 1
-        async with self._lock:
-            with open(_get_log_file_path(), "a") as f:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-                f.write(f"\n--- Interaction #{self._interaction_count} | Room {room_id} ---\n")
-                f.write(f"{timestamp} | USER_ACTION                    | msg_len={len(user_message)}\n")
+        with self._lock:
+            self._interaction_count += 1
+            count = self._interaction_count
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        self._enqueue(
+            f"\n--- Interaction #{count} | Room {room_id} ---\n"
+            f"{timestamp} | USER_ACTION                    | msg_len={len(user_message)}"
+        )
 
     async def log_interaction_end(self, room_id: int, total_duration_ms: float, agent_count: int):
         """Log the end of a user interaction (all agents responded)."""
         if not self.enabled:
             return
 
-        async with self._lock:
-            with open(_get_log_file_path(), "a") as f:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-                f.write(
-                    f"{timestamp} | INTERACTION_COMPLETE           | {total_duration_ms:8.2f}ms | agents={agent_count}\n"
-                )
-                f.write(f"--- End Interaction #{self._interaction_count} ---\n\n")
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        self._enqueue(
+            f"{timestamp} | INTERACTION_COMPLETE           | {total_duration_ms:8.2f}ms | agents={agent_count}\n"
+            f"--- End Interaction #{self._interaction_count} ---\n"
+        )
 
     def get_summary(self) -> dict[str, Any]:
-        """Get summary statistics for the current session."""
-        if not self._entries:
-            return {"total_entries": 0}
-
-        phases = {}
-        for entry in self._entries:
-            if entry.phase not in phases:
-                phases[entry.phase] = []
-            phases[entry.phase].append(entry.duration_ms)
-
-        summary = {
-            "total_entries": len(self._entries),
+        """Get summary statistics (with p50/p95/p99) for the current session."""
+        with self._lock:
+            if not self._stats["recorded"]:
+                return {"total_entries": 0}
+            phases = {phase: histogram.summary() for phase, histogram in self._phases.items()}
+
+        return {
+            "total_entries": self._stats["recorded"],
             "session_duration_s": (datetime.now() - self._session_start).total_seconds(),
             "interactions": self._interaction_count,
-            "phases": {},
+            "phases": phases,
         }
 
-        for phase, durations in phases.items():
-            summary["phases"][phase] = {
-                "count": len(durations),
-                "total_ms": sum(durations),
-                "avg_ms": sum(durations) / len(durations),
-                "min_ms": min(durations),
-                "max_ms": max(durations),
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Full report for the debug endpoint: per-phase and per-agent
+        histograms plus buffer/writer counters.
+        """
+        with self._lock:
+            phases: dict[str, dict[str, Any]] = {
+                phase: {**histogram.summary(), "agents": {}} for phase, histogram in sorted(self._phases.items())
+            }
+            for (phase, agent_name), histogram in self._series.items():
+                phases[phase]["agents"][agent_name] = histogram.summary()
+            buffer = {
+                **self._stats,
+                "pending": len(self._buffer),
+                "capacity": self._buffer.maxlen,
+                "agent_series": len(self._series),
             }
 
-        return summary
+        return {
+            "enabled": self.enabled,
+            "session_duration_s": round((datetime.now() - self._session_start).total_seconds(), 1),
+            "interactions": self._interaction_count,
+            "buffer": buffer,
+            "phases": phases,
+        }
 
     async def write_summary(self):
         """Write session summary to log file."""
@@ -354,26 +511,26 @@ class PerfLogger:
             return
 
         summary = self.get_summary()
+        if not summary["total_entries"]:
+            return
 
-        async with self._lock:
-            with open(_get_log_file_path(), "a") as f:
-                f.write(f"\n{'=' * 80}\n")
-                f.write("Session Summary\n")
-                f.write(f"{'=' * 80}\n")
-                f.write(f"Total entries: {summary['total_entries']}\n")
-                f.write(f"Session duration: {summary['session_duration_s']:.2f}s\n")
-                f.write(f"Total interactions: {summary['interactions']}\n")
-                f.write("\nPhase Breakdown:\n")
-
-                for phase, stats in summary.get("phases", {}).items():
-                    f.write(f"  {phase}:\n")
-                    f.write(f"    count: {stats['count']}\n")
-                    f.write(f"    total: {stats['total_ms']:.2f}ms\n")
-                    f.write(f"    avg: {stats['avg_ms']:.2f}ms\n")
-                    f.write(f"    min: {stats['min_ms']:.2f}ms\n")
-                    f.write(f"    max: {stats['max_ms']:.2f}ms\n")
-
-                f.write(f"{'=' * 80}\n\n")
+        lines = [
+            f"\n{'=' * 80}",
+            "Session Summary",
+            f"{'=' * 80}",
+            f"Total entries: {summary['total_entries']}",
+            f"Session duration: {summary['session_duration_s']:.2f}s",
+            f"Total interactions: {summary['interactions']}",
+            "\nPhase Breakdown:",
+        ]
+        for phase, stats in summary.get("phases", {}).items():
+            lines.append(f"  {phase}:")
+            lines.append(f"    count: {stats['count']}")
+            for key in ("total", "avg", "min", "max", "p50", "p95", "p99"):
+                lines.append(f"    {key}: {stats[f'{key}_ms']:.2f}ms")
+        lines.append(f"{'=' * 80}\n")
+        self._enqueue("\n".join(lines))
+        self.flush()
 
 
 # Singleton instance
@@ -523,7 +680,8 @@ def track_perf(
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
             perf = get_perf_logger()
-            if not perf.enabled:
+            tracer = get_tracer()
+            if not perf.enabled and not tracer.enabled:
                 return await func(*args, **kwargs)
 
             # First try callable/static values
@@ -546,7 +704,8 @@ def track_perf(
             error = None
 
             try:
-                result = await func(*args, **kwargs)
+                with tracer.span(phase_name, room_id=extracted_room_id, agent_name=extracted_agent_name):
+                    result = await func(*args, **kwargs)
                 return result
             except Exception as e:
                 error = e
@@ -576,13 +735,14 @@ def track_perf(
                     extra=extra,
                 )
 
-                perf._entries.append(entry)
-                await perf._write_entry(entry)
+                if perf.enabled:
+                    perf._record(entry)
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
             perf = get_perf_logger()
-            if not perf.enabled:
+            tracer = get_tracer()
+            if not perf.enabled and not tracer.enabled:
                 return func(*args, **kwargs)
 
             # First try callable/static values
@@ -604,7 +764,8 @@ def track_perf(
             error = None
 
             try:
-                result = func(*args, **kwargs)
+                with tracer.span(phase_name, room_id=extracted_room_id, agent_name=extracted_agent_name):
+                    result = func(*args, **kwargs)
                 return result
             except Exception as e:
                 error = e
@@ -634,10 +795,8 @@ def track_perf(
                     extra=extra,
                 )
 
-                perf._entries.append(entry)
-                with open(_get_log_file_path(), "a") as f:
-                    f.write(entry.to_log_line() + "\n")
-                logger.info(f"⏱️  {entry.to_log_line()}")
+                if perf.enabled:
+                    perf._record(entry)
 
         # Return appropriate wrapper based on function type
         import asyncio
@@ -0,0 +1,269 @@
+"""
+Startup profiler for time-to-first-request analysis.
+
+Breaks backend startup down into:
+- Module imports: inclusive and self time per module, rolled up per top-level package
+- Startup steps: app creation and each lifespan step (init_db, seed_agents, ...)
+
+Enable with PROFILE_STARTUP=true, or pass --profile-startup to the launcher.
+main.py installs the profiler before anything else is imported; the report is
+logged once lifespan startup completes and is served at GET /debug/startup.
+
+This module only depends on the standard library so that installing it does
+not itself skew the import numbers.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+logger = logging.getLogger("StartupProfiler")
+
+PROFILE_STARTUP_FLAG = "--profile-startup"
+
+# Number of modules/packages shown in the text report
+REPORT_TOP_N = int(os.environ.get("PROFILE_STARTUP_TOP", "25"))
+
+
+def is_startup_profiling_requested(argv: Optional[list[str]] = None) -> bool:
+    """Check the PROFILE_STARTUP env var and the --profile-startup flag."""
+    argv = sys.argv if argv is None else argv
+    if PROFILE_STARTUP_FLAG in argv:
+        return True
+    return os.environ.get("PROFILE_STARTUP", "").lower() in ("true", "1", "yes")
+
+
+@dataclass
+class ModuleTiming:
+    """Import timing for a single module."""
+
+    name: str
+    inclusive_ms: float
+    self_ms: float
+
+
+@dataclass
+class _ImportFrame:
+    name: str
+    start: float
+    children_ms: float = 0.0
+
+
+class _TimingFinder:
+    """
+    Meta path finder that times module execution.
+
+    It resolves the spec with the remaining finders and swaps the loader's
+    exec_module for a timed wrapper on that loader instance only, so loader
+    types (and isinstance checks against them) are unchanged.
+    """
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "resolving", False):
+            return None
+
+        self._local.resolving = True
+        try:
+            spec = None
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._local.resolving = False
+
+        if spec is None or spec.loader is None or isinstance(spec.loader, type):
+            # Builtin/frozen importers are classes shared by many modules; leave them alone
+            return spec
+
+        exec_module = getattr(spec.loader, "exec_module", None)
+        if exec_module is None:
+            return spec
+
+        profiler = self._profiler
+
+        def timed_exec_module(module):
+            with profiler._time_import(fullname):
+                exec_module(module)
+
+        try:
+            spec.loader.exec_module = timed_exec_module
+        except (AttributeError, TypeError):
+            pass
+        return spec
+
+
+@dataclass
+class StartupProfiler:
+    """Collects import and startup-step timings for one process start."""
+
+    started_at: float = field(default_factory=time.perf_counter)
+    modules: dict[str, ModuleTiming] = field(default_factory=dict)
+    steps: list[tuple[str, float]] = field(default_factory=list)
+    finished_at: Optional[float] = None
+
+    def __post_init__(self):
+        self._finder: Optional[_TimingFinder] = None
+        self._stack = threading.local()
+        self._lock = threading.Lock()
+
+    # --- install / uninstall ---
+
+    def install(self) -> None:
+        """Insert the timing finder at the front of sys.meta_path."""
+        if self._finder is None:
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self) -> None:
+        """Remove the timing finder; already-wrapped loaders keep working."""
+        if self._finder is not None:
+            try:
+                sys.meta_path.remove(self._finder)
+            except ValueError:
+                pass
+            self._finder = None
+
+    # --- recording ---
+
+    @contextmanager
+    def _time_import(self, name: str) -> Iterator[None]:
+        stack = getattr(self._stack, "frames", None)
+        if stack is None:
+            stack = self._stack.frames = []
+
+        frame = _ImportFrame(name=name, start=time.perf_counter())
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            inclusive_ms = (time.perf_counter() - frame.start) * 1000
+            if stack:
+                stack[-1].children_ms += inclusive_ms
+            with self._lock:
+                self.modules[name] = ModuleTiming(
+                    name=name,
+                    inclusive_ms=inclusive_ms,
+                    self_ms=max(inclusive_ms - frame.children_ms, 0.0),
+                )
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Time a named startup step."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.steps.append((name, (time.perf_counter() - start) * 1000))
+
+    def finish(self) -> None:
+        """Mark startup complete and stop timing imports."""
+        if self.finished_at is None:
+            self.finished_at = time.perf_counter()
+        self.uninstall()
+
+    # --- reporting ---
+
+    def package_totals(self) -> dict[str, float]:
+        """Self time summed per top-level package (sums to total import time)."""
+        totals: dict[str, float] = {}
+        with self._lock:
+            for timing in self.modules.values():
+                package = timing.name.split(".", 1)[0]
+                totals[package] = totals.get(package, 0.0) + timing.self_ms
+        return dict(sorted(totals.items(), key=lambda kv: kv[1], reverse=True))
+
+    def get_report(self, top_n: int = REPORT_TOP_N) -> dict[str, Any]:
+        """Build a JSON-serializable report."""
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        with self._lock:
+            modules = sorted(self.modules.values(), key=lambda t: t.inclusive_ms, reverse=True)
+            steps = list(self.steps)
+
+        total_import_ms = sum(t.self_ms for t in modules)
+        return {
+            "complete": self.finished_at is not None,
+            "total_ms": round((end - self.started_at) * 1000, 1),
+            "import_ms": round(total_import_ms, 1),
+            "module_count": len(modules),
+            "steps": [{"name": name, "ms": round(ms, 1)} for name, ms in steps],
+            "packages": [
+                {"name": name, "self_ms": round(ms, 1)} for name, ms in list(self.package_totals().items())[:top_n]
+            ],
+            "modules": [
+                {"name": t.name, "inclusive_ms": round(t.inclusive_ms, 1), "self_ms": round(t.self_ms, 1)}
+                for t in modules[:top_n]
+            ],
+        }
+
+    def format_report(self, top_n: int = REPORT_TOP_N) -> str:
+        """Render the report as a plain-text table for the log."""
+        report = self.get_report(top_n)
+        lines = [
+            "=" * 64,
+            f"STARTUP PROFILE: {report['total_ms']:.0f}ms total, "
+            f"{report['import_ms']:.0f}ms importing {report['module_count']} modules",
+            "=" * 64,
+            "Startup steps:",
+        ]
+        for entry in report["steps"]:
+            lines.append(f"  {entry['name']:<40} {entry['ms']:>9.1f}ms")
+        lines.append("Import time by package (self):")
+        for entry in report["packages"]:
+            lines.append(f"  {entry['name']:<40} {entry['self_ms']:>9.1f}ms")
+        lines.append("Slowest modules (inclusive / self):")
+        for entry in report["modules"]:
+            lines.append(f"  {entry['name']:<40} {entry['inclusive_ms']:>9.1f}ms {entry['self_ms']:>9.1f}ms")
+        lines.append("=" * 64)
+        return "\n".join(lines)
+
+
+# Global instance, set only when profiling is enabled
+_profiler: Optional[StartupProfiler] = None
+
+
+def install_startup_profiler(argv: Optional[list[str]] = None) -> Optional[StartupProfiler]:
+    """Install the profiler if requested via env/argv. Safe to call more than once."""
+    global _profiler
+    if _profiler is None and is_startup_profiling_requested(argv):
+        _profiler = StartupProfiler()
+        _profiler.install()
+        # Profiling was asked for explicitly, so show the report even at WARNING log level
+        logger.setLevel(logging.INFO)
+    return _profiler
+
+
+def get_startup_profiler() -> Optional[StartupProfiler]:
+    """Get the active profiler, or None when profiling is disabled."""
+    return _profiler
+
+
+@contextmanager
+def startup_step(name: str) -> Iterator[None]:
+    """Time a startup step when profiling is enabled; no-op otherwise."""
+    if _profiler is None:
+        yield
+        return
+    with _profiler.step(name):
+        yield
+
+
+def finish_startup_profile() -> None:
+    """Stop import timing and log the report (no-op when disabled)."""
+    if _profiler is None or _profiler.finished_at is not None:
+        return
+    _profiler.finish()
+    logger.info("\n" + _profiler.format_report())
@@ -0,0 +1,315 @@
+"""
+Hierarchical trace spans for turn latency analysis.
+
+latency.log records flat phases. Spans add the parent/child structure:
+
+    turn -> tape cell -> SDK query -> tool call / sub-agent Task
+
+Each span carries room, world and agent attributes (inherited from its parent
+unless overridden) and is propagated through a ``contextvars.ContextVar``, so
+child tasks created inside a span (e.g. concurrent cells) nest under it.
+
+SDK tool callbacks and hooks run in the client's reader task rather than in
+the task that sent the query, so they can't see the query's span through the
+context. Spans opened with ``anchor=True`` (SDK queries) are therefore also
+registered by (room_id, agent_name), and a span with no live context parent
+attaches to the matching anchor.
+
+Completed turns are kept in memory (bounded) and exported as Chrome Trace
+Event JSON, which loads directly in Perfetto (ui.perfetto.dev) or
+chrome://tracing. Each turn is one process; each asyncio task is one track.
+
+Enable with PERF_TRACE=true. When disabled, ``span()`` returns a shared no-op
+context manager after a single flag check.
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("Tracing")
+
+TRACE_ENABLED = os.environ.get("PERF_TRACE", "").lower() in ("true", "1", "yes")
+
+# Completed/in-flight traces kept in memory (oldest dropped first)
+MAX_TRACES = 100
+
+# Spans kept per trace; further spans are counted as dropped
+MAX_SPANS_PER_TRACE = 5000
+
+# Attributes inherited from the parent span
+INHERITED_ATTRS = ("room_id", "world_id", "agent_name")
+
+_NOOP = nullcontext()
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+
+    name: str
+    span_id: int
+    trace_id: int
+    parent_id: Optional[int]
+    start_us: int
+    lane: str
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    end_us: Optional[int] = None
+
+    @property
+    def ended(self) -> bool:
+        return self.end_us is not None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_us if self.end_us is not None else _now_us()
+        return (end - self.start_us) / 1000
+
+
+@dataclass
+class _Trace:
+    trace_id: int
+    root: Span
+    spans: List[Span] = field(default_factory=list)
+    dropped: int = 0
+
+
+def _now_us() -> int:
+    return time.perf_counter_ns() // 1000
+
+
+def _lane() -> str:
+    """Track name for the current asyncio task (or thread)."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return task.get_name()
+    return threading.current_thread().name
+
+
+class Tracer:
+    """Records spans per trace and exports them as Chrome Trace Event JSON."""
+
+    def __init__(self, enabled: bool = TRACE_ENABLED, max_traces: int = MAX_TRACES):
+        self.enabled = enabled
+        self._max_traces = max_traces
+        self._traces: OrderedDict[int, _Trace] = OrderedDict()
+        self._anchors: Dict[Tuple[Any, Any], Span] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def span(self, name: str, *, anchor: bool = False, **attrs):
+        """
+        Context manager recording a span around a block (sync or async code).
+
+        Args:
+            name: Span name (e.g., "turn", "cell", "sdk_query", "tool:travel")
+            anchor: Register the span by (room_id, agent_name) so callbacks
+                running outside this context (SDK tools, hooks) nest under it
+            **attrs: Span attributes; room_id, world_id and agent_name are
+                inherited from the parent when not given
+        """
+        if not self.enabled:
+            return _NOOP
+        return self._span(name, anchor, attrs)
+
+    @contextmanager
+    def _span(self, name: str, anchor: bool, attrs: Dict[str, Any]) -> Iterator[Span]:
+        span = self.start_span(name, anchor=anchor, **attrs)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.attrs["error"] = type(e).__name__
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+    def start_span(self, name: str, *, anchor: bool = False, parent: Optional[Span] = None, **attrs) -> Optional[Span]:
+        """
+        Start a span without making it current (for start/stop callback pairs).
+
+        ``parent`` nests the span under an explicit (unfinished) span instead of
+        the current or anchored one. Returns None when tracing is disabled.
+        Finish with ``end_span``.
+        """
+        if not self.enabled:
+            return None
+
+        if parent is None or parent.ended:
+            parent = self._resolve_parent(attrs)
+        if parent is not None:
+            for key in INHERITED_ATTRS:
+                if attrs.get(key) is None and parent.attrs.get(key) is not None:
+                    attrs[key] = parent.attrs[key]
+        attrs = {k: v for k, v in attrs.items() if v is not None}
+
+        span_id = next(self._ids)
+        span = Span(
+            name=name,
+            span_id=span_id,
+            trace_id=parent.trace_id if parent else span_id,
+            parent_id=parent.span_id if parent else None,
+            start_us=_now_us(),
+            lane=_lane(),
+            attrs=attrs,
+        )
+
+        with self._lock:
+            if parent is None:
+                self._traces[span.trace_id] = _Trace(trace_id=span.trace_id, root=span)
+                while len(self._traces) > self._max_traces:
+                    self._traces.popitem(last=False)
+            if anchor:
+                self._anchors[(attrs.get("room_id"), attrs.get("agent_name"))] = span
+        return span
+
+    def end_span(self, span: Optional[Span], **attrs) -> None:
+        """Finish a span (no-op for None or an already finished span)."""
+        if span is None or span.ended:
+            return
+        span.end_us = _now_us()
+        span.attrs.update(attrs)
+
+        with self._lock:
+            key = (span.attrs.get("room_id"), span.attrs.get("agent_name"))
+            if self._anchors.get(key) is span:
+                del self._anchors[key]
+            trace = self._traces.get(span.trace_id)
+            if trace is None:
+                return
+            if len(trace.spans) < MAX_SPANS_PER_TRACE:
+                trace.spans.append(span)
+            else:
+                trace.dropped += 1
+
+    def _resolve_parent(self, attrs: Dict[str, Any]) -> Optional[Span]:
+        current = _current_span.get()
+        if current is not None and not current.ended:
+            return current
+        room_id, agent_name = attrs.get("room_id"), attrs.get("agent_name")
+        if room_id is None or agent_name is None:
+            return None
+        with self._lock:
+            return self._anchors.get((room_id, agent_name))
+
+    def current_span(self) -> Optional[Span]:
+        """The span active in this context, if any."""
+        return _current_span.get()
+
+    def list_traces(self) -> List[Dict[str, Any]]:
+        """Summaries of retained traces, newest first."""
+        with self._lock:
+            traces = list(self._traces.values())
+        return [
+            {
+                "trace_id": t.trace_id,
+                "name": t.root.name,
+                **t.root.attrs,
+                "duration_ms": round(t.root.duration_ms, 1),
+                "finished": t.root.ended,
+                "spans": len(t.spans),
+                "dropped": t.dropped,
+            }
+            for t in reversed(traces)
+        ]
+
+    def export_chrome_trace(
+        self,
+        trace_ids: Optional[List[int]] = None,
+        room_id: Optional[int] = None,
+        world_id: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Export traces as Chrome Trace Event JSON.
+
+        Args:
+            trace_ids: Traces to export (default: all retained traces)
+            room_id: Only traces whose root span has this room
+            world_id: Only traces whose root span has this world
+
+        Returns:
+            {"traceEvents": [...], "displayTimeUnit": "ms"}
+        """
+        with self._lock:
+            traces = [t for t in self._traces.values() if trace_ids is None or t.trace_id in trace_ids]
+            traces = [(t, list(t.spans)) for t in traces]
+
+        events: List[Dict[str, Any]] = []
+        for trace, spans in traces:
+            root_attrs = trace.root.attrs
+            if room_id is not None and root_attrs.get("room_id") != room_id:
+                continue
+            if world_id is not None and root_attrs.get("world_id") != world_id:
+                continue
+
+            pid = trace.trace_id
+            label = " ".join(f"{k}={root_attrs[k]}" for k in ("world_id", "room_id", "turn") if k in root_attrs)
+            events.append(
+                {
+                    "ph": "M",
+                    "name": "process_name",
+                    "pid": pid,
+                    "tid": 0,
+                    "args": {"name": f"{trace.root.name} {label}"},
+                }
+            )
+
+            if not trace.root.ended:
+                # Include the in-flight root so a running turn is still viewable
+                spans.append(trace.root)
+
+            lanes: Dict[str, int] = {}
+            for span in sorted(spans, key=lambda s: s.start_us):
+                tid = lanes.get(span.lane)
+                if tid is None:
+                    tid = lanes[span.lane] = len(lanes) + 1
+                    events.append(
+                        {"ph": "M", "name": "thread_name", "pid": pid, "tid": tid, "args": {"name": span.lane}}
+                    )
+                end_us = span.end_us if span.end_us is not None else _now_us()
+                events.append(
+                    {
+                        "ph": "X",
+                        "name": span.name,
+                        "cat": span.name.split(":", 1)[0],
+                        "pid": pid,
+                        "tid": tid,
+                        "ts": span.start_us,
+                        "dur": end_us - span.start_us,
+                        "args": {"span_id": span.span_id, "parent_id": span.parent_id, **span.attrs},
+                    }
+                )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def clear(self) -> None:
+        """Drop all retained traces."""
+        with self._lock:
+            self._traces.clear()
+            self._anchors.clear()
+
+
+# Singleton instance
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Get the singleton tracer instance."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
@@ -0,0 +1,117 @@
+"""
+In-memory per-room interaction counters and pause state.
+
+TapeExecutor checks the room's pause flag and interaction limit before every
+cell. Reading those from the room row means a cache lookup (and on a miss, a
+room query) plus a COUNT over the room's messages, once per cell. Instead,
+each room's state is seeded from the database once and then kept current by
+the writers:
+
+- crud message creation calls ``record_messages`` after each commit
+- crud room updates call ``room_updated`` (the pause change notification)
+- message/room deletion calls ``forget`` so the next read re-seeds
+
+Checks are then O(1) dict reads. Like the cache, every critical section is
+pure dict work under one ``threading.Lock`` with no ``await`` inside.
+"""
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Iterable, Optional
+
+logger = logging.getLogger("RoomState")
+
+# Max rooms tracked; least recently used rooms are re-seeded on next access
+MAX_TRACKED_ROOMS = 2000
+
+
+@dataclass
+class RoomLimits:
+    """Pause flag, interaction limit and agent message count for one room."""
+
+    is_paused: bool
+    max_interactions: Optional[int]
+    interaction_count: int
+
+    @property
+    def limit_reached(self) -> bool:
+        return self.max_interactions is not None and self.interaction_count >= self.max_interactions
+
+
+class RoomStateRegistry:
+    """Tracks RoomLimits per room, updated incrementally by the CRUD layer."""
+
+    def __init__(self, max_rooms: int = MAX_TRACKED_ROOMS):
+        self._rooms: OrderedDict[int, RoomLimits] = OrderedDict()
+        self._max_rooms = max_rooms
+        self._lock = Lock()
+        self._stats = {"hits": 0, "seeds": 0}
+
+    def get(self, room_id: int) -> Optional[RoomLimits]:
+        """Get a copy of the tracked state, or None if the room isn't seeded."""
+        with self._lock:
+            limits = self._rooms.get(room_id)
+            if limits is None:
+                return None
+            self._rooms.move_to_end(room_id)
+            self._stats["hits"] += 1
+            return RoomLimits(limits.is_paused, limits.max_interactions, limits.interaction_count)
+
+    def seed(self, room_id: int, limits: RoomLimits) -> RoomLimits:
+        """
+        Start tracking a room from a database snapshot.
+
+        If another coroutine seeded the room first, its state wins, since it
+        may already include increments this snapshot missed.
+        """
+        with self._lock:
+            existing = self._rooms.get(room_id)
+            if existing is not None:
+                return RoomLimits(existing.is_paused, existing.max_interactions, existing.interaction_count)
+            self._rooms[room_id] = limits
+            self._stats["seeds"] += 1
+            while len(self._rooms) > self._max_rooms:
+                self._rooms.popitem(last=False)
+            return RoomLimits(limits.is_paused, limits.max_interactions, limits.interaction_count)
+
+    def record_messages(self, room_id: int, count: int = 1) -> None:
+        """Count newly committed agent (assistant-role) messages."""
+        with self._lock:
+            limits = self._rooms.get(room_id)
+            if limits is not None:
+                limits.interaction_count += count
+
+    def room_updated(self, room_id: int, is_paused: bool, max_interactions: Optional[int]) -> None:
+        """Apply a committed pause/limit change."""
+        with self._lock:
+            limits = self._rooms.get(room_id)
+            if limits is not None:
+                limits.is_paused = is_paused
+                limits.max_interactions = max_interactions
+        logger.debug(f"Room {room_id} updated | paused={is_paused} | max_interactions={max_interactions}")
+
+    def forget(self, room_ids: Iterable[int]) -> None:
+        """Stop tracking rooms (their messages were deleted or the rooms removed)."""
+        with self._lock:
+            for room_id in room_ids:
+                self._rooms.pop(room_id, None)
+
+    def clear(self) -> None:
+        """Stop tracking all rooms."""
+        with self._lock:
+            self._rooms.clear()
+
+    def get_stats(self) -> dict:
+        """Get tracked room count and hit/seed counters."""
+        with self._lock:
+            return {**self._stats, "size": len(self._rooms)}
+
+
+_registry = RoomStateRegistry()
+
+
+def get_room_state() -> RoomStateRegistry:
+    """Get the global room state registry."""
+    return _registry
@@ -356,6 +356,10 @@ def main():
     # Check for --browser flag (skip pywebview, use browser directly)
     use_browser = "--browser" in sys.argv
 
+    # --profile-startup logs an import/lifespan time breakdown once the server is ready
+    if "--profile-startup" in sys.argv:
+        os.environ["PROFILE_STARTUP"] = "true"
+
     # Run environment setup (including first-time wizard if needed)
     setup_was_run = setup_environment()
 
@@ -418,4 +422,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the image compression process pool in the frozen (PyInstaller) build
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     main()
@@ -3,12 +3,21 @@ claudeworld API - Multi-Claude chat room application.
 
 This is the main entry point for the FastAPI application.
 All application configuration and setup is handled by the app factory.
+
+Set PROFILE_STARTUP=true (or pass --profile-startup to the launcher) to log a
+breakdown of import and lifespan time once startup completes.
 """
 
+# Installed before any other import so the profile covers the whole import graph
+from infrastructure.logging.startup_profiler import install_startup_profiler, startup_step
+
+install_startup_profiler()
+
 from core import get_settings, setup_logging
 from core.app_factory import create_app
 
 settings = get_settings()
 setup_logging(debug_mode=settings.debug_agents)
 
-app = create_app()
+with startup_step("create_app"):
+    app = create_app()
@@ -15,8 +15,10 @@ import time
 from typing import Dict, List, Optional
 
 import crud
+from core import get_settings
 from domain.value_objects.contexts import OrchestrationContext
 from infrastructure.database import models
+from infrastructure.logging.tracing import get_tracer
 from sdk import AgentManager
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -27,12 +29,14 @@ from .tape.models import CellType, TurnCell, TurnTape
 logger = logging.getLogger("ChatModeOrchestrator")
 
 
-def create_chat_mode_tape(npcs: List[models.Agent]) -> Optional[TurnTape]:
+def create_chat_mode_tape(npcs: List[models.Agent], parallel: bool = False) -> Optional[TurnTape]:
     """
     Create a tape for chat mode NPC responses.
 
     Args:
         npcs: List of NPC agents at the current location
+        parallel: If True, regular NPCs respond in one concurrent cell instead of
+            one sequential cell each (they won't see each other's replies)
 
     Returns:
         TurnTape for chat mode, or None if no NPCs
@@ -49,15 +53,24 @@ def create_chat_mode_tape(npcs: List[models.Agent]) -> Optional[TurnTape]:
     # Sort regular agents by priority (higher first)
     regular_agents.sort(key=lambda a: a.priority, reverse=True)
 
-    # Add regular agents as sequential cells (one per agent)
-    # Each agent gets its own cell to ensure sequential execution and prevent interaction
-    for agent in regular_agents:
+    if parallel and len(regular_agents) > 1:
+        # One concurrent cell; results are still collected in priority order
         tape.cells.append(
             TurnCell(
-                cell_type=CellType.SEQUENTIAL,
-                agent_ids=[agent.id],
+                cell_type=CellType.CONCURRENT,
+                agent_ids=[a.id for a in regular_agents],
             )
         )
+    else:
+        # Add regular agents as sequential cells (one per agent)
+        # Each agent gets its own cell to ensure sequential execution and prevent interaction
+        for agent in regular_agents:
+            tape.cells.append(
+                TurnCell(
+                    cell_type=CellType.SEQUENTIAL,
+                    agent_ids=[agent.id],
+                )
+            )
 
     # Add interrupt agents (always respond) as sequential cells
     # Sort by priority (higher first)
@@ -71,7 +84,8 @@ def create_chat_mode_tape(npcs: List[models.Agent]) -> Optional[TurnTape]:
         )
 
     logger.info(
-        f"Created chat mode tape: {len(regular_agents)} regular NPCs (sequential), {len(interrupt_agents)} interrupt NPCs"
+        f"Created chat mode tape: {len(regular_agents)} regular NPCs "
+        f"({'concurrent' if parallel else 'sequential'}), {len(interrupt_agents)} interrupt NPCs"
     )
     return tape
 
@@ -162,7 +176,7 @@ class ChatModeOrchestrator:
         agents_by_id = {a.id: a for a in npcs}
 
         # Create tape for NPC responses
-        tape = create_chat_mode_tape(npcs)
+        tape = create_chat_mode_tape(npcs, parallel=get_settings().chat_mode_parallel_npcs)
         if tape is None:
             return True
 
@@ -173,14 +187,17 @@ class ChatModeOrchestrator:
             max_total_messages=15,  # Lower limit for chat mode
         )
 
+        async def run_tape():
+            # Root trace span for this chat turn
+            with get_tracer().span("chat_turn", room_id=room_id, world_id=world_id, chat_session_id=chat_session_id):
+                return await executor.execute(
+                    tape=tape,
+                    orch_context=orch_context,
+                    user_message_content=message_text,
+                )
+
         # Create processing task
-        processing_task = asyncio.create_task(
-            executor.execute(
-                tape=tape,
-                orch_context=orch_context,
-                user_message_content=message_text,
-            )
-        )
+        processing_task = asyncio.create_task(run_tape())
 
         # Track task for cancellation
         self.active_room_tasks[room_id] = processing_task
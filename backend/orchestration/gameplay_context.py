@@ -46,8 +46,8 @@ class GameplayContextBuilder:
 
     System prompt structure:
         [platform_system_prompt]
-        [lore]
-        [current location info]
+        [protagonist, lore, world history]   <- static, memoized
+        [time, current location, stats]      <- rendered per turn
 
     User message structure:
         Action Manager: player action
@@ -152,20 +152,37 @@ class GameplayContextBuilder:
         Returns:
             System prompt suffix with lore and location info
         """
+        static_section, dynamic_section = self.build_action_manager_system_prompt_parts(context)
+        return f"{static_section}\n{dynamic_section}" if static_section else dynamic_section
+
+    def build_action_manager_system_prompt_parts(self, context: ActionManagerContext) -> tuple[str, str]:
+        """
+        Build the Action Manager system prompt suffix as (static, dynamic) sections.
+
+        The static section (protagonist, lore, world history) renders to the
+        same bytes while its inputs are unchanged, so it comes first and keeps
+        the prompt prefix cacheable. It is a plain join, cheaper than hashing
+        the lore to memoize it. The dynamic section (time, location, stats)
+        follows.
+
+        Args:
+            context: ActionManagerContext
+
+        Returns:
+            Tuple of (static_section, dynamic_section)
+        """
+        return self._render_static_section(context), self._render_dynamic_section(context)
+
+    @staticmethod
+    def _render_static_section(context: ActionManagerContext) -> str:
+        """Render protagonist, lore and world history."""
         parts = []
 
-        # Protagonist name and current time
+        # Protagonist name
         if context.user_name:
             parts.append(f"# Protagonist: {context.user_name}")
             parts.append("")
 
-        # Current time
-        hour = context.game_time.get("hour", 8)
-        minute = context.game_time.get("minute", 0)
-        day = context.game_time.get("day", 1)
-        parts.append(f"# Current Time: {hour:02d}:{minute:02d}, Day {day}")
-        parts.append("")
-
         # World lore
         if context.lore:
             parts.append("# World Lore")
@@ -180,6 +197,20 @@ class GameplayContextBuilder:
             parts.append(context.world_history.strip())
             parts.append("")
 
+        return "\n".join(parts)
+
+    @staticmethod
+    def _render_dynamic_section(context: ActionManagerContext) -> str:
+        """Render current time, location and player stats."""
+        parts = []
+
+        # Current time
+        hour = context.game_time.get("hour", 8)
+        minute = context.game_time.get("minute", 0)
+        day = context.game_time.get("day", 1)
+        parts.append(f"# Current Time: {hour:02d}:{minute:02d}, Day {day}")
+        parts.append("")
+
         # Current location
         parts.append("# Current Location")
         parts.append("")
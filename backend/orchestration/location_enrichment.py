@@ -0,0 +1,352 @@
+"""
+Background enrichment of draft locations near the player.
+
+A draft location (``is_draft``) exists on the map but still awaits a design
+from the Location Designer. Left alone, the Action Manager designs it inline
+with a Task call on the turn the player travels there, and the player waits
+for it. After each gameplay turn, ``LocationEnricher.schedule`` ranks the
+drafts adjacent to the player's current location by how likely the player is
+to go there next, and runs a Location Designer job for the top candidates:
+
+- Ranking: a draft named in the current action suggestions ranks highest,
+  then one mentioned in the current location's description, then nearer
+  positions on the map.
+- Low priority: jobs wait while the world has a running or queued turn, and
+  at most ``concurrency`` jobs run at once across all worlds.
+- Persistence goes through ``persist_location_design``, which enriches a draft
+  in place (filesystem and database) and clears its draft flag.
+
+Arrivals are counted, so the stats show how often the player reached a
+location that had already been enriched in the background.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from domain.entities.agent import is_action_manager
+from domain.entities.agent_config import AgentConfigData
+from domain.entities.world_models import LocationConfig
+from domain.value_objects import TaskIdentifier
+from domain.value_objects.contexts import AgentResponseContext
+from infrastructure.background import spawn_background
+from infrastructure.database.connection import background_session
+from infrastructure.logging.perf_logger import LatencyHistogram, get_perf_logger
+from sdk import AgentManager
+from sdk.client.connection_admission import ConnectionPriority, connection_priority
+
+logger = logging.getLogger("LocationEnrichment")
+
+# Standalone agent name for background jobs (its tools come from group_subagent's config)
+LOCATION_DESIGNER_AGENT = "Location_Designer"
+LOCATION_DESIGNER_GROUP = "subagent"
+
+# Pool key agent id for enrichment jobs; negative so it never matches a database agent id,
+# which keeps the job off the destination room's pooled Action Manager client
+ENRICHMENT_POOL_AGENT_ID = -1
+
+# Seconds between checks while the world has a turn running or queued
+IDLE_POLL_SECONDS = 0.5
+
+# Ranking weights
+SUGGESTION_WEIGHT = 3.0
+DESCRIPTION_WEIGHT = 1.0
+
+
+def _mentioned(location: LocationConfig, texts: List[str]) -> bool:
+    """Whether any text names the location (folder name or display name)."""
+    names = {location.name.replace("_", " ").lower(), (location.display_name or "").strip().lower()}
+    names.discard("")
+    return any(name in text.lower() for text in texts for name in names)
+
+
+def _distance(a: LocationConfig, b: LocationConfig) -> float:
+    try:
+        return math.dist(tuple(a.position)[:2], tuple(b.position)[:2])
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def rank_enrichment_candidates(
+    current: LocationConfig,
+    locations: Dict[str, LocationConfig],
+    suggestions: List[str],
+) -> List[Tuple[str, float]]:
+    """
+    Rank draft locations adjacent to the current one by likelihood of travel.
+
+    Args:
+        current: The player's current location
+        locations: All locations in the world, by name
+        suggestions: The action suggestions currently offered to the player
+
+    Returns:
+        (location name, score) pairs, most likely first
+    """
+    ranked = []
+    for name, location in locations.items():
+        if name == current.name or not location.is_draft:
+            continue
+        if name not in current.adjacent and current.name not in location.adjacent:
+            continue
+        score = 1.0 / (1.0 + _distance(current, location))
+        if _mentioned(location, suggestions):
+            score += SUGGESTION_WEIGHT
+        if _mentioned(location, [current.description]):
+            score += DESCRIPTION_WEIGHT
+        ranked.append((name, round(score, 3)))
+    return sorted(ranked, key=lambda pair: (-pair[1], pair[0]))
+
+
+def build_enrichment_prompt(world_name: str, location: LocationConfig, current: LocationConfig) -> str:
+    """Task-style request for the Location Designer to enrich one draft."""
+    from services.world_service import WorldService
+
+    lore = WorldService.load_lore(world_name)
+    position = tuple(location.position)[:2] if location.position else (0, 0)
+    adjacent = ", ".join(location.adjacent) if location.adjacent else current.name
+    draft = location.description.strip() or "(no description yet)"
+    return f"""Enrich draft location "{location.name}" ({location.display_name}), adjacent to "{current.name}".
+It already exists on the map as a placeholder; design it fully now so it is ready when the player arrives.
+
+## World Lore
+{lore[:2000] or "(none)"}
+
+## Draft
+{draft}
+
+## Requirements
+- Call persist_location_design with name "{location.name}" exactly
+- Keep position ({position[0]}, {position[1]}) and adjacency: {adjacent}
+- Build on the draft; do not contradict it"""
+
+
+class LocationEnricher:
+    """Runs low-priority Location Designer jobs for drafts next to the player."""
+
+    def __init__(self, enabled: bool = False, concurrency: int = 1, max_candidates: int = 2, max_defer: float = 120.0):
+        """
+        Args:
+            enabled: Whether turns schedule enrichment at all
+            concurrency: Max jobs running at once across all worlds
+            max_candidates: Drafts enriched per turn (top ranked)
+            max_defer: Seconds a job waits for its world to go idle before giving up
+        """
+        self.enabled = enabled
+        self.concurrency = concurrency
+        self.max_candidates = max_candidates
+        self.max_defer = max_defer
+        self._slots = asyncio.Semaphore(concurrency)
+        self._planning: Dict[int, asyncio.Task] = {}
+        self._in_flight: set[Tuple[int, str]] = set()
+        self._enriched: Dict[int, set[str]] = {}  # world_id -> locations enriched in the background
+        self._job_ms = LatencyHistogram()
+        self._counters = {
+            "scheduled": 0,
+            "enriched": 0,
+            "already_enriched": 0,
+            "deferred_out": 0,
+            "failed": 0,
+            "arrivals": 0,
+            "arrivals_enriched": 0,
+            "arrivals_draft": 0,
+        }
+
+    def schedule(self, world_id: int, world_name: str, agent_manager: AgentManager) -> bool:
+        """
+        Plan enrichment for the drafts around the player in the background.
+
+        Returns:
+            True if planning was started, False if disabled or already planning
+        """
+        if not self.enabled:
+            return False
+        task = self._planning.get(world_id)
+        if task and not task.done():
+            return False
+        self._planning[world_id] = spawn_background(
+            self._plan(world_id, world_name, agent_manager),
+            name=f"plan_location_enrichment:world={world_id}",
+        )
+        return True
+
+    async def _plan(self, world_id: int, world_name: str, agent_manager: AgentManager) -> None:
+        """Rank candidates and start a job for each of the top ones not already running."""
+        from services.location_storage import LocationStorage
+        from services.player_service import PlayerService
+        from services.room_mapping_service import RoomMappingService
+
+        def load() -> Tuple[Optional[LocationConfig], Dict[str, LocationConfig], List[str]]:
+            state = PlayerService.load_player_state(world_name)
+            locations = LocationStorage.load_all_locations(world_name)
+            current = locations.get(state.current_location) if state and state.current_location else None
+            return current, locations, RoomMappingService.load_suggestions(world_name)
+
+        current, locations, suggestions = await asyncio.to_thread(load)
+        if current is None:
+            return
+
+        ranked = rank_enrichment_candidates(current, locations, suggestions)
+        for name, score in ranked[: self.max_candidates]:
+            if (world_id, name) in self._in_flight:
+                continue
+            self._in_flight.add((world_id, name))
+            self._counters["scheduled"] += 1
+            logger.info(f"Scheduling enrichment of draft '{name}' in world '{world_name}' (score={score})")
+            spawn_background(
+                self._run_job(world_id, world_name, locations[name], current, agent_manager),
+                name=f"enrich_location:world={world_id}:{name}",
+            )
+
+    async def _wait_until_idle(self, world_id: int) -> bool:
+        """Wait until the world has no running or queued turn; False if that takes too long."""
+        from orchestration.turn_scheduler import get_turn_scheduler
+
+        deadline = time.monotonic() + self.max_defer
+        while True:
+            status = get_turn_scheduler().get_queue_status(world_id)
+            if not status["running"] and not status["pending"]:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(IDLE_POLL_SECONDS)
+
+    async def _run_job(
+        self,
+        world_id: int,
+        world_name: str,
+        location: LocationConfig,
+        current: LocationConfig,
+        agent_manager: AgentManager,
+    ) -> None:
+        try:
+            if not await self._wait_until_idle(world_id):
+                self._counters["deferred_out"] += 1
+                return
+            async with self._slots:
+                # Turns that started while waiting for a slot go first
+                if not await self._wait_until_idle(world_id):
+                    self._counters["deferred_out"] += 1
+                    return
+                await self._enrich(world_id, world_name, location, current, agent_manager)
+        except Exception as e:
+            self._counters["failed"] += 1
+            logger.warning(f"Enrichment of '{location.name}' in world '{world_name}' failed: {e}")
+        finally:
+            self._in_flight.discard((world_id, location.name))
+
+    async def _enrich(
+        self,
+        world_id: int,
+        world_name: str,
+        location: LocationConfig,
+        current: LocationConfig,
+        agent_manager: AgentManager,
+    ) -> None:
+        """Run the Location Designer for one draft; it persists via persist_location_design."""
+        import crud
+        from sdk.agent.task_subagent_definitions import build_subagent_definition
+        from sdk.client.mcp_registry import get_mcp_registry
+        from services.location_storage import LocationStorage
+
+        start = time.perf_counter()
+        async with background_session() as db:
+            db_location = await crud.get_location_by_name(db, world_id, location.name)
+            if db_location is None or not db_location.is_draft:
+                self._counters["already_enriched"] += 1
+                return
+
+            # The job speaks as the location room's Action Manager but pools under its own key
+            agents = await crud.get_agents_cached(db, db_location.room_id)
+            manager = next((a for a in agents if is_action_manager(a.name)), None)
+            definition = build_subagent_definition("location_designer")
+            if manager is None or definition is None:
+                self._counters["failed"] += 1
+                return
+
+            task_id = TaskIdentifier(room_id=db_location.room_id, agent_id=ENRICHMENT_POOL_AGENT_ID)
+            context = AgentResponseContext(
+                system_prompt=definition.prompt,
+                user_message=build_enrichment_prompt(world_name, location, current),
+                agent_name=LOCATION_DESIGNER_AGENT,
+                config=AgentConfigData(),
+                room_id=db_location.room_id,
+                agent_id=manager.id,
+                group_name=LOCATION_DESIGNER_GROUP,
+                task_id=task_id,
+                world_name=world_name,
+                db=db,
+                world_id=world_id,
+                hidden=True,
+            )
+            try:
+                with connection_priority(ConnectionPriority.BACKGROUND):
+                    async for _event in agent_manager.generate_sdk_response(context):
+                        pass
+            finally:
+                # One-off job: release the client and the tool config bound to this session
+                await agent_manager.client_pool.cleanup(task_id)
+                get_mcp_registry().invalidate_cache(agent_name=LOCATION_DESIGNER_AGENT)
+
+        enriched = LocationStorage.load_location(world_name, location.name)
+        duration_ms = (time.perf_counter() - start) * 1000
+        if enriched is None or enriched.is_draft:
+            self._counters["failed"] += 1
+            logger.warning(f"Location Designer did not persist draft '{location.name}' in world '{world_name}'")
+            return
+
+        self._counters["enriched"] += 1
+        self._enriched.setdefault(world_id, set()).add(location.name)
+        self._job_ms.record(duration_ms)
+        get_perf_logger().log_sync(
+            "location_enrichment",
+            duration_ms,
+            LOCATION_DESIGNER_AGENT,
+            db_location.room_id,
+            world_id=world_id,
+            location=location.name,
+        )
+
+    def record_arrival(self, world_id: int, location_name: str, is_draft: bool) -> None:
+        """Count a travel arrival, and whether its location was enriched in the background."""
+        self._counters["arrivals"] += 1
+        if is_draft:
+            self._counters["arrivals_draft"] += 1
+        elif location_name in self._enriched.get(world_id, ()):
+            self._counters["arrivals_enriched"] += 1
+
+    def forget_world(self, world_id: int) -> None:
+        """Drop a world's background-enriched set (e.g., on world reset)."""
+        self._enriched.pop(world_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Configuration, job counters, arrival counters and job duration percentiles."""
+        return {
+            "enabled": self.enabled,
+            "concurrency": self.concurrency,
+            "max_candidates": self.max_candidates,
+            "in_flight": len(self._in_flight),
+            **self._counters,
+            "job": self._job_ms.summary(),
+        }
+
+
+# Global singleton
+_location_enricher: Optional[LocationEnricher] = None
+
+
+def get_location_enricher() -> LocationEnricher:
+    """Get or create the global location enricher, configured from settings."""
+    global _location_enricher
+    if _location_enricher is None:
+        from core import get_settings
+
+        settings = get_settings()
+        _location_enricher = LocationEnricher(
+            enabled=settings.location_enrichment_enabled,
+            concurrency=settings.location_enrichment_concurrency,
+            max_candidates=settings.location_enrichment_candidates,
+        )
+    return _location_enricher
@@ -25,8 +25,9 @@ from domain.value_objects.enums import ConversationMode, MessageRole, WorldPhase
 from i18n.timezone import format_kst_timestamp
 from infrastructure.background import run_uninterruptible
 from infrastructure.logging.perf_logger import get_perf_logger
+from infrastructure.logging.tracing import get_tracer
 from services.player_service import PlayerService
-from services.prompt_builder import build_runtime_system_prompt
+from services.prompt_builder import build_runtime_system_prompt, record_prompt_prefix
 from services.world_service import WorldService
 from utils.helpers import get_pool_key
 
@@ -221,6 +222,7 @@ class ResponseGenerator:
         )
         message_to_agent = None
         gameplay_system_prompt_suffix = ""
+        gameplay_static_section = ""
 
         # Action Manager needs: is_game AND user_message_content
         # Note: is_action_mgr is computed earlier for context building
@@ -228,11 +230,27 @@ class ResponseGenerator:
 
         if should_build_am_context:
             gameplay_ctx_start = time.perf_counter()
-            context_builder = GameplayContextBuilder(world_name)
+            prepared = orch_context.prepared_turn
+            if prepared and prepared.agent_id == agent.id:
+                # Prepared while the player was typing (single use)
+                orch_context.prepared_turn = None
+                context_builder = prepared.builder
+                gameplay_static_section = prepared.static_section
+                gameplay_dynamic_section = prepared.dynamic_section
+            else:
+                prepared = None
+                context_builder = GameplayContextBuilder(world_name)
 
-            # Action Manager: system prompt gets lore + location + present characters (loaded from world)
-            am_context = context_builder.build_action_manager_context()
-            gameplay_system_prompt_suffix = context_builder.build_action_manager_system_prompt(am_context)
+                # Action Manager: system prompt gets lore + location + present characters (loaded from world)
+                am_context = context_builder.build_action_manager_context()
+                gameplay_static_section, gameplay_dynamic_section = (
+                    context_builder.build_action_manager_system_prompt_parts(am_context)
+                )
+            gameplay_system_prompt_suffix = (
+                f"{gameplay_static_section}\n{gameplay_dynamic_section}"
+                if gameplay_static_section
+                else gameplay_dynamic_section
+            )
             message_to_agent = context_builder.build_action_manager_user_message(
                 user_message_content, agent.name, npc_reactions=npc_reactions
             )
@@ -244,6 +262,7 @@ class ResponseGenerator:
                 orch_context.room_id,
                 type="action_manager",
                 npc_reaction_count=len(npc_reactions) if npc_reactions else 0,
+                prepared=prepared is not None,
             )
             logger.info(
                 f"[Gameplay] Built Action Manager context for world '{world_name}' "
@@ -273,19 +292,17 @@ class ResponseGenerator:
         # 3. Other agents: use stored prompt as-is
         sys_prompt_start = time.perf_counter()
         effective_system_prompt = agent.system_prompt
+        # Static prefix: the part of the prompt that should be byte-identical across turns
+        static_prefix = agent.system_prompt
+        prompt_type = "default"
+        prompt_extra = {}
 
         if gameplay_system_prompt_suffix:
             # Gameplay agents get lore appended as suffix (existing behavior)
             effective_system_prompt = f"{agent.system_prompt}\n\n{gameplay_system_prompt_suffix}"
-            sys_prompt_ms = (time.perf_counter() - sys_prompt_start) * 1000
-            perf.log_sync(
-                "build_system_prompt",
-                sys_prompt_ms,
-                agent.name,
-                orch_context.room_id,
-                type="gameplay_suffix",
-                prompt_len=len(effective_system_prompt),
-            )
+            if gameplay_static_section:
+                static_prefix = f"{agent.system_prompt}\n\n{gameplay_static_section}"
+            prompt_type = "gameplay_suffix"
         elif is_chat_mode and world_name and not is_action_mgr:
             # Chat mode NPCs: build runtime prompt with lore injected in the middle
             # Structure: [platform_guideline] -> [lore] -> [character_traits]
@@ -296,37 +313,25 @@ class ResponseGenerator:
                     config_data=agent_config,
                     lore=lore,
                 )
-                sys_prompt_ms = (time.perf_counter() - sys_prompt_start) * 1000
-                perf.log_sync(
-                    "build_system_prompt",
-                    sys_prompt_ms,
-                    agent.name,
-                    orch_context.room_id,
-                    type="chat_mode_lore",
-                    lore_len=len(lore),
-                    prompt_len=len(effective_system_prompt),
-                )
+                static_prefix = effective_system_prompt
+                prompt_type = "chat_mode_lore"
+                prompt_extra = {"lore_len": len(lore)}
                 logger.info(f"[ChatMode] Built runtime system prompt for '{agent.name}' with lore ({len(lore)} chars)")
-            else:
-                sys_prompt_ms = (time.perf_counter() - sys_prompt_start) * 1000
-                perf.log_sync(
-                    "build_system_prompt",
-                    sys_prompt_ms,
-                    agent.name,
-                    orch_context.room_id,
-                    type="default",
-                    prompt_len=len(effective_system_prompt),
-                )
-        else:
-            sys_prompt_ms = (time.perf_counter() - sys_prompt_start) * 1000
-            perf.log_sync(
-                "build_system_prompt",
-                sys_prompt_ms,
-                agent.name,
-                orch_context.room_id,
-                type="default",
-                prompt_len=len(effective_system_prompt),
-            )
+
+        prefix_hash, prefix_stable = record_prompt_prefix(orch_context.room_id, agent.name, static_prefix or "")
+        sys_prompt_ms = (time.perf_counter() - sys_prompt_start) * 1000
+        perf.log_sync(
+            "build_system_prompt",
+            sys_prompt_ms,
+            agent.name,
+            orch_context.room_id,
+            type=prompt_type,
+            **prompt_extra,
+            prompt_len=len(effective_system_prompt),
+            prefix_len=len(static_prefix or ""),
+            prefix_hash=prefix_hash,
+            prefix_stable=prefix_stable,
+        )
 
         # Extract image from the latest message if present (for native multimodal support)
         image = None
@@ -370,37 +375,58 @@ class ResponseGenerator:
         sdk_start_time = time.perf_counter()
 
         # Iterate over streaming events from agent manager
-        async for event in orch_context.agent_manager.generate_sdk_response(response_context):
-            event_type = event.get("type")
-
-            if event_type == "stream_start":
-                stream_started = True
-
-            elif event_type == "content_delta":
-                response_text += event.get("delta", "")
-
-            elif event_type == "thinking_delta":
-                thinking_text += event.get("delta", "")
-
-            elif event_type == "stream_end":
-                # Extract final data
-                response_text = event.get("response_text") or response_text
-                thinking_text = event.get("thinking_text") or thinking_text
-                new_session_id = event.get("session_id", session_id)
-                memory_entries = event.get("memory_entries", [])
-                anthropic_calls = event.get("anthropic_calls", [])
-                skipped = event.get("skipped", False)
-
-                # Log SDK response timing
-                sdk_duration_ms = (time.perf_counter() - sdk_start_time) * 1000
-                perf.log_sync(
-                    "sdk_response_total",
-                    sdk_duration_ms,
-                    agent.name,
-                    orch_context.room_id,
-                    response_len=len(response_text or ""),
-                    thinking_len=len(thinking_text or ""),
-                )
+        # (anchored so SDK tool callbacks, which run in the client reader task, nest under it)
+        with get_tracer().span(
+            "sdk_query",
+            anchor=True,
+            room_id=orch_context.room_id,
+            world_id=orch_context.world_id,
+            agent_name=agent.name,
+            hidden=hidden,
+        ):
+            async for event in orch_context.agent_manager.generate_sdk_response(response_context):
+                event_type = event.get("type")
+
+                if event_type == "stream_start":
+                    stream_started = True
+
+                elif event_type == "content_delta":
+                    response_text += event.get("delta", "")
+
+                elif event_type == "thinking_delta":
+                    thinking_text += event.get("delta", "")
+
+                elif event_type == "narration_start":
+                    # Measured from the player's action, so turn setup (NPC warm-up,
+                    # context building) is included
+                    turn_started = self.last_user_message_time.get(orch_context.room_id)
+                    if turn_started is not None:
+                        perf.log_sync(
+                            "time_to_first_narration_token",
+                            (time.time() - turn_started) * 1000,
+                            agent.name,
+                            orch_context.room_id,
+                        )
+
+                elif event_type == "stream_end":
+                    # Extract final data
+                    response_text = event.get("response_text") or response_text
+                    thinking_text = event.get("thinking_text") or thinking_text
+                    new_session_id = event.get("session_id", session_id)
+                    memory_entries = event.get("memory_entries", [])
+                    anthropic_calls = event.get("anthropic_calls", [])
+                    skipped = event.get("skipped", False)
+
+                    # Log SDK response timing
+                    sdk_duration_ms = (time.perf_counter() - sdk_start_time) * 1000
+                    perf.log_sync(
+                        "sdk_response_total",
+                        sdk_duration_ms,
+                        agent.name,
+                        orch_context.room_id,
+                        response_len=len(response_text or ""),
+                        thinking_len=len(thinking_text or ""),
+                    )
 
         # Memory entries are now written directly by the memorize tool
         # So we can skip this section (kept for reference/debugging)
@@ -12,13 +12,15 @@ saved to the database.
 import asyncio
 import logging
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any, Dict, List, Optional
 
 import crud
+from core import get_settings
 from domain.value_objects.contexts import OrchestrationContext
-from domain.value_objects.enums import MessageRole
+from infrastructure.database.connection import background_session
 from infrastructure.logging.perf_logger import get_perf_logger
+from infrastructure.logging.tracing import get_tracer
 from sqlalchemy.orm import selectinload
 
 from .models import CellType, ExecutionResult, TurnCell, TurnTape
@@ -46,6 +48,7 @@ class TapeExecutor:
     - User interrupt handling (stops execution, tape cut externally)
     - Skip counting for all-skipped detection
     - Hidden agent support (messages created via tools instead of auto-save)
+    - Concurrent cells with a concurrency limit and per-cell timeout
     """
 
     def __init__(
@@ -53,6 +56,8 @@ class TapeExecutor:
         response_generator,
         agents_by_id: Dict[int, any],
         max_total_messages: int = 30,
+        max_concurrent_agents: Optional[int] = None,
+        cell_timeout: Optional[float] = None,
     ):
         """
         Initialize executor.
@@ -61,10 +66,17 @@ class TapeExecutor:
             response_generator: ResponseGenerator instance
             agents_by_id: Dict mapping agent IDs to agent objects
             max_total_messages: Safety limit to prevent infinite loops
+            max_concurrent_agents: Max agents running at once in a concurrent cell
+                (default: settings.max_concurrent_cell_agents)
+            cell_timeout: Seconds before a concurrent cell's unfinished agents are
+                cancelled (default: settings.concurrent_cell_timeout)
         """
+        settings = get_settings()
         self.response_generator = response_generator
         self.agents_by_id = agents_by_id
         self.max_total_messages = max_total_messages
+        self.max_concurrent_agents = max(1, max_concurrent_agents or settings.max_concurrent_cell_agents)
+        self.cell_timeout = cell_timeout if cell_timeout is not None else settings.concurrent_cell_timeout
 
     async def execute(
         self,
@@ -95,9 +107,12 @@ class TapeExecutor:
         cell_count = 0
 
         while not tape.is_exhausted():
+            # Pause flag and interaction count are tracked in memory (seeded once,
+            # updated on message creation and room updates), so this is O(1)
+            limits = await crud.get_room_limits(orch_context.db, orch_context.room_id)
+
             # ===== SINGLE PAUSE CHECK =====
-            room = await crud.get_room_cached(orch_context.db, orch_context.room_id)
-            if room and room.is_paused:
+            if limits and limits.is_paused:
                 logger.info(f"⏸️  Tape paused | Room: {orch_context.room_id}")
                 result.was_paused = True
                 break
@@ -111,15 +126,13 @@ class TapeExecutor:
                 break
 
             # ===== SINGLE LIMIT CHECK (room.max_interactions) =====
-            if room and room.max_interactions is not None:
-                current_count = await self._count_agent_messages(orch_context.db, orch_context.room_id)
-                if current_count >= room.max_interactions:
-                    logger.info(
-                        f"🛑 Room interaction limit reached | Room: {orch_context.room_id} | "
-                        f"Count: {current_count}/{room.max_interactions}"
-                    )
-                    result.reached_limit = True
-                    break
+            if limits and limits.limit_reached:
+                logger.info(
+                    f"🛑 Room interaction limit reached | Room: {orch_context.room_id} | "
+                    f"Count: {limits.interaction_count}/{limits.max_interactions}"
+                )
+                result.reached_limit = True
+                break
 
             # Get current cell
             cell = tape.current_cell()
@@ -132,12 +145,20 @@ class TapeExecutor:
                 cell_count += 1
 
                 # Pass collected reactions to non-reaction cells
-                cell_result = await self._execute_cell(
-                    cell,
-                    orch_context,
-                    user_message_content,
-                    npc_reactions=collected_reactions if not cell.is_reaction else None,
-                )
+                with get_tracer().span(
+                    f"cell:{cell.cell_type.value}",
+                    room_id=orch_context.room_id,
+                    world_id=orch_context.world_id,
+                    cell_num=cell_count,
+                    agents=len(cell.agent_ids),
+                    hidden=cell.hidden,
+                ):
+                    cell_result = await self._execute_cell(
+                        cell,
+                        orch_context,
+                        user_message_content,
+                        npc_reactions=collected_reactions if not cell.is_reaction else None,
+                    )
 
                 # Collect reactions from reaction cells
                 if cell.is_reaction and cell_result.reactions:
@@ -338,27 +359,56 @@ class TapeExecutor:
         user_message_content: Optional[str],
         cell: TurnCell,
     ) -> CellExecutionResult:
-        """Execute multiple agents concurrently via asyncio.gather.
+        """Execute multiple agents concurrently.
+
+        At most ``max_concurrent_agents`` run at once, each with its own DB
+        session (an AsyncSession can't be shared by concurrent coroutines).
+        Agents still running when ``cell_timeout`` expires are cancelled.
+        Results are collected in the cell's agent order, not completion order,
+        so reactions and message counts are deterministic.
 
         For reaction cells (is_reaction=True), agents run hidden and their
         responses are collected for passing to the next cell (Action Manager).
         """
-        tasks = [
-            self.response_generator.generate_response(
-                orch_context=orch_context,
-                agent=agent,
-                user_message_content=user_message_content,
-                hidden=cell.hidden,  # Pass hidden flag for reaction cells
-            )
-            for agent in agents
-        ]
+        semaphore = asyncio.Semaphore(self.max_concurrent_agents)
+
+        async def run_agent(agent):
+            async with semaphore:
+                async with background_session() as agent_db:
+                    return await self.response_generator.generate_response(
+                        orch_context=replace(orch_context, db=agent_db),
+                        agent=agent,
+                        user_message_content=user_message_content,
+                        hidden=cell.hidden,  # Pass hidden flag for reaction cells
+                    )
+
+        tasks = [asyncio.create_task(run_agent(agent)) for agent in agents]
+
+        logger.debug(f"⏳ Executing {len(tasks)} agents concurrently (limit {self.max_concurrent_agents})...")
+        try:
+            _, pending = await asyncio.wait(tasks, timeout=self.cell_timeout)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
-        logger.debug(f"⏳ Executing {len(tasks)} agents concurrently...")
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if pending:
+            timed_out = [agents[i].name for i, task in enumerate(tasks) if task in pending]
+            logger.warning(f"⏱️  Concurrent cell timed out after {self.cell_timeout}s | Cancelling: {timed_out}")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        # None marks a timed-out agent
+        results = [None if task.cancelled() else (task.exception() or task.result()) for task in tasks]
 
         cell_result = CellExecutionResult()
 
         for i, res in enumerate(results):
+            if res is None:
+                # Like errors, timeouts don't count as skips
+                continue
             if isinstance(res, Exception):
                 logger.error(f"❌ Agent {agents[i].name} error: {res}")
                 # Errors don't count as skips
@@ -397,20 +447,6 @@ class TapeExecutor:
 
         return cell_result
 
-    async def _count_agent_messages(self, db, room_id: int) -> int:
-        """Count agent messages in room."""
-        from infrastructure.database import models
-        from sqlalchemy import func
-        from sqlalchemy.future import select
-
-        result = await db.execute(
-            select(func.count(models.Message.id)).where(
-                models.Message.room_id == room_id,
-                models.Message.role == MessageRole.ASSISTANT,
-            )
-        )
-        return result.scalar() or 0
-
     async def _refresh_room_id_after_travel(self, orch_context: OrchestrationContext) -> bool:
         """
         Check if player location changed and update orch_context.room_id.
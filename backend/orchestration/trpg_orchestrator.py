@@ -13,13 +13,17 @@ import time
 from typing import Dict, List, Optional
 
 import crud
-from domain.value_objects.contexts import OrchestrationContext
+from domain.value_objects.contexts import OrchestrationContext, TurnContext
 from domain.value_objects.enums import WorldPhase
+from infrastructure.background import spawn_background
 from infrastructure.database import models
-from infrastructure.logging.perf_logger import track_interaction
+from infrastructure.logging.perf_logger import get_perf_logger, track_interaction
+from infrastructure.logging.tracing import get_tracer
 from sdk import AgentManager
+from services.usage_accounting import usage_turn
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .location_enrichment import get_location_enricher
 from .response_generator import ResponseGenerator
 from .tape import TapeExecutor
 from .tape.trpg_generator import (
@@ -40,7 +44,7 @@ class TRPGOrchestrator:
     TRPGOrchestrator follows a strict sequential order for game resolution.
     """
 
-    def __init__(self):
+    def __init__(self, max_concurrent_turns: int = 4):
         # Track active processing tasks per room for interruption
         self.active_room_tasks: Dict[int, asyncio.Task] = {}
         # Used to skip broadcasting responses that were started before interruption
@@ -53,10 +57,14 @@ class TRPGOrchestrator:
         self.sub_agent_rooms: Dict[int, dict] = {}
         # Track rooms where narration has been produced (allows input unblocking)
         self.narration_produced_rooms: set[int] = set()
-        # Store agent_manager during turn execution (for tool access)
-        self._current_agent_manager: Optional[AgentManager] = None
-        # Store current orchestration context during turn (for memory rounds)
-        self._current_orch_context: Optional[OrchestrationContext] = None
+        # Orchestration context of each running turn, keyed by room ID (for tool
+        # access, e.g. memory rounds during travel). This is a registry rather than
+        # a contextvar because SDK tool callbacks run in the client's reader task,
+        # which does not inherit the turn task's context.
+        self._turn_contexts: Dict[int, OrchestrationContext] = {}
+        # Global limit on turns running at once across all worlds
+        self.max_concurrent_turns = max_concurrent_turns
+        self._turn_slots = asyncio.Semaphore(max_concurrent_turns)
 
     def get_chatting_agents(self, room_id: int, agent_manager: AgentManager) -> list[int]:
         """
@@ -119,6 +127,28 @@ class TRPGOrchestrator:
         """Check if narration has been produced for a room."""
         return room_id in self.narration_produced_rooms
 
+    def get_turn_context(
+        self, room_id: Optional[int] = None, world_id: Optional[int] = None
+    ) -> Optional[OrchestrationContext]:
+        """
+        Get the orchestration context of the turn running in a room.
+
+        Falls back to the running turn of ``world_id`` when the room has none
+        (turns are serialized per world, so there is at most one).
+        """
+        if room_id is not None and room_id in self._turn_contexts:
+            return self._turn_contexts[room_id]
+        if world_id is not None:
+            for orch_context in self._turn_contexts.values():
+                if orch_context.world_id == world_id:
+                    return orch_context
+        return None
+
+    @property
+    def running_turn_count(self) -> int:
+        """Number of turns currently executing."""
+        return len(self._turn_contexts)
+
     @track_interaction(room_id_param="room_id", action_param="action_text")
     async def handle_player_action(
         self,
@@ -127,6 +157,7 @@ class TRPGOrchestrator:
         action_text: str,
         agent_manager: AgentManager,
         world: models.World,
+        turn: Optional[TurnContext] = None,
     ) -> bool:
         """
         Handle a player action and orchestrate TRPG agent responses.
@@ -137,6 +168,8 @@ class TRPGOrchestrator:
             action_text: The player's action text
             agent_manager: AgentManager for generating responses
             world: World model for phase detection
+            turn: Optional context resolved at turn admission; when given, its
+                room agents and NPCs are used instead of querying them again
 
         Returns:
             True if processing completed, False if cancelled/failed
@@ -146,8 +179,29 @@ class TRPGOrchestrator:
         # Record timestamp for interruption tracking
         self.last_user_message_time[room_id] = time.time()
 
+        # Root trace span: cells, SDK queries and tool calls of this turn nest under it
+        # (the same turn number tags the token usage of every response in it)
+        turn_number = turn.turn if turn else None
+        with get_tracer().span("turn", room_id=room_id, world_id=world.id, turn=turn_number), usage_turn(turn_number):
+            # Wait for a global turn slot (turns of other worlds may be running)
+            wait_start = time.perf_counter()
+            async with self._turn_slots:
+                wait_ms = (time.perf_counter() - wait_start) * 1000
+                get_perf_logger().log_sync("turn_slot_wait", wait_ms, room_id=room_id, world_id=world.id)
+                return await self._run_player_action(db, room_id, action_text, agent_manager, world, turn)
+
+    async def _run_player_action(
+        self,
+        db: AsyncSession,
+        room_id: int,
+        action_text: str,
+        agent_manager: AgentManager,
+        world: models.World,
+        turn: Optional[TurnContext],
+    ) -> bool:
+        """Run one player turn while holding a turn slot."""
         # Get all agents for the room
-        all_agents = await crud.get_agents_cached(db, room_id)
+        all_agents = turn.agents if turn else await crud.get_agents_cached(db, room_id)
 
         if not all_agents:
             logger.warning(f"[TRPG] No agents found in room {room_id}")
@@ -160,12 +214,29 @@ class TRPGOrchestrator:
             agent_manager=agent_manager,
             world_id=world.id,
             world_name=world.name,
+            prepared_turn=turn.prepared if turn else None,
         )
 
-        # Store context for tool access (e.g., memory rounds during travel)
-        self._current_agent_manager = agent_manager
-        self._current_orch_context = orch_context
+        # Register context for tool access (e.g., memory rounds during travel)
+        self._turn_contexts[room_id] = orch_context
+        try:
+            return await self._run_tape(db, room_id, action_text, agent_manager, world, turn, all_agents, orch_context)
+        finally:
+            if self._turn_contexts.get(room_id) is orch_context:
+                del self._turn_contexts[room_id]
 
+    async def _run_tape(
+        self,
+        db: AsyncSession,
+        room_id: int,
+        action_text: str,
+        agent_manager: AgentManager,
+        world: models.World,
+        turn: Optional[TurnContext],
+        all_agents: List[models.Agent],
+        orch_context: OrchestrationContext,
+    ) -> bool:
+        """Build and execute the tape for the world's phase."""
         # Build agent lookup dict
         agents_by_id = {a.id: a for a in all_agents}
 
@@ -178,6 +249,7 @@ class TRPGOrchestrator:
 
         # Determine which tape to generate based on world phase and available agents
         tape = None
+        warmup_task: Optional[asyncio.Task] = None
 
         if world.phase == WorldPhase.ONBOARDING:
             # During onboarding, only Onboarding Manager responds
@@ -189,14 +261,18 @@ class TRPGOrchestrator:
         else:
             # Active gameplay - get NPCs and pre-connect them
             if has_gameplay_agents(all_agents):
-                npcs = await self._get_npcs_at_current_location(db, world.id)
+                npcs = turn.npcs if turn else await self._get_npcs_at_current_location(db, world.id)
                 npc_ids = [npc.id for npc in npcs]
 
-                # Pre-connect NPC clients concurrently (warm up SDK clients)
+                # Warm up NPC clients in the background, alongside the Action Manager
+                # cell, so its first token doesn't wait for NPC CLI processes to spawn
                 if npcs:
                     npc_names = [npc.name for npc in npcs]
                     logger.info(f"[TRPG] Found {len(npc_ids)} NPCs at location: {npc_names}")
-                    await self._pre_connect_npcs(npcs[:5], db, room_id, world, agent_manager)
+                    warmup_task = spawn_background(
+                        self._pre_connect_npcs(npcs[:5], room_id, world, agent_manager),
+                        name=f"pre_connect_npcs:room={room_id}",
+                    )
 
                 tape = create_gameplay_tape(all_agents, npc_ids=npc_ids)
                 logger.info(f"[TRPG] Gameplay phase - running action round (NPCs: {len(npc_ids)})")
@@ -221,6 +297,10 @@ class TRPGOrchestrator:
                 f"Responses: {result.total_responses} | Skips: {result.total_skips}"
             )
 
+            # Design the drafts the player may travel to next while they read
+            if world.phase != WorldPhase.ONBOARDING:
+                get_location_enricher().schedule(world.id, world.name, agent_manager)
+
             return True
 
         except asyncio.CancelledError:
@@ -236,9 +316,9 @@ class TRPGOrchestrator:
             self.active_room_tasks.pop(room_id, None)
             # Clear narration produced flag for next turn
             self.clear_narration_produced(room_id)
-            # Clear stored context
-            self._current_agent_manager = None
-            self._current_orch_context = None
+            # Stop NPC warm-up that outlived the turn
+            if warmup_task and not warmup_task.done():
+                warmup_task.cancel()
 
     async def _execute_tape(self, executor, tape, orch_context, action_text):
         """Execute the tape and return result."""
@@ -300,16 +380,22 @@ class TRPGOrchestrator:
     async def _pre_connect_npcs(
         self,
         npcs: list,
-        db: AsyncSession,
         room_id: int,
         world: models.World,
         agent_manager: AgentManager,
     ) -> None:
-        """Pre-connect NPC clients concurrently to warm up SDK clients."""
-        try:
-            await asyncio.gather(*(
-                agent_manager.pre_connect(
-                    db=db,
+        """
+        Pre-connect NPC clients concurrently to warm up SDK clients.
+
+        Each pre-connect gets its own DB session: they run concurrently with each
+        other and with the turn, and an AsyncSession is not safe to share.
+        """
+        from infrastructure.database.connection import background_session
+
+        async def pre_connect(npc) -> bool:
+            async with background_session() as npc_db:
+                return await agent_manager.pre_connect(
+                    db=npc_db,
                     room_id=room_id,
                     agent_id=npc.id,
                     agent_name=npc.name,
@@ -318,8 +404,20 @@ class TRPGOrchestrator:
                     config_file=npc.config_file,
                     group_name=npc.group,
                 )
-                for npc in npcs
-            ))
+
+        start = time.perf_counter()
+        try:
+            results = await asyncio.gather(*(pre_connect(npc) for npc in npcs))
+            get_perf_logger().log_sync(
+                "npc_pre_connect",
+                (time.perf_counter() - start) * 1000,
+                room_id=room_id,
+                npcs=len(npcs),
+                connected=sum(1 for r in results if r),
+            )
+        except asyncio.CancelledError:
+            logger.debug(f"[TRPG] Pre-connect NPCs cancelled, turn ended first | Room: {room_id}")
+            raise
         except Exception as e:
             # Pre-connect is best-effort, don't fail the turn
             logger.debug(f"[TRPG] Pre-connect NPCs failed (non-critical): {e}")
@@ -328,6 +426,8 @@ class TRPGOrchestrator:
         self,
         location_id: int,
         memory_prompt: str = "Use the memorize tool to remember any significant events from this conversation before the player leaves.",
+        room_id: Optional[int] = None,
+        world_id: Optional[int] = None,
     ) -> int:
         """
         Trigger NPCs at a location to memorize the conversation.
@@ -338,17 +438,20 @@ class TRPGOrchestrator:
         Args:
             location_id: ID of the location where NPCs should memorize
             memory_prompt: The prompt to send to each NPC
+            room_id: Room of the turn that triggered the round (the caller's room)
+            world_id: World of that turn, used if the room has no running turn
 
         Returns:
             Number of NPCs that processed the memory round
         """
-        if not self._current_orch_context or not self._current_agent_manager:
+        turn_context = self.get_turn_context(room_id=room_id, world_id=world_id)
+        if turn_context is None or turn_context.agent_manager is None:
             logger.warning("[TRPG] Cannot trigger memory round - no active context")
             return 0
 
         from crud.locations import get_characters_at_location
 
-        db = self._current_orch_context.db
+        db = turn_context.db
 
         # Get NPCs at the location
         npcs = await get_characters_at_location(db, location_id, exclude_system_agents=True)
@@ -370,9 +473,9 @@ class TRPGOrchestrator:
         memory_orch_context = OrchestrationContext(
             db=db,
             room_id=location.room_id,
-            agent_manager=self._current_agent_manager,
-            world_id=self._current_orch_context.world_id,
-            world_name=self._current_orch_context.world_name,
+            agent_manager=turn_context.agent_manager,
+            world_id=turn_context.world_id,
+            world_name=turn_context.world_name,
         )
 
         # Trigger all NPCs in parallel (hidden, they'll use memorize tool if needed)
@@ -424,5 +527,7 @@ def get_trpg_orchestrator() -> TRPGOrchestrator:
     """Get or create the global TRPG orchestrator instance."""
     global _trpg_orchestrator
     if _trpg_orchestrator is None:
-        _trpg_orchestrator = TRPGOrchestrator()
+        from core import get_settings
+
+        _trpg_orchestrator = TRPGOrchestrator(max_concurrent_turns=get_settings().max_concurrent_turns)
     return _trpg_orchestrator
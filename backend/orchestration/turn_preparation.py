@@ -0,0 +1,216 @@
+"""
+Speculative Action Manager preparation while the player is typing.
+
+The Action Manager's cold path before its model call is: load world files and
+build the gameplay context, resolve the MCP config, acquire (and connect) the
+pooled client, then render the system prompt. The frontend calls the prepare
+endpoint when the action input gains focus or text; ``TurnPreparer.prepare``
+does that work in the background and holds the result for a short TTL.
+
+``submit_action`` then calls ``take()`` with the admitted turn's key. The
+prepared state is used only if it was built for that exact turn, location and
+stats version (player stats plus game time), and is discarded otherwise.
+Preparation is skipped while a turn is running or queued for the world, since
+that turn will change the state the prompt is rendered from.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from domain.entities.agent import is_action_manager
+from infrastructure.background import spawn_background
+from infrastructure.database import models
+from infrastructure.database.connection import background_session
+from infrastructure.logging.perf_logger import get_perf_logger
+from sdk import AgentManager
+
+from .gameplay_context import ActionManagerContext, GameplayContextBuilder
+
+logger = logging.getLogger("TurnPreparation")
+
+
+def stats_version(stats: Optional[dict], game_time: Optional[dict]) -> str:
+    """Short hash of the player stats and game time the system prompt is rendered from."""
+    payload = json.dumps([stats or {}, game_time or {}], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:12]
+
+
+@dataclass
+class PreparedTurn:
+    """Action Manager state prepared ahead of a player's action."""
+
+    world_id: int
+    room_id: int
+    turn: int  # Turn number the action will be admitted as
+    location_id: Optional[int]
+    stats_version: str
+    agent_id: int
+    builder: GameplayContextBuilder  # Holds the loaded world files for the user message
+    am_context: ActionManagerContext
+    static_section: str
+    dynamic_section: str
+    expires_at: float
+    client_ready: bool = False
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def matches(self, turn: int, location_id: Optional[int], version: str) -> bool:
+        return self.turn == turn and self.location_id == location_id and self.stats_version == version
+
+
+class TurnPreparer:
+    """Holds at most one prepared Action Manager turn per world."""
+
+    def __init__(self, ttl: float = 30.0):
+        """
+        Args:
+            ttl: Seconds a prepared turn stays valid
+        """
+        self.ttl = ttl
+        self._prepared: Dict[int, PreparedTurn] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._counters = {"prepared": 0, "used": 0, "stale": 0, "expired": 0, "failed": 0}
+
+    def request(
+        self,
+        world: models.World,
+        room_id: int,
+        turn: int,
+        location_id: Optional[int],
+        version: str,
+        agents: list,
+        agent_manager: AgentManager,
+    ) -> str:
+        """
+        Start preparing the world's next turn in the background.
+
+        Returns:
+            "ready" if a matching turn is already prepared, "preparing" if a
+            preparation was started or is in flight, or "skipped" if the room
+            has no Action Manager
+        """
+        existing = self._prepared.get(world.id)
+        if existing and not existing.expired and existing.matches(turn, location_id, version):
+            return "ready"
+
+        task = self._tasks.get(world.id)
+        if task and not task.done():
+            return "preparing"
+
+        agent = next((a for a in agents if is_action_manager(a.name)), None)
+        if agent is None:
+            return "skipped"
+
+        self._tasks[world.id] = spawn_background(
+            self._prepare(world, room_id, turn, location_id, version, agent, agent_manager),
+            name=f"prepare_turn:world={world.id}",
+        )
+        return "preparing"
+
+    async def _prepare(
+        self,
+        world: models.World,
+        room_id: int,
+        turn: int,
+        location_id: Optional[int],
+        version: str,
+        agent: models.Agent,
+        agent_manager: AgentManager,
+    ) -> None:
+        """Build the gameplay context, warm the pooled client and render the system prompt."""
+        start = time.perf_counter()
+        try:
+            builder = GameplayContextBuilder(world.name)
+            am_context = await asyncio.to_thread(builder.build_action_manager_context)
+            static_section, dynamic_section = builder.build_action_manager_system_prompt_parts(am_context)
+
+            # Resolves the MCP config and acquires/connects the pooled client
+            async with background_session() as db:
+                client_ready = await agent_manager.pre_connect(
+                    db=db,
+                    room_id=room_id,
+                    agent_id=agent.id,
+                    agent_name=agent.name,
+                    world_name=world.name,
+                    world_id=world.id,
+                    config_file=agent.config_file,
+                    group_name=agent.group,
+                )
+
+            self._prepared[world.id] = PreparedTurn(
+                world_id=world.id,
+                room_id=room_id,
+                turn=turn,
+                location_id=location_id,
+                stats_version=version,
+                agent_id=agent.id,
+                builder=builder,
+                am_context=am_context,
+                static_section=static_section,
+                dynamic_section=dynamic_section,
+                expires_at=time.monotonic() + self.ttl,
+                client_ready=client_ready,
+            )
+            self._counters["prepared"] += 1
+            get_perf_logger().log_sync(
+                "turn_prepare",
+                (time.perf_counter() - start) * 1000,
+                agent.name,
+                room_id,
+                world_id=world.id,
+                turn=turn,
+                client_ready=client_ready,
+            )
+        except Exception as e:
+            # Preparation is best-effort; the turn falls back to the cold path
+            self._counters["failed"] += 1
+            logger.warning(f"Turn preparation failed for world {world.id}: {e}")
+
+    def take(self, world_id: int, turn: int, location_id: Optional[int], version: str) -> Optional[PreparedTurn]:
+        """
+        Consume the world's prepared turn if it is still valid for this turn.
+
+        The prepared state is removed either way.
+        """
+        prepared = self._prepared.pop(world_id, None)
+        if prepared is None:
+            return None
+        if prepared.expired:
+            self._counters["expired"] += 1
+            logger.debug(f"Prepared turn for world {world_id} expired")
+            return None
+        if not prepared.matches(turn, location_id, version):
+            self._counters["stale"] += 1
+            logger.debug(f"Prepared turn for world {world_id} is stale (turn {prepared.turn} vs {turn})")
+            return None
+        self._counters["used"] += 1
+        return prepared
+
+    def discard(self, world_id: int) -> None:
+        """Drop any prepared turn for the world."""
+        self._prepared.pop(world_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters and number of worlds holding a prepared turn."""
+        return {"ttl": self.ttl, "held": len(self._prepared), **self._counters}
+
+
+# Global singleton
+_turn_preparer: Optional[TurnPreparer] = None
+
+
+def get_turn_preparer() -> TurnPreparer:
+    """Get or create the global turn preparer, configured from settings."""
+    global _turn_preparer
+    if _turn_preparer is None:
+        from core import get_settings
+
+        _turn_preparer = TurnPreparer(ttl=get_settings().turn_prepare_ttl)
+    return _turn_preparer
@@ -0,0 +1,239 @@
+"""
+Per-world turn scheduler for player actions.
+
+Player actions for the same world run one at a time, in arrival order.
+Each world has a bounded FIFO of pending turns; when it is full, new actions
+are rejected with the current queue position instead of piling up concurrent
+SDK work. With coalescing ("latest wins") enabled, a new action supersedes any
+queued turns that have not started yet: their messages are already in the
+room, so the surviving turn sees them as conversation history.
+
+A turn is admitted in two steps so the endpoint can reject before writing
+anything: ``reserve()`` claims a queue slot (or raises TurnQueueFullError),
+then ``submit()`` attaches the coroutine factory once the turn is admitted.
+``release()`` gives the slot back if admission fails.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from infrastructure.background import spawn_background
+from infrastructure.logging.perf_logger import get_perf_logger
+
+logger = logging.getLogger("TurnScheduler")
+
+# Number of recent wait/run samples kept for percentiles
+METRIC_WINDOW = 200
+
+
+class TurnState(str, Enum):
+    """Lifecycle of a queued turn."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    COALESCED = "coalesced"
+    RELEASED = "released"
+
+
+class TurnQueueFullError(Exception):
+    """Raised when a world's turn queue is at capacity."""
+
+    def __init__(self, world_id: int, depth: int, position: int):
+        self.world_id = world_id
+        self.depth = depth
+        self.position = position
+        super().__init__(f"Turn queue for world {world_id} is full ({depth} pending)")
+
+
+@dataclass
+class TurnTicket:
+    """A reserved slot in a world's turn queue."""
+
+    world_id: int
+    seq: int
+    position: int
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    state: TurnState = TurnState.QUEUED
+    run: Optional[Callable[[], Awaitable[Any]]] = None
+
+    def __post_init__(self):
+        self._ready = asyncio.Event()
+
+
+class _Samples:
+    """Bounded window of duration samples (ms)."""
+
+    def __init__(self, window: int = METRIC_WINDOW):
+        self._values: Deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self._values.append(value)
+        self.count += 1
+
+    def summary(self) -> Dict[str, float]:
+        values = sorted(self._values)
+        if not values:
+            return {"count": self.count, "avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        return {
+            "count": self.count,
+            "avg_ms": round(sum(values) / len(values), 1),
+            "p50_ms": round(values[len(values) // 2], 1),
+            "p95_ms": round(values[min(len(values) - 1, int(len(values) * 0.95))], 1),
+            "max_ms": round(values[-1], 1),
+        }
+
+
+@dataclass
+class _WorldQueue:
+    pending: Deque[TurnTicket] = field(default_factory=deque)
+    running: Optional[TurnTicket] = None
+    worker: Optional[asyncio.Task] = None
+
+
+class TurnScheduler:
+    """Serializes player turns per world with a bounded FIFO."""
+
+    def __init__(self, max_depth: int = 3, coalesce: bool = False):
+        """
+        Args:
+            max_depth: Max turns waiting per world (not counting the running one)
+            coalesce: If True, a new turn supersedes queued turns that haven't started
+        """
+        self.max_depth = max_depth
+        self.coalesce = coalesce
+        self._queues: Dict[int, _WorldQueue] = {}
+        self._seq = 0
+        self._counters = {"accepted": 0, "rejected": 0, "coalesced": 0, "completed": 0, "failed": 0}
+        self._wait = _Samples()
+        self._run = _Samples()
+
+    def reserve(self, world_id: int) -> TurnTicket:
+        """
+        Claim a slot in the world's queue.
+
+        Returns:
+            Ticket whose ``position`` is the number of turns ahead of it
+            (0 means it starts as soon as it is submitted)
+
+        Raises:
+            TurnQueueFullError: If the queue is full and coalescing is off
+        """
+        queue = self._queues.setdefault(world_id, _WorldQueue())
+
+        if self.coalesce:
+            for ticket in queue.pending:
+                self._finish(ticket, TurnState.COALESCED)
+                self._counters["coalesced"] += 1
+            queue.pending.clear()
+        elif len(queue.pending) >= self.max_depth:
+            self._counters["rejected"] += 1
+            raise TurnQueueFullError(world_id, len(queue.pending), self._ahead(queue) + 1)
+
+        self._seq += 1
+        ticket = TurnTicket(world_id=world_id, seq=self._seq, position=self._ahead(queue))
+        queue.pending.append(ticket)
+        self._counters["accepted"] += 1
+
+        if queue.worker is None or queue.worker.done():
+            queue.worker = spawn_background(self._drain(world_id, queue), name=f"turn_queue:world={world_id}")
+        return ticket
+
+    def submit(self, ticket: TurnTicket, run: Callable[[], Awaitable[Any]]) -> None:
+        """Attach the turn's coroutine factory; the worker runs it when the ticket reaches the front."""
+        if ticket.state != TurnState.QUEUED:
+            # Superseded while the endpoint was admitting it
+            return
+        ticket.run = run
+        ticket._ready.set()
+
+    def release(self, ticket: TurnTicket) -> None:
+        """Give back a reserved slot whose turn was never submitted."""
+        queue = self._queues.get(ticket.world_id)
+        if queue and ticket in queue.pending:
+            queue.pending.remove(ticket)
+        if ticket.state == TurnState.QUEUED:
+            self._finish(ticket, TurnState.RELEASED)
+
+    def _ahead(self, queue: _WorldQueue) -> int:
+        return len(queue.pending) + (1 if queue.running else 0)
+
+    @staticmethod
+    def _finish(ticket: TurnTicket, state: TurnState) -> None:
+        ticket.state = state
+        ticket._ready.set()
+
+    async def _drain(self, world_id: int, queue: _WorldQueue) -> None:
+        """Run queued turns for one world until its queue is empty."""
+        perf = get_perf_logger()
+        while queue.pending:
+            ticket = queue.pending[0]
+            await ticket._ready.wait()
+            if queue.pending and queue.pending[0] is ticket:
+                queue.pending.popleft()
+            if ticket.state != TurnState.QUEUED or ticket.run is None:
+                continue
+
+            wait_ms = (time.perf_counter() - ticket.enqueued_at) * 1000
+            self._wait.add(wait_ms)
+            perf.log_sync("turn_queue_wait", wait_ms, world_id=world_id, position=ticket.position)
+
+            ticket.state = TurnState.RUNNING
+            queue.running = ticket
+            start = time.perf_counter()
+            try:
+                await ticket.run()
+                ticket.state = TurnState.DONE
+                self._counters["completed"] += 1
+            except Exception as e:
+                ticket.state = TurnState.FAILED
+                self._counters["failed"] += 1
+                logger.exception(f"Turn {ticket.seq} for world {world_id} failed: {e}")
+            finally:
+                run_ms = (time.perf_counter() - start) * 1000
+                self._run.add(run_ms)
+                perf.log_sync("turn_run", run_ms, world_id=world_id)
+                queue.running = None
+
+        if self._queues.get(world_id) is queue and not queue.pending:
+            del self._queues[world_id]
+
+    def get_queue_status(self, world_id: int) -> Dict[str, Any]:
+        """Pending and running turns for one world."""
+        queue = self._queues.get(world_id)
+        if queue is None:
+            return {"world_id": world_id, "running": False, "pending": 0}
+        return {"world_id": world_id, "running": queue.running is not None, "pending": len(queue.pending)}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Counters plus queue-wait and turn-run time percentiles."""
+        return {
+            "max_depth": self.max_depth,
+            "coalesce": self.coalesce,
+            "active_worlds": len(self._queues),
+            **self._counters,
+            "queue_wait": self._wait.summary(),
+            "turn_run": self._run.summary(),
+        }
+
+
+# Global singleton
+_turn_scheduler: Optional[TurnScheduler] = None
+
+
+def get_turn_scheduler() -> TurnScheduler:
+    """Get or create the global turn scheduler, configured from settings."""
+    global _turn_scheduler
+    if _turn_scheduler is None:
+        from core import get_settings
+
+        settings = get_settings()
+        _turn_scheduler = TurnScheduler(max_depth=settings.turn_queue_depth, coalesce=settings.turn_queue_coalesce)
+    return _turn_scheduler
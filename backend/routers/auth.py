@@ -2,8 +2,10 @@
 
 import json
 import secrets
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse
 from infrastructure.auth import generate_jwt_token, validate_password_with_role
 from slowapi import Limiter
 from slowapi.util import get_remote_address
@@ -82,21 +84,80 @@ async def health_check():
 @router.get("/health/pool")
 async def pool_stats(request: Request):
     """Get client pool statistics (for debugging)."""
+    from sdk.client.client_pool import get_pool_metrics
+    from sdk.client.mcp_registry import get_mcp_registry
+
     agent_manager = request.app.state.agent_manager
     pool = agent_manager.client_pool
     pool_keys = list(pool.pool.keys())
     cleanup_tasks = len(pool._cleanup_tasks)
 
-    # Get semaphore availability (how many slots are free for new connections)
-    semaphore = pool._connection_semaphore
-    # Note: _value is internal but useful for debugging
-    available_slots = getattr(semaphore, "_value", "unknown")
+    # Connection admission: free slots, adaptive limit, sheds and queue waits per priority class
+    admission = pool.admission.get_stats()
 
     return {
         "pool_size": len(pool_keys),
         "pool_keys": [str(k) for k in pool_keys],
         "pending_cleanup_tasks": cleanup_tasks,
         "active_clients": len(agent_manager.active_clients),
-        "connection_semaphore_available": available_slots,
+        "connection_semaphore_available": admission["available"],
         "max_concurrent_connections": pool.MAX_CONCURRENT_CONNECTIONS,
+        "connection_admission": admission,
+        "reconnects": get_pool_metrics().get_reconnect_stats(),
+        "mcp_config_cache": get_mcp_registry().get_stats(),
     }
+
+
+@router.get("/health/pool/clients")
+async def pool_clients(
+    request: Request,
+    room_id: Optional[int] = None,
+    agent_id: Optional[int] = None,
+    pump: Optional[str] = Query(default=None, pattern="^(running|stopped|none)$"),
+    busy: Optional[bool] = None,
+    has_error: Optional[bool] = None,
+    min_idle_s: Optional[float] = Query(default=None, ge=0),
+    sort: str = Query(default="age_s", pattern="^(age_s|idle_s|queue_depth|rss_mb|cpu_s)$"),
+    order: str = Query(default="desc", pattern="^(asc|desc)$"),
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+):
+    """
+    List pooled clients with their CLI subprocess (for debugging pool pressure and leaks).
+
+    Returns:
+        Dictionary containing:
+        - pool_size/matched: pooled clients and how many passed the filters
+        - clients: task_id, age_s, idle_s, busy, config_hash, session_id, queue_depth,
+          pump state, pid, rss_mb, cpu_s and last_error per client
+        - unpooled_processes: child processes owned by no pooled client (leaked, or
+          still disconnecting in the background)
+    """
+    from sdk.client.pool_introspection import describe_pool
+
+    agent_manager = request.app.state.agent_manager
+    return describe_pool(
+        agent_manager.client_pool,
+        active_task_ids=set(agent_manager.active_clients),
+        room_id=room_id,
+        agent_id=agent_id,
+        pump=pump,
+        busy=busy,
+        has_error=has_error,
+        min_idle_s=min_idle_s,
+        sort=sort,
+        descending=order == "desc",
+        limit=limit,
+    )
+
+
+@router.get("/health/pool/metrics", response_class=PlainTextResponse)
+async def pool_metrics(request: Request):
+    """Client pool state and counters in the Prometheus text exposition format."""
+    from sdk.client.client_pool import get_pool_metrics
+    from sdk.client.pool_introspection import describe_pool, render_prometheus
+
+    agent_manager = request.app.state.agent_manager
+    pool = agent_manager.client_pool
+    snapshot = describe_pool(pool, active_task_ids=set(agent_manager.active_clients))
+    body = render_prometheus(snapshot, get_pool_metrics(), pool.admission.get_stats())
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
@@ -4,10 +4,12 @@ Debug and monitoring endpoints.
 These endpoints provide access to cache statistics and other debugging information.
 """
 
-from typing import Dict
+from typing import Any, Dict, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query
+from infrastructure.database.connection import get_db
 from services.cache_service import get_cache_service
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 
@@ -56,3 +58,200 @@ async def clear_cache() -> Dict[str, str]:
     cache_service = get_cache_service()
     cache_service.clear()
     return {"status": "success", "message": "Cache cleared successfully"}
+
+
+@router.get("/startup")
+async def get_startup_profile() -> Dict[str, Any]:
+    """
+    Get the startup profile (import and lifespan time breakdown).
+
+    Only populated when the server was started with PROFILE_STARTUP=true
+    or the launcher's --profile-startup flag.
+    """
+    from infrastructure.logging.startup_profiler import get_startup_profiler
+
+    profiler = get_startup_profiler()
+    if profiler is None:
+        return {"enabled": False}
+    return {"enabled": True, **profiler.get_report()}
+
+
+@router.get("/perf")
+async def get_perf_stats() -> Dict[str, Any]:
+    """
+    Get latency percentiles recorded by the perf logger.
+
+    Only populated when the server was started with PERF_LOG=true.
+
+    Returns:
+        Dictionary containing:
+        - enabled/session_duration_s/interactions
+        - buffer: recorded/written/dropped line counters, pending lines,
+          capacity, batches written and write errors
+        - phases: per phase count/avg/min/max and p50/p95/p99 in milliseconds,
+          with the same breakdown per agent under "agents"
+    """
+    from infrastructure.logging.perf_logger import get_perf_logger
+
+    return get_perf_logger().get_stats()
+
+
+@router.get("/prompt-cache/stats")
+async def get_prompt_cache_stats() -> Dict[str, Any]:
+    """
+    Get system prompt cache statistics.
+
+    Returns:
+        Dictionary containing:
+        - hits/misses/evictions/size/hit_rate: memoized template renders
+        - prefix_stable/prefix_changed/prefix_stable_rate: turns whose static
+          prompt prefix matched the previous turn (upstream prompt-cache eligible)
+    """
+    from services.prompt_builder import get_prompt_cache_stats as _get_prompt_cache_stats
+
+    return _get_prompt_cache_stats()
+
+
+@router.get("/subagent-cache/stats")
+async def get_subagent_cache_stats() -> Dict[str, Any]:
+    """
+    Get designer sub-agent result cache statistics.
+
+    Returns:
+        Dictionary containing:
+        - enabled/ttl_seconds/size: cache configuration and memoized results
+        - lookups/hits/hit_rate: designer Task calls and how many were answered
+          without running the sub-agent
+        - subagents: per sub-agent type lookups, hits_existing (already in the
+          world), hits_memo (repeated request), misses, stored and hit_rate
+    """
+    from services.subagent_cache import get_subagent_cache
+
+    return get_subagent_cache().get_stats()
+
+
+@router.get("/subagents/stats")
+async def get_subagent_stats() -> Dict[str, Any]:
+    """
+    Get sub-agent run statistics per sub-agent type.
+
+    Returns:
+        Dictionary keyed by sub-agent type, each containing:
+        - runs/cached/background/errors/abandoned: run counters
+        - tool_calls/result_chars and token counters (input, output, cache read,
+          cache creation, total) summed over runs
+        - queue/run/total: latency percentiles (Task call -> start -> stop -> result)
+        - tools: latency percentiles per tool called inside the sub-agent
+    """
+    from sdk.agent.subagent_ledger import get_subagent_stats
+
+    return get_subagent_stats().get_stats()
+
+
+@router.get("/location-enrichment/stats")
+async def get_location_enrichment_stats() -> Dict[str, Any]:
+    """
+    Get background draft location enrichment statistics.
+
+    Returns:
+        Dictionary containing:
+        - enabled/concurrency/max_candidates: configuration
+        - in_flight: jobs waiting for an idle world or running
+        - scheduled/enriched/already_enriched/deferred_out/failed: job counters
+        - arrivals/arrivals_enriched/arrivals_draft: travel arrivals, and how many
+          reached a location enriched in the background or still a draft
+        - job: count, avg, p50/p95/p99 and max job duration in milliseconds
+    """
+    from orchestration.location_enrichment import get_location_enricher
+
+    return get_location_enricher().get_stats()
+
+
+@router.get("/turn-queue/stats")
+async def get_turn_queue_stats() -> Dict[str, Any]:
+    """
+    Get player turn queue statistics.
+
+    Returns:
+        Dictionary containing:
+        - max_depth/coalesce: queue configuration
+        - active_worlds: worlds with a running or pending turn
+        - accepted/rejected/coalesced/completed/failed: turn counters
+        - queue_wait/turn_run: count, avg, p50, p95 and max in milliseconds
+        - running_turns/max_concurrent_turns: turns executing across all worlds
+        - prepared_turns: speculative Action Manager preparation counters
+    """
+    from orchestration.trpg_orchestrator import get_trpg_orchestrator
+    from orchestration.turn_preparation import get_turn_preparer
+    from orchestration.turn_scheduler import get_turn_scheduler
+
+    orchestrator = get_trpg_orchestrator()
+    return {
+        **get_turn_scheduler().get_metrics(),
+        "running_turns": orchestrator.running_turn_count,
+        "max_concurrent_turns": orchestrator.max_concurrent_turns,
+        "prepared_turns": get_turn_preparer().get_stats(),
+    }
+
+
+@router.get("/usage/daily")
+async def get_daily_usage(
+    days: int = Query(default=7, ge=1, le=90),
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
+    """
+    Get token usage per UTC day across all worlds.
+
+    Returns:
+        Dictionary containing:
+        - recorder: usage rows recorded/written/failed/buffered in this process
+        - days: newest first, each with input/output/cache-read/cache-creation
+          tokens, cache_hit_ratio, cost_usd and latency, broken down per agent
+          and per world
+    """
+    import crud
+    from services.usage_accounting import get_usage_recorder
+
+    recorder = get_usage_recorder()
+    await recorder.flush()
+    return {"recorder": recorder.get_stats(), "days": await crud.get_daily_usage(db, days=days)}
+
+
+@router.get("/traces")
+async def list_traces() -> Dict[str, Any]:
+    """
+    List retained turn traces (newest first).
+
+    Only populated when the server was started with PERF_TRACE=true.
+
+    Returns:
+        Dictionary containing:
+        - enabled: whether span tracing is on
+        - traces: trace_id, root span name and attributes, duration, span count
+    """
+    from infrastructure.logging.tracing import get_tracer
+
+    tracer = get_tracer()
+    return {"enabled": tracer.enabled, "traces": tracer.list_traces()}
+
+
+@router.get("/traces/export")
+async def export_traces(room_id: Optional[int] = None, world_id: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Export all retained traces (optionally for one room or world) as Chrome
+    Trace Event JSON. Save the response and open it in ui.perfetto.dev.
+    """
+    from infrastructure.logging.tracing import get_tracer
+
+    return get_tracer().export_chrome_trace(room_id=room_id, world_id=world_id)
+
+
+@router.get("/traces/{trace_id}")
+async def export_trace(trace_id: int) -> Dict[str, Any]:
+    """Export one turn's trace as Chrome Trace Event JSON."""
+    from infrastructure.logging.tracing import get_tracer
+
+    tracer = get_tracer()
+    if not any(t["trace_id"] == trace_id for t in tracer.list_traces()):
+        raise HTTPException(status_code=404, detail="Trace not found")
+    return tracer.export_chrome_trace(trace_ids=[trace_id])
@@ -5,21 +5,27 @@ Endpoints for submitting player actions and getting action suggestions.
 """
 
 import logging
+from dataclasses import replace
+from typing import Optional
 
 import crud
 import schemas
+from core import get_settings
 from core.dependencies import (
     RequestIdentity,
     get_agent_manager,
     get_request_identity,
 )
 from domain.services.access_control import AccessControl
-from domain.value_objects.enums import MessageRole, ParticipantType, WorldPhase
+from domain.value_objects.contexts import TurnContext
+from domain.value_objects.enums import SYSTEM_AGENT_GROUPS, MessageRole, ParticipantType, WorldPhase
 from domain.value_objects.slash_commands import SlashCommandType, parse_slash_command
 from fastapi import APIRouter, Depends, HTTPException
-from infrastructure.background import spawn_background
+from infrastructure.database import models
 from infrastructure.database.connection import get_db
 from orchestration.trpg_orchestrator import get_trpg_orchestrator
+from orchestration.turn_preparation import get_turn_preparer, stats_version
+from orchestration.turn_scheduler import TurnQueueFullError, TurnScheduler, TurnTicket, get_turn_scheduler
 from sdk import AgentManager
 from services.player_service import PlayerService
 from services.room_mapping_service import RoomMappingService
@@ -68,9 +74,6 @@ async def submit_action(
     if not player_state:
         raise HTTPException(status_code=404, detail="Player state not found")
 
-    # Update last played timestamp
-    await crud.update_world_last_played(db, world_id)
-
     # Determine which room to use based on phase
     target_room_id = None
     current_location_id = None
@@ -91,6 +94,10 @@ async def submit_action(
     # Parse for slash commands
     parsed = parse_slash_command(action.text)
 
+    # Regular turns update the timestamp as part of turn admission below
+    if parsed.command_type in (SlashCommandType.CHAT, SlashCommandType.END) or player_state.is_chat_mode:
+        await crud.update_world_last_played(db, world_id)
+
     # Handle /chat command
     if parsed.command_type == SlashCommandType.CHAT:
         # Only allow in active gameplay phase
@@ -127,31 +134,68 @@ async def submit_action(
 
     # Regular TRPG flow below
 
-    # Add action to history
-    await crud.add_action_to_history(
-        db,
-        world_id,
-        player_state.turn_count + 1,
-        action.text,
-        "Processing...",
-    )
+    # Claim a slot in the world's turn queue before writing anything
+    scheduler = get_turn_scheduler()
+    try:
+        ticket = scheduler.reserve(world_id)
+    except TurnQueueFullError as e:
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "message": "Too many pending actions, please wait for the current turn to finish.",
+                "queue_position": e.position,
+                "queue_depth": e.depth,
+            },
+        )
 
-    # Increment turn counter
-    new_turn = await crud.increment_turn(db, world_id)
+    # Everything up to submit must give the slot back if it fails or the request is
+    # cancelled: a reserved ticket that is never submitted blocks the world's queue
+    try:
+        admission = await _admit_trpg_turn(
+            db, world, action, target_room_id, current_location_id, agent_manager, scheduler, ticket
+        )
+    except BaseException:
+        scheduler.release(ticket)
+        raise
+    logger.info(f"Action submitted for world {world_id} (queue position {ticket.position}): {action.text[:50]}...")
+
+    return {
+        "status": "processing",
+        "message": "Action received, processing turn...",
+        "turn": admission.turn,
+        "message_id": admission.message_id,
+        "queue_position": ticket.position,
+    }
+
+
+async def _admit_trpg_turn(
+    db: AsyncSession,
+    world: models.World,
+    action: schemas.PlayerAction,
+    target_room_id: int,
+    current_location_id: Optional[int],
+    agent_manager: AgentManager,
+    scheduler: TurnScheduler,
+    ticket: TurnTicket,
+) -> crud.TurnAdmission:
+    """Admit a regular TRPG action and submit its turn to the world's queue."""
+    world_id = world.id
 
     # Compress image if present
-    image_data, image_media_type = try_compress_image(
+    image_data, image_media_type = await try_compress_image(
         action.image_data, action.image_media_type, context=f"world {world_id}"
     )
 
     # Get game time snapshot for active phase (None for onboarding)
     game_time_snapshot = None
+    fs_player_state = None
     if world.phase == WorldPhase.ACTIVE:
         fs_player_state = PlayerService.load_player_state(world.name)
         if fs_player_state and fs_player_state.game_time:
             game_time_snapshot = fs_player_state.game_time
 
-    # Save user message to the appropriate room
+    # Admit the turn: timestamp, action history, turn counter, gameplay agents
+    # and the user message are written in one transaction
     message = schemas.MessageCreate(
         content=action.text,
         role=MessageRole.USER,
@@ -160,43 +204,155 @@ async def submit_action(
         image_media_type=image_media_type,
         game_time_snapshot=game_time_snapshot,
     )
-    saved_message = await crud.create_message(db, target_room_id, message, update_room_activity=True)
+    admission = await crud.admit_turn(db, world_id, target_room_id, action.text, message)
 
-    # Trigger TRPG agent responses in background
+    # Use the Action Manager state prepared while the player was typing, if it
+    # was built for this turn, location and stats version
+    prepared = None
+    if world.phase == WorldPhase.ACTIVE:
+        prepared = get_turn_preparer().take(
+            world_id,
+            admission.turn,
+            current_location_id,
+            stats_version(
+                fs_player_state.stats if fs_player_state else None,
+                game_time_snapshot,
+            ),
+        )
+
+    # Resolve everything the turn needs now, so the background task doesn't re-query it
+    room_agents = await crud.get_agents_cached(db, target_room_id)
+    turn_context = TurnContext(
+        world_id=world.id,
+        world_name=world.name,
+        room_id=target_room_id,
+        location_id=current_location_id,
+        turn=admission.turn,
+        message_id=admission.message_id,
+        agents=room_agents,
+        npcs=_npcs(room_agents) if current_location_id else [],
+        prepared=prepared,
+    )
+
+    # Run TRPG agent responses once this turn reaches the front of the world's queue
     async def trigger_trpg_responses():
         """Background task to trigger TRPG agent responses with its own DB session."""
         from infrastructure.database.connection import background_session
 
         async with background_session() as task_db:
             try:
-                # Ensure gameplay agents are in the location room
-                # (they might be missing if location was created before agents were seeded)
-                from crud.worlds import add_gameplay_agents_to_room
-
-                await add_gameplay_agents_to_room(task_db, target_room_id)
-
-                trpg_orchestrator = get_trpg_orchestrator()
-                # Re-fetch world in this session
+                # Re-fetch the world in this session: the turn may have waited in the
+                # queue while the phase changed or the world was deleted
                 task_world = await crud.get_world(task_db, world_id)
-                if task_world:
-                    await trpg_orchestrator.handle_player_action(
-                        db=task_db,
-                        room_id=target_room_id,
-                        action_text=action.text,
-                        agent_manager=agent_manager,
-                        world=task_world,
-                    )
+                if task_world is None:
+                    logger.info(f"World {world_id} is gone, skipping queued turn {turn_context.turn}")
+                    return
+                turn = await _follow_player(task_db, turn_context)
+                trpg_orchestrator = get_trpg_orchestrator()
+                await trpg_orchestrator.handle_player_action(
+                    db=task_db,
+                    room_id=turn.room_id,
+                    action_text=action.text,
+                    agent_manager=agent_manager,
+                    world=task_world,
+                    turn=turn,
+                )
             except Exception as e:
                 logger.exception(f"Error triggering TRPG responses: {e}")
 
-    spawn_background(trigger_trpg_responses(), name=f"trigger_trpg_responses:world={world_id}")
-    logger.info(f"Action submitted for world {world_id}: {action.text[:50]}...")
+    scheduler.submit(ticket, trigger_trpg_responses)
+    return admission
 
-    return {
-        "status": "processing",
-        "message": "Action received, processing turn...",
-        "turn": new_turn,
-    }
+
+def _npcs(agents: list[models.Agent]) -> list[models.Agent]:
+    """Character agents among a room's agents (system agents excluded)."""
+    return [a for a in agents if a.group not in SYSTEM_AGENT_GROUPS]
+
+
+async def _follow_player(db: AsyncSession, turn: TurnContext) -> TurnContext:
+    """
+    Re-target a queued turn if a turn ahead of it moved the player.
+
+    The room and its agents are resolved when the action is submitted, but the
+    turn may start later: if an earlier turn traveled, the action belongs to the
+    player's new location. Its message is moved to that room and the room's
+    agents are resolved again (the prepared state was built for the old one).
+    """
+    if turn.location_id is None:
+        return turn
+    player_state = await crud.get_player_state(db, turn.world_id)
+    location_id = player_state.current_location_id if player_state else None
+    if location_id is None or location_id == turn.location_id:
+        return turn
+    location = await crud.get_location(db, location_id)
+    if location is None or location.room_id is None:
+        return turn
+
+    await crud.retarget_turn(db, turn.message_id, location.room_id)
+    agents = await crud.get_agents_cached(db, location.room_id)
+    logger.info(
+        f"Turn {turn.turn} for world {turn.world_id} follows the player from room {turn.room_id} to {location.room_id}"
+    )
+    return replace(
+        turn, room_id=location.room_id, location_id=location_id, agents=agents, npcs=_npcs(agents), prepared=None
+    )
+
+
+@router.post("/{world_id}/action/prepare")
+async def prepare_action(
+    world_id: int,
+    db: AsyncSession = Depends(get_db),
+    identity: RequestIdentity = Depends(get_request_identity),
+    agent_manager: AgentManager = Depends(get_agent_manager),
+):
+    """
+    Prepare the next turn's Action Manager while the player is typing.
+
+    Called by the frontend when the action input gains focus or text. Builds
+    the gameplay context, warms the Action Manager's pooled client and renders
+    its system prompt in the background. The next submitted action uses it if
+    the turn, location and player stats haven't changed in the meantime.
+
+    Opt-in via TURN_PREPARE_ENABLED. Returns one of: "disabled", "skipped",
+    "busy" (a turn is running or queued), "preparing" or "ready".
+    """
+    world = await crud.get_world(db, world_id)
+    if not world:
+        raise HTTPException(status_code=404, detail="World not found")
+    AccessControl.raise_if_no_access(identity.user_id, identity.role, world.owner_id)
+
+    if not get_settings().turn_prepare_enabled:
+        return {"status": "disabled"}
+
+    player_state = await crud.get_player_state(db, world_id)
+    if not player_state:
+        raise HTTPException(status_code=404, detail="Player state not found")
+    if world.phase != WorldPhase.ACTIVE or player_state.is_chat_mode or not player_state.current_location_id:
+        return {"status": "skipped"}
+
+    # A running or queued turn will change the state the prompt is built from
+    queue_status = get_turn_scheduler().get_queue_status(world_id)
+    if queue_status["running"] or queue_status["pending"]:
+        return {"status": "busy"}
+
+    location = await crud.get_location(db, player_state.current_location_id)
+    if not location or not location.room_id:
+        return {"status": "skipped"}
+
+    fs_player_state = PlayerService.load_player_state(world.name)
+    status = get_turn_preparer().request(
+        world,
+        location.room_id,
+        turn=player_state.turn_count + 1,
+        location_id=location.id,
+        version=stats_version(
+            fs_player_state.stats if fs_player_state else None,
+            fs_player_state.game_time if fs_player_state else None,
+        ),
+        agents=await crud.get_agents_cached(db, location.room_id),
+        agent_manager=agent_manager,
+    )
+    return {"status": status}
 
 
 @router.get("/{world_id}/action/suggestions")
@@ -20,6 +20,7 @@ from infrastructure.database.connection import background_session
 from orchestration import get_chat_mode_orchestrator
 from sdk import AgentManager
 from sdk.agent.options_builder import build_agent_options
+from sdk.client.connection_admission import ConnectionPriority, connection_priority
 from services.agent_config_service import AgentConfigService
 from services.prompt_builder import build_system_prompt
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -74,7 +75,9 @@ async def _warm_chat_summarizer(room_id: int, agent_manager: AgentManager) -> No
             options, config_hash = build_agent_options(context, system_prompt, [])
 
             # Pre-create the client in the pool
-            _pooled, is_new, _lock = await agent_manager.client_pool.get_or_create(task_id, options, config_hash)
+            _pooled, is_new, _lock = await agent_manager.client_pool.get_or_create(
+                task_id, options, config_hash, priority=ConnectionPriority.WARMUP
+            )
 
             if is_new:
                 logger.info(f"Chat_Summarizer client warmed for room {room_id}")
@@ -190,7 +193,7 @@ async def handle_chat_mode_action(
     chat_session_id = player_state.chat_session_id
 
     # Compress image if present
-    compressed_image_data, compressed_image_media_type = try_compress_image(
+    compressed_image_data, compressed_image_media_type = await try_compress_image(
         image_data, image_media_type, context=f"chat mode in world {world_id}"
     )
 
@@ -415,15 +418,16 @@ Write in past tense, third person (e.g., "The player discussed...", "They agreed
             task_id=task_id,
         )
 
-        # Generate summary via AgentManager
+        # Generate summary via AgentManager (background class: deferred under connection pressure)
         response_text = ""
-        async for event in agent_manager.generate_sdk_response(context):
-            if event.get("type") == "content_delta":
-                response_text += event.get("delta", "")
-            elif event.get("type") == "stream_end":
-                # Use final response_text from stream_end if available
-                if event.get("response_text"):
-                    response_text = event["response_text"]
+        with connection_priority(ConnectionPriority.BACKGROUND):
+            async for event in agent_manager.generate_sdk_response(context):
+                if event.get("type") == "content_delta":
+                    response_text += event.get("delta", "")
+                elif event.get("type") == "stream_end":
+                    # Use final response_text from stream_end if available
+                    if event.get("response_text"):
+                        response_text = event["response_text"]
 
         logger.info(f"Chat_Summarizer generated summary: {response_text[:100]}...")
         return response_text.strip() if response_text else None
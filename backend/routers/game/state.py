@@ -13,9 +13,10 @@ from core.dependencies import (
     get_request_identity,
 )
 from domain.services.access_control import AccessControl
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from infrastructure.database.connection import get_db
 from services.player_service import PlayerService
+from services.usage_accounting import get_usage_recorder
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
@@ -158,3 +159,43 @@ async def get_world_items(
     items = ItemService.get_all_items_in_world(world.name)
 
     return {"items": items, "count": len(items)}
+
+
+@router.get("/{world_id}/usage/turns", response_model=list[schemas.TurnTokenUsage])
+async def get_turn_usage(
+    world_id: int,
+    limit: int = Query(default=20, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+    identity: RequestIdentity = Depends(get_request_identity),
+):
+    """
+    Get token usage of the world's last N turns (newest first).
+
+    Each turn has input/output/cache-read/cache-creation tokens, prompt-cache hit
+    ratio, cost and latency summed over all its agent responses, per agent too.
+    """
+    world = await crud.get_world(db, world_id)
+    if not world:
+        raise HTTPException(status_code=404, detail="World not found")
+    AccessControl.raise_if_no_access(identity.user_id, identity.role, world.owner_id)
+
+    # Include responses still waiting in the write buffer
+    await get_usage_recorder().flush()
+    return await crud.get_turn_usage(db, world_id, limit=limit)
+
+
+@router.get("/{world_id}/usage/daily", response_model=list[schemas.DailyTokenUsage])
+async def get_daily_usage(
+    world_id: int,
+    days: int = Query(default=7, ge=1, le=90),
+    db: AsyncSession = Depends(get_db),
+    identity: RequestIdentity = Depends(get_request_identity),
+):
+    """Get the world's token usage per UTC day (newest first), with a per-agent breakdown."""
+    world = await crud.get_world(db, world_id)
+    if not world:
+        raise HTTPException(status_code=404, detail="World not found")
+    AccessControl.raise_if_no_access(identity.user_id, identity.role, world.owner_id)
+
+    await get_usage_recorder().flush()
+    return await crud.get_daily_usage(db, world_id, days=days)
@@ -30,10 +30,13 @@ from infrastructure.database.connection import (
     serialized_write,
 )
 from orchestration import get_trpg_orchestrator
+from orchestration.location_enrichment import get_location_enricher
 from sdk import AgentManager
 from services.location_storage import LocationStorage
 from services.player_service import PlayerService
 from services.room_mapping_service import RoomMappingService
+from services.subagent_cache import get_subagent_cache
+from services.usage_accounting import get_usage_recorder
 from services.world_reset_service import WorldResetService
 from services.world_service import WorldService
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -521,6 +524,14 @@ async def _perform_world_reset(
 
     logger.info(f"Resetting world '{world.name}' to initial state")
 
+    # Memoized sub-agent results describe the world being discarded
+    get_subagent_cache().clear_world(world.name)
+    get_location_enricher().forget_world(world.id)
+
+    # Turn numbers restart, so earlier token usage leaves the per-turn rollups
+    await get_usage_recorder().flush()
+    await crud.detach_turn_usage(db, world.id)
+
     # Clean up stale entries from _index.yaml (entries without directories)
     stale_entries = LocationStorage.cleanup_stale_entries(world.name)
     if stale_entries:
@@ -1,5 +1,6 @@
 """Message-related routes for polling, sending, and listing messages."""
 
+import asyncio
 import logging
 from typing import List
 
@@ -21,7 +22,7 @@ from sdk import AgentManager
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from sqlalchemy.ext.asyncio import AsyncSession
-from utils.images import compress_image_base64
+from utils.images import compress_image_base64_async
 
 router = APIRouter()
 logger = logging.getLogger("MessageRouter")
@@ -163,11 +164,18 @@ async def send_message(
 
             logger.info(f"[send_message] Compressing {len(images_to_process)} image(s) for room {room_id}")
 
-            for i, img in enumerate(images_to_process):
+            # Compress in parallel in the worker pool (keeps the event loop free)
+            results = await asyncio.gather(
+                *(
+                    compress_image_base64_async(img.data, img.media_type, context=f"room {room_id}")
+                    for img in images_to_process
+                )
+            )
+
+            for i, (img, (compressed_data, compressed_media_type)) in enumerate(zip(images_to_process, results)):
                 original_size = len(img.data)
                 total_original += original_size
 
-                compressed_data, compressed_media_type = compress_image_base64(img.data, img.media_type)
                 compressed_size = len(compressed_data)
                 total_compressed += compressed_size
 
@@ -188,7 +196,9 @@ async def send_message(
     elif message.image_data and message.image_media_type:
         try:
             logger.info(f"[send_message] Compressing single image for room {room_id} (legacy format)")
-            compressed_data, compressed_media_type = compress_image_base64(message.image_data, message.image_media_type)
+            compressed_data, compressed_media_type = await compress_image_base64_async(
+                message.image_data, message.image_media_type, context=f"room {room_id}"
+            )
             # Convert to new images format
             message.images = [schemas.ImageItem(data=compressed_data, media_type=compressed_media_type)]
             # Clear deprecated fields
@@ -13,6 +13,8 @@ This package organizes schemas by resource type:
 from schemas.agents import Agent, AgentBase, AgentCreate, AgentUpdate
 from schemas.common import TimestampSerializerMixin
 from schemas.game import (
+    AgentTokenUsage,
+    DailyTokenUsage,
     GameStateResponse,
     GameTime,
     ImportableWorld,
@@ -26,12 +28,15 @@ from schemas.game import (
     PlayerStateBase,
     StatDefinition,
     StatDefinitions,
+    TokenUsageTotals,
+    TurnTokenUsage,
     World,
     WorldBase,
     WorldCreate,
     WorldResetRequest,
     WorldResetResponse,
     WorldSummary,
+    WorldTokenUsage,
     WorldUpdate,
 )
 from schemas.messages import ImageItem, Message, MessageBase, MessageCreate, PollResponse
@@ -80,4 +85,10 @@ __all__ = [
     "PlayerState",
     "PlayerAction",
     "GameStateResponse",
+    # Game - Token Usage
+    "TokenUsageTotals",
+    "AgentTokenUsage",
+    "WorldTokenUsage",
+    "TurnTokenUsage",
+    "DailyTokenUsage",
 ]
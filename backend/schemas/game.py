@@ -362,6 +362,58 @@ class GameStateResponse(BaseModel):
     suggestions: Optional[List[str]] = None
 
 
+
+# =============================================================================
+# Token Usage Schemas
+# =============================================================================
+
+
+class TokenUsageTotals(BaseModel):
+    """Token usage summed over a set of agent responses."""
+
+    responses: int
+    input_tokens: int  # Uncached prompt tokens
+    output_tokens: int
+    cache_read_tokens: int
+    cache_creation_tokens: int
+    cache_hit_ratio: float  # cache_read_tokens / all prompt tokens
+    cost_usd: float
+    avg_latency_ms: float
+    max_latency_ms: int
+
+
+class AgentTokenUsage(TokenUsageTotals):
+    """Token usage of one agent."""
+
+    agent_name: str
+
+
+class WorldTokenUsage(TokenUsageTotals):
+    """Token usage of one world (None: chat rooms outside worlds)."""
+
+    world_id: Optional[int] = None
+
+
+class TurnTokenUsage(TokenUsageTotals):
+    """Token usage of one player turn, with a per-agent breakdown."""
+
+    turn: int
+    started_at: datetime
+    agents: List[AgentTokenUsage]
+
+    @field_serializer("started_at")
+    def serialize_started_at(self, dt: datetime, _info):
+        return _serialize_utc_datetime(dt)
+
+
+class DailyTokenUsage(TokenUsageTotals):
+    """Token usage of one UTC day, with per-agent (and per-world) breakdowns."""
+
+    day: str  # YYYY-MM-DD
+    agents: List[AgentTokenUsage]
+    worlds: Optional[List[WorldTokenUsage]] = None  # Only when covering all worlds
+
+
 __all__ = [
     # World
     "WorldBase",
@@ -386,4 +438,10 @@ __all__ = [
     "PlayerState",
     "PlayerAction",
     "GameStateResponse",
+    # Token Usage
+    "TokenUsageTotals",
+    "AgentTokenUsage",
+    "WorldTokenUsage",
+    "TurnTokenUsage",
+    "DailyTokenUsage",
 ]
@@ -10,8 +10,14 @@ Package structure:
 - sdk/tools/ - Tool definitions (schemas, descriptions, input models)
 - sdk/handlers/ - MCP tool handler implementations (server factories, tool call logic)
 - sdk/config/ - YAML configurations (guidelines, localization)
+
+Handler re-exports are resolved lazily so ``from sdk import AgentManager`` does
+not load the MCP tool modules; they are imported when first used.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from infrastructure.logging.formatters import format_message_for_debug
 
 # Re-exports from agent
@@ -26,11 +32,29 @@ from sdk.agent.task_subagent_definitions import (
 from sdk.client.client_pool import ClientPool
 from sdk.client.stream_parser import StreamParser
 
-# Re-exports from handlers
-from sdk.handlers import create_action_mcp_server
+if TYPE_CHECKING:
+    from sdk.handlers import create_action_mcp_server
+    from sdk.handlers.onboarding_tools import SUBAGENT_TOOL_NAMES, create_onboarding_tools
+
+# Lazily re-exported handler names -> defining module
+_LAZY_EXPORTS = {
+    # Re-exports from handlers
+    "create_action_mcp_server": "sdk.handlers.action_tools",
+    # Subagent tools for SDK native Task pattern
+    "SUBAGENT_TOOL_NAMES": "sdk.handlers.onboarding_tools",
+    "create_onboarding_tools": "sdk.handlers.onboarding_tools",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-# Subagent tools for SDK native Task pattern
-from sdk.handlers.onboarding_tools import SUBAGENT_TOOL_NAMES, create_onboarding_tools
 
 __all__ = [
     # Agent orchestration
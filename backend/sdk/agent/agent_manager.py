@@ -24,10 +24,13 @@ from domain.value_objects.task_identifier import TaskIdentifier
 from infrastructure.logging.agent_logger import append_response_to_debug_log, write_debug_log
 from infrastructure.logging.formatters import format_message_for_debug
 from infrastructure.logging.perf_logger import get_perf_logger
+from infrastructure.logging.tracing import get_tracer
+from services.usage_accounting import get_usage_recorder
 
 from sdk.agent.options_builder import build_agent_options
 from sdk.agent.streaming_state import StreamingStateManager
 from sdk.client.client_pool import ClientPool
+from sdk.client.connection_admission import ConnectionPriority, resolve_priority
 from sdk.client.stream_parser import NarrationStreamExtractor, StreamParser
 from sdk.loaders import get_debug_config
 
@@ -196,6 +199,7 @@ class AgentManager:
             anthropic_calls: list[str] = []  # Track anthropic tool calls (via hook)
             structured_output = None  # Track structured output if using output_format
             usage_data: dict | None = None  # Track token usage from API response
+            cost_usd: float | None = None  # Cost of this response (from the CLI's running total)
 
             # Narration streaming state
             in_narration_block = False
@@ -219,7 +223,10 @@ class AgentManager:
             # NOTE: usage_lock returned but not currently used - AgentManager's clients
             # are keyed by (room_id, agent_id) and typically not accessed concurrently
             # pooled contains: client, msg_queue (for reading), pump_task (background drainer)
-            pooled, is_new, _ = await self.client_pool.get_or_create(pool_key, options, config_hash)
+            with get_tracer().span("pool_acquire", room_id=context.room_id, agent_name=context.agent_name):
+                pooled, is_new, _ = await self.client_pool.get_or_create(
+                    pool_key, options, config_hash, priority=resolve_priority(context.agent_name)
+                )
             pool_duration_ms = (time.perf_counter() - pool_start) * 1000
 
             # Log pool fetch timing (overall summary - details logged in ClientPool)
@@ -414,6 +421,7 @@ class AgentManager:
                 # Capture usage data if present (from ResultMessage)
                 if parsed.usage:
                     usage_data = parsed.usage
+                    cost_usd = pooled.cost_delta(parsed.cost_usd)
 
                 # Narration tool streaming: track tool_use blocks for narration
                 if parsed.tool_start_name and (
@@ -425,6 +433,9 @@ class AgentManager:
                 if parsed.tool_input_delta is not None and in_narration_block and narration_extractor:
                     narration_delta = narration_extractor.feed(parsed.tool_input_delta)
                     if narration_delta:
+                        if not narration_text:
+                            # Lets the orchestrator measure time to first narration token per turn
+                            yield {"type": "narration_start", "temp_id": temp_id}
                         narration_text += narration_delta
                         self._broadcast(context.room_id, {
                             "type": "narration_delta",
@@ -512,9 +523,11 @@ class AgentManager:
             )
 
             # Update pooled client's session_id to match the new session from SDK response
+            # (the previous one stays in its lineage, so stale resumes still reuse it)
             if new_session_id and pooled.session_id != new_session_id:
                 logger.debug(f"Updating pooled session_id: {pooled.session_id} -> {new_session_id}")
-                pooled.session_id = new_session_id
+                pooled.adopt_session(new_session_id)
+            pooled.mark_used()
 
             # Unregister the client when done
             if context.task_id and context.task_id in self.active_clients:
@@ -546,6 +559,8 @@ class AgentManager:
                 cache_read = usage_data.get("cache_read_input_tokens", 0)
                 output_tokens = usage_data.get("output_tokens", 0)
                 total_input = input_tokens + cache_creation + cache_read
+                # Share of input served from the upstream prompt cache (stable system prompt prefix)
+                cache_hit_ratio = round(cache_read / total_input, 3) if total_input else 0.0
                 _perf.log_sync(
                     "api_usage",
                     0,  # No duration, just logging usage data
@@ -555,8 +570,18 @@ class AgentManager:
                     cache_creation=cache_creation,
                     cache_read=cache_read,
                     total_input=total_input,
+                    cache_hit_ratio=cache_hit_ratio,
                     output_tokens=output_tokens,
                 )
+                get_usage_recorder().record(
+                    usage_data,
+                    agent_name=context.agent_name,
+                    room_id=context.room_id,
+                    agent_id=context.agent_id,
+                    world_id=context.world_id,
+                    latency_ms=(time.perf_counter() - query_start) * 1000,
+                    cost_usd=cost_usd,
+                )
 
             # Append response to debug log
             append_response_to_debug_log(
@@ -758,8 +783,10 @@ class AgentManager:
             # Create task identifier
             task_id = TaskIdentifier(room_id=room_id, agent_id=agent_id)
 
-            # Get or create client (this establishes connection)
-            pooled, is_new, _ = await self.client_pool.get_or_create(task_id, options, config_hash)
+            # Get or create client (this establishes connection); a warm-up is shed under pressure
+            pooled, is_new, _ = await self.client_pool.get_or_create(
+                task_id, options, config_hash, priority=ConnectionPriority.WARMUP
+            )
 
             if is_new:
                 logger.info(f"🔌 Pre-connect: NEW client for {agent_name} (room={room_id})")
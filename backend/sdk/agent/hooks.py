@@ -2,23 +2,29 @@
 Hook factory functions for Claude Agent SDK.
 
 This module provides functions to create various hooks used during agent
-response generation, including prompt tracking, tool capture, and subagent handling.
+response generation, including prompt tracking, tool capture, subagent handling
+and the sub-agent result cache.
 """
 
 from __future__ import annotations
 
 import logging
-import time
 from typing import TYPE_CHECKING, Any, Callable, Coroutine
 
 from claude_agent_sdk.types import (
     HookMatcher,
+    PostToolUseFailureHookInput,
     PostToolUseHookInput,
     PreToolUseHookInput,
+    SubagentStartHookInput,
+    SubagentStopHookInput,
     SyncHookJSONOutput,
     UserPromptSubmitHookInput,
 )
 from infrastructure.logging.perf_logger import get_perf_logger
+from services.subagent_cache import get_subagent_cache, tool_response_text
+
+from sdk.agent.subagent_ledger import SubagentLedger
 
 if TYPE_CHECKING:
     from domain.value_objects.contexts import AgentResponseContext
@@ -26,11 +32,6 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 _perf = get_perf_logger()
 
-# Track subagent invocation times by agent_id for duration calculation
-_subagent_start_times: dict[
-    str, tuple[float, str, int, str]
-] = {}  # agent_id -> (start_time, parent_agent, room_id, subagent_type)
-
 # Type alias for hook functions
 HookFunc = Callable[..., Coroutine[Any, Any, SyncHookJSONOutput]]
 
@@ -38,13 +39,17 @@ HookFunc = Callable[..., Coroutine[Any, Any, SyncHookJSONOutput]]
 def create_prompt_submit_hook(
     agent_name: str,
     room_id: int,
+    ledger: SubagentLedger | None = None,
 ) -> HookFunc:
     """
     Create a UserPromptSubmit hook to track when prompts are submitted.
 
+    A submitted prompt starts a new turn in the agent's sub-agent ledger.
+
     Args:
         agent_name: Name of the agent for logging
         room_id: Room ID for logging
+        ledger: Optional sub-agent ledger of the agent
 
     Returns:
         Async hook function
@@ -60,6 +65,8 @@ def create_prompt_submit_hook(
         Note: user_prompt_chars is the character length of the user message string,
         NOT the actual API token count. Real token usage comes from api_usage phase.
         """
+        if ledger is not None:
+            ledger.begin_turn()
         _perf.log_sync(
             "prompt_submitted",
             0,  # No duration calculation, just timestamp
@@ -103,91 +110,65 @@ def create_anthropic_capture_hook(
     return capture_anthropic_tool
 
 
+def create_subagent_start_hook(
+    ledger: SubagentLedger,
+) -> HookFunc:
+    """
+    Create a SubagentStart hook that marks a sub-agent as running.
+
+    The sub-agent's ``agent_id`` is bound to its Task call in the ledger, which
+    ends the queue phase of the run.
+
+    Args:
+        ledger: Sub-agent ledger of the parent agent
+
+    Returns:
+        Async hook function
+    """
+
+    async def handle_subagent_start(
+        input_data: SubagentStartHookInput,
+        _tool_use_id: str | None,
+        _ctx: dict,
+    ) -> SyncHookJSONOutput:
+        """Hook to record when a subagent starts running."""
+        run = ledger.subagent_started(input_data.get("agent_id", ""), input_data.get("agent_type", ""))
+        if run is None:
+            logger.debug(f"SubagentStart without a matching Task call: {input_data.get('agent_type')}")
+        return {"continue_": True}
+
+    return handle_subagent_start
+
+
 def create_subagent_stop_hook(
     context: AgentResponseContext,
+    ledger: SubagentLedger | None = None,
 ) -> HookFunc:
     """
     Create a SubagentStop hook to track when subagents complete.
 
-    This hook logs subagent completion for performance monitoring and calculates
-    the duration from start (tracked by PreToolUse hook) to stop.
+    The stop is matched to its Task call through the ``agent_id`` bound at
+    SubagentStart (see sdk/agent/subagent_ledger.py). Background runs are
+    complete here; foreground runs complete when their Task result arrives.
 
     Args:
         context: Agent response context for logging
+        ledger: Sub-agent ledger of the parent agent (a fresh one if omitted)
 
     Returns:
         Async hook function
     """
+    ledger = ledger or SubagentLedger(context.agent_name, context.room_id, context.world_id)
 
     async def handle_subagent_stop(
-        input_data: dict,
-        tool_use_id: str | None,
+        input_data: SubagentStopHookInput,
+        _tool_use_id: str | None,
         _ctx: dict,
     ) -> SyncHookJSONOutput:
-        """Hook to log when subagent completes."""
-        stop_time = time.perf_counter()
-        logger.info(f"🔔 SubagentStop hook fired. Input keys: {list(input_data.keys())}")
-
-        # Try to get agent_id
-        agent_id = input_data.get("agent_id")
-        logger.info(f"🔔 SubagentStop: agent_id={agent_id}")
-
-        # Calculate subagent duration if we have start time
-        subagent_type = "unknown"
-        parent_agent = context.agent_name
-        room_id = context.room_id
-        duration_ms = 0.0
-        matched_key = None
-
-        # Try to find start time in order of reliability:
-        # 1. tool_use_id (most reliable - same ID from pre/post hooks)
-        # 2. agent_id (from SubagentStop input)
-        # 3. composite key (room:subagent_type fallback)
-
-        keys_to_try = [k for k in [tool_use_id, agent_id] if k]
-        for key in keys_to_try:
-            if key in _subagent_start_times:
-                start_time, parent_agent, room_id, subagent_type = _subagent_start_times.pop(key)
-                duration_ms = (stop_time - start_time) * 1000
-                matched_key = key
-                logger.debug(f"Matched subagent by key: {key}, duration: {duration_ms:.2f}ms")
-                break
-
-        if matched_key is None:
-            # Try composite key matching by room_id
-            for k, (start, parent, rid, stype) in list(_subagent_start_times.items()):
-                # Clean up old entries (older than 5 minutes)
-                if (stop_time - start) > 300:
-                    del _subagent_start_times[k]
-                    continue
-                # Match by composite key pattern or same room
-                if rid == context.room_id:
-                    duration_ms = (stop_time - start) * 1000
-                    subagent_type = stype
-                    parent_agent = parent
-                    matched_key = k
-                    del _subagent_start_times[k]
-                    # Also clean up related composite key if exists
-                    composite = f"{rid}:{stype}"
-                    _subagent_start_times.pop(composite, None)
-                    logger.debug(f"Matched subagent by room fallback: {k}, duration: {duration_ms:.2f}ms")
-                    break
-
-        if matched_key is None:
-            logger.warning(
-                f"Could not match subagent stop to start. Keys available: {list(_subagent_start_times.keys())}"
-            )
-
-        # Log subagent completion
-        await _perf.log_async(
-            "subagent_completed",
-            duration_ms,
-            subagent_type,
-            room_id,
-            parent=parent_agent,
-            success=True,
-        )
-
+        """Hook to record when a subagent stops running."""
+        run = ledger.subagent_stopped(input_data.get("agent_id", ""), input_data.get("agent_type", ""))
+        if run is None:
+            logger.warning(f"Could not match SubagentStop to a Task call: agent_id={input_data.get('agent_id')}")
         return {"continue_": True}
 
     return handle_subagent_stop
@@ -195,19 +176,24 @@ def create_subagent_stop_hook(
 
 def create_pre_task_subagent_hook(
     context: AgentResponseContext,
+    ledger: SubagentLedger | None = None,
 ) -> HookFunc:
     """
     Create a PreToolUse hook to track when any Task tool (subagent) is invoked.
 
-    This logs the subagent invocation for performance monitoring and stores
-    the start time for duration calculation when the subagent completes.
+    This logs the subagent invocation for performance monitoring and opens its
+    run in the sub-agent ledger, keyed by the Task's tool_use_id.
+    Designer Tasks answered by the sub-agent result cache are denied instead,
+    with the cached result as the reason.
 
     Args:
         context: Agent response context for logging
+        ledger: Sub-agent ledger of the parent agent (a fresh one if omitted)
 
     Returns:
         Async hook function
     """
+    ledger = ledger or SubagentLedger(context.agent_name, context.room_id, context.world_id)
 
     async def track_subagent_invocation(
         input_data: PreToolUseHookInput,
@@ -226,21 +212,28 @@ def create_pre_task_subagent_hook(
         if not subagent_type:
             return {"continue_": True}
 
-        # Store start time for duration calculation
-        # Key priority: tool_use_id first (most reliable), then composite key
-        # The composite key helps match when tool_use_id isn't available in SubagentStop
-        start_time = time.perf_counter()
-        start_data = (start_time, context.agent_name, context.room_id, subagent_type)
-
-        # Store by tool_use_id (primary)
-        if tool_use_id:
-            _subagent_start_times[tool_use_id] = start_data
-            logger.debug(f"Stored subagent start time with tool_use_id: {tool_use_id}")
+        # Answer from the sub-agent result cache instead of running the Task
+        hit = get_subagent_cache().lookup(context.world_name or "", subagent_type, tool_input.get("prompt", ""))
+        if hit is not None:
+            ledger.task_cached(tool_use_id, subagent_type, hit.source)
+            _perf.log_sync(
+                "subagent_cache_hit",
+                0.0,
+                context.agent_name,
+                context.room_id,
+                subagent=subagent_type,
+                source=hit.source,
+                tool_use_id=tool_use_id or "none",
+            )
+            return {
+                "hookSpecificOutput": {
+                    "hookEventName": "PreToolUse",
+                    "permissionDecision": "deny",
+                    "permissionDecisionReason": hit.result,
+                }
+            }
 
-        # Also store by composite key for fallback matching
-        composite_key = f"{context.room_id}:{subagent_type}"
-        _subagent_start_times[composite_key] = start_data
-        logger.debug(f"Stored subagent start time with composite key: {composite_key}")
+        ledger.task_requested(tool_use_id, subagent_type, run_in_background)
 
         # Log subagent invocation
         _perf.log_sync(
@@ -258,6 +251,95 @@ def create_pre_task_subagent_hook(
     return track_subagent_invocation
 
 
+def create_subagent_tool_hooks(
+    ledger: SubagentLedger,
+) -> tuple[HookFunc, HookFunc]:
+    """
+    Create PreToolUse/PostToolUse hooks timing tool calls made inside sub-agents.
+
+    Tool hooks fired inside a sub-agent carry its ``agent_id``; hooks fired by
+    the parent agent do not and are ignored. A failed Task call (PostToolUse
+    does not fire for it) is recorded through the same post hook registered
+    for PostToolUseFailure.
+
+    Args:
+        ledger: Sub-agent ledger of the parent agent
+
+    Returns:
+        (pre hook, post hook) tuple
+    """
+
+    async def track_tool_start(
+        input_data: PreToolUseHookInput,
+        tool_use_id: str | None,
+        _ctx: dict,
+    ) -> SyncHookJSONOutput:
+        """Open the timing of a sub-agent's tool call."""
+        agent_id = input_data.get("agent_id")
+        if agent_id:
+            ledger.tool_started(agent_id, tool_use_id, input_data.get("tool_name", ""))
+        return {"continue_": True}
+
+    async def track_tool_end(
+        input_data: PostToolUseHookInput | PostToolUseFailureHookInput,
+        tool_use_id: str | None,
+        _ctx: dict,
+    ) -> SyncHookJSONOutput:
+        """Close the timing of a sub-agent's tool call, or record a failed Task."""
+        failed = input_data.get("hook_event_name") == "PostToolUseFailure"
+        agent_id = input_data.get("agent_id")
+        if agent_id:
+            ledger.tool_finished(agent_id, tool_use_id, error=failed)
+        elif failed and input_data.get("tool_name") == "Task":
+            ledger.task_finished(tool_use_id, None, "", error=True)
+        return {"continue_": True}
+
+    return track_tool_start, track_tool_end
+
+
+def create_subagent_result_hook(
+    context: AgentResponseContext,
+    ledger: SubagentLedger | None = None,
+) -> HookFunc:
+    """
+    Create a PostToolUse hook that memoizes completed designer Task results.
+
+    The Task result also completes the run in the sub-agent ledger, with its
+    token usage and result size.
+
+    Args:
+        context: Agent response context (provides the world)
+        ledger: Optional sub-agent ledger of the parent agent
+
+    Returns:
+        Async hook function
+    """
+
+    async def store_subagent_result(
+        input_data: PostToolUseHookInput,
+        tool_use_id: str | None,
+        _ctx: dict,
+    ) -> SyncHookJSONOutput:
+        """Store a foreground Task's result in the sub-agent result cache."""
+        tool_input = input_data.get("tool_input", {})
+        if input_data.get("tool_name") != "Task" or input_data.get("agent_id"):
+            return {"continue_": True}
+        response = input_data.get("tool_response")
+        result = tool_response_text(response)
+        if ledger is not None:
+            ledger.task_finished(tool_use_id, response, result)
+        if not tool_input.get("run_in_background", False):
+            get_subagent_cache().store(
+                context.world_name or "",
+                tool_input.get("subagent_type", ""),
+                tool_input.get("prompt", ""),
+                result,
+            )
+        return {"continue_": True}
+
+    return store_subagent_result
+
+
 def build_hooks(
     context: AgentResponseContext,
     anthropic_calls_capture: list[str] | None = None,
@@ -265,6 +347,9 @@ def build_hooks(
     """
     Build all hooks for agent response generation.
 
+    The sub-agent hooks share one SubagentLedger, which lives as long as the
+    client the hooks are registered with.
+
     Args:
         context: Agent response context
         anthropic_calls_capture: Optional list to capture anthropic tool call situations
@@ -273,12 +358,14 @@ def build_hooks(
         Dict of hooks to pass to ClaudeAgentOptions, or None if no hooks
     """
     hooks: dict = {}
+    ledger = SubagentLedger(context.agent_name, context.room_id, context.world_id)
+    track_tool_start, track_tool_end = create_subagent_tool_hooks(ledger)
 
     # Add UserPromptSubmit hook to track when prompt is submitted
     hooks["UserPromptSubmit"] = [
         HookMatcher(
             matcher=None,
-            hooks=[create_prompt_submit_hook(context.agent_name, context.room_id)],
+            hooks=[create_prompt_submit_hook(context.agent_name, context.room_id, ledger)],
         )
     ]
 
@@ -295,13 +382,31 @@ def build_hooks(
             )
         )
 
-    # Add SubagentStop hook
+    # Memoize designer sub-agent results (see services/subagent_cache.py)
+    hooks["PostToolUse"].append(
+        HookMatcher(
+            matcher="Task",
+            hooks=[create_subagent_result_hook(context, ledger)],
+        )
+    )
+
+    # Time tool calls made inside sub-agents; record failed Tasks
+    hooks["PostToolUse"].append(HookMatcher(matcher=None, hooks=[track_tool_end]))
+    hooks["PostToolUseFailure"] = [HookMatcher(matcher=None, hooks=[track_tool_end])]
+
+    # Add SubagentStart/SubagentStop hooks
+    hooks["SubagentStart"] = [
+        HookMatcher(
+            matcher=None,
+            hooks=[create_subagent_start_hook(ledger)],
+        )
+    ]
     if "SubagentStop" not in hooks:
         hooks["SubagentStop"] = []
     hooks["SubagentStop"].append(
         HookMatcher(
             matcher=None,
-            hooks=[create_subagent_stop_hook(context)],
+            hooks=[create_subagent_stop_hook(context, ledger)],
         )
     )
 
@@ -313,8 +418,9 @@ def build_hooks(
     hooks["PreToolUse"].append(
         HookMatcher(
             matcher="Task",
-            hooks=[create_pre_task_subagent_hook(context)],
+            hooks=[create_pre_task_subagent_hook(context, ledger)],
         )
     )
+    hooks["PreToolUse"].append(HookMatcher(matcher=None, hooks=[track_tool_start]))
 
     return hooks if hooks else None
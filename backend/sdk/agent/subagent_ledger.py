@@ -0,0 +1,357 @@
+"""
+Per-turn ledger of sub-agent (Task) runs.
+
+Every Task call gets an entry keyed by its ``tool_use_id`` when the parent
+agent's PreToolUse hook fires. The CLI's sub-agent hooks identify the
+sub-agent by ``agent_id`` instead, so SubagentStart binds that id to the
+oldest unbound entry of the same ``agent_type`` in this ledger. Tool hooks
+fired inside the sub-agent carry the same ``agent_id``, which attributes its
+tool calls without guessing. Each ledger belongs to one agent's hooks, so
+sub-agents running in other rooms can never be matched.
+
+Timings per run:
+
+    queue   PreToolUse(Task) -> SubagentStart
+    run     SubagentStart -> SubagentStop
+    total   PreToolUse(Task) -> Task result (foreground) or SubagentStop (background)
+
+Each finished run is added to the process-wide ``SubagentStats`` and to the
+turn trace as a ``subagent:<type>`` span, with ``subagent_run`` and
+``subagent_tool:<name>`` child spans. ``begin_turn`` (on UserPromptSubmit)
+drops the previous turn's finished runs and abandons foreground runs that
+never finished (e.g., an interrupted turn).
+"""
+
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from infrastructure.logging.perf_logger import LatencyHistogram, get_perf_logger
+from infrastructure.logging.tracing import Span, get_tracer
+
+# Background runs still unfinished after this many seconds are abandoned at the next turn
+BACKGROUND_RUN_TTL = 600.0
+
+USAGE_KEYS = ("input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens")
+
+
+def task_usage(response: Any) -> Dict[str, int]:
+    """Token usage reported in a Task tool response (empty if none)."""
+    if not isinstance(response, dict):
+        return {}
+    usage = response.get("usage") if isinstance(response.get("usage"), dict) else {}
+    counts = {key: int(usage.get(key) or 0) for key in USAGE_KEYS}
+    counts["total_tokens"] = int(response.get("totalTokens") or 0) or sum(counts.values())
+    return counts if counts["total_tokens"] else {}
+
+
+@dataclass
+class SubagentRun:
+    """One Task call and the sub-agent it started."""
+
+    tool_use_id: str
+    subagent_type: str
+    background: bool
+    turn: int
+    requested_at: float
+    agent_id: Optional[str] = None
+    started_at: Optional[float] = None
+    stopped_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    cached: Optional[str] = None  # result cache source when the Task was answered without running
+    error: bool = False
+    abandoned: bool = False
+    tool_calls: int = 0
+    tool_ms: Dict[str, float] = field(default_factory=dict)  # tool name -> total ms
+    usage: Dict[str, int] = field(default_factory=dict)
+    result_chars: int = 0
+    span: Optional[Span] = None
+    run_span: Optional[Span] = None
+    open_tools: Dict[str, Tuple[str, float, Optional[Span]]] = field(default_factory=dict)
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+    @property
+    def queue_ms(self) -> float:
+        return (self.started_at - self.requested_at) * 1000 if self.started_at is not None else 0.0
+
+    @property
+    def run_ms(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.stopped_at or self.finished_at or time.perf_counter()
+        return (end - self.started_at) * 1000
+
+    @property
+    def total_ms(self) -> float:
+        end = self.finished_at or time.perf_counter()
+        return (end - self.requested_at) * 1000
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "tool_use_id": self.tool_use_id,
+            "subagent_type": self.subagent_type,
+            "agent_id": self.agent_id,
+            "background": self.background,
+            "turn": self.turn,
+            "finished": self.finished,
+            "cached": self.cached,
+            "error": self.error,
+            "abandoned": self.abandoned,
+            "queue_ms": round(self.queue_ms, 2),
+            "run_ms": round(self.run_ms, 2),
+            "total_ms": round(self.total_ms, 2),
+            "tool_calls": self.tool_calls,
+            "tool_ms": {name: round(ms, 2) for name, ms in self.tool_ms.items()},
+            "usage": dict(self.usage),
+            "result_chars": self.result_chars,
+        }
+
+
+def _end_span(span: Optional[Span], **attrs) -> None:
+    """End a span, setting only the attributes that have a value."""
+    get_tracer().end_span(span, **{key: value for key, value in attrs.items() if value is not None})
+
+
+class SubagentLedger:
+    """Sub-agent runs started by one agent, keyed by Task tool_use_id."""
+
+    def __init__(self, agent_name: str, room_id: int, world_id: Optional[int] = None):
+        self.agent_name = agent_name
+        self.room_id = room_id
+        self.world_id = world_id
+        self.turn = 0
+        self._runs: Dict[str, SubagentRun] = {}
+        self._by_agent_id: Dict[str, str] = {}
+        self._anonymous = itertools.count(1)
+
+    def begin_turn(self) -> None:
+        """Start a new turn: drop finished runs and abandon ones that can no longer finish."""
+        self.turn += 1
+        now = time.perf_counter()
+        for tool_use_id, run in list(self._runs.items()):
+            if not run.finished and (not run.background or now - run.requested_at > BACKGROUND_RUN_TTL):
+                run.abandoned = True
+                self._finish(run, now)
+            if run.finished:
+                del self._runs[tool_use_id]
+                if run.agent_id:
+                    self._by_agent_id.pop(run.agent_id, None)
+
+    def task_requested(self, tool_use_id: Optional[str], subagent_type: str, background: bool) -> SubagentRun:
+        """Record a Task call (parent's PreToolUse) and open its trace span."""
+        key = tool_use_id or f"anonymous-{next(self._anonymous)}"
+        run = SubagentRun(
+            tool_use_id=key,
+            subagent_type=subagent_type,
+            background=background,
+            turn=self.turn,
+            requested_at=time.perf_counter(),
+        )
+        run.span = get_tracer().start_span(
+            f"subagent:{subagent_type}",
+            room_id=self.room_id,
+            world_id=self.world_id,
+            agent_name=self.agent_name,
+            background=background,
+            tool_use_id=key,
+        )
+        self._runs[key] = run
+        return run
+
+    def task_cached(self, tool_use_id: Optional[str], subagent_type: str, source: str) -> SubagentRun:
+        """Record a Task answered by the sub-agent result cache (no sub-agent ran)."""
+        run = self.task_requested(tool_use_id, subagent_type, background=False)
+        run.cached = source
+        self._finish(run, time.perf_counter())
+        return run
+
+    def _bind(self, agent_id: str, agent_type: str) -> Optional[SubagentRun]:
+        """The run for a sub-agent id, binding it to the oldest unbound run of its type."""
+        tool_use_id = self._by_agent_id.get(agent_id)
+        if tool_use_id is not None:
+            return self._runs.get(tool_use_id)
+        unbound = [r for r in self._runs.values() if r.agent_id is None and not r.finished and not r.cached]
+        run = next((r for r in unbound if r.subagent_type == agent_type), None)
+        if run is None and not agent_type:
+            run = next(iter(unbound), None)
+        if run is not None:
+            run.agent_id = agent_id
+            self._by_agent_id[agent_id] = run.tool_use_id
+        return run
+
+    def subagent_started(self, agent_id: str, agent_type: str) -> Optional[SubagentRun]:
+        """SubagentStart: the sub-agent left the queue and began running."""
+        run = self._bind(agent_id, agent_type)
+        if run is None or run.started_at is not None:
+            return run
+        run.started_at = time.perf_counter()
+        run.run_span = get_tracer().start_span("subagent_run", parent=run.span, agent_id=agent_id)
+        return run
+
+    def subagent_stopped(self, agent_id: str, agent_type: str) -> Optional[SubagentRun]:
+        """SubagentStop: the sub-agent finished (background runs are complete here)."""
+        run = self._bind(agent_id, agent_type)
+        if run is None:
+            return None
+        now = time.perf_counter()
+        if run.started_at is None:
+            # No SubagentStart seen: the run is measured from the Task call
+            run.started_at = run.requested_at
+        run.stopped_at = now
+        get_tracer().end_span(run.run_span)
+        if run.background:
+            self._finish(run, now)
+        return run
+
+    def tool_started(self, agent_id: str, tool_use_id: Optional[str], tool_name: str) -> None:
+        """PreToolUse fired inside a sub-agent."""
+        run = self._runs.get(self._by_agent_id.get(agent_id, ""))
+        if run is None or not tool_use_id:
+            return
+        span = get_tracer().start_span(f"subagent_tool:{tool_name}", parent=run.run_span or run.span)
+        run.open_tools[tool_use_id] = (tool_name, time.perf_counter(), span)
+
+    def tool_finished(self, agent_id: str, tool_use_id: Optional[str], error: bool = False) -> None:
+        """PostToolUse (or PostToolUseFailure) fired inside a sub-agent."""
+        run = self._runs.get(self._by_agent_id.get(agent_id, ""))
+        if run is None or not tool_use_id or tool_use_id not in run.open_tools:
+            return
+        tool_name, started, span = run.open_tools.pop(tool_use_id)
+        run.tool_calls += 1
+        run.tool_ms[tool_name] = run.tool_ms.get(tool_name, 0.0) + (time.perf_counter() - started) * 1000
+        _end_span(span, error=error or None)
+
+    def task_finished(self, tool_use_id: Optional[str], response: Any, result_text: str, error: bool = False) -> None:
+        """Parent's PostToolUse for Task: the result (or launch acknowledgement) arrived."""
+        run = self._runs.get(tool_use_id or "")
+        if run is None or run.finished:
+            return
+        run.error = error
+        if run.background and not error:
+            return  # Only the launch acknowledgement; the run completes at SubagentStop
+        run.usage = task_usage(response)
+        run.result_chars = len(result_text)
+        self._finish(run, time.perf_counter())
+
+    def _finish(self, run: SubagentRun, now: float) -> None:
+        run.finished_at = now
+        for _tool_use_id, (_name, _started, span) in run.open_tools.items():
+            _end_span(span, unmatched=True)
+        run.open_tools.clear()
+        _end_span(run.run_span, unmatched=run.abandoned or None)
+        summary = run.summary()
+        _end_span(
+            run.span,
+            queue_ms=summary["queue_ms"],
+            run_ms=summary["run_ms"],
+            tool_calls=run.tool_calls,
+            total_tokens=run.usage.get("total_tokens"),
+            result_chars=run.result_chars,
+            cached=run.cached,
+            error=run.error or None,
+            unmatched=run.abandoned or None,
+        )
+        get_subagent_stats().record(run)
+        if run.cached is None:
+            get_perf_logger().log_sync(
+                "subagent_completed",
+                summary["total_ms"],
+                run.subagent_type,
+                self.room_id,
+                parent=self.agent_name,
+                success=not (run.error or run.abandoned),
+                background=run.background,
+                queue_ms=summary["queue_ms"],
+                run_ms=summary["run_ms"],
+                tool_calls=run.tool_calls,
+                total_tokens=run.usage.get("total_tokens", 0),
+                result_chars=run.result_chars,
+            )
+
+    def runs(self, turn: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Summaries of runs in the ledger (optionally only those requested in one turn)."""
+        return [r.summary() for r in self._runs.values() if turn is None or r.turn == turn]
+
+
+class SubagentStats:
+    """Process-wide sub-agent timing, token and result-size aggregates per sub-agent type."""
+
+    def __init__(self):
+        self._types: Dict[str, Dict[str, Any]] = {}
+
+    def _entry(self, subagent_type: str) -> Dict[str, Any]:
+        entry = self._types.get(subagent_type)
+        if entry is None:
+            entry = {
+                "counters": {
+                    "runs": 0,
+                    "cached": 0,
+                    "background": 0,
+                    "errors": 0,
+                    "abandoned": 0,
+                    "tool_calls": 0,
+                    "result_chars": 0,
+                    **{key: 0 for key in USAGE_KEYS},
+                    "total_tokens": 0,
+                },
+                "queue": LatencyHistogram(),
+                "run": LatencyHistogram(),
+                "total": LatencyHistogram(),
+                "tools": {},
+            }
+            self._types[subagent_type] = entry
+        return entry
+
+    def record(self, run: SubagentRun) -> None:
+        entry = self._entry(run.subagent_type)
+        counters = entry["counters"]
+        if run.cached is not None:
+            counters["cached"] += 1
+            return
+        counters["runs"] += 1
+        counters["background"] += run.background
+        counters["errors"] += run.error
+        counters["abandoned"] += run.abandoned
+        counters["tool_calls"] += run.tool_calls
+        counters["result_chars"] += run.result_chars
+        for key, value in run.usage.items():
+            counters[key] = counters.get(key, 0) + value
+        if run.abandoned:
+            return
+        entry["queue"].record(run.queue_ms)
+        entry["run"].record(run.run_ms)
+        entry["total"].record(run.total_ms)
+        for name, ms in run.tool_ms.items():
+            entry["tools"].setdefault(name, LatencyHistogram()).record(ms)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per sub-agent type counters plus queue/run/total and per-tool latency percentiles."""
+        return {
+            subagent_type: {
+                **entry["counters"],
+                "queue": entry["queue"].summary(),
+                "run": entry["run"].summary(),
+                "total": entry["total"].summary(),
+                "tools": {name: hist.summary() for name, hist in entry["tools"].items()},
+            }
+            for subagent_type, entry in self._types.items()
+        }
+
+    def clear(self) -> None:
+        self._types.clear()
+
+
+# Global singleton
+_subagent_stats: Optional[SubagentStats] = None
+
+
+def get_subagent_stats() -> SubagentStats:
+    """Get or create the global sub-agent stats aggregator."""
+    global _subagent_stats
+    if _subagent_stats is None:
+        _subagent_stats = SubagentStats()
+    return _subagent_stats
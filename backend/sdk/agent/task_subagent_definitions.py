@@ -21,8 +21,6 @@ from typing import Optional
 
 from claude_agent_sdk.types import AgentDefinition
 
-from sdk.handlers.onboarding_tools import SUBAGENT_TOOL_NAMES
-
 # Valid sub-agent types (formerly sourced from subagent_prompts.py)
 # Now sub-agent prompts are defined in characteristics.md files
 SUBAGENT_TYPES = {"item_designer", "character_designer", "location_designer", "detailed_character_designer"}
@@ -162,6 +160,9 @@ def build_subagent_definition(agent_type: str) -> Optional[AgentDefinition]:
         logger.warning(f"Unknown sub-agent type: {agent_type}")
         return None
 
+    # Imported here so loading agent definitions does not pull in the tool modules
+    from sdk.handlers.onboarding_tools import SUBAGENT_TOOL_NAMES
+
     # Get the persist tool name for this agent type (may be None for no-persist agents)
     persist_tool_name = SUBAGENT_TOOL_NAMES.get(agent_type)
 
@@ -17,6 +17,20 @@ Config Hash Tracking:
 - Each pooled client is associated with a config hash
 - When config hash changes (e.g., new tool groups, different world), client is reconnected
 - This ensures MCP servers/tools are correctly configured without unnecessary reconnects
+
+Session Lineage:
+- Each pooled client remembers the session it resumed and every session the CLI
+  reported since (the CLI may hand out a new session id per query)
+- A request to resume any session in that lineage is already served by the
+  pooled client, so it is reused even if the caller's stored session lags behind
+- Reconnects are counted per cause in PoolMetrics: session (a session outside
+  the lineage, or a deliberate fresh start), config, and eviction (the client
+  was cleaned up and the task came back)
+
+Connection Admission:
+- New connects are admitted by priority class (Action Manager, NPC reactions,
+  warm-ups, background jobs) under a limit that adapts to connect latency and
+  host memory; see sdk.client.connection_admission
 """
 
 from __future__ import annotations
@@ -34,6 +48,7 @@ from claude_agent_sdk.types import ResultMessage
 from domain.value_objects.task_identifier import TaskIdentifier
 from infrastructure.logging.perf_logger import get_perf_logger
 
+from sdk.client.connection_admission import ConnectionAdmission, ConnectionPriority, resolve_priority
 from sdk.client.transports import build_transport
 
 if TYPE_CHECKING:
@@ -43,6 +58,9 @@ logger = logging.getLogger(__name__)
 _perf = get_perf_logger()
 
 
+RECONNECT_CAUSES = ("session", "config", "eviction")
+
+
 @dataclass
 class PoolMetrics:
     """
@@ -68,6 +86,21 @@ class PoolMetrics:
     # Retries
     retry_count: int = 0
 
+    # Reconnects of a task that had a pooled client, by cause
+    reconnects_session: int = 0
+    reconnects_config: int = 0
+    reconnects_eviction: int = 0
+    # Reuses where the requested session was an earlier session of the pooled client
+    session_affinity_reuses: int = 0
+    # Memory content updates that no longer change the config hash (see MCPRegistry)
+    reconnects_avoided: int = 0
+
+    # MCP config cache (MCPRegistry)
+    mcp_cache_hits: int = 0
+    mcp_cache_misses: int = 0
+    mcp_cache_evictions: int = 0
+    mcp_build_total_ms: float = 0.0
+
     def record_pool_hit(self, check_ms: float, task_id: "TaskIdentifier") -> None:
         """Record a pool hit (client reused)."""
         self.pool_hits += 1
@@ -103,8 +136,8 @@ class PoolMetrics:
                 lock_type="task",
             )
 
-    def record_semaphore(self, wait_ms: float, task_id: "TaskIdentifier") -> None:
-        """Record semaphore acquisition time."""
+    def record_semaphore(self, wait_ms: float, task_id: "TaskIdentifier", priority: Optional[str] = None) -> None:
+        """Record connection slot acquisition time (per-class waits are kept by ConnectionAdmission)."""
         self.semaphore_total_ms += wait_ms
         if wait_ms > 10:  # Only log if significant contention (>10ms)
             _perf.log_sync(
@@ -113,6 +146,7 @@ class PoolMetrics:
                 room_id=task_id.room_id,
                 agent_id=task_id.agent_id,
                 lock_type="semaphore",
+                priority=priority,
             )
 
     def record_instantiate(self, duration_ms: float, task_id: "TaskIdentifier") -> None:
@@ -161,12 +195,66 @@ class PoolMetrics:
             error=error[:50],
         )
 
+    def record_reconnect(self, cause: str, task_id: "TaskIdentifier") -> None:
+        """Record a reconnect caused by a session change, config change or eviction."""
+        if cause not in RECONNECT_CAUSES:
+            raise ValueError(f"Unknown reconnect cause: {cause}")
+        setattr(self, f"reconnects_{cause}", getattr(self, f"reconnects_{cause}") + 1)
+        _perf.log_sync(
+            "pool_reconnect",
+            0.0,
+            room_id=task_id.room_id,
+            agent_id=task_id.agent_id,
+            cause=cause,
+        )
+
+    def record_session_affinity_reuse(self) -> None:
+        """Record a pooled client reused because it continues the requested session."""
+        self.session_affinity_reuses += 1
+
+    def record_reconnect_avoided(self) -> None:
+        """Record a memory update that used to change the config hash (and reconnect)."""
+        self.reconnects_avoided += 1
+
+    def get_reconnect_stats(self) -> dict[str, int]:
+        """Reconnect counters per cause, session affinity reuses and avoided reconnects."""
+        return {
+            **{cause: getattr(self, f"reconnects_{cause}") for cause in RECONNECT_CAUSES},
+            "session_affinity_reuses": self.session_affinity_reuses,
+            "avoided": self.reconnects_avoided,
+        }
+
+    def record_mcp_cache_hit(self) -> None:
+        """Record an MCP config cache hit (no log line; hits are per turn and cheap)."""
+        self.mcp_cache_hits += 1
+
+    def record_mcp_cache_eviction(self) -> None:
+        """Record an MCP config evicted by the registry's size cap."""
+        self.mcp_cache_evictions += 1
+
+    def record_mcp_config_built(self, build_ms: float, agent_name: str, server_count: int) -> None:
+        """Record an MCP config cache miss and the time spent rebuilding servers."""
+        self.mcp_cache_misses += 1
+        self.mcp_build_total_ms += build_ms
+        _perf.log_sync(
+            "mcp_config_build",
+            build_ms,
+            agent_name=agent_name,
+            servers=server_count,
+        )
+
     @property
     def hit_rate(self) -> float:
         """Calculate pool hit rate (0.0 to 1.0)."""
         total = self.pool_hits + self.pool_misses
         return self.pool_hits / total if total > 0 else 0.0
 
+    @property
+    def mcp_cache_hit_rate(self) -> float:
+        """Calculate MCP config cache hit rate (0.0 to 1.0)."""
+        total = self.mcp_cache_hits + self.mcp_cache_misses
+        return self.mcp_cache_hits / total if total > 0 else 0.0
+
 
 # Singleton pool metrics instance
 _pool_metrics = PoolMetrics()
@@ -183,6 +271,11 @@ def get_pool_metrics() -> PoolMetrics:
 MESSAGE_QUEUE_MAX_SIZE = int(os.environ.get("SDK_MESSAGE_QUEUE_SIZE", "2000"))
 MESSAGE_QUEUE_WARN_THRESHOLD = 0.8  # Warn when queue reaches 80% capacity
 
+# Sessions remembered per pooled client (oldest are forgotten first)
+SESSION_LINEAGE_MAX = 32
+# Cleaned-up task ids remembered to attribute their next connect to eviction
+EVICTED_TASKS_MAX = 1024
+
 
 @dataclass
 class PooledClient:
@@ -194,6 +287,48 @@ class PooledClient:
     # Message pump: continuously drains receive_messages() to keep SDK control channel healthy
     msg_queue: asyncio.Queue["Message"] = field(default_factory=lambda: asyncio.Queue(maxsize=MESSAGE_QUEUE_MAX_SIZE))
     pump_task: Optional[asyncio.Task[None]] = None  # Background task draining messages
+    # Sessions this client continues (insertion-ordered set, current session last)
+    lineage: dict[str, None] = field(default_factory=dict)
+    # Introspection (see sdk/client/pool_introspection.py); times are time.monotonic()
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+    last_error: Optional[str] = None
+    last_error_at: Optional[float] = None
+    # Running total_cost_usd last reported by this client's CLI process
+    reported_cost_usd: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.session_id:
+            self.lineage[self.session_id] = None
+
+    def adopt_session(self, session_id: str) -> None:
+        """Make the session reported by the CLI current, keeping earlier ones in the lineage."""
+        self.session_id = session_id
+        self.lineage.pop(session_id, None)
+        self.lineage[session_id] = None
+        while len(self.lineage) > SESSION_LINEAGE_MAX:
+            del self.lineage[next(iter(self.lineage))]
+
+    def continues(self, session_id: Optional[str]) -> bool:
+        """Whether this client's conversation already includes the given session."""
+        return session_id is not None and session_id in self.lineage
+
+    def cost_delta(self, total_cost_usd: Optional[float]) -> Optional[float]:
+        """Cost of the latest response, given the CLI's running total for this process."""
+        if total_cost_usd is None:
+            return None
+        previous, self.reported_cost_usd = self.reported_cost_usd, total_cost_usd
+        # A lower total means the CLI started counting again
+        return total_cost_usd - previous if total_cost_usd >= previous else total_cost_usd
+
+    def mark_used(self) -> None:
+        """Record that the client was handed out or finished a response."""
+        self.last_used_at = time.monotonic()
+
+    def record_error(self, error: str) -> None:
+        """Remember the most recent error seen on this client."""
+        self.last_error = error[:500]
+        self.last_error_at = time.monotonic()
 
 
 def _is_critical_message(msg: "Message") -> bool:
@@ -246,6 +381,9 @@ async def _pump_messages(pooled: PooledClient, task_id: TaskIdentifier) -> None:
                 )
                 warned_backpressure = True
 
+            if isinstance(msg, ResultMessage) and msg.is_error:
+                pooled.record_error(f"{msg.subtype}: {msg.result}" if msg.result else msg.subtype)
+
             try:
                 pooled.msg_queue.put_nowait(msg)
             except asyncio.QueueFull:
@@ -271,6 +409,7 @@ async def _pump_messages(pooled: PooledClient, task_id: TaskIdentifier) -> None:
         raise
     except Exception as e:
         logger.warning(f"Pump task error for {task_id}: {e}")
+        pooled.record_error(f"pump: {e}")
     finally:
         # Signal end of stream with sentinel value - NEVER drop this
         # Use blocking put to ensure completion is always observable
@@ -296,12 +435,15 @@ class ClientPool:
         - Key: TaskIdentifier(room_id, agent_id)
         - Value: PooledClient (client + config_hash + session_id)
         - Cleanup: Background disconnect to avoid cancel scope issues
-        - Concurrency: Semaphore allows up to MAX_CONCURRENT_CONNECTIONS simultaneous connections
+        - Concurrency: ConnectionAdmission allows up to MAX_CONCURRENT_CONNECTIONS simultaneous
+          connections, admitted by priority class and adapted to connect latency and host memory
         - Usage lock: Per-client lock to serialize query/receive_response
         - Config hash: Tracks MCP config used at connect; reconnects on change
+        - Session lineage: Reuses a client that continues the requested session
     """
 
-    # Allow up to 10 concurrent connections (prevents ProcessTransport issues while allowing parallelism)
+    # Allow up to 10 concurrent connections (prevents ProcessTransport issues while allowing parallelism);
+    # ConnectionAdmission lowers the limit under slow connects or low host memory
     MAX_CONCURRENT_CONNECTIONS = 10
     # Stabilization delay after each connection (seconds)
     # Reduced from 50ms to 20ms - monitor for ProcessTransport race conditions
@@ -312,13 +454,15 @@ class ClientPool:
     def __init__(self):
         """Initialize the client pool."""
         self.pool: dict[TaskIdentifier, PooledClient] = {}
-        # Use semaphore instead of lock to allow limited concurrency
-        self._connection_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CONNECTIONS)
+        # Priority admission instead of a plain semaphore: limited, adaptive concurrency
+        self.admission = ConnectionAdmission(self.MAX_CONCURRENT_CONNECTIONS)
         # Per-task_id locks to prevent duplicate client creation for the same task
         self._task_locks: dict[TaskIdentifier, asyncio.Lock] = {}
         # Per-task_id locks for serializing query/receive_response on each client
         self._usage_locks: dict[TaskIdentifier, asyncio.Lock] = {}
         self._cleanup_tasks: set[asyncio.Task] = set()
+        # Task ids removed by cleanup() (insertion-ordered), to count their next connect as eviction
+        self._evicted: dict[TaskIdentifier, float] = {}
 
     def _get_task_lock(self, task_id: TaskIdentifier) -> asyncio.Lock:
         """Get or create a per-task_id lock for connection creation."""
@@ -326,6 +470,11 @@ class ClientPool:
             self._task_locks[task_id] = asyncio.Lock()
         return self._task_locks[task_id]
 
+    def is_busy(self, task_id: TaskIdentifier) -> bool:
+        """Whether a caller holds the task's usage lock (query in progress)."""
+        lock = self._usage_locks.get(task_id)
+        return lock is not None and lock.locked()
+
     def _get_usage_lock(self, task_id: TaskIdentifier) -> asyncio.Lock:
         """Get or create a per-task_id lock for query/receive_response serialization."""
         if task_id not in self._usage_locks:
@@ -333,7 +482,11 @@ class ClientPool:
         return self._usage_locks[task_id]
 
     async def get_or_create(
-        self, task_id: TaskIdentifier, options: ClaudeAgentOptions, config_hash: str = ""
+        self,
+        task_id: TaskIdentifier,
+        options: ClaudeAgentOptions,
+        config_hash: str = "",
+        priority: Optional[ConnectionPriority] = None,
     ) -> Tuple[PooledClient, bool, asyncio.Lock]:
         """
         Get existing client or create new one.
@@ -342,13 +495,16 @@ class ClientPool:
         update options on existing clients - that would have no effect.
 
         Reconnection triggers:
-        1. Session ID change (conversation context reset)
+        1. Session change: the requested session is not in the pooled client's
+           lineage (or is None while the client has one, i.e. a context reset)
         2. Config hash change (MCP servers/tools changed)
 
         Args:
             task_id: Identifier for this agent task
             options: SDK client configuration (only used for new connections)
             config_hash: Hash of MCP config (used to detect config changes)
+            priority: Connection priority class if a new client is needed
+                (default: the context's connection_priority, else REACTION)
 
         Returns:
             (pooled_client, is_new, usage_lock) tuple
@@ -356,6 +512,9 @@ class ClientPool:
             - is_new: True if newly created, False if reused from pool
             - usage_lock: Lock to serialize query/receive_response on this client
 
+        Raises:
+            ConnectionShedError: If a lower-priority connect is shed under connection pressure
+
         SDK Best Practice: Use lock to prevent ProcessTransport race
         conditions when creating multiple clients concurrently.
         """
@@ -365,32 +524,16 @@ class ClientPool:
         pool_check_start = time.perf_counter()
         if task_id in self.pool:
             pooled = self.pool[task_id]
-            old_session_id = pooled.session_id
-            new_session_id = getattr(options, "resume", None)
-            old_config_hash = pooled.config_hash
-
             logger.debug(
                 f"Client exists for {task_id} | "
-                f"Session: {old_session_id} -> {new_session_id} | "
-                f"Config: {old_config_hash[:8] if old_config_hash else 'none'} -> {config_hash[:8] if config_hash else 'none'}"
+                f"Session: {pooled.session_id} -> {getattr(options, 'resume', None)} | "
+                f"Config: {pooled.config_hash[:8] if pooled.config_hash else 'none'} -> {config_hash[:8] if config_hash else 'none'}"
             )
 
-            # Check if we need to reconnect
-            session_changed = old_session_id != new_session_id and (
-                old_session_id is not None or new_session_id is not None
-            )
-            config_changed = config_hash and old_config_hash != config_hash
-
-            if session_changed:
-                logger.info(
-                    f"Session changed for {task_id} (old: {old_session_id}, new: {new_session_id}), recreating client"
-                )
-                self._remove_from_pool(task_id)
-                # Fall through to create new client below
-            elif config_changed:
-                logger.info(
-                    f"Config changed for {task_id} (old: {old_config_hash[:8]}, new: {config_hash[:8]}), recreating client"
-                )
+            cause = self._reconnect_cause(pooled, options, config_hash)
+            if cause:
+                logger.info(f"{cause.capitalize()} changed for {task_id}, recreating client")
+                _pool_metrics.record_reconnect(cause, task_id)
                 self._remove_from_pool(task_id)
                 # Fall through to create new client below
             else:
@@ -401,12 +544,20 @@ class ClientPool:
                 )
                 # NOTE: We do NOT update options here - they are baked in at connect time
                 # Updating client.options has no effect on the running CLI subprocess
+                pooled.mark_used()
                 usage_lock = self._get_usage_lock(task_id)
                 return pooled, False, usage_lock
+        elif (evicted_at := self._evicted.pop(task_id, None)) is not None:
+            logger.debug(f"Reconnecting {task_id} {time.monotonic() - evicted_at:.1f}s after cleanup")
+            _pool_metrics.record_reconnect("eviction", task_id)
 
         pool_check_ms = (time.perf_counter() - pool_check_start) * 1000
         _pool_metrics.record_pool_miss(pool_check_ms, task_id)
 
+        priority = resolve_priority() if priority is None else priority
+        # A queued lower-priority connect for this task holds the task lock we are about to wait on
+        self.admission.promote(task_id, priority)
+
         # Use per-task_id lock to prevent duplicate client creation for the same task
         task_lock = self._get_task_lock(task_id)
         lock_wait_start = time.perf_counter()
@@ -417,22 +568,10 @@ class ClientPool:
             # Double-check after acquiring task lock (another coroutine might have created it)
             if task_id in self.pool:
                 pooled = self.pool[task_id]
-                old_session_id = pooled.session_id
-                new_session_id = getattr(options, "resume", None)
-                old_config_hash = pooled.config_hash
-
-                # Check if we need to reconnect
-                session_changed = old_session_id != new_session_id and (
-                    old_session_id is not None or new_session_id is not None
-                )
-                config_changed = config_hash and old_config_hash != config_hash
-
-                if session_changed:
-                    logger.info(f"Session changed for {task_id} while waiting for lock, recreating client")
-                    self._remove_from_pool(task_id)
-                    # Continue to create new client below
-                elif config_changed:
-                    logger.info(f"Config changed for {task_id} while waiting for lock, recreating client")
+                cause = self._reconnect_cause(pooled, options, config_hash)
+                if cause:
+                    logger.info(f"{cause.capitalize()} changed for {task_id} while waiting for lock, recreating client")
+                    _pool_metrics.record_reconnect(cause, task_id)
                     self._remove_from_pool(task_id)
                     # Continue to create new client below
                 else:
@@ -440,14 +579,13 @@ class ClientPool:
                     # NOTE: We do NOT update options here - they are baked in at connect time
                     overall_ms = (time.perf_counter() - overall_start) * 1000
                     _pool_metrics.record_client_reused_after_wait(overall_ms, task_id)
+                    pooled.mark_used()
                     usage_lock = self._get_usage_lock(task_id)
                     return pooled, False, usage_lock
 
-            # Use semaphore to limit overall connection concurrency (prevents ProcessTransport issues)
-            semaphore_wait_start = time.perf_counter()
-            async with self._connection_semaphore:
-                semaphore_wait_ms = (time.perf_counter() - semaphore_wait_start) * 1000
-                _pool_metrics.record_semaphore(semaphore_wait_ms, task_id)
+            # Limit overall connection concurrency (prevents ProcessTransport issues), by priority
+            async with self.admission.slot(priority, task_id) as waited_s:
+                _pool_metrics.record_semaphore(waited_s * 1000, task_id, priority.name)
 
                 logger.debug(
                     f"Creating new client for {task_id} (config hash: {config_hash[:8] if config_hash else 'none'})"
@@ -465,7 +603,21 @@ class ClientPool:
 
                         # Connect without a prompt - messages are sent via query() instead
                         # Note: connect timing is now handled by MetricsTransport (when PERF_LOG=true)
-                        await client.connect()
+                        try:
+                            connect_start = time.perf_counter()
+                            await client.connect()
+                            self.admission.record_connect((time.perf_counter() - connect_start) * 1000)
+                        except asyncio.CancelledError:
+                            # Caller gave up mid-connect (e.g. a cancelled NPC warm-up):
+                            # disconnect in the background so the CLI process isn't leaked
+                            task = asyncio.create_task(
+                                self._disconnect_client_background(
+                                    PooledClient(client=client, config_hash=config_hash), task_id
+                                )
+                            )
+                            self._cleanup_tasks.add(task)
+                            task.add_done_callback(self._cleanup_tasks.discard)
+                            raise
 
                         # Store with metadata and start message pump
                         session_id = getattr(options, "resume", None)
@@ -503,6 +655,27 @@ class ClientPool:
                             # Re-raise on final attempt or non-transport errors
                             raise
 
+    @staticmethod
+    def _reconnect_cause(pooled: PooledClient, options: ClaudeAgentOptions, config_hash: str) -> Optional[str]:
+        """
+        Decide whether a pooled client can serve a request.
+
+        Returns:
+            "session" or "config" if the client must be recreated, None to reuse it
+        """
+        requested = getattr(options, "resume", None)
+        affinity = False
+        if requested != pooled.session_id:
+            if not pooled.continues(requested):
+                return "session"
+            affinity = True
+        if config_hash and pooled.config_hash != config_hash:
+            return "config"
+        if affinity:
+            logger.debug(f"Session {requested} is continued by pooled session {pooled.session_id}, reusing client")
+            _pool_metrics.record_session_affinity_reuse()
+        return None
+
     def _remove_from_pool(self, task_id: TaskIdentifier):
         """
         Remove a client from the pool and schedule background disconnect.
@@ -553,6 +726,10 @@ class ClientPool:
 
         # Remove from pool immediately
         del self.pool[task_id]
+        self._evicted.pop(task_id, None)
+        self._evicted[task_id] = time.monotonic()
+        while len(self._evicted) > EVICTED_TASKS_MAX:
+            del self._evicted[next(iter(self._evicted))]
 
         # Also remove locks to prevent memory leak
         self._task_locks.pop(task_id, None)
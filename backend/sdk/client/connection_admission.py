@@ -0,0 +1,349 @@
+"""
+Priority admission for new SDK client connections.
+
+Connecting a client spawns a CLI process, so ``ClientPool`` limits how many
+connects run at once. ``ConnectionAdmission`` replaces the plain semaphore it
+used with a priority queue of four classes, from most to least urgent:
+
+    ACTION_MANAGER  the player-facing Action Manager turn
+    REACTION        NPC reactions and other turn-time agents (the default)
+    WARMUP          speculative pre-connects (pre_connect, summarizer warm-up)
+    BACKGROUND      summarizers, history compression, location enrichment
+
+A free slot always goes to the most urgent waiter (FIFO within a class). The
+lower classes are deferred while the pool is busy: they only take a slot while
+more than ``RESERVED_SLOTS`` slots are free, so a burst of warm-ups or
+background jobs cannot occupy every slot a player turn needs. A waiter whose
+class has a ``WAIT_BUDGETS_S`` entry is shed with ConnectionShedError once it
+has waited that long; callers of these classes already treat a failed connect
+as a skipped warm-up or job. A queued waiter is promoted when a more urgent
+request for the same task arrives, since that request waits behind it on the
+task lock.
+
+The limit adapts between ``MIN_LIMIT`` and the pool's maximum:
+- Connect latency: an exponential moving average above
+  ``CONNECT_LATENCY_HIGH_MS`` lowers the limit by one slot, below
+  ``CONNECT_LATENCY_LOW_MS`` raises it by one (at most once per
+  ``ADJUST_INTERVAL_S``)
+- Host memory: MemAvailable from /proc/meminfo caps the limit at the number of
+  CLI processes that fit above ``MEMORY_LOW_MB``; below it, warm-ups are shed
+  at once
+
+Shed counts and queue waits per class are reported by ``get_stats()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, AsyncIterator, Hashable, Iterator, Optional
+
+from domain.entities.agent import is_action_manager
+from infrastructure.logging.perf_logger import LatencyHistogram, get_perf_logger
+
+logger = logging.getLogger(__name__)
+_perf = get_perf_logger()
+
+MEMINFO = Path("/proc/meminfo")
+
+
+class ConnectionPriority(IntEnum):
+    """Connection priority classes; lower values are admitted first."""
+
+    ACTION_MANAGER = 0
+    REACTION = 1
+    WARMUP = 2
+    BACKGROUND = 3
+
+
+# Seconds a waiter may queue for a slot before it is shed (None: never shed)
+WAIT_BUDGETS_S: dict[ConnectionPriority, Optional[float]] = {
+    ConnectionPriority.ACTION_MANAGER: None,
+    ConnectionPriority.REACTION: None,
+    ConnectionPriority.WARMUP: 2.0,
+    ConnectionPriority.BACKGROUND: 30.0,
+}
+
+# Slots that must stay free for more urgent classes before a class is admitted
+RESERVED_SLOTS: dict[ConnectionPriority, int] = {
+    ConnectionPriority.ACTION_MANAGER: 0,
+    ConnectionPriority.REACTION: 0,
+    ConnectionPriority.WARMUP: 1,
+    ConnectionPriority.BACKGROUND: 2,
+}
+
+# Adaptive limit bounds and connect latency thresholds
+MIN_LIMIT = 2
+CONNECT_LATENCY_HIGH_MS = 4000.0
+CONNECT_LATENCY_LOW_MS = 1500.0
+LATENCY_EWMA_ALPHA = 0.3
+ADJUST_INTERVAL_S = 5.0
+
+# Host memory: free memory kept for the backend, and the footprint of one CLI process
+MEMORY_LOW_MB = 512
+CLIENT_MEMORY_MB = 256
+MEMORY_CHECK_INTERVAL_S = 2.0
+
+
+_connection_priority: ContextVar[Optional[ConnectionPriority]] = ContextVar("connection_priority", default=None)
+
+
+@contextmanager
+def connection_priority(priority: ConnectionPriority) -> Iterator[None]:
+    """Connect clients created in this context (and tasks it starts) with this priority."""
+    token = _connection_priority.set(priority)
+    try:
+        yield
+    finally:
+        _connection_priority.reset(token)
+
+
+def resolve_priority(agent_name: Optional[str] = None) -> ConnectionPriority:
+    """Priority of the current context, else ACTION_MANAGER for the Action Manager, else REACTION."""
+    priority = _connection_priority.get()
+    if priority is not None:
+        return priority
+    if agent_name and is_action_manager(agent_name):
+        return ConnectionPriority.ACTION_MANAGER
+    return ConnectionPriority.REACTION
+
+
+class ConnectionShedError(Exception):
+    """Raised when a lower-priority connection is shed under connection pressure."""
+
+    def __init__(self, priority: ConnectionPriority, waited_s: float, reason: str):
+        self.priority = priority
+        self.waited_s = waited_s
+        self.reason = reason
+        super().__init__(f"{priority.name.lower()} connection shed after {waited_s:.1f}s ({reason.replace('_', ' ')})")
+
+
+def read_mem_available_mb() -> Optional[int]:
+    """MemAvailable from /proc/meminfo in MB, or None where it cannot be read."""
+    try:
+        for line in MEMINFO.read_text().splitlines():
+            if line.startswith("MemAvailable:"):
+                return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+@dataclass
+class _Waiter:
+    priority: ConnectionPriority
+    seq: int
+    key: Optional[Hashable]
+    future: asyncio.Future = field(repr=False)
+
+    @property
+    def order(self) -> tuple[int, int]:
+        return (self.priority, self.seq)
+
+
+class ConnectionAdmission:
+    """Priority-ordered, adaptive limit on concurrent connects."""
+
+    def __init__(self, max_limit: int, min_limit: int = MIN_LIMIT, memory_reader=read_mem_available_mb):
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.in_use = 0
+        self._latency_limit = max_limit
+        self._memory_reader = memory_reader
+        self._available_mb: Optional[int] = None
+        self._memory_checked_at = -MEMORY_CHECK_INTERVAL_S
+        self._adjusted_at = -ADJUST_INTERVAL_S
+        self._connect_ewma_ms: Optional[float] = None
+        self._waiters: list[_Waiter] = []
+        self._seq = itertools.count()
+        self._admitted = {p: 0 for p in ConnectionPriority}
+        self._shed = {p: 0 for p in ConnectionPriority}
+        self._waits = {p: LatencyHistogram() for p in ConnectionPriority}
+
+    # --- Limit -------------------------------------------------------------
+
+    def _refresh_memory(self) -> None:
+        now = time.monotonic()
+        if now - self._memory_checked_at >= MEMORY_CHECK_INTERVAL_S:
+            self._memory_checked_at = now
+            self._available_mb = self._memory_reader()
+
+    @property
+    def memory_pressure(self) -> bool:
+        """Whether host memory available is below MEMORY_LOW_MB."""
+        return self._available_mb is not None and self._available_mb < MEMORY_LOW_MB
+
+    @property
+    def limit(self) -> int:
+        """Current concurrent connect limit (latency-adjusted, capped by host memory)."""
+        limit = self._latency_limit
+        if self._available_mb is not None:
+            fits = (self._available_mb - MEMORY_LOW_MB) // CLIENT_MEMORY_MB
+            limit = min(limit, max(self.min_limit, fits))
+        return limit
+
+    @property
+    def available(self) -> int:
+        """Free slots under the current limit."""
+        return max(0, self.limit - self.in_use)
+
+    def record_connect(self, connect_ms: float) -> None:
+        """Feed a connect latency into the moving average and adjust the limit."""
+        if self._connect_ewma_ms is None:
+            self._connect_ewma_ms = connect_ms
+        else:
+            self._connect_ewma_ms += LATENCY_EWMA_ALPHA * (connect_ms - self._connect_ewma_ms)
+
+        now = time.monotonic()
+        if now - self._adjusted_at < ADJUST_INTERVAL_S:
+            return
+        previous = self._latency_limit
+        if self._connect_ewma_ms > CONNECT_LATENCY_HIGH_MS:
+            self._latency_limit = max(self.min_limit, previous - 1)
+        elif self._connect_ewma_ms < CONNECT_LATENCY_LOW_MS:
+            self._latency_limit = min(self.max_limit, previous + 1)
+        if self._latency_limit != previous:
+            self._adjusted_at = now
+            logger.info(
+                f"Connection limit {previous} -> {self._latency_limit} "
+                f"(connect latency avg {self._connect_ewma_ms:.0f}ms)"
+            )
+            self._dispatch()
+
+    # --- Queue -------------------------------------------------------------
+
+    def _admissible(self, priority: ConnectionPriority) -> bool:
+        limit = self.limit
+        reserve = min(RESERVED_SLOTS[priority], limit - 1)
+        return limit - self.in_use > reserve
+
+    def _dispatch(self) -> None:
+        """Hand free slots to waiters, most urgent first."""
+        while self._waiters:
+            waiter = min(self._waiters, key=lambda w: w.order)
+            if not self._admissible(waiter.priority):
+                return
+            self._waiters.remove(waiter)
+            self.in_use += 1
+            waiter.future.set_result(None)
+
+    def promote(self, key: Hashable, priority: ConnectionPriority) -> None:
+        """Raise queued waiters for key to priority (a more urgent request for the task waits behind them)."""
+        promoted = False
+        for waiter in self._waiters:
+            if waiter.key == key and waiter.priority > priority:
+                logger.debug(f"Promoting queued {waiter.priority.name} connect for {key} to {priority.name}")
+                waiter.priority = priority
+                promoted = True
+        if promoted:
+            self._dispatch()
+
+    def _shed_waiter(self, priority: ConnectionPriority, waited_s: float, reason: str, key) -> ConnectionShedError:
+        self._shed[priority] += 1
+        _perf.log_sync(
+            "pool_connection_shed",
+            waited_s * 1000,
+            room_id=getattr(key, "room_id", None),
+            agent_id=getattr(key, "agent_id", None),
+            priority=priority.name,
+            reason=reason,
+        )
+        logger.warning(f"Shedding {priority.name} connect for {key} after {waited_s:.1f}s ({reason})")
+        return ConnectionShedError(priority, waited_s, reason)
+
+    async def acquire(self, priority: ConnectionPriority, key: Optional[Hashable] = None) -> float:
+        """
+        Wait for a connection slot.
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            ConnectionShedError: If the class's wait budget ran out, or a
+                warm-up was requested under host memory pressure
+        """
+        self._refresh_memory()
+        start = time.monotonic()
+        if priority >= ConnectionPriority.WARMUP and self.memory_pressure:
+            raise self._shed_waiter(priority, 0.0, "memory_pressure", key)
+
+        if not self._waiters and self._admissible(priority):
+            self.in_use += 1
+            self._record_wait(priority, 0.0)
+            return 0.0
+
+        waiter = _Waiter(priority, next(self._seq), key, asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        self._dispatch()
+        try:
+            while not waiter.future.done():
+                budget = WAIT_BUDGETS_S[waiter.priority]
+                timeout = None if budget is None else budget - (time.monotonic() - start)
+                if timeout is not None and timeout <= 0:
+                    self._waiters.remove(waiter)
+                    raise self._shed_waiter(waiter.priority, time.monotonic() - start, "wait_budget", key)
+                # Re-evaluate the budget when it expires (the waiter may have been promoted)
+                await asyncio.wait({waiter.future}, timeout=timeout)
+        except asyncio.CancelledError:
+            if waiter.future.done():
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+                self._dispatch()
+            raise
+
+        waited_s = time.monotonic() - start
+        self._record_wait(waiter.priority, waited_s)
+        return waited_s
+
+    def _record_wait(self, priority: ConnectionPriority, waited_s: float) -> None:
+        self._admitted[priority] += 1
+        self._waits[priority].record(waited_s * 1000)
+
+    def release(self) -> None:
+        """Return a slot and admit the next waiters."""
+        self.in_use -= 1
+        self._refresh_memory()
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, priority: ConnectionPriority, key: Optional[Hashable] = None) -> AsyncIterator[float]:
+        """Hold a connection slot for the block; yields the seconds waited."""
+        waited_s = await self.acquire(priority, key)
+        try:
+            yield waited_s
+        finally:
+            self.release()
+
+    # --- Stats -------------------------------------------------------------
+
+    def get_stats(self) -> dict[str, Any]:
+        """Limit, usage, queue depth, admissions, sheds and queue waits per class."""
+        queued = {p: 0 for p in ConnectionPriority}
+        for waiter in self._waiters:
+            queued[waiter.priority] += 1
+        return {
+            "limit": self.limit,
+            "max_limit": self.max_limit,
+            "in_use": self.in_use,
+            "available": self.available,
+            "connect_latency_avg_ms": round(self._connect_ewma_ms, 1) if self._connect_ewma_ms is not None else None,
+            "mem_available_mb": self._available_mb,
+            "memory_pressure": self.memory_pressure,
+            "classes": {
+                p.name.lower(): {
+                    "queued": queued[p],
+                    "admitted": self._admitted[p],
+                    "shed": self._shed[p],
+                    "wait_ms": self._waits[p].summary(),
+                }
+                for p in ConnectionPriority
+            },
+        }
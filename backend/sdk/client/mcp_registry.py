@@ -5,7 +5,7 @@ This module centralizes the logic for:
 - Determining which tool groups are enabled for an agent
 - Creating and configuring MCP servers for each tool group
 - Building the allowed tools list
-- Caching MCP configs to avoid per-turn rebuilds
+- Caching MCP configs to avoid per-turn rebuilds (bounded LRU, scoped per agent)
 
 Separates tool/MCP server management from the AgentManager to improve
 maintainability and testability.
@@ -13,6 +13,9 @@ maintainability and testability.
 
 import hashlib
 import logging
+import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
@@ -23,16 +26,9 @@ from domain.value_objects.contexts import AgentResponseContext
 if TYPE_CHECKING:
     from sdk.agent.agent_manager import AgentManager
 
-from sdk.handlers import (
-    SUBAGENT_TOOL_NAMES,
-    create_action_manager_mcp_server,
-    create_action_mcp_server,
-    create_character_design_mcp_server,
-    create_guidelines_mcp_server,
-    create_onboarding_mcp_server,
-    create_subagents_mcp_server,
-)
+from sdk.client.client_pool import get_pool_metrics
 from sdk.handlers.context import ToolContext
+from sdk.handlers.memory_store import get_memory_store
 from sdk.loaders import (
     get_agent_tool_config,
     get_tool_names_by_group,
@@ -43,6 +39,10 @@ logger = logging.getLogger("MCPRegistry")
 # Default tool groups that are always enabled (unless explicitly disabled)
 DEFAULT_TOOL_GROUPS = {"guidelines", "action"}
 
+# Cap on cached MCP configs. Keys are per (agent, world, room), so the cache grows
+# with world count; the least recently used config is evicted past this size.
+MCP_CONFIG_CACHE_MAX_SIZE = int(os.environ.get("MCP_CONFIG_CACHE_SIZE", "256"))
+
 
 @dataclass
 class MCPServerConfig:
@@ -52,6 +52,7 @@ class MCPServerConfig:
     allowed_tool_names: list[str] = field(default_factory=list)
     enabled_groups: set[str] = field(default_factory=set)
     config_hash: str = ""  # Hash of context fields that affect config
+    scope: str = ""  # Invalidation scope (agent config_file, or agent name if none)
 
 
 class MCPRegistry:
@@ -63,53 +64,111 @@ class MCPRegistry:
 
     Implements caching to avoid per-turn MCP config rebuilds:
     - Cache key: hash of context fields that affect config
-    - Cache invalidation: automatic when context changes
+    - Cache invalidation: automatic when context changes, or explicit per agent
+      scope (config_file) so one agent's config write leaves others cached
+    - Bounded: least recently used entries are evicted past max_size
     """
 
-    def __init__(self, settings):
+    def __init__(self, settings, max_size: int = MCP_CONFIG_CACHE_MAX_SIZE):
         """
         Initialize the MCP registry.
 
         Args:
             settings: Application settings instance
+            max_size: Maximum cached configs before LRU eviction
         """
         self.settings = settings
-        # Cache: config_hash -> MCPServerConfig
-        self._config_cache: dict[str, MCPServerConfig] = {}
+        self._max_size = max_size
+        # Cache: config_hash -> MCPServerConfig (OrderedDict order doubles as LRU recency)
+        self._config_cache: OrderedDict[str, MCPServerConfig] = OrderedDict()
+        # Index: scope -> config hashes built for it (for per-agent invalidation)
+        self._scope_index: dict[str, set[str]] = {}
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @staticmethod
+    def _normalize_scope(config_file: Optional[str] = None, agent_name: Optional[str] = None) -> str:
+        """Build the invalidation scope key for an agent.
+
+        Agents are scoped by their config folder (unique per world); agents
+        without one fall back to their name.
+        """
+        if config_file:
+            return f"file:{Path(config_file).as_posix()}"
+        return f"agent:{agent_name or ''}"
+
+    def _scope_for(self, context: AgentResponseContext) -> str:
+        """Get the invalidation scope for a response context."""
+        return self._normalize_scope(context.config.config_file, context.agent_name)
+
+    def _drop(self, config_hash: str) -> Optional[MCPServerConfig]:
+        """Remove one cache entry and its scope index reference."""
+        config = self._config_cache.pop(config_hash, None)
+        if config is not None:
+            hashes = self._scope_index.get(config.scope)
+            if hashes is not None:
+                hashes.discard(config_hash)
+                if not hashes:
+                    del self._scope_index[config.scope]
+        return config
+
+    def _store(self, config: MCPServerConfig) -> None:
+        """Insert a built config and enforce the size cap."""
+        self._config_cache[config.config_hash] = config
+        self._config_cache.move_to_end(config.config_hash)
+        self._scope_index.setdefault(config.scope, set()).add(config.config_hash)
+
+        while len(self._config_cache) > self._max_size:
+            evicted_hash = next(iter(self._config_cache))
+            self._drop(evicted_hash)
+            self._stats["evictions"] += 1
+            get_pool_metrics().record_mcp_cache_eviction()
+            logger.debug(f"MCP config evicted (size cap {self._max_size}): hash={evicted_hash[:8]}")
 
     def _compute_config_hash(self, context: AgentResponseContext) -> str:
         """
-        Compute a hash of context fields that affect MCP config.
+        Compute a hash of context fields that affect the MCP tool surface.
 
         This determines when we need to rebuild vs reuse cached config.
         Fields included:
         - agent_name, agent_id: affect tool context
         - group_name: affects enabled tool groups
-        - config_file, long_term_memory_index: affect action MCP server
+        - whether the agent has long-term memories: adds the recall tool
         - world_name, world_id, room_id: affect onboarding/action_manager/narrator servers
 
         Note: db session is excluded as it's a runtime dependency, not config.
+        The config folder and memory index are excluded too: the action tools
+        read them from the memory store at call time (see _publish_memory), so
+        memory updates don't change the hash and don't reconnect the client.
         """
         # Build a tuple of hashable fields
         hash_parts = [
             str(context.agent_name),
             str(context.agent_id),
             str(getattr(context, "group_name", "")),
-            str(context.config.config_file) if context.config.config_file else "",
-            str(context.config.long_term_memory_index) if context.config.long_term_memory_index else "",
+            "recall" if context.config.long_term_memory_index else "",
             str(context.world_name) if context.world_name else "",
             str(context.world_id) if context.world_id else "",
             str(context.room_id) if context.room_id else "",
         ]
         hash_input = "|".join(hash_parts)
         result = hashlib.sha256(hash_input.encode()).hexdigest()[:16]
-        logger.debug(
-            f"Config hash for {context.agent_name}: {result} | "
-            f"config_file={context.config.config_file}, "
-            f"memory_keys={list(context.config.long_term_memory_index.keys()) if context.config.long_term_memory_index else None}"
-        )
+        logger.debug(f"Config hash for {context.agent_name}: {result}")
         return result
 
+    def _publish_memory(self, context: AgentResponseContext) -> None:
+        """Hand the agent's current config folder and memory index to its action tools."""
+        config_file = context.config.config_file
+        updated = get_memory_store().publish(
+            context.agent_name,
+            context.agent_id,
+            Path(config_file) if config_file else None,
+            context.config.long_term_memory_index,
+        )
+        if updated:
+            # With the content in the hash, this update would have reconnected the client
+            get_pool_metrics().record_reconnect_avoided()
+            logger.debug(f"Memory updated for {context.agent_name} without a config hash change")
+
     def build_mcp_config(
         self,
         context: AgentResponseContext,
@@ -119,7 +178,8 @@ class MCPRegistry:
         Build MCP server configuration for an agent.
 
         This method:
-        1. Computes a config hash and checks cache
+        1. Publishes the agent's memory to the memory store, then computes a
+           config hash and checks cache
         2. If cache hit, returns cached config (avoids per-turn rebuild)
         3. If cache miss, builds config and caches it:
            - Determines which tool groups are enabled
@@ -133,12 +193,17 @@ class MCPRegistry:
         Returns:
             MCPServerConfig with mcp_servers dict, allowed_tool_names list, and config_hash
         """
+        self._publish_memory(context)
+
         # Compute config hash for cache lookup
         config_hash = self._compute_config_hash(context)
 
         # Check cache first (fast path)
-        if config_hash in self._config_cache:
-            cached_config = self._config_cache[config_hash]
+        cached_config = self._config_cache.get(config_hash)
+        if cached_config is not None:
+            self._config_cache.move_to_end(config_hash)  # mark as recently used
+            self._stats["hits"] += 1
+            get_pool_metrics().record_mcp_cache_hit()
             logger.debug(
                 f"MCP config CACHE HIT for {context.agent_name}: "
                 f"hash={config_hash[:8]}, servers={list(cached_config.mcp_servers.keys())}"
@@ -146,10 +211,13 @@ class MCPRegistry:
             return cached_config
 
         # Cache miss - build new config
+        self._stats["misses"] += 1
         logger.debug(f"MCP config CACHE MISS for {context.agent_name}: hash={config_hash[:8]}, building...")
+        build_start = time.perf_counter()
 
         config = MCPServerConfig()
         config.config_hash = config_hash
+        config.scope = self._scope_for(context)
 
         # Get per-agent tool configuration
         agent_tool_config = self._get_agent_tool_config(context)
@@ -170,7 +238,9 @@ class MCPRegistry:
         config.allowed_tool_names = self._build_allowed_tools(config.enabled_groups, agent_tool_config)
 
         # Cache the config
-        self._config_cache[config_hash] = config
+        self._store(config)
+        build_ms = (time.perf_counter() - build_start) * 1000
+        get_pool_metrics().record_mcp_config_built(build_ms, context.agent_name, len(config.mcp_servers))
 
         logger.debug(
             f"MCP config BUILT for {context.agent_name}: "
@@ -181,27 +251,62 @@ class MCPRegistry:
 
         return config
 
-    def invalidate_cache(self, config_hash: Optional[str] = None) -> int:
+    def invalidate_cache(
+        self,
+        config_hash: Optional[str] = None,
+        *,
+        config_file: Optional[str] = None,
+        agent_name: Optional[str] = None,
+    ) -> int:
         """
         Invalidate cached MCP configs.
 
+        With no arguments the whole cache is cleared. Prefer the scoped forms:
+        a single agent's config change should not force rebuilds for every
+        other agent in every world.
+
         Args:
-            config_hash: Specific hash to invalidate, or None to clear all
+            config_hash: Specific hash to invalidate
+            config_file: Invalidate every config built for this agent folder
+            agent_name: Invalidate configs for an agent without a config_file
 
         Returns:
             Number of cache entries cleared
         """
         if config_hash:
-            if config_hash in self._config_cache:
-                del self._config_cache[config_hash]
+            if self._drop(config_hash) is not None:
+                self._stats["invalidations"] += 1
                 logger.debug(f"Invalidated MCP config cache for hash={config_hash[:8]}")
                 return 1
             return 0
-        else:
-            count = len(self._config_cache)
-            self._config_cache.clear()
-            logger.debug(f"Cleared all MCP config cache ({count} entries)")
-            return count
+
+        if config_file or agent_name:
+            scope = self._normalize_scope(config_file, agent_name)
+            hashes = list(self._scope_index.get(scope, ()))
+            for h in hashes:
+                self._drop(h)
+            self._stats["invalidations"] += len(hashes)
+            if hashes:
+                logger.debug(f"Invalidated {len(hashes)} MCP config(s) for {scope}")
+            return len(hashes)
+
+        count = len(self._config_cache)
+        self._config_cache.clear()
+        self._scope_index.clear()
+        self._stats["invalidations"] += count
+        logger.debug(f"Cleared all MCP config cache ({count} entries)")
+        return count
+
+    def get_stats(self) -> dict:
+        """Get cache statistics (size, hits, misses, evictions, invalidations)."""
+        total = self._stats["hits"] + self._stats["misses"]
+        return {
+            "size": len(self._config_cache),
+            "max_size": self._max_size,
+            "scopes": len(self._scope_index),
+            **self._stats,
+            "hit_rate": self._stats["hits"] / total if total > 0 else 0.0,
+        }
 
     def _get_agent_tool_config(self, context: AgentResponseContext) -> dict:
         """Get per-agent tool configuration from group_config.yaml."""
@@ -241,6 +346,16 @@ class MCPRegistry:
         agent_manager: Optional["AgentManager"] = None,
     ) -> dict[str, Any]:
         """Create MCP servers for enabled tool groups."""
+        # Tool modules are heavy; load them on first server build, not at startup
+        from sdk.handlers import (
+            create_action_manager_mcp_server,
+            create_action_mcp_server,
+            create_character_design_mcp_server,
+            create_guidelines_mcp_server,
+            create_onboarding_mcp_server,
+            create_subagents_mcp_server,
+        )
+
         mcp_servers = {}
 
         # Create action MCP server (skip, memorize, recall tools) if enabled
@@ -373,6 +488,8 @@ class MCPRegistry:
             logger.debug(f"Added action_manager tools: {action_manager_tools}")
 
         if "subagent" in enabled_groups:
+            from sdk.handlers import SUBAGENT_TOOL_NAMES
+
             # Subagent persist tools (used by subagents invoked via Task tool)
             subagent_persist_tools = [
                 SUBAGENT_TOOL_NAMES["item_designer"],
@@ -0,0 +1,309 @@
+"""
+Per-client introspection of the ClientPool.
+
+``describe_pool`` lists every pooled client with its age, idle time, config
+hash, session, message queue depth, pump state, last error and the CLI
+subprocess it runs (PID, RSS and CPU time read from /proc). Child processes of
+the backend that belong to no pooled client are listed separately, so leaked
+CLI processes stand out. ``render_prometheus`` exposes the same data, plus the
+PoolMetrics counters and the connection admission state (limit, sheds and queue
+waits per priority class), in the Prometheus text format.
+
+/proc is read on Linux only; elsewhere the process fields are None.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from sdk.client.client_pool import RECONNECT_CAUSES
+
+if TYPE_CHECKING:
+    from sdk.client.client_pool import ClientPool, PooledClient, PoolMetrics
+
+PROC = Path("/proc")
+
+# Sort keys accepted by describe_pool (clients without a value sort last)
+SORT_KEYS = ("age_s", "idle_s", "queue_depth", "rss_mb", "cpu_s")
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def client_pid(pooled: "PooledClient") -> Optional[int]:
+    """PID of the CLI subprocess behind a pooled client (None for in-process transports)."""
+    transport = getattr(pooled.client, "_transport", None)
+    # Our wrappers (MetricsTransport, JSONL logging) keep the wrapped transport in _inner
+    for _ in range(4):
+        if transport is None:
+            return None
+        process = getattr(transport, "_process", None)
+        if process is not None:
+            pid = getattr(process, "pid", None)
+            return pid if isinstance(pid, int) else None
+        transport = getattr(transport, "_inner", None)
+    return None
+
+
+def read_process_stats(pid: int) -> Optional[dict[str, Any]]:
+    """
+    Resource usage of a process from /proc.
+
+    Returns:
+        name, state, ppid, rss_mb and cpu_s (user + system), or None if the
+        process does not exist or /proc is unavailable
+    """
+    try:
+        stat = (PROC / str(pid) / "stat").read_text()
+        statm = (PROC / str(pid) / "statm").read_text()
+    except OSError:
+        return None
+    # The command name is parenthesised and may contain spaces
+    name_start, name_end = stat.index("("), stat.rindex(")")
+    fields = stat[name_end + 2 :].split()
+    try:
+        utime, stime = int(fields[11]), int(fields[12])
+        rss_pages = int(statm.split()[1])
+        ppid = int(fields[1])
+    except (IndexError, ValueError):
+        return None
+    return {
+        "name": stat[name_start + 1 : name_end],
+        "state": fields[0],
+        "ppid": ppid,
+        "rss_mb": round(rss_pages * _PAGE_SIZE / 1024 / 1024, 1),
+        "cpu_s": round((utime + stime) / _CLOCK_TICKS, 2),
+    }
+
+
+def child_processes(parent_pid: Optional[int] = None) -> list[dict[str, Any]]:
+    """Direct child processes of this process (or parent_pid), with their stats."""
+    parent_pid = os.getpid() if parent_pid is None else parent_pid
+    try:
+        entries = [entry.name for entry in PROC.iterdir() if entry.name.isdigit()]
+    except OSError:
+        return []
+    children = []
+    for name in entries:
+        stats = read_process_stats(int(name))
+        if stats is not None and stats["ppid"] == parent_pid:
+            children.append({"pid": int(name), **stats})
+    return children
+
+
+def describe_client(task_id, pooled: "PooledClient", busy: bool, now: Optional[float] = None) -> dict[str, Any]:
+    """Snapshot of one pooled client and its subprocess."""
+    now = time.monotonic() if now is None else now
+    pump = pooled.pump_task
+    pid = client_pid(pooled)
+    process = read_process_stats(pid) if pid is not None else None
+    return {
+        "task_id": str(task_id),
+        "room_id": task_id.room_id,
+        "agent_id": task_id.agent_id,
+        "age_s": round(now - pooled.created_at, 1),
+        "idle_s": round(now - pooled.last_used_at, 1),
+        "busy": busy,
+        "config_hash": pooled.config_hash,
+        "session_id": pooled.session_id,
+        "lineage": len(pooled.lineage),
+        "queue_depth": pooled.msg_queue.qsize(),
+        "queue_capacity": pooled.msg_queue.maxsize,
+        "pump": "none" if pump is None else ("stopped" if pump.done() else "running"),
+        "pid": pid,
+        "process_alive": None if pid is None else process is not None,
+        "process_state": process["state"] if process else None,
+        "rss_mb": process["rss_mb"] if process else None,
+        "cpu_s": process["cpu_s"] if process else None,
+        "last_error": pooled.last_error,
+        "last_error_age_s": round(now - pooled.last_error_at, 1) if pooled.last_error_at is not None else None,
+    }
+
+
+def describe_pool(
+    pool: "ClientPool",
+    *,
+    active_task_ids: Optional[set] = None,
+    room_id: Optional[int] = None,
+    agent_id: Optional[int] = None,
+    pump: Optional[str] = None,
+    busy: Optional[bool] = None,
+    has_error: Optional[bool] = None,
+    min_idle_s: Optional[float] = None,
+    sort: str = "age_s",
+    descending: bool = True,
+    limit: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    List pooled clients, filtered and sorted.
+
+    Args:
+        pool: The client pool
+        active_task_ids: Tasks currently streaming a response (counted as busy
+            in addition to clients whose usage lock is held)
+        room_id, agent_id: Only clients of this room / agent
+        pump: Only clients whose message pump is "running", "stopped" or "none"
+        busy: Only clients that are (or are not) serving a query
+        has_error: Only clients that have (or have not) recorded an error
+        min_idle_s: Only clients idle for at least this many seconds
+        sort: One of SORT_KEYS
+        descending: Sort order
+        limit: Maximum number of clients returned
+
+    Returns:
+        Dictionary containing:
+        - pool_size/matched: pooled clients and how many passed the filters
+        - clients: per-client snapshots (see describe_client)
+        - unpooled_processes: child processes not owned by any pooled client
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(f"Unknown sort key: {sort}")
+
+    now = time.monotonic()
+    active_task_ids = active_task_ids or set()
+    clients = [
+        describe_client(task_id, pooled, task_id in active_task_ids or pool.is_busy(task_id), now)
+        for task_id, pooled in list(pool.pool.items())
+    ]
+    pooled_pids = {client["pid"] for client in clients if client["pid"] is not None}
+
+    def keep(client: dict[str, Any]) -> bool:
+        return (
+            (room_id is None or client["room_id"] == room_id)
+            and (agent_id is None or client["agent_id"] == agent_id)
+            and (pump is None or client["pump"] == pump)
+            and (busy is None or client["busy"] == busy)
+            and (has_error is None or (client["last_error"] is not None) == has_error)
+            and (min_idle_s is None or client["idle_s"] >= min_idle_s)
+        )
+
+    matched = [client for client in clients if keep(client)]
+    with_value = [client for client in matched if client[sort] is not None]
+    without_value = [client for client in matched if client[sort] is None]
+    ordered = sorted(with_value, key=lambda client: client[sort], reverse=descending) + without_value
+
+    return {
+        "pool_size": len(clients),
+        "matched": len(matched),
+        "clients": ordered[:limit] if limit is not None else ordered,
+        "unpooled_processes": [child for child in child_processes() if child["pid"] not in pooled_pids],
+    }
+
+
+def _sample(lines: list[str], name: str, value: Any, labels: Optional[dict[str, Any]] = None) -> None:
+    if value is None:
+        return
+    if isinstance(value, bool):
+        value = int(value)
+    label_text = ""
+    if labels:
+        label_text = "{" + ",".join(f'{key}="{val}"' for key, val in labels.items()) + "}"
+    lines.append(f"{name}{label_text} {value}")
+
+
+def _family(lines: list[str], name: str, kind: str, help_text: str) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _render_admission(lines: list[str], prefix: str, admission: dict[str, Any]) -> None:
+    gauges = [
+        ("connection_slots_available", "Free connection slots under the current limit", "available"),
+        ("connection_limit", "Concurrent connect limit (adapted to connect latency and host memory)", "limit"),
+        ("connection_memory_pressure", "1 while host memory available is below the low watermark", "memory_pressure"),
+    ]
+    for suffix, help_text, key in gauges:
+        _family(lines, f"{prefix}_{suffix}", "gauge", help_text)
+        _sample(lines, f"{prefix}_{suffix}", admission[key])
+
+    classes = admission["classes"]
+    per_class = [
+        ("connection_queued", "gauge", "Connects waiting for a slot", "queued"),
+        ("connection_admitted_total", "counter", "Connects admitted", "admitted"),
+        ("connection_shed_total", "counter", "Connects shed under connection pressure", "shed"),
+    ]
+    for suffix, kind, help_text, key in per_class:
+        _family(lines, f"{prefix}_{suffix}", kind, f"{help_text} by priority class")
+        for priority, stats in classes.items():
+            _sample(lines, f"{prefix}_{suffix}", stats[key], {"priority": priority})
+
+    # Queue waits as a summary: quantiles plus sum and count (in seconds)
+    name = f"{prefix}_connection_wait_seconds"
+    _family(lines, name, "summary", "Time connects waited for a slot by priority class")
+    for priority, stats in classes.items():
+        wait = stats["wait_ms"]
+        if wait.get("count"):
+            for quantile, key in (("0.5", "p50_ms"), ("0.95", "p95_ms"), ("0.99", "p99_ms")):
+                _sample(lines, name, wait[key] / 1000, {"priority": priority, "quantile": quantile})
+        _sample(lines, f"{name}_sum", wait.get("total_ms", 0.0) / 1000, {"priority": priority})
+        _sample(lines, f"{name}_count", wait["count"], {"priority": priority})
+
+
+def render_prometheus(
+    snapshot: dict[str, Any], metrics: "PoolMetrics", admission: Optional[dict[str, Any]] = None
+) -> str:
+    """
+    Render a describe_pool snapshot and the pool counters in the Prometheus text format.
+
+    Args:
+        snapshot: describe_pool result
+        metrics: Pool counters
+        admission: ConnectionAdmission.get_stats() result, if connection
+            admission should be included
+    """
+    lines: list[str] = []
+    prefix = "claudeworld_pool"
+
+    _family(lines, f"{prefix}_clients", "gauge", "Pooled SDK clients")
+    _sample(lines, f"{prefix}_clients", snapshot["pool_size"])
+    _family(lines, f"{prefix}_unpooled_processes", "gauge", "Child processes not owned by a pooled client")
+    _sample(lines, f"{prefix}_unpooled_processes", len(snapshot["unpooled_processes"]))
+    if admission is not None:
+        _render_admission(lines, prefix, admission)
+
+    per_client = [
+        ("age_seconds", "gauge", "Seconds since the client connected", "age_s"),
+        ("idle_seconds", "gauge", "Seconds since the client was last used", "idle_s"),
+        ("busy", "gauge", "1 while the client serves a query", "busy"),
+        ("queue_depth", "gauge", "Messages waiting in the client's queue", "queue_depth"),
+        ("pump_running", "gauge", "1 while the message pump runs", None),
+        ("process_rss_bytes", "gauge", "Resident memory of the CLI subprocess", None),
+        ("process_cpu_seconds_total", "counter", "CPU time of the CLI subprocess", "cpu_s"),
+        ("has_error", "gauge", "1 if the client recorded an error", None),
+    ]
+    for suffix, kind, help_text, key in per_client:
+        name = f"{prefix}_client_{suffix}"
+        _family(lines, name, kind, help_text)
+        for client in snapshot["clients"]:
+            labels = {"room_id": client["room_id"], "agent_id": client["agent_id"]}
+            if suffix == "pump_running":
+                value: Any = client["pump"] == "running"
+            elif suffix == "process_rss_bytes":
+                value = int(client["rss_mb"] * 1024 * 1024) if client["rss_mb"] is not None else None
+            elif suffix == "has_error":
+                value = client["last_error"] is not None
+            else:
+                value = client[key]
+            _sample(lines, name, value, labels)
+
+    counters = [
+        ("hits_total", "Pool lookups served by a pooled client", metrics.pool_hits),
+        ("misses_total", "Pool lookups that needed a new client", metrics.pool_misses),
+        ("clients_created_total", "Clients connected", metrics.clients_created),
+        ("retries_total", "Connection retries", metrics.retry_count),
+        ("session_affinity_reuses_total", "Reuses of a client continuing the session", metrics.session_affinity_reuses),
+        ("reconnects_avoided_total", "Memory updates that no longer reconnect", metrics.reconnects_avoided),
+    ]
+    for suffix, help_text, value in counters:
+        _family(lines, f"{prefix}_{suffix}", "counter", help_text)
+        _sample(lines, f"{prefix}_{suffix}", value)
+
+    _family(lines, f"{prefix}_reconnects_total", "counter", "Reconnects of a pooled task by cause")
+    reconnects = metrics.get_reconnect_stats()
+    for cause in RECONNECT_CAUSES:
+        _sample(lines, f"{prefix}_reconnects_total", reconnects[cause], {"cause": cause})
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,645 @@
+"""
+Scripted control-protocol transport for offline load tests.
+
+``ScriptedTransport`` stands in for the Claude Code CLI subprocess. It speaks
+the same stream-JSON control protocol to ``ClaudeSDKClient``: it answers the
+SDK's ``initialize``/``interrupt`` requests and, for each user message, plays
+back one turn of a ``TransportScript``.
+
+A turn is a list of steps (plain dicts, so scripts can be stored as JSON):
+
+    {"type": "think", "seconds": 0.8}
+        Pause, like the model's time to first token.
+    {"type": "text", "text": "..."} / {"type": "thinking", "text": "..."}
+        Streamed as ``stream_event`` deltas at the script's token rate, then
+        sent as a complete assistant message.
+    {"type": "tool_use", "name": "mcp__action_manager__narration", "input": {...}}
+        Sent as an assistant ``tool_use`` block (with streamed input JSON).
+        Tools on in-process SDK MCP servers are executed for real through an
+        ``mcp_message`` control request, exactly as the CLI does, so tool
+        handlers, DB writes and SSE broadcasts all run. PreToolUse/PostToolUse
+        hooks fire around the call; other tools get a synthetic result.
+    {"type": "message", "message": {...}}
+        Emitted verbatim (recorded streams).
+    {"type": "control_request", "request": {...}[, "hook": {...}]}
+        Sent to the SDK and awaited (recorded tool calls and hook callbacks).
+        ``hook`` locates a recorded hook callback by event, matcher and
+        position, so it is re-targeted at the callback id the current backend
+        registered for the same hook.
+
+Every turn ends with a ``result`` message carrying approximate token usage.
+
+``load_transport_log`` turns a JSONL log written by
+``JsonlLoggingSubprocessTransport`` (with ``include_reads: true``) into a
+recorded script: one turn per user message, holding the CLI's messages and
+control requests verbatim. Recorded scripts skip the synthetic init, hooks and
+result, since the recording already contains them. Tool calls answered through
+``mcp_message`` are kept in ``ScriptedTransport.tool_calls`` for comparison.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import re
+import time
+import uuid
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from claude_agent_sdk import ClaudeAgentOptions, Transport
+from domain.value_objects.task_identifier import TaskIdentifier
+
+logger = logging.getLogger(__name__)
+
+# Rough characters per token, used for usage numbers and delta chunking
+CHARS_PER_TOKEN = 4
+
+# How long to wait for the SDK to answer a control request (tool calls included)
+CONTROL_RESPONSE_TIMEOUT = 120.0
+
+_TOKEN_RE = re.compile(r"\S+\s*|\s+")
+
+# Logged write payloads may be truncated, so user messages are matched by prefix
+_USER_PAYLOAD_RE = re.compile(r'^\{"type":\s*"user"')
+
+Step = dict[str, Any]
+
+
+@dataclass
+class TransportScript:
+    """Turns to play back, with pacing."""
+
+    turns: list[list[Step]] = field(default_factory=list)
+    tokens_per_second: float = 0.0  # 0 streams without delay
+    think_time: float = 0.0  # Seconds before the first message of each turn
+    model: str = "scripted"
+    recorded: bool = False  # Steps are a captured stream (see load_transport_log)
+
+    def turn(self, index: int) -> list[Step]:
+        """Steps for the index-th query (turns are cycled)."""
+        if not self.turns:
+            return []
+        return self.turns[index % len(self.turns)]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TransportScript:
+        return cls(
+            turns=data.get("turns", []),
+            tokens_per_second=float(data.get("tokens_per_second", 0.0)),
+            think_time=float(data.get("think_time", 0.0)),
+            model=data.get("model", "scripted"),
+            recorded=bool(data.get("recorded", False)),
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> TransportScript:
+        """Load a script saved as JSON."""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "tokens_per_second": self.tokens_per_second,
+            "think_time": self.think_time,
+            "recorded": self.recorded,
+            "turns": self.turns,
+        }
+
+
+def _hook_locations(hooks: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Map each hook callback id in an initialize request to its event, matcher and position."""
+    locations: dict[str, dict[str, Any]] = {}
+    for event, matchers in (hooks or {}).items():
+        for matcher in matchers or []:
+            for index, callback_id in enumerate(matcher.get("hookCallbackIds", [])):
+                locations[callback_id] = {"event": event, "matcher": matcher.get("matcher"), "index": index}
+    return locations
+
+
+def load_transport_log(path: Union[str, Path], keep_timing: bool = False) -> TransportScript:
+    """
+    Convert a JSONL transport log into a recorded script.
+
+    Each logged user message starts a turn; the messages and control requests
+    the CLI sent until the next one become its steps. Control responses are
+    dropped (ScriptedTransport answers the SDK itself), as is anything read
+    before the first user message (connection setup).
+
+    Args:
+        path: Log written by JsonlLoggingSubprocessTransport
+        keep_timing: Insert think steps reproducing the recorded gaps between
+            messages (default: replay as fast as the backend allows)
+
+    Raises:
+        ValueError: If the log holds no turns or was written without reads
+    """
+    hooks: dict[str, dict[str, Any]] = {}
+    turns: list[list[Step]] = []
+    reads = 0
+    last_ts: Optional[datetime] = None
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            ts = datetime.fromisoformat(event["ts"]) if "ts" in event else None
+            direction = event.get("direction")
+
+            if direction == "write":
+                payload = event.get("payload", "")
+                if _USER_PAYLOAD_RE.match(payload):
+                    turns.append([])
+                    last_ts = ts
+                elif '"initialize"' in payload:
+                    try:
+                        request = json.loads(payload).get("request", {})
+                    except json.JSONDecodeError:
+                        continue  # Truncated; hook callbacks are replayed by id
+                    if request.get("subtype") == "initialize":
+                        hooks = _hook_locations(request.get("hooks") or {})
+                continue
+
+            if direction != "read":
+                continue
+            reads += 1
+            message = event.get("message", {})
+            if not turns or message.get("type") == "control_response":
+                continue
+
+            steps = turns[-1]
+            if keep_timing and ts is not None and last_ts is not None:
+                gap = (ts - last_ts).total_seconds()
+                if gap > 0:
+                    steps.append({"type": "think", "seconds": round(gap, 3)})
+            last_ts = ts
+
+            if message.get("type") == "control_request":
+                request = message.get("request", {})
+                step: Step = {"type": "control_request", "request": request}
+                location = hooks.get(request.get("callback_id", ""))
+                if request.get("subtype") == "hook_callback" and location is not None:
+                    step["hook"] = location
+                steps.append(step)
+            else:
+                steps.append({"type": "message", "message": message})
+
+    if not reads:
+        raise ValueError(f"{path} has no read messages; record it with include_reads: true")
+    if not turns:
+        raise ValueError(f"{path} has no user messages to replay")
+    return TransportScript(turns=turns, recorded=True)
+
+
+def _split_tokens(text: str) -> list[str]:
+    """Split text into word-sized chunks (whitespace kept) for streaming."""
+    return _TOKEN_RE.findall(text) or [text]
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN) if text else 0
+
+
+def _tool_result(response: dict[str, Any]) -> tuple[list[dict[str, Any]], bool]:
+    """Content and error flag from the SDK's answer to an mcp_message tools/call."""
+    if response.get("subtype") == "error":
+        return [{"type": "text", "text": response.get("error", "error")}], True
+
+    mcp_response = response.get("response", {}).get("mcp_response", {})
+    if "error" in mcp_response:
+        return [{"type": "text", "text": mcp_response["error"].get("message", "error")}], True
+    result = mcp_response.get("result", {})
+    return result.get("content", []), bool(result.get("isError"))
+
+
+def _matches(matcher: Optional[str], tool_name: str) -> bool:
+    """Whether a hook matcher selects a tool (None, "" and "*" match everything)."""
+    if matcher in (None, "", "*"):
+        return True
+    try:
+        return re.fullmatch(matcher, tool_name) is not None
+    except re.error:
+        return matcher == tool_name
+
+
+class ScriptedTransport(Transport):
+    """
+    Transport that plays scripted control-protocol turns instead of running the CLI.
+
+    Usage:
+        script = TransportScript(turns=[[{"type": "text", "text": "Hello"}]])
+        client = ClaudeSDKClient(options=options, transport=ScriptedTransport(options, script))
+    """
+
+    def __init__(self, options: ClaudeAgentOptions, script: TransportScript, session_id: Optional[str] = None):
+        self._options = options
+        self._script = script
+        self._session_id = session_id or str(uuid.uuid4())
+        self._sdk_servers = {
+            name
+            for name, config in (options.mcp_servers or {}).items()
+            if isinstance(options.mcp_servers, dict) and isinstance(config, dict) and config.get("type") == "sdk"
+        }
+        self._hooks: dict[str, list[dict[str, Any]]] = {}
+        self._outbox: asyncio.Queue[Optional[dict[str, Any]]] = asyncio.Queue()
+        self._pending: dict[str, asyncio.Future] = {}
+        self._request_ids = itertools.count(1)
+        self._tool_ids = itertools.count(1)
+        self._turns: asyncio.Queue[Optional[dict[str, Any]]] = asyncio.Queue()
+        self._runner: Optional[asyncio.Task] = None
+        self._interrupted = False
+        self._result_sent = False
+        self._ready = False
+        self.turn_count = 0
+        self.tool_calls: list[dict[str, Any]] = []
+
+    @property
+    def session_id(self) -> str:
+        return self._session_id
+
+    async def connect(self) -> None:
+        if self._ready:
+            return
+        self._ready = True
+        self._runner = asyncio.create_task(self._run_turns(), name="scripted-transport")
+
+    async def write(self, data: str) -> None:
+        if not self._ready:
+            raise RuntimeError("Transport not connected")
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            message = json.loads(line)
+            msg_type = message.get("type")
+
+            if msg_type == "control_request":
+                await self._answer_control_request(message)
+            elif msg_type == "control_response":
+                response = message.get("response", {})
+                future = self._pending.pop(response.get("request_id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+            elif msg_type == "user":
+                await self._turns.put(message)
+
+    async def _answer_control_request(self, message: dict[str, Any]) -> None:
+        request = message.get("request", {})
+        subtype = request.get("subtype")
+        response: dict[str, Any] = {}
+
+        if subtype == "initialize":
+            self._hooks = request.get("hooks") or {}
+            response = {"commands": [], "output_style": "default", "models": [{"value": self._script.model}]}
+        elif subtype == "interrupt":
+            self._interrupted = True
+
+        await self._emit(
+            {
+                "type": "control_response",
+                "response": {"subtype": "success", "request_id": message.get("request_id"), "response": response},
+            }
+        )
+
+    def read_messages(self) -> AsyncIterator[dict[str, Any]]:
+        return self._read_messages_impl()
+
+    async def _read_messages_impl(self) -> AsyncIterator[dict[str, Any]]:
+        while True:
+            message = await self._outbox.get()
+            if message is None:
+                return
+            yield message
+
+    async def close(self) -> None:
+        if not self._ready:
+            return
+        self._ready = False
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._runner = None
+        for future in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+        self._outbox.put_nowait(None)
+
+    def is_ready(self) -> bool:
+        return self._ready
+
+    async def end_input(self) -> None:
+        await self._turns.put(None)
+
+    # ------------------------------------------------------------------
+    # Turn playback
+    # ------------------------------------------------------------------
+
+    async def _emit(self, message: dict[str, Any]) -> None:
+        await self._outbox.put(message)
+
+    async def _run_turns(self) -> None:
+        while True:
+            user_message = await self._turns.get()
+            if user_message is None:
+                return
+            try:
+                await self._play_turn(user_message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Scripted turn failed: {e}")
+                await self._emit_result(time.perf_counter(), 0, 0, is_error=True, error=str(e))
+
+    async def _play_turn(self, user_message: dict[str, Any]) -> None:
+        start = time.perf_counter()
+        self._interrupted = False
+        self._result_sent = False
+        steps = self._script.turn(self.turn_count)
+        self.turn_count += 1
+
+        prompt = user_message.get("message", {}).get("content", "")
+        if not isinstance(prompt, str):
+            prompt = json.dumps(prompt, ensure_ascii=False)
+        if not self._script.recorded:
+            await self._fire_hooks("UserPromptSubmit", None, {"prompt": prompt})
+            await self._emit(
+                {
+                    "type": "system",
+                    "subtype": "init",
+                    "session_id": self._session_id,
+                    "model": self._script.model,
+                    "tools": [],
+                    "mcp_servers": [{"name": name, "status": "connected"} for name in sorted(self._sdk_servers)],
+                }
+            )
+        if self._script.think_time > 0:
+            await asyncio.sleep(self._script.think_time)
+
+        output_tokens = 0
+        for step in steps:
+            if self._interrupted:
+                break
+            output_tokens += await self._play_step(step)
+
+        if self._result_sent and not self._interrupted:
+            return
+        await self._emit_result(
+            start,
+            _estimate_tokens(prompt),
+            output_tokens,
+            is_error=self._interrupted,
+            error="interrupted" if self._interrupted else None,
+        )
+
+    async def _play_step(self, step: Step) -> int:
+        """Play one step; returns the output tokens it produced."""
+        kind = step.get("type")
+        if kind == "think":
+            await asyncio.sleep(float(step.get("seconds", 0.0)))
+            return 0
+        if kind in ("text", "thinking"):
+            return await self._play_text(kind, step.get("text", ""))
+        if kind == "tool_use":
+            return await self._play_tool_use(step["name"], step.get("input", {}), step.get("id"))
+        if kind == "message":
+            message = step["message"]
+            self._result_sent = self._result_sent or message.get("type") == "result"
+            await self._emit({**message, "session_id": self._session_id})
+            return 0
+        if kind == "control_request":
+            request = step["request"]
+            if "hook" in step:
+                callback_id = self._hook_callback_id(step["hook"])
+                if callback_id is None:
+                    logger.debug(f"Skipping recorded hook no longer registered: {step['hook']}")
+                    return 0
+                request = {**request, "callback_id": callback_id}
+            await self.send_control_request(request)
+            return 0
+        logger.warning(f"Unknown script step type: {kind}")
+        return 0
+
+    async def _stream(self, event: dict[str, Any]) -> None:
+        if self._options.include_partial_messages:
+            await self._emit(
+                {
+                    "type": "stream_event",
+                    "uuid": str(uuid.uuid4()),
+                    "session_id": self._session_id,
+                    "event": event,
+                    "parent_tool_use_id": None,
+                }
+            )
+
+    async def _stream_chunks(self, chunks: Sequence[str], make_delta: Callable[[str], dict[str, Any]]) -> None:
+        delay = 1.0 / self._script.tokens_per_second if self._script.tokens_per_second > 0 else 0.0
+        for chunk in chunks:
+            if self._interrupted:
+                return
+            await self._stream({"type": "content_block_delta", "index": 0, "delta": make_delta(chunk)})
+            if delay:
+                await asyncio.sleep(delay)
+
+    async def _play_text(self, kind: str, text: str) -> int:
+        block_type, delta_type = ("thinking", "thinking_delta") if kind == "thinking" else ("text", "text_delta")
+        await self._stream({"type": "content_block_start", "index": 0, "content_block": {"type": block_type}})
+        await self._stream_chunks(_split_tokens(text), lambda chunk: {"type": delta_type, block_type: chunk})
+        await self._stream({"type": "content_block_stop", "index": 0})
+
+        block = (
+            {"type": "thinking", "thinking": text, "signature": ""}
+            if kind == "thinking"
+            else {"type": "text", "text": text}
+        )
+        await self._emit_assistant(block)
+        return _estimate_tokens(text)
+
+    async def _play_tool_use(self, name: str, tool_input: dict[str, Any], tool_use_id: Optional[str]) -> int:
+        tool_use_id = tool_use_id or f"toolu_scripted_{next(self._tool_ids)}"
+        input_json = json.dumps(tool_input, ensure_ascii=False)
+
+        await self._stream(
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "tool_use", "id": tool_use_id, "name": name, "input": {}},
+            }
+        )
+        await self._stream_chunks(
+            _split_tokens(input_json), lambda chunk: {"type": "input_json_delta", "partial_json": chunk}
+        )
+        await self._stream({"type": "content_block_stop", "index": 0})
+        await self._emit_assistant({"type": "tool_use", "id": tool_use_id, "name": name, "input": tool_input})
+
+        hook_input = {"tool_name": name, "tool_input": tool_input}
+        await self._fire_hooks("PreToolUse", tool_use_id, hook_input, tool_name=name)
+        content, is_error = await self._call_tool(name, tool_input)
+        if name == "Task":
+            await self._fire_hooks(
+                "SubagentStop",
+                tool_use_id,
+                {"agent_id": tool_use_id, "agent_type": tool_input.get("subagent_type", ""), "stop_hook_active": False},
+            )
+        await self._fire_hooks("PostToolUse", tool_use_id, {**hook_input, "tool_response": content}, tool_name=name)
+
+        await self._emit(
+            {
+                "type": "user",
+                "message": {
+                    "role": "user",
+                    "content": [
+                        {"type": "tool_result", "tool_use_id": tool_use_id, "content": content, "is_error": is_error}
+                    ],
+                },
+                "parent_tool_use_id": None,
+                "session_id": self._session_id,
+            }
+        )
+        return _estimate_tokens(input_json)
+
+    async def _call_tool(self, name: str, tool_input: dict[str, Any]) -> tuple[list[dict[str, Any]], bool]:
+        """Run a tool on its SDK MCP server, or return a synthetic result for other tools."""
+        parts = name.split("__", 2)
+        if len(parts) != 3 or parts[0] != "mcp" or parts[1] not in self._sdk_servers:
+            return [{"type": "text", "text": f"[scripted] {name} completed"}], False
+
+        response = await self.send_control_request(
+            {
+                "subtype": "mcp_message",
+                "server_name": parts[1],
+                "message": {
+                    "jsonrpc": "2.0",
+                    "id": next(self._request_ids),
+                    "method": "tools/call",
+                    "params": {"name": parts[2], "arguments": tool_input},
+                },
+            }
+        )
+        return _tool_result(response)
+
+    def _hook_callback_id(self, location: dict[str, Any]) -> Optional[str]:
+        """Callback id registered for a recorded hook's event, matcher and position."""
+        for matcher in self._hooks.get(location.get("event", "")) or []:
+            if matcher.get("matcher") != location.get("matcher"):
+                continue
+            callback_ids = matcher.get("hookCallbackIds", [])
+            index = location.get("index", 0)
+            if index < len(callback_ids):
+                return callback_ids[index]
+        return None
+
+    async def _fire_hooks(
+        self, event: str, tool_use_id: Optional[str], hook_input: dict[str, Any], tool_name: Optional[str] = None
+    ) -> None:
+        """Send hook_callback requests for every registered callback matching the event."""
+        for matcher in self._hooks.get(event) or []:
+            if tool_name is not None and not _matches(matcher.get("matcher"), tool_name):
+                continue
+            for callback_id in matcher.get("hookCallbackIds", []):
+                await self.send_control_request(
+                    {
+                        "subtype": "hook_callback",
+                        "callback_id": callback_id,
+                        "input": {
+                            "hook_event_name": event,
+                            "session_id": self._session_id,
+                            "transcript_path": "",
+                            "cwd": "",
+                            **hook_input,
+                        },
+                        "tool_use_id": tool_use_id,
+                    }
+                )
+
+    async def send_control_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Send a control request to the SDK and wait for its response."""
+        request_id = f"scripted_{next(self._request_ids)}"
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        await self._emit({"type": "control_request", "request_id": request_id, "request": request})
+        try:
+            response = await asyncio.wait_for(future, timeout=CONTROL_RESPONSE_TIMEOUT)
+        finally:
+            self._pending.pop(request_id, None)
+
+        message = request.get("message") or {}
+        if request.get("subtype") == "mcp_message" and message.get("method") == "tools/call":
+            content, is_error = _tool_result(response)
+            params = message.get("params", {})
+            self.tool_calls.append(
+                {
+                    "server": request.get("server_name"),
+                    "tool": params.get("name"),
+                    "arguments": params.get("arguments", {}),
+                    "content": content,
+                    "is_error": is_error,
+                }
+            )
+        return response
+
+    async def _emit_assistant(self, block: dict[str, Any]) -> None:
+        await self._emit(
+            {
+                "type": "assistant",
+                "message": {
+                    "id": f"msg_scripted_{uuid.uuid4().hex[:12]}",
+                    "role": "assistant",
+                    "model": self._script.model,
+                    "content": [block],
+                },
+                "parent_tool_use_id": None,
+                "session_id": self._session_id,
+            }
+        )
+
+    async def _emit_result(
+        self, start: float, input_tokens: int, output_tokens: int, is_error: bool = False, error: Optional[str] = None
+    ) -> None:
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        result: dict[str, Any] = {
+            "type": "result",
+            "subtype": "error_during_execution" if is_error else "success",
+            "duration_ms": duration_ms,
+            "duration_api_ms": duration_ms,
+            "is_error": is_error,
+            "num_turns": 1,
+            "session_id": self._session_id,
+            "total_cost_usd": 0.0,
+            "usage": {
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cache_read_input_tokens": 0,
+                "cache_creation_input_tokens": 0,
+            },
+        }
+        if error:
+            result["result"] = error
+        await self._emit(result)
+
+
+def scripted_transport_factory(
+    select: Union[TransportScript, Callable[[ClaudeAgentOptions, TaskIdentifier], TransportScript]],
+) -> Callable[[ClaudeAgentOptions, TaskIdentifier], Transport]:
+    """
+    Build a factory for ``set_transport_factory`` that creates scripted transports.
+
+    Args:
+        select: One script for every client, or a function choosing a script
+            from the client's options and TaskIdentifier
+    """
+
+    def factory(options: ClaudeAgentOptions, task_id: TaskIdentifier) -> Transport:
+        script = select if isinstance(select, TransportScript) else select(options, task_id)
+        return ScriptedTransport(options, script)
+
+    return factory
@@ -30,6 +30,7 @@ class ParsedStreamMessage:
         anthropic_calls: List of anthropic tool call arguments from this message
         structured_output: Structured output data if using output_format (e.g., WorldSeed)
         usage: Token usage data from ResultMessage (input_tokens, output_tokens, cache info)
+        cost_usd: Running total cost of the CLI process from ResultMessage, None otherwise
         tool_start_name: Tool name from content_block_start (tool_use), None otherwise
         tool_input_delta: Partial JSON from input_json_delta, None otherwise
         content_block_stopped: True if content_block_stop event
@@ -43,6 +44,7 @@ class ParsedStreamMessage:
     anthropic_calls: list[str] = field(default_factory=list)
     structured_output: Optional[dict] = None
     usage: Optional[dict] = None
+    cost_usd: Optional[float] = None
     tool_start_name: Optional[str] = None
     tool_input_delta: Optional[str] = None
     content_block_stopped: bool = False
@@ -82,8 +84,10 @@ class StreamParser:
         anthropic_calls: list[str] = []
         structured_output = None
         usage = None
+        cost_usd = None
 
         if isinstance(message, ResultMessage):
+            cost_usd = message.total_cost_usd
             if message.usage:
                 usage = message.usage
                 logger.info(f"ResultMessage.usage raw: {type(usage).__name__} = {usage}")
@@ -132,6 +136,7 @@ class StreamParser:
             anthropic_calls=anthropic_calls,
             structured_output=structured_output,
             usage=usage,
+            cost_usd=cost_usd,
         )
 
     @staticmethod
@@ -9,6 +9,8 @@ provides a safe extension seam inside ClaudeWorld.
 Current use cases:
   - Opt-in JSONL logging of raw control-protocol traffic for debugging.
   - MetricsTransport for performance instrumentation (integrates with perf_logger).
+  - A process-wide transport factory override (``set_transport_factory``), used
+    by benchmarks and replays to swap the CLI for a ScriptedTransport.
 """
 
 from __future__ import annotations
@@ -17,7 +19,7 @@ import asyncio
 import json
 import logging
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -32,6 +34,20 @@ from sdk.loaders import get_debug_config
 
 logger = logging.getLogger(__name__)
 
+# Replaces the CLI subprocess transport for every new client when set
+_transport_factory: Optional[Callable[[ClaudeAgentOptions, TaskIdentifier], Transport]] = None
+
+
+def set_transport_factory(factory: Optional[Callable[[ClaudeAgentOptions, TaskIdentifier], Transport]]) -> None:
+    """
+    Override the transport created for new SDK clients (None restores the CLI).
+
+    Used by offline benchmarks and replays (see sdk/client/scripted_transport.py).
+    Clients already in the pool keep their transport.
+    """
+    global _transport_factory
+    _transport_factory = factory
+
 
 @dataclass(frozen=True)
 class TransportLoggingConfig:
@@ -357,7 +373,8 @@ def build_transport(options: ClaudeAgentOptions, task_id: TaskIdentifier) -> Tra
 
     Transport layers (from outermost to innermost):
     1. MetricsTransport (when PERF_LOG=true) - performance instrumentation
-    2. JsonlLoggingSubprocessTransport (when debug.logging.transport.enabled) - raw traffic logging
+    2. Factory override (set_transport_factory), or
+       JsonlLoggingSubprocessTransport (when debug.logging.transport.enabled) - raw traffic logging
     3. SDK's built-in SubprocessCLITransport (default)
 
     Returns None to use SDK's built-in transport when no wrappers are needed.
@@ -365,6 +382,11 @@ def build_transport(options: ClaudeAgentOptions, task_id: TaskIdentifier) -> Tra
     from infrastructure.logging.perf_logger import is_perf_logging_enabled
 
     perf_enabled = is_perf_logging_enabled()
+
+    if _transport_factory is not None:
+        transport = _transport_factory(options, task_id)
+        return MetricsTransport(transport, task_id) if perf_enabled else transport
+
     jsonl_cfg = _load_transport_logging_config()
 
     # If neither metrics nor JSONL logging is enabled, use SDK default
@@ -6,28 +6,60 @@ This module re-exports all tool creation functions from specialized modules.
 - guidelines_tools: guidelines read tool (for chat agents)
 - servers: MCP server factories (action manager, onboarding, subagents, character design)
 - Individual tool modules: character, location, mechanics, narrative, equipment, etc.
+
+Re-exports are resolved lazily (PEP 562) so that importing a light submodule
+such as ``sdk.handlers.context`` does not pull in every tool module at startup.
+The tool modules are loaded the first time an MCP server is built.
 """
 
-# Re-export action tools
-from sdk.handlers.action_tools import create_action_mcp_server, create_action_tools
-
-# Re-export guidelines tools
-from sdk.handlers.guidelines_tools import create_guidelines_mcp_server
-
-# Re-export onboarding tools
-from sdk.handlers.onboarding_tools import SUBAGENT_TOOL_NAMES
-
-# Re-export server factories
-from sdk.handlers.servers import (
-    create_action_manager_mcp_server,
-    create_action_manager_tools,
-    create_character_design_mcp_server,
-    create_character_design_tools,
-    create_onboarding_mcp_server,
-    create_onboarding_tools,
-    create_subagents_mcp_server,
-    create_subagents_tools,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sdk.handlers.action_tools import create_action_mcp_server, create_action_tools
+    from sdk.handlers.guidelines_tools import create_guidelines_mcp_server
+    from sdk.handlers.onboarding_tools import SUBAGENT_TOOL_NAMES
+    from sdk.handlers.servers import (
+        create_action_manager_mcp_server,
+        create_action_manager_tools,
+        create_character_design_mcp_server,
+        create_character_design_tools,
+        create_onboarding_mcp_server,
+        create_onboarding_tools,
+        create_subagents_mcp_server,
+        create_subagents_tools,
+    )
+
+# Re-exported name -> defining submodule
+_LAZY_EXPORTS = {
+    # Action tools
+    "create_action_tools": "sdk.handlers.action_tools",
+    "create_action_mcp_server": "sdk.handlers.action_tools",
+    # Guidelines tools
+    "create_guidelines_mcp_server": "sdk.handlers.guidelines_tools",
+    # Onboarding tools
+    "SUBAGENT_TOOL_NAMES": "sdk.handlers.onboarding_tools",
+    # Server factories
+    "create_action_manager_mcp_server": "sdk.handlers.servers",
+    "create_action_manager_tools": "sdk.handlers.servers",
+    "create_character_design_mcp_server": "sdk.handlers.servers",
+    "create_character_design_tools": "sdk.handlers.servers",
+    "create_onboarding_mcp_server": "sdk.handlers.servers",
+    "create_onboarding_tools": "sdk.handlers.servers",
+    "create_subagents_mcp_server": "sdk.handlers.servers",
+    "create_subagents_tools": "sdk.handlers.servers",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
 
 __all__ = [
     # Action tools (for chat agents)
@@ -7,6 +7,10 @@ This module defines MCP tools that agents can use to control their behavior:
 - recall: Retrieve detailed long-term memories by subtitle
 
 Uses Pydantic models for type-safe validation of inputs and outputs.
+
+memorize and recall read the agent's config folder and memory index from the
+shared memory store when called (see sdk/handlers/memory_store.py), so a cached
+server never serves a stale index.
 """
 
 from typing import Any
@@ -19,10 +23,19 @@ from domain.value_objects.action_models import (
 )
 
 from sdk.handlers.context import ToolContext
+from sdk.handlers.memory_store import AgentMemory, get_memory_store
 from sdk.loaders import get_tool_description, get_tool_response, is_tool_enabled
 from sdk.tools.action import MemorizeInput, RecallInput, SkipInput
 
 
+def _current_memory(ctx: ToolContext) -> AgentMemory:
+    """Latest memory published for the agent, or the memory the tools were built with."""
+    memory = get_memory_store().get(ctx.agent_name, ctx.agent_id)
+    if memory is None:
+        return AgentMemory(config_file=ctx.config_file, index=ctx.long_term_memory_index or {})
+    return memory
+
+
 def create_action_tools(ctx: ToolContext) -> list:
     """
     Create action tools (skip, memorize, recall) with descriptions loaded from YAML.
@@ -68,7 +81,8 @@ def create_action_tools(ctx: ToolContext) -> list:
             validated_input = MemorizeInput(**args)
 
             # Write directly to file if config_file is available
-            if ctx.config_file:
+            config_file = _current_memory(ctx).config_file
+            if config_file:
                 # Load game time from player state if world_name is available
                 game_time = None
                 if ctx.world_name:
@@ -77,7 +91,7 @@ def create_action_tools(ctx: ToolContext) -> list:
                         game_time = player_state.game_time
 
                 success = AgentConfigService.append_to_recent_events(
-                    config_file=str(ctx.config_file), memory_entry=validated_input.memory_entry, game_time=game_time
+                    config_file=str(config_file), memory_entry=validated_input.memory_entry, game_time=game_time
                 )
 
                 if success:
@@ -104,13 +118,12 @@ def create_action_tools(ctx: ToolContext) -> list:
         tools.append(memorize_tool)
 
     # Recall tool - agents call this to retrieve long-term memories by subtitle
-    long_term_memory_index = ctx.long_term_memory_index or {}
-    if is_tool_enabled("recall") and long_term_memory_index:
-        # Build list of available subtitles for description
-        memory_subtitles = ", ".join(f"'{s}'" for s in long_term_memory_index.keys())
-        recall_description = get_tool_description(
-            "recall", agent_name=ctx.agent_name, memory_subtitles=memory_subtitles, group_name=ctx.group_name
-        )
+    # Registered if the agent has memories when the server is built; the index
+    # itself is read at call time, so entries added later are recallable too.
+    # The description leaves out the subtitles: a cached server would keep the
+    # list from build time, so a miss lists the current subtitles instead
+    if is_tool_enabled("recall") and ctx.long_term_memory_index:
+        recall_description = get_tool_description("recall", agent_name=ctx.agent_name, group_name=ctx.group_name)
 
         @tool("recall", recall_description, RecallInput.model_json_schema())
         async def recall_tool(args: dict[str, Any]):
@@ -119,6 +132,7 @@ def create_action_tools(ctx: ToolContext) -> list:
             validated_input = RecallInput(**args)
 
             # Look up the memory content
+            long_term_memory_index = _current_memory(ctx).index
             memory_content = long_term_memory_index.get(validated_input.subtitle)
 
             if memory_content:
@@ -17,6 +17,7 @@ from typing import Any
 from claude_agent_sdk import tool
 from services.facades import PlayerFacade
 from services.item_service import ItemService
+from services.subagent_cache import ITEMS, get_subagent_cache
 
 from sdk.handlers.common import tool_error, tool_success
 from sdk.handlers.context import ToolContext
@@ -109,6 +110,9 @@ def create_item_tools(ctx: ToolContext) -> list:
                     created_items.append(item)
                     logger.info(f"✅ Created item template: {item.item_id}")
 
+                if created_items:
+                    get_subagent_cache().bump(world_name, ITEMS)
+
                 # Add to inventory if requested (used during onboarding for starting items)
                 if validated.add_to_inventory and created_items:
                     if player_facade:
@@ -2,7 +2,7 @@
 Location management tools for TRPG gameplay.
 
 Contains tools for location navigation and management:
-- persist_location_design: Create location (used by sub-agents via Task tool)
+- persist_location_design: Create or enrich a draft location (used by sub-agents via Task tool)
 - travel: Move player to an existing location
 - list_locations: List all available locations
 
@@ -22,6 +22,7 @@ from services.location_storage import LocationStorage
 from services.persistence_manager import PersistenceManager
 from services.player_service import PlayerService
 from services.room_mapping_service import RoomMappingService
+from services.subagent_cache import LOCATIONS, get_subagent_cache
 from services.world_service import WorldService
 
 from sdk.handlers.common import build_action_context, tool_error, tool_success
@@ -95,6 +96,7 @@ def create_location_tools(ctx: ToolContext) -> list:
             # Get current room_id for sub-agent status display
             # Import here to avoid circular import
             from orchestration import get_trpg_orchestrator
+            from orchestration.location_enrichment import get_location_enricher
 
             trpg_orchestrator = get_trpg_orchestrator()
             current_room_id: Optional[int] = None
@@ -138,7 +140,9 @@ def create_location_tools(ctx: ToolContext) -> list:
                     # Trigger memory round for NPCs at the departing location
                     try:
                         if from_loc and from_loc.id:
-                            npc_count = await trpg_orchestrator.trigger_npc_memory_round(from_loc.id)
+                            npc_count = await trpg_orchestrator.trigger_npc_memory_round(
+                                from_loc.id, room_id=ctx.room_id, world_id=world_id
+                            )
                             if npc_count > 0:
                                 logger.info(f"Memory round complete: {npc_count} NPCs processed")
                     except Exception as e:
@@ -236,6 +240,10 @@ def create_location_tools(ctx: ToolContext) -> list:
                     display_name = matching_location.name
                     pos_x, pos_y = matching_location.position_x, matching_location.position_y
 
+                    get_location_enricher().record_arrival(
+                        world_id, matching_location.name, bool(matching_location.is_draft)
+                    )
+
                     logger.info(f"Traveled to existing location: {display_name}")
 
                 # ============================================================
@@ -417,7 +425,8 @@ def create_location_tools(ctx: ToolContext) -> list:
 
             Used by Location Designer sub-agent after designing a location.
             Creates the location files and connects to adjacent locations.
-            Returns an error if the location already exists.
+            A draft location with the same name is enriched in place; any other
+            existing location returns an error.
             """
             validated = PersistLocationDesignInput(**args)
 
@@ -436,7 +445,7 @@ def create_location_tools(ctx: ToolContext) -> list:
                         existing = loc
                         break
 
-                if existing:
+                if existing and not existing.is_draft:
                     return tool_error(f"Location '{validated.name}' already exists. Cannot overwrite.")
 
                 # Build adjacent hints from adjacent_to (already a list or None)
@@ -444,14 +453,25 @@ def create_location_tools(ctx: ToolContext) -> list:
 
                 # Use PersistenceManager for coordinated FS + DB creation
                 pm = PersistenceManager(db, world_id, world_name)
-                new_location_id = await pm.create_location(
-                    name=validated.name,
-                    display_name=validated.display_name,
-                    description=validated.description,
-                    position=(validated.position_x, validated.position_y),
-                    adjacent_hints=adjacent_hints,
-                    is_starting=validated.is_starting,
-                )
+                if existing:
+                    # Draft awaiting enrichment: keep its name, room and connections
+                    new_location_id = await pm.enrich_location(
+                        location_id=existing.id,
+                        name=existing.name,
+                        display_name=validated.display_name,
+                        description=validated.description,
+                        position=(validated.position_x, validated.position_y),
+                        adjacent_hints=adjacent_hints,
+                    )
+                else:
+                    new_location_id = await pm.create_location(
+                        name=validated.name,
+                        display_name=validated.display_name,
+                        description=validated.description,
+                        position=(validated.position_x, validated.position_y),
+                        adjacent_hints=adjacent_hints,
+                        is_starting=validated.is_starting,
+                    )
 
                 # Connect to adjacent locations in DB
                 if adjacent_hints:
@@ -466,9 +486,11 @@ def create_location_tools(ctx: ToolContext) -> list:
                 if validated.is_starting:
                     logger.info(f"Location '{validated.name}' marked as starting location candidate")
 
-                logger.info(f"Created location: {validated.display_name} (id={new_location_id})")
+                action = "Enriched" if existing else "Created"
+                logger.info(f"{action} location: {validated.display_name} (id={new_location_id})")
+                get_subagent_cache().bump(world_name, LOCATIONS)
 
-                response_text = f"""**Location Created:**
+                response_text = f"""**Location {action}:**
 - Name: {validated.name}
 - Position: ({validated.position_x}, {validated.position_y})
 - Is Starting: {validated.is_starting}
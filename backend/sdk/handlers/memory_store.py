@@ -0,0 +1,78 @@
+"""
+Shared in-process store of agents' long-term memory for the action tools.
+
+MCP servers are fixed when the CLI connects and are cached by config hash, so
+tools must not capture content that changes between turns. ``MCPRegistry``
+publishes each agent's config folder and memory index here whenever it builds
+the agent's MCP config (every response); the recall and memorize tools look up
+the latest entry when they are called. Memory updates therefore reach a pooled
+client without changing its config hash, and without a reconnect.
+"""
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class AgentMemory:
+    """An agent's config folder and long-term memory index at publish time."""
+
+    config_file: Optional[Path]
+    index: dict[str, str]
+
+
+class MemoryIndexStore:
+    """Latest AgentMemory per agent, keyed by (agent_name, agent_id)."""
+
+    def __init__(self):
+        self._entries: dict[tuple[str, Optional[int]], AgentMemory] = {}
+        self._lock = threading.Lock()
+        self._stats = {"publishes": 0, "updates": 0}
+
+    def publish(
+        self,
+        agent_name: str,
+        agent_id: Optional[int],
+        config_file: Optional[Path],
+        index: Optional[dict[str, str]],
+    ) -> bool:
+        """
+        Make an agent's current memory visible to its tools.
+
+        Returns:
+            True if an earlier entry for the agent had different content
+        """
+        memory = AgentMemory(config_file=config_file, index=dict(index or {}))
+        key = (agent_name, agent_id)
+        with self._lock:
+            previous = self._entries.get(key)
+            self._entries[key] = memory
+            self._stats["publishes"] += 1
+            updated = previous is not None and previous != memory
+            if updated:
+                self._stats["updates"] += 1
+        return updated
+
+    def get(self, agent_name: str, agent_id: Optional[int]) -> Optional[AgentMemory]:
+        """Latest published memory for an agent, or None if never published."""
+        with self._lock:
+            return self._entries.get((agent_name, agent_id))
+
+    def get_stats(self) -> dict[str, int]:
+        """Number of agents, publishes, and publishes that changed content."""
+        with self._lock:
+            return {"agents": len(self._entries), **self._stats}
+
+
+# Global singleton
+_memory_store: Optional[MemoryIndexStore] = None
+
+
+def get_memory_store() -> MemoryIndexStore:
+    """Get or create the global memory index store."""
+    global _memory_store
+    if _memory_store is None:
+        _memory_store = MemoryIndexStore()
+    return _memory_store
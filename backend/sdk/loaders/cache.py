@@ -2,16 +2,19 @@
 Caching infrastructure for YAML configuration files.
 
 Provides file-based caching with automatic invalidation on file changes.
+Configs are loaded from worker threads too (agent seeding), and a ruamel YAML
+instance is not thread-safe, so each thread parses with its own instance.
 """
 
 import logging
+import threading
 from pathlib import Path
 from typing import Any, Dict
 
 from infrastructure.locking import file_lock
 from ruamel.yaml import YAML
 
-yaml = YAML(typ="safe", pure=True)
+_thread_local = threading.local()
 logger = logging.getLogger(__name__)
 
 # Cache for loaded configurations: path -> (mtime, config)
@@ -26,24 +29,45 @@ def _get_file_mtime(file_path: Path) -> float:
         return 0.0
 
 
-def _load_yaml_file(file_path: Path) -> Dict[str, Any]:
+def _get_yaml() -> YAML:
+    """Get this thread's YAML parser."""
+    yaml = getattr(_thread_local, "yaml", None)
+    if yaml is None:
+        yaml = _thread_local.yaml = YAML(typ="safe", pure=True)
+    return yaml
+
+
+def _read_yaml_file(file_path: Path) -> Dict[str, Any]:
     """
-    Load a YAML file with file locking.
+    Load a YAML file with file locking, raising if it can't be parsed.
 
     Args:
         file_path: Path to the YAML file
 
     Returns:
-        Dictionary containing the parsed YAML content
+        Dictionary containing the parsed YAML content ({} if the file is missing)
     """
     if not file_path.exists():
         logger.warning(f"Configuration file not found: {file_path}")
         return {}
 
+    with file_lock(str(file_path), "r") as f:
+        content = _get_yaml().load(f)
+        return content if content else {}
+
+
+def _load_yaml_file(file_path: Path) -> Dict[str, Any]:
+    """
+    Load a YAML file with file locking.
+
+    Args:
+        file_path: Path to the YAML file
+
+    Returns:
+        Dictionary containing the parsed YAML content
+    """
     try:
-        with file_lock(str(file_path), "r") as f:
-            content = yaml.load(f)
-            return content if content else {}
+        return _read_yaml_file(file_path)
     except Exception as e:
         logger.error(f"Error loading YAML file {file_path}: {e}")
         return {}
@@ -69,8 +93,12 @@ def get_cached_config(file_path: Path, force_reload: bool = False) -> Dict[str,
         if cached_mtime == current_mtime:
             return cached_config
 
-    # Load fresh configuration
-    config = _load_yaml_file(file_path)
+    # Load fresh configuration; a failed load is not cached, so the next call retries
+    try:
+        config = _read_yaml_file(file_path)
+    except Exception as e:
+        logger.error(f"Error loading YAML file {file_path}: {e}")
+        return {}
     _config_cache[cache_key] = (current_mtime, config)
 
     logger.debug(f"Loaded configuration from {file_path}")
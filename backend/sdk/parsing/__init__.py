@@ -4,14 +4,27 @@ SDK Parsing utilities.
 This package provides parsing functions for agent configurations and other data.
 """
 
-from .agent_parser import list_available_configs, parse_agent_config
-from .memory_parser import get_memory_by_subtitle, get_memory_subtitles, parse_long_term_memory
+from .agent_parser import (
+    get_agent_config_cache_stats,
+    invalidate_agent_config_cache,
+    list_available_configs,
+    parse_agent_config,
+)
+from .memory_parser import (
+    get_memory_by_subtitle,
+    get_memory_subtitles,
+    parse_long_term_memory,
+    parse_long_term_memory_text,
+)
 
 __all__ = [
     "parse_agent_config",
     "list_available_configs",
+    "invalidate_agent_config_cache",
+    "get_agent_config_cache_stats",
     # Memory parsing
     "parse_long_term_memory",
+    "parse_long_term_memory_text",
     "get_memory_subtitles",
     "get_memory_by_subtitle",
 ]
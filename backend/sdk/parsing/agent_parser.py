@@ -3,19 +3,48 @@ Agent configuration parser for markdown files.
 
 This module handles loading agent configurations from markdown files
 following a specific format with standardized sections.
+
+Parsed configs are cached per agent folder. Each source file is tracked by
+(mtime_ns, size) and only the files whose stat changed are re-read, so a
+memory write to recent_events.md costs one file read instead of a full
+re-parse. Writers in this process also call invalidate_agent_config_cache()
+so coarse-mtime filesystems can't serve a stale section.
 """
 
 import logging
+import threading
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 import yaml
 from domain.entities.agent_config import AgentConfigData
 
-from sdk.parsing.memory_parser import parse_long_term_memory
+from sdk.parsing.memory_parser import parse_long_term_memory_text
 
 logger = logging.getLogger("ConfigParser")
 
+# Markdown sections read verbatim into AgentConfigData fields
+_SECTION_FILES = ("in_a_nutshell.md", "characteristics.md", "recent_events.md")
+_MEMORY_FILE = "consolidated_memory.md"
+_YAML_FILE = "config.yaml"
+
+# File signature: (mtime_ns, size), or None when the file does not exist
+_FileSignature = Optional[tuple[int, int]]
+
+
+@dataclass
+class _CachedFolder:
+    """Parsed pieces of one agent folder, each tagged with the signature it was read at."""
+
+    files: Dict[str, tuple[_FileSignature, Any]] = field(default_factory=dict)
+
+
+# Process-wide parsed-config cache: resolved folder path -> parsed pieces
+_folder_cache: Dict[str, _CachedFolder] = {}
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0, "file_reads": 0}
+
 
 def parse_agent_config(file_path: str) -> Optional[AgentConfigData]:
     """
@@ -43,7 +72,7 @@ def parse_agent_config(file_path: str) -> Optional[AgentConfigData]:
         project_root = get_settings().project_root
         path = project_root / file_path
 
-    if not path.exists() or not path.is_dir():
+    if not path.is_dir():
         return None
 
     try:
@@ -53,72 +82,150 @@ def parse_agent_config(file_path: str) -> Optional[AgentConfigData]:
         return None
 
 
-def _parse_folder_config(folder_path: Path) -> AgentConfigData:
-    """Parse agent configuration from folder with separate .md files and optional config.yaml."""
+def invalidate_agent_config_cache(file_path: Optional[str] = None) -> int:
+    """
+    Drop cached parsed configs.
 
-    def read_section(filename: str) -> str:
-        file_path = folder_path / filename
-        if file_path.exists():
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read().strip()
-        return ""
-
-    def read_yaml_config() -> dict:
-        """Read optional config.yaml for additional settings like home_location."""
-        config_file = folder_path / "config.yaml"
-        if config_file.exists():
-            try:
-                with open(config_file, "r", encoding="utf-8") as f:
-                    return yaml.safe_load(f) or {}
-            except Exception as e:
-                logger.warning(f"Failed to parse config.yaml in {folder_path}: {e}")
-        return {}
+    Args:
+        file_path: Agent folder (relative to project root or absolute), or None to clear all
+
+    Returns:
+        Number of folders dropped
+    """
+    with _cache_lock:
+        if file_path is None:
+            count = len(_folder_cache)
+            _folder_cache.clear()
+            return count
+
+        path = Path(file_path)
+        if not path.is_absolute():
+            from core.settings import get_settings
+
+            path = get_settings().project_root / file_path
+        return 1 if _folder_cache.pop(str(path), None) is not None else 0
 
-    def find_profile_pic() -> Optional[str]:
-        """Find profile picture file in the agent folder."""
-        # Common image extensions to look for
-        image_extensions = [".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg"]
-        # Common profile pic filenames
-        common_names = ["profile", "avatar", "picture", "photo"]
-
-        # First, try common profile pic filenames
-        for name in common_names:
-            for ext in image_extensions:
-                pic_path = folder_path / f"{name}{ext}"
-                if pic_path.exists():
-                    return pic_path.name
-
-        # If no common name found, look for any image file
-        for ext in image_extensions:
-            for file in folder_path.glob(f"*{ext}"):
-                return file.name
 
+def get_agent_config_cache_stats() -> dict:
+    """Get parsed-config cache statistics (folders, hits, misses, file_reads)."""
+    with _cache_lock:
+        return {"folders": len(_folder_cache), **_cache_stats}
+
+
+def _file_signature(path: Path) -> _FileSignature:
+    """Stat a file for change detection (None if missing)."""
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_section(path: Path) -> str:
+    """Read a markdown section file."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read().strip()
 
-    # Parse long-term memory file (consolidated_memory.md)
-    long_term_memory_file = folder_path / "consolidated_memory.md"
-    long_term_memory_index = None
-    long_term_memory_subtitles = None
 
-    # Load memory index for recall tool
-    if long_term_memory_file.exists():
-        long_term_memory_index = parse_long_term_memory(long_term_memory_file)
-        if long_term_memory_index:
-            # Create a comma-separated list of subtitles for context injection
-            long_term_memory_subtitles = ", ".join(f"'{s}'" for s in long_term_memory_index.keys())
-
-    # Read optional config.yaml for additional settings
-    yaml_config = read_yaml_config()
-
-    return AgentConfigData(
-        in_a_nutshell=read_section("in_a_nutshell.md"),
-        characteristics=read_section("characteristics.md"),
-        recent_events=read_section("recent_events.md"),
-        profile_pic=find_profile_pic(),
+def _read_memory(path: Path) -> Optional[Dict[str, str]]:
+    """Read and index consolidated_memory.md for the recall tool."""
+    try:
+        return parse_long_term_memory_text(path.read_text(encoding="utf-8"))
+    except Exception as e:
+        logger.error(f"Error parsing long-term memory file {path}: {e}")
+        return {}
+
+
+def _read_yaml(path: Path) -> dict:
+    """Read optional config.yaml for additional settings like home_location."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+    except Exception as e:
+        logger.warning(f"Failed to parse config.yaml in {path.parent}: {e}")
+        return {}
+
+
+def _parse_folder_config(folder_path: Path) -> AgentConfigData:
+    """Parse agent configuration from folder with separate .md files and optional config.yaml.
+
+    Served from the per-folder cache; only files whose signature changed are re-read.
+    """
+    key = str(folder_path)
+    with _cache_lock:
+        cached = _folder_cache.get(key)
+
+    # Work on a copy so concurrent callers never observe a half-updated entry
+    files = dict(cached.files) if cached is not None else {}
+    changed = False
+
+    def load(filename: str, reader: Callable[[Path], Any], default: Any) -> Any:
+        nonlocal changed
+        file_path = folder_path / filename
+        signature = _file_signature(file_path)
+        entry = files.get(filename)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        value = reader(file_path) if signature is not None else default
+        files[filename] = (signature, value)
+        changed = True
+        with _cache_lock:
+            _cache_stats["file_reads"] += 1
+        return value
+
+    sections = {name: load(name, _read_section, "") for name in _SECTION_FILES}
+    long_term_memory_index = load(_MEMORY_FILE, _read_memory, None)
+    yaml_config = load(_YAML_FILE, _read_yaml, {})
+    # Folder mtime changes when files are added/removed (profile picture swaps)
+    profile_pic = load(".", lambda _: _find_profile_pic(folder_path), None)
+
+    with _cache_lock:
+        if changed:
+            _folder_cache[key] = _CachedFolder(files=files)
+            _cache_stats["misses"] += 1
+        else:
+            _cache_stats["hits"] += 1
+
+    long_term_memory_subtitles = None
+    if long_term_memory_index:
+        # Create a comma-separated list of subtitles for context injection
+        long_term_memory_subtitles = ", ".join(f"'{s}'" for s in long_term_memory_index.keys())
+
+    config = AgentConfigData(
+        in_a_nutshell=sections["in_a_nutshell.md"],
+        characteristics=sections["characteristics.md"],
+        recent_events=sections["recent_events.md"],
+        profile_pic=profile_pic,
         long_term_memory_index=long_term_memory_index,
         long_term_memory_subtitles=long_term_memory_subtitles,
         home_location=yaml_config.get("home_location"),
     )
+    # Callers own the returned object; never hand out the cached dict itself
+    if config.long_term_memory_index is not None:
+        config = replace(config, long_term_memory_index=dict(config.long_term_memory_index))
+    return config
+
+
+def _find_profile_pic(folder_path: Path) -> Optional[str]:
+    """Find profile picture file in the agent folder."""
+    # Common image extensions to look for
+    image_extensions = [".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg"]
+    # Common profile pic filenames
+    common_names = ["profile", "avatar", "picture", "photo"]
+
+    # First, try common profile pic filenames
+    for name in common_names:
+        for ext in image_extensions:
+            pic_path = folder_path / f"{name}{ext}"
+            if pic_path.exists():
+                return pic_path.name
+
+    # If no common name found, look for any image file
+    for ext in image_extensions:
+        for file in folder_path.glob(f"*{ext}"):
+            return file.name
+
+    return None
 
 
 def list_available_configs() -> Dict[str, Dict[str, Optional[str]]]:
@@ -9,6 +9,9 @@ from typing import Dict, List, Optional
 
 logger = logging.getLogger("MemoryParser")
 
+# Subtitle header: ## [subtitle]
+_SUBTITLE_PATTERN = re.compile(r"^##[^\S\n]*\[([^\]\n]+)\]", re.MULTILINE)
+
 
 def parse_long_term_memory(file_path: Path) -> Dict[str, str]:
     """
@@ -33,40 +36,37 @@ def parse_long_term_memory(file_path: Path) -> Dict[str, str]:
 
     try:
         content = file_path.read_text(encoding="utf-8")
+        return parse_long_term_memory_text(content)
 
-        # Split by subtitle headers: ## [subtitle]
-        # Pattern matches: ## [text]
-        pattern = r"^##\s*\[([^\]]+)\]"
+    except Exception as e:
+        logger.error(f"Error parsing long-term memory file {file_path}: {e}")
+        return {}
 
-        memories = {}
-        current_subtitle = None
-        current_content = []
 
-        for line in content.split("\n"):
-            # Check if this line is a subtitle header
-            match = re.match(pattern, line)
-            if match:
-                # Save previous memory if exists
-                if current_subtitle:
-                    memories[current_subtitle] = "\n".join(current_content).strip()
+def parse_long_term_memory_text(content: str) -> Dict[str, str]:
+    """
+    Parse long-term memory content (see parse_long_term_memory for the format).
 
-                # Start new memory
-                current_subtitle = match.group(1)
-                current_content = []
-            else:
-                # Accumulate content lines
-                if current_subtitle is not None:
-                    current_content.append(line)
+    Single pass over the text: each header match marks where the previous
+    memory ends, so the body is sliced out instead of rebuilt line by line.
 
-        # Save last memory
-        if current_subtitle:
-            memories[current_subtitle] = "\n".join(current_content).strip()
+    Args:
+        content: Raw memory file content
 
-        return memories
+    Returns:
+        Dictionary mapping subtitles to their content
+    """
+    memories = {}
+    headers = list(_SUBTITLE_PATTERN.finditer(content))
 
-    except Exception as e:
-        logger.error(f"Error parsing long-term memory file {file_path}: {e}")
-        return {}
+    for i, match in enumerate(headers):
+        # Body starts on the line after the header (rest of header line is ignored)
+        body_start = content.find("\n", match.end())
+        body_end = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+        body = content[body_start + 1 : body_end] if body_start != -1 and body_start < body_end else ""
+        memories[match.group(1)] = body.strip()
+
+    return memories
 
 
 def get_memory_subtitles(file_path: Path) -> List[str]:
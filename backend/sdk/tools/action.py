@@ -108,7 +108,7 @@ ACTION_TOOLS: ToolDict = {
             "Retrieve a detailed memory entry by subtitle from {agent_name}'s long-term memories. "
             "Use this when {agent_name} is reacting to a past event, relationship, or promise "
             "and needs concrete details (and their current feelings about it) to respond in-character.\n"
-            "Available memories: {memory_subtitles}"
+            "Subtitles are listed in {agent_name}'s memory index; an unknown subtitle returns the current list."
         ),
         input_model=RecallInput,
         response="{memory_content}",
@@ -5,7 +5,8 @@ This service separates file I/O operations from database CRUD operations,
 providing a cleaner separation of concerns and making the code more testable.
 
 Note: When agent configs are modified (recent_events, profile pics, etc.),
-the MCP cache is invalidated to ensure hot-reloading works correctly.
+that agent's MCP cache entries are invalidated to ensure hot-reloading works
+correctly. Other agents keep their cached configs.
 """
 
 import base64
@@ -23,24 +24,36 @@ if TYPE_CHECKING:
 logger = logging.getLogger("AgentConfigService")
 
 
-def _invalidate_mcp_cache() -> None:
+def _invalidate_mcp_cache(config_file: Optional[str] = None, agent_name: Optional[str] = None) -> None:
     """
-    Invalidate the MCP config cache after agent config changes.
+    Invalidate one agent's MCP config cache entries after its config changes.
 
-    This ensures hot-reloading works correctly - when agent configs change
-    (e.g., memories updated, profile pics changed), the cached MCP
-    configurations are cleared so the next request rebuilds them.
+    This ensures hot-reloading works correctly - when an agent's config changes
+    (e.g., memories updated, profile pic changed), its cached MCP
+    configurations are dropped so its next request rebuilds them. The rebuilt
+    config hashes the same, so the pooled client is not reconnected, and
+    unrelated agents are untouched.
     """
     try:
         from sdk.client.mcp_registry import get_mcp_registry
 
-        count = get_mcp_registry().invalidate_cache()
+        count = get_mcp_registry().invalidate_cache(config_file=config_file, agent_name=agent_name)
         if count > 0:
-            logger.info(f"Invalidated MCP cache ({count} entries) due to agent config change")
+            logger.info(f"Invalidated MCP cache ({count} entries) for {config_file or agent_name}")
     except Exception as e:
         logger.warning(f"Failed to invalidate MCP cache: {e}")
 
 
+def _invalidate_parsed_config(config_file: str) -> None:
+    """Drop the agent's parsed-config cache entry after this process writes to it."""
+    try:
+        from sdk.parsing import invalidate_agent_config_cache
+
+        invalidate_agent_config_cache(config_file)
+    except Exception as e:
+        logger.warning(f"Failed to invalidate parsed config cache: {e}")
+
+
 class AgentConfigService:
     """
     Handles all agent configuration file operations.
@@ -100,7 +113,8 @@ class AgentConfigService:
                 f.write("\n" + formatted_entry + "\n")
 
             logger.debug(f"Appended memory entry to {recent_events_file}")
-            _invalidate_mcp_cache()
+            _invalidate_parsed_config(config_file)
+            _invalidate_mcp_cache(config_file=config_file)
             return True
 
         except FileNotFoundError:
@@ -109,7 +123,8 @@ class AgentConfigService:
                 with file_lock(str(recent_events_file), "w") as f:
                     f.write(formatted_entry + "\n")
                 logger.debug(f"Created {recent_events_file} with memory entry")
-                _invalidate_mcp_cache()
+                _invalidate_parsed_config(config_file)
+                _invalidate_mcp_cache(config_file=config_file)
                 return True
             except Exception as e:
                 logger.error(f"Error: Could not create recent_events file: {e}")
@@ -191,7 +206,7 @@ class AgentConfigService:
 
             profile_path.write_bytes(image_data)
             logger.info(f"Saved profile picture for {agent_name} to {profile_path}")
-            _invalidate_mcp_cache()
+            _invalidate_mcp_cache(config_file=f"agents/{agent_name}")
             return True
 
         except Exception as e:
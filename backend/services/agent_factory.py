@@ -5,7 +5,11 @@ This service separates business logic (config loading, prompt building, group se
 from CRUD operations, providing cleaner separation of concerns.
 """
 
+import asyncio
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, Optional
 
@@ -13,6 +17,7 @@ import crud
 from core import get_settings
 from domain.entities.agent_config import AgentConfigData
 from infrastructure.database import models
+from infrastructure.logging.perf_logger import get_perf_logger
 from sdk.loaders import get_group_config
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,6 +26,9 @@ from .prompt_builder import build_system_prompt
 
 logger = logging.getLogger("AgentFactory")
 
+# Worker threads for parsing agent configs during startup seeding
+SEED_PARSE_WORKERS = int(os.environ.get("AGENT_SEED_WORKERS", "8"))
+
 
 @dataclass
 class AgentSettings:
@@ -103,6 +111,66 @@ def _resolve_group_settings(name: str, group: Optional[str]) -> AgentSettings:
     return settings
 
 
+def _prepare_agent_fields(
+    name: str,
+    config_file: str,
+    group: Optional[str] = None,
+    provided_config: Optional[AgentConfigData] = None,
+    world_name: Optional[str] = None,
+) -> dict:
+    """
+    Load, merge and render everything needed to create an agent row.
+
+    Pure filesystem/CPU work (no database), so it is safe to run in a worker
+    thread. Returns crud.create_agent's keyword arguments (without db).
+    """
+    # 1. Load config from filesystem
+    file_config = AgentConfigService.load_agent_config(config_file)
+
+    # 2. Merge configs (provided values take precedence)
+    if provided_config:
+        final_config = merge_agent_configs(provided_config, file_config)
+    else:
+        final_config = file_config or AgentConfigData()
+
+    # 3. Get profile_pic from provided or file config
+    profile_pic = None
+    if provided_config and provided_config.profile_pic:
+        profile_pic = provided_config.profile_pic
+    elif file_config and file_config.profile_pic:
+        profile_pic = file_config.profile_pic
+
+    # 4. Build system prompt
+    system_prompt = build_system_prompt(name, final_config)
+
+    # 5. Resolve group settings
+    settings = _resolve_group_settings(name, group)
+
+    # 6. Auto-detect world_name from config_file if not provided
+    # Config files for world-specific agents are like: worlds/{world_name}/agents/{agent_name}
+    effective_world_name = world_name
+    if not effective_world_name and config_file and config_file.startswith("worlds/"):
+        parts = config_file.split("/")
+        if len(parts) >= 2:
+            effective_world_name = parts[1]
+            logger.debug(f"Auto-detected world_name '{effective_world_name}' from config_file")
+
+    return {
+        "name": name,
+        "system_prompt": system_prompt,
+        "profile_pic": profile_pic,
+        "in_a_nutshell": final_config.in_a_nutshell,
+        "characteristics": final_config.characteristics,
+        "recent_events": final_config.recent_events,
+        "group": group,
+        "config_file": config_file,
+        "interrupt_every_turn": settings.interrupt_every_turn,
+        "priority": settings.priority,
+        "transparent": settings.transparent,
+        "world_name": effective_world_name,
+    }
+
+
 class AgentFactory:
     """
     Factory for creating and managing agents.
@@ -136,38 +204,10 @@ class AgentFactory:
         Returns:
             Created or updated Agent model
         """
-        # 1. Load config from filesystem
-        file_config = AgentConfigService.load_agent_config(config_file)
+        fields = _prepare_agent_fields(name, config_file, group, provided_config, world_name)
+        effective_world_name = fields["world_name"]
 
-        # 2. Merge configs (provided values take precedence)
-        if provided_config:
-            final_config = merge_agent_configs(provided_config, file_config)
-        else:
-            final_config = file_config or AgentConfigData()
-
-        # 3. Get profile_pic from provided or file config
-        profile_pic = None
-        if provided_config and provided_config.profile_pic:
-            profile_pic = provided_config.profile_pic
-        elif file_config and file_config.profile_pic:
-            profile_pic = file_config.profile_pic
-
-        # 4. Build system prompt
-        system_prompt = build_system_prompt(name, final_config)
-
-        # 5. Resolve group settings
-        settings = _resolve_group_settings(name, group)
-
-        # 6. Auto-detect world_name from config_file if not provided
-        # Config files for world-specific agents are like: worlds/{world_name}/agents/{agent_name}
-        effective_world_name = world_name
-        if not effective_world_name and config_file and config_file.startswith("worlds/"):
-            parts = config_file.split("/")
-            if len(parts) >= 2:
-                effective_world_name = parts[1]
-                logger.debug(f"Auto-detected world_name '{effective_world_name}' from config_file")
-
-        # 7. Check if agent already exists (handles stale DB entries after world reset)
+        # Check if agent already exists (handles stale DB entries after world reset)
         existing_agent = await crud.get_agent_by_name(db, name, world_name=effective_world_name)
         if existing_agent:
             logger.info(
@@ -176,32 +216,18 @@ class AgentFactory:
             return await crud.update_agent(
                 db=db,
                 agent_id=existing_agent.id,
-                system_prompt=system_prompt,
-                profile_pic=profile_pic,
-                in_a_nutshell=final_config.in_a_nutshell,
-                characteristics=final_config.characteristics,
-                recent_events=final_config.recent_events,
-                interrupt_every_turn=settings.interrupt_every_turn,
-                priority=settings.priority,
-                transparent=settings.transparent,
+                system_prompt=fields["system_prompt"],
+                profile_pic=fields["profile_pic"],
+                in_a_nutshell=fields["in_a_nutshell"],
+                characteristics=fields["characteristics"],
+                recent_events=fields["recent_events"],
+                interrupt_every_turn=fields["interrupt_every_turn"],
+                priority=fields["priority"],
+                transparent=fields["transparent"],
             )
 
-        # 8. Create via pure CRUD
-        return await crud.create_agent(
-            db=db,
-            name=name,
-            system_prompt=system_prompt,
-            profile_pic=profile_pic,
-            in_a_nutshell=final_config.in_a_nutshell,
-            characteristics=final_config.characteristics,
-            recent_events=final_config.recent_events,
-            group=group,
-            config_file=config_file,
-            interrupt_every_turn=settings.interrupt_every_turn,
-            priority=settings.priority,
-            transparent=settings.transparent,
-            world_name=effective_world_name,
-        )
+        # Create via pure CRUD
+        return await crud.create_agent(db=db, **fields)
 
     @staticmethod
     async def reload_from_config(db: AsyncSession, agent_id: int) -> Optional[models.Agent]:
@@ -296,6 +322,10 @@ class AgentFactory:
         """
         Seed agents from config files at startup if they don't exist.
 
+        Existing names are fetched in one query, missing agents' configs are
+        parsed concurrently in a thread pool, and all new rows are inserted in
+        one transaction.
+
         Args:
             db: Database session
 
@@ -303,31 +333,55 @@ class AgentFactory:
             Dict of agent_name -> Agent for created agents
         """
         from sdk.parsing import list_available_configs  # Lazy import to avoid circular dependency
-        from sqlalchemy.future import select
 
+        start = time.perf_counter()
         available_configs = list_available_configs()
-        created_agents: Dict[str, models.Agent] = {}
-
-        for agent_name, config_info in available_configs.items():
-            config_path = config_info["path"]
-            group_name = config_info["group"]
-
-            # Check if agent already exists
-            result = await db.execute(select(models.Agent).where(models.Agent.name == agent_name))
-            existing_agent = result.scalar_one_or_none()
-
-            if not existing_agent:
-                # Create agent from config file
-                agent = await AgentFactory.create_from_config(
-                    db=db,
-                    name=agent_name,
-                    config_file=config_path,
-                    group=group_name,
+        scan_ms = (time.perf_counter() - start) * 1000
+
+        query_start = time.perf_counter()
+        existing_names = await crud.get_agent_names(db)
+        missing = {name: info for name, info in available_configs.items() if name not in existing_names}
+        query_ms = (time.perf_counter() - query_start) * 1000
+
+        parse_start = time.perf_counter()
+        pending: list[dict] = []
+        if missing:
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(SEED_PARSE_WORKERS, len(missing))), thread_name_prefix="agent-seed"
+            ) as executor:
+                pending = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(executor, _prepare_agent_fields, name, info["path"], info["group"])
+                        for name, info in missing.items()
+                    )
                 )
+        parse_ms = (time.perf_counter() - parse_start) * 1000
 
-                group_info = f" (group: {group_name})" if group_name else ""
-                logger.info(f"Created agent '{agent_name}'{group_info} from config file: {config_path}")
+        insert_start = time.perf_counter()
+        created = await crud.create_agents_bulk(db, pending)
+        insert_ms = (time.perf_counter() - insert_start) * 1000
 
-                created_agents[agent_name] = agent
+        created_agents: Dict[str, models.Agent] = {}
+        for agent in created:
+            group_info = f" (group: {agent.group})" if agent.group else ""
+            logger.info(f"Created agent '{agent.name}'{group_info} from config file: {agent.config_file}")
+            created_agents[agent.name] = agent
+
+        total_ms = (time.perf_counter() - start) * 1000
+        logger.info(
+            f"Seeded {len(created_agents)}/{len(available_configs)} agents in {total_ms:.1f}ms "
+            f"(scan={scan_ms:.1f}ms, query={query_ms:.1f}ms, parse={parse_ms:.1f}ms, insert={insert_ms:.1f}ms)"
+        )
+        get_perf_logger().log_sync(
+            "seed_agents",
+            total_ms,
+            configs=len(available_configs),
+            created=len(created_agents),
+            scan_ms=round(scan_ms, 1),
+            query_ms=round(query_ms, 1),
+            parse_ms=round(parse_ms, 1),
+            insert_ms=round(insert_ms, 1),
+        )
 
         return created_agents
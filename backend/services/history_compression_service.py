@@ -155,6 +155,7 @@ async def _generate_compressed_section(
     from domain.entities.agent import AgentConfigData
     from domain.value_objects import TaskIdentifier
     from domain.value_objects.contexts import AgentResponseContext
+    from sdk.client.connection_admission import ConnectionPriority, connection_priority
 
     from services import AgentConfigService
     from services.prompt_builder import build_system_prompt
@@ -204,14 +205,15 @@ Your consolidated summary here..."""
             task_id=task_id,
         )
 
-        # Generate summary via AgentManager
+        # Generate summary via AgentManager (background class: deferred under connection pressure)
         response_text = ""
-        async for event in agent_manager.generate_sdk_response(context):
-            if event.get("type") == "content_delta":
-                response_text += event.get("delta", "")
-            elif event.get("type") == "stream_end":
-                if event.get("response_text"):
-                    response_text = event["response_text"]
+        with connection_priority(ConnectionPriority.BACKGROUND):
+            async for event in agent_manager.generate_sdk_response(context):
+                if event.get("type") == "content_delta":
+                    response_text += event.get("delta", "")
+                elif event.get("type") == "stream_end":
+                    if event.get("response_text"):
+                        response_text = event["response_text"]
 
         logger.info(f"History_Summarizer generated section: {response_text[:100]}...")
         return response_text.strip() if response_text else None
@@ -167,6 +167,41 @@ class LocationStorage:
         logger.info(f"Updated location '{location_name}' in world '{world_name}'")
         return True
 
+    @classmethod
+    def enrich_location(
+        cls,
+        world_name: str,
+        location_name: str,
+        display_name: str,
+        description: str,
+        position: tuple,
+        adjacent: Optional[List[str]] = None,
+    ) -> bool:
+        """Replace a draft location's design and clear its draft flag.
+
+        Adjacent names are merged into the existing list; events.md is kept.
+        """
+        index_file, index = _load_index(world_name)
+        loc_data = index.get("locations", {}).get(location_name) if index else None
+        if loc_data is None:
+            logger.warning(f"Location '{location_name}' not found in world '{world_name}'")
+            return False
+
+        location_path = WorldService.get_world_path(world_name) / "locations" / location_name
+        location_path.mkdir(exist_ok=True)
+        with open(location_path / "description.md", "w", encoding="utf-8") as f:
+            f.write(f"# {display_name}\n\n{description}\n")
+
+        loc_data["name"] = display_name
+        loc_data["position"] = list(position)
+        existing_adjacent = loc_data.get("adjacent") or []
+        loc_data["adjacent"] = existing_adjacent + [a for a in adjacent or [] if a not in existing_adjacent]
+        loc_data["is_draft"] = False
+
+        _save_index(index_file, index)
+        logger.info(f"Enriched draft location '{location_name}' in world '{world_name}'")
+        return True
+
     @classmethod
     def cleanup_stale_entries(cls, world_name: str) -> List[str]:
         """Remove stale entries from _index.yaml that don't have directories."""
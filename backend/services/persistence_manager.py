@@ -3,7 +3,7 @@ Persistence Manager - Unified interface for world initialization and sync.
 
 This module provides a single point of access for:
 1. World initialization (syncing filesystem content to database)
-2. Creating locations (requires both filesystem and database)
+2. Creating locations and enriching drafts (requires both filesystem and database)
 3. Exporting database state back to filesystem (for backups)
 
 Runtime state operations (stats, inventory, location changes) go directly
@@ -32,7 +32,7 @@ class PersistenceManager:
 
     This class handles:
     - Initial sync from filesystem to database (during onboarding→active transition)
-    - Creating locations (requires both FS + DB)
+    - Creating locations and enriching draft locations (requires both FS + DB)
     - Exporting database state to filesystem (for backup/portability)
 
     Runtime state changes (stats, inventory, travel) should use crud.game.* directly.
@@ -126,6 +126,58 @@ class PersistenceManager:
 
         return db_location.id
 
+    async def enrich_location(
+        self,
+        location_id: int,
+        name: str,
+        display_name: str,
+        description: str,
+        position: tuple[int, int],
+        adjacent_hints: Optional[list[str]] = None,
+    ) -> int:
+        """
+        Replace a draft location's design in both filesystem and database.
+
+        The location keeps its room, events and connections; only its design
+        is replaced and the draft flag cleared.
+
+        Args:
+            location_id: Database ID of the draft location
+            name: Internal location name (used as key/path)
+            display_name: Human-readable display name
+            description: Location description
+            position: (x, y) position on the map
+            adjacent_hints: Additional adjacent location names (filesystem)
+
+        Returns:
+            Database ID of the enriched location
+        """
+        # 1. Update filesystem (source of truth)
+        LocationStorage.enrich_location(
+            self.world_name,
+            name,
+            display_name,
+            description,
+            position,
+            adjacent=adjacent_hints,
+        )
+
+        # 2. Update database
+        await crud.update_location(
+            self.db,
+            location_id,
+            schemas.LocationUpdate(
+                display_name=display_name,
+                description=description,
+                position_x=position[0],
+                position_y=position[1],
+                is_draft=False,
+            ),
+        )
+        logger.info(f"Enriched draft location '{name}' (id={location_id})")
+
+        return location_id
+
     async def sync_player_state_from_filesystem(self) -> None:
         """
         Sync player state from filesystem to database.
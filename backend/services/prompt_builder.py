@@ -3,16 +3,147 @@ Prompt builder service for constructing agent system prompts.
 
 This module provides centralized prompt building logic to avoid duplication
 across CRUD operations.
+
+Rendered templates (the platform guideline) are memoized in a bounded LRU by
+agent name and checked against the template they were rendered from, so an
+unchanged template returns the identical string every turn. Plain
+concatenation, such as the Action Manager's lore and history section, is not
+memoized: hashing a multi-KB prompt costs more than joining it, and the join
+is byte-stable anyway. Keeping the prefix byte-stable is what lets the
+upstream prompt cache hit; ``record_prompt_prefix`` tracks that per agent and
+room for the perf log.
 """
 
+import hashlib
 import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable
 
 from domain.entities.agent_config import AgentConfigData
-from i18n.korean import format_with_particles
+from i18n.korean import compile_template, render_template
 from sdk.loaders import get_base_system_prompt
 
 logger = logging.getLogger(__name__)
 
+# Max memoized template renders (one per agent and template kind)
+PROMPT_CACHE_MAX_SIZE = int(os.environ.get("PROMPT_CACHE_SIZE", "256"))
+
+# Max (room, agent) pairs remembered for prefix-stability tracking
+PREFIX_TRACKING_MAX_SIZE = 1024
+
+_lock = threading.Lock()
+# Rendered templates by (kind, name), with the template they were rendered from
+_render_cache: OrderedDict[tuple[str, str], tuple[str, str]] = OrderedDict()
+_last_prefix: OrderedDict[tuple, str] = OrderedDict()
+_stats = {
+    "hits": 0,
+    "misses": 0,
+    "evictions": 0,
+    "prefix_stable": 0,
+    "prefix_changed": 0,
+}
+
+
+def content_hash(*parts: str | None) -> str:
+    """Stable hash of prompt inputs (None and "" hash differently)."""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(b"\x01" if part is None else b"\x00" + part.encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def memoize_render(kind: str, name: str, template: str, build: Callable[[], str]) -> str:
+    """
+    Return the cached render of ``template`` for ``name``, rendering it on a miss.
+
+    Keyed by name rather than content: the template is only compared, which
+    is an identity check while the loader returns the same string.
+
+    Args:
+        kind: Template type, part of the key
+        name: What the template is rendered for (e.g. the agent name)
+        template: Template source; a different template invalidates the entry
+        build: Renders the template
+
+    Returns:
+        The memoized render (the same string object while the template is unchanged)
+    """
+    key = (kind, name)
+    with _lock:
+        cached = _render_cache.get(key)
+        if cached is not None and (cached[0] is template or cached[0] == template):
+            _render_cache.move_to_end(key)
+            _stats["hits"] += 1
+            return cached[1]
+        _stats["misses"] += 1
+
+    value = build()
+
+    with _lock:
+        _render_cache[key] = (template, value)
+        _render_cache.move_to_end(key)
+        while len(_render_cache) > PROMPT_CACHE_MAX_SIZE:
+            _render_cache.popitem(last=False)
+            _stats["evictions"] += 1
+    return value
+
+
+def record_prompt_prefix(room_id: int | None, agent_name: str, prefix: str) -> tuple[str, bool]:
+    """
+    Remember the static prefix sent for an agent in a room.
+
+    Args:
+        room_id: Room the prompt is for
+        agent_name: Agent the prompt is for
+        prefix: Static part of the system prompt
+
+    Returns:
+        Tuple of (short prefix hash, whether it matches the previous turn's prefix)
+    """
+    prefix_hash = content_hash(prefix)[:12]
+    key = (room_id, agent_name)
+    with _lock:
+        stable = _last_prefix.get(key) == prefix_hash
+        _last_prefix[key] = prefix_hash
+        _last_prefix.move_to_end(key)
+        while len(_last_prefix) > PREFIX_TRACKING_MAX_SIZE:
+            _last_prefix.popitem(last=False)
+        _stats["prefix_stable" if stable else "prefix_changed"] += 1
+    return prefix_hash, stable
+
+
+def get_prompt_cache_stats() -> dict:
+    """Get template render cache and prefix stability statistics."""
+    with _lock:
+        stats = dict(_stats)
+        stats["size"] = len(_render_cache)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups * 100, 2) if lookups else 0.0
+    turns = stats["prefix_stable"] + stats["prefix_changed"]
+    stats["prefix_stable_rate"] = round(stats["prefix_stable"] / turns * 100, 2) if turns else 0.0
+    return stats
+
+
+def clear_prompt_cache() -> None:
+    """Drop all memoized prompt sections and prefix history."""
+    with _lock:
+        _render_cache.clear()
+        _last_prefix.clear()
+
+
+def _render_base_prompt(agent_name: str) -> str:
+    """Render the base system prompt (selected by agent type) with Korean particle formatting."""
+    template = get_base_system_prompt(agent_name)
+    return memoize_render(
+        "base",
+        agent_name,
+        template,
+        lambda: render_template(compile_template(template, ("agent_name",)), agent_name=agent_name),
+    )
+
 
 def build_system_prompt(agent_name: str, config_data: AgentConfigData) -> str:
     """
@@ -34,14 +165,14 @@ def build_system_prompt(agent_name: str, config_data: AgentConfigData) -> str:
         Complete system prompt string with markdown formatting
     """
     # Start with base system prompt (selected by agent type) and apply Korean particle formatting
-    system_prompt = format_with_particles(get_base_system_prompt(agent_name), agent_name=agent_name)
+    base_prompt = _render_base_prompt(agent_name)
 
     # Append character configuration with markdown headings
     config_markdown = config_data.to_system_prompt_markdown(agent_name)
-    if config_markdown:
-        system_prompt += config_markdown
+    if not config_markdown:
+        return base_prompt
 
-    return system_prompt
+    return base_prompt + config_markdown
 
 
 def build_runtime_system_prompt(
@@ -74,14 +205,16 @@ def build_runtime_system_prompt(
         Complete system prompt with lore injected in the middle
     """
     # Start with base system prompt (selected by agent type) and apply Korean particle formatting
-    system_prompt = format_with_particles(get_base_system_prompt(agent_name), agent_name=agent_name)
+    base_prompt = _render_base_prompt(agent_name)
+    config_markdown = config_data.to_system_prompt_markdown(agent_name)
+
+    system_prompt = base_prompt
 
     # Inject lore between platform guideline and character config
     if lore:
         system_prompt += f"\n\n# World Lore\n\n{lore.strip()}"
 
     # Append character configuration with markdown headings
-    config_markdown = config_data.to_system_prompt_markdown(agent_name)
     if config_markdown:
         system_prompt += config_markdown
 
@@ -0,0 +1,324 @@
+"""
+World-scoped memo cache for designer sub-agent (Task) results.
+
+The Action Manager often invokes item_designer / location_designer /
+character_designer for something the world already has: re-describing an
+item that has a template, or "creating" a location it is about to revisit.
+Each of those is a full sub-agent run. The PreToolUse hook for Task looks the
+request up here first; on a hit the Task is denied with the equivalent result
+as the reason (which the model receives as the tool result), so the sub-agent
+never starts.
+
+Hits come from two sources:
+
+    existing  The prompt's design target already exists: an item id or name
+              with an items/*.yaml template, an enriched (non-draft)
+              location, or a character with an agent directory. The target
+              is the name quoted after "Create location/item/character"
+              (else the first quoted name); other quoted names, such as an
+              adjacent location, are context. Prompts asking for a "new" or
+              "another" one never hit.
+    memo      The same normalized prompt already finished in this world and
+              the world's version for that designer's kind hasn't changed
+              since. Versions are bumped by the persist tools, and a world
+              reset drops the world's entries.
+
+Character prompts are never memoized: asking twice for "a city guard" can
+legitimately mean two guards. Background Tasks aren't memoized either, since
+their tool result is only the launch acknowledgement.
+
+Enable/disable with SUBAGENT_CACHE_ENABLED; memo entries expire after
+SUBAGENT_CACHE_TTL seconds.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from core import get_settings
+from domain.entities.agent import is_character_designer, is_item_designer, is_location_designer
+
+from .item_service import ItemService
+from .location_storage import LocationStorage
+from .world_service import WorldService
+
+logger = logging.getLogger(__name__)
+
+# Max memoized results across all worlds (least recently used dropped first)
+SUBAGENT_CACHE_MAX_SIZE = 512
+
+# Quoted names: "x", “x”, `x` (single quotes are too often apostrophes)
+_QUOTED_RE = re.compile(r'["“`]([^"”`\n]{2,80})["”`]')
+# Quoted name after a create verb: Create location "x", Design the “x”
+_CREATE_TARGET_RE = re.compile(
+    r"\b(?:create|design|make|generate)\s+(?:(?:a|an|the)\s+)?(?:(?:location|item|character|npc)\s+)?"
+    r'["“`]([^"”`\n]{2,80})["”`]',
+    re.IGNORECASE,
+)
+_NEW_RE = re.compile(r"\b(?:new|another)\s+(?:location|item|character|npc)\b", re.IGNORECASE)
+_PUNCT_RE = re.compile(r"[^\w\s\"'“”`]+")
+_SPACE_RE = re.compile(r"\s+")
+
+ITEMS = "items"
+LOCATIONS = "locations"
+CHARACTERS = "characters"
+
+
+@dataclass
+class SubagentCacheHit:
+    """A cached equivalent of a sub-agent Task result."""
+
+    subagent_type: str
+    source: str  # "existing" or "memo"
+    result: str
+
+
+@dataclass
+class _Entry:
+    result: str
+    version: int
+    stored_at: float
+
+
+def designer_kind(subagent_type: str) -> Optional[str]:
+    """World state kind a designer sub-agent writes (None for other sub-agents)."""
+    if is_item_designer(subagent_type):
+        return ITEMS
+    if is_location_designer(subagent_type):
+        return LOCATIONS
+    if is_character_designer(subagent_type):
+        return CHARACTERS
+    return None
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Lowercase, drop punctuation (quotes kept) and collapse whitespace."""
+    return _SPACE_RE.sub(" ", _PUNCT_RE.sub(" ", prompt.lower())).strip()
+
+
+def quoted_names(prompt: str) -> list[str]:
+    """Names quoted in a Task prompt, e.g. Create location "smugglers_cove"."""
+    return [name.strip() for name in _QUOTED_RE.findall(prompt) if name.strip()]
+
+
+def design_target(prompt: str) -> Optional[str]:
+    """
+    Name a designer Task is asked to design, or None if it asks for something new.
+
+    The name quoted after a create verb wins; otherwise the first quoted name.
+    """
+    if _NEW_RE.search(prompt):
+        return None
+    match = _CREATE_TARGET_RE.search(prompt)
+    if match and match.group(1).strip():
+        return match.group(1).strip()
+    names = quoted_names(prompt)
+    return names[0] if names else None
+
+
+def _slug(name: str) -> str:
+    return _SPACE_RE.sub("_", name.strip().lower())
+
+
+def tool_response_text(response: Any) -> str:
+    """Text of a Task tool response (string, content blocks or a dict with content)."""
+    if isinstance(response, str):
+        return response
+    if isinstance(response, dict):
+        response = response.get("content", response.get("result", ""))
+        if isinstance(response, str):
+            return response
+    if isinstance(response, list):
+        return "\n".join(
+            block.get("text", "") for block in response if isinstance(block, dict) and block.get("type") == "text"
+        )
+    return ""
+
+
+def _find_existing_item(world_name: str, name: str) -> Optional[str]:
+    templates = ItemService.load_all_item_templates(world_name)
+    if not templates:
+        return None
+    by_name = {str(t.get("name", "")).strip().lower(): item_id for item_id, t in templates.items()}
+    item_id = _slug(name) if _slug(name) in templates else by_name.get(name.lower())
+    if not item_id:
+        return None
+    template = templates[item_id]
+    return (
+        f"Item template '{item_id}' ({template.get('name', item_id)}) already exists in this world, "
+        f"so item_designer was not run. Use item_id '{item_id}' directly."
+    )
+
+
+def _find_existing_location(world_name: str, name: str) -> Optional[str]:
+    locations = LocationStorage.load_all_locations(world_name)
+    if not locations:
+        return None
+    by_display = {(loc.display_name or "").strip().lower(): key for key, loc in locations.items()}
+    key = _slug(name) if _slug(name) in locations else by_display.get(name.lower())
+    location = locations.get(key) if key else None
+    if location is None or location.is_draft:
+        return None
+    return (
+        f"Location '{key}' ({location.display_name}) already exists and is fully designed, "
+        f"so location_designer was not run. Travel there directly.\n\n{location.description[:500]}"
+    )
+
+
+def _find_existing_character(world_name: str, name: str) -> Optional[str]:
+    agent_name = name.strip().replace(" ", "_")
+    if not agent_name or not (WorldService.get_world_path(world_name) / "agents" / agent_name).is_dir():
+        return None
+    return (
+        f"Character '{name}' already exists in this world, so character_designer was not run. "
+        f"Use move_character to bring them into the scene."
+    )
+
+
+class SubagentResultCache:
+    """Memoizes designer sub-agent results per world and reports hit rates."""
+
+    def __init__(self, enabled: bool = True, ttl_seconds: float = 1800.0, max_size: int = SUBAGENT_CACHE_MAX_SIZE):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._entries: OrderedDict[Tuple[str, str, str], _Entry] = OrderedDict()
+        self._versions: Dict[Tuple[str, str], int] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, subagent_type: str, key: str) -> None:
+        stats = self._stats.setdefault(
+            subagent_type, {"lookups": 0, "hits_existing": 0, "hits_memo": 0, "misses": 0, "stored": 0}
+        )
+        stats[key] += 1
+
+    def version(self, world_name: str, kind: str) -> int:
+        """Current version of a world's items, locations or characters."""
+        with self._lock:
+            return self._versions.get((world_name, kind), 0)
+
+    def bump(self, world_name: str, kind: str) -> None:
+        """Mark a world's items/locations/characters as changed (called by persist tools)."""
+        with self._lock:
+            self._versions[(world_name, kind)] = self._versions.get((world_name, kind), 0) + 1
+
+    def lookup(self, world_name: str, subagent_type: str, prompt: str) -> Optional[SubagentCacheHit]:
+        """
+        Find a fresh equivalent result for a designer Task.
+
+        Returns None on a miss, when disabled, or for non-designer sub-agents.
+        """
+        kind = designer_kind(subagent_type)
+        if not self.enabled or kind is None or not world_name:
+            return None
+
+        with self._lock:
+            self._count(subagent_type, "lookups")
+
+        target = design_target(prompt)
+        existing = None
+        if target:
+            try:
+                if kind == ITEMS:
+                    existing = _find_existing_item(world_name, target)
+                elif kind == LOCATIONS:
+                    existing = _find_existing_location(world_name, target)
+                else:
+                    existing = _find_existing_character(world_name, target)
+            except Exception as e:
+                logger.warning(f"Sub-agent cache lookup failed for {subagent_type}: {e}")
+
+        with self._lock:
+            if existing is not None:
+                self._count(subagent_type, "hits_existing")
+                return SubagentCacheHit(subagent_type=subagent_type, source="existing", result=existing)
+
+            key = (world_name, kind, hashlib.sha1(normalize_prompt(prompt).encode("utf-8")).hexdigest())
+            entry = self._entries.get(key)
+            if entry is not None:
+                fresh = (
+                    entry.version == self._versions.get((world_name, kind), 0)
+                    and time.monotonic() - entry.stored_at < self.ttl_seconds
+                )
+                if fresh:
+                    self._entries.move_to_end(key)
+                    self._count(subagent_type, "hits_memo")
+                    return SubagentCacheHit(
+                        subagent_type=subagent_type,
+                        source="memo",
+                        result=(
+                            f"An equivalent {subagent_type} request already completed in this world and "
+                            f"nothing it depends on has changed, so it was not run again. Its result:\n\n"
+                            f"{entry.result}"
+                        ),
+                    )
+                del self._entries[key]
+
+            self._count(subagent_type, "misses")
+            return None
+
+    def store(self, world_name: str, subagent_type: str, prompt: str, result: str) -> None:
+        """Remember a completed designer Task's result at the world's current version."""
+        kind = designer_kind(subagent_type)
+        if not self.enabled or kind in (None, CHARACTERS) or not world_name or not result:
+            return
+
+        key = (world_name, kind, hashlib.sha1(normalize_prompt(prompt).encode("utf-8")).hexdigest())
+        with self._lock:
+            version = self._versions.get((world_name, kind), 0)
+            self._entries[key] = _Entry(result=result, version=version, stored_at=time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+            self._count(subagent_type, "stored")
+
+    def clear_world(self, world_name: str) -> None:
+        """Drop a world's memoized results and versions (e.g., on world reset)."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == world_name]:
+                del self._entries[key]
+            for key in [k for k in self._versions if k[0] == world_name]:
+                del self._versions[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Lookup/hit/miss counters and hit rates, overall and per sub-agent type."""
+        with self._lock:
+            per_type = {name: dict(stats) for name, stats in self._stats.items()}
+            size = len(self._entries)
+
+        for stats in per_type.values():
+            hits = stats["hits_existing"] + stats["hits_memo"]
+            stats["hit_rate"] = round(hits / stats["lookups"] * 100, 2) if stats["lookups"] else 0.0
+
+        lookups = sum(s["lookups"] for s in per_type.values())
+        hits = sum(s["hits_existing"] + s["hits_memo"] for s in per_type.values())
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl_seconds,
+            "size": size,
+            "lookups": lookups,
+            "hits": hits,
+            "hit_rate": round(hits / lookups * 100, 2) if lookups else 0.0,
+            "subagents": per_type,
+        }
+
+
+# Singleton instance
+_subagent_cache: Optional[SubagentResultCache] = None
+
+
+def get_subagent_cache() -> SubagentResultCache:
+    """Get the singleton sub-agent result cache, configured from settings."""
+    global _subagent_cache
+    if _subagent_cache is None:
+        settings = get_settings()
+        _subagent_cache = SubagentResultCache(
+            enabled=settings.subagent_cache_enabled, ttl_seconds=settings.subagent_cache_ttl
+        )
+    return _subagent_cache
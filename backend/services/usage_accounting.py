@@ -0,0 +1,150 @@
+"""
+Token usage accounting per response, turn, agent and world.
+
+``generate_sdk_response`` reports the usage of every completed SDK query
+(from the CLI's ResultMessage) to ``UsageRecorder.record``. Rows are buffered
+and written to the ``token_usage`` table in one batch shortly afterwards, so
+recording never adds a database commit to the response path.
+
+The player turn a response belongs to comes from ``usage_turn``, a context
+variable the orchestrator sets around each turn; tasks started inside the turn
+(cells, reactions, background jobs it spawns) inherit it.
+
+Rollups (last N turns, daily per agent/world) are computed from the table by
+``crud.get_turn_usage`` and ``crud.get_daily_usage``; every rollup includes the
+prompt-cache hit ratio (cache-read tokens over all prompt tokens).
+"""
+
+import asyncio
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from infrastructure.background import spawn_background
+
+logger = logging.getLogger("UsageAccounting")
+
+# Seconds between a first buffered row and its batch write
+FLUSH_DELAY = 2.0
+
+# Buffered rows that trigger an immediate write
+MAX_BUFFERED = 50
+
+_usage_turn: ContextVar[Optional[int]] = ContextVar("usage_turn", default=None)
+
+
+@contextmanager
+def usage_turn(turn: Optional[int]) -> Iterator[None]:
+    """Attribute responses generated in this context to a player turn."""
+    token = _usage_turn.set(turn)
+    try:
+        yield
+    finally:
+        _usage_turn.reset(token)
+
+
+class UsageRecorder:
+    """Buffers per-response token usage and writes it in batches."""
+
+    def __init__(self, enabled: bool = True, flush_delay: float = FLUSH_DELAY, max_buffered: int = MAX_BUFFERED):
+        self.enabled = enabled
+        self.flush_delay = flush_delay
+        self.max_buffered = max_buffered
+        self._buffer: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._counters = {"recorded": 0, "written": 0, "failed": 0, "batches": 0}
+
+    def record(
+        self,
+        usage: Dict[str, Any],
+        *,
+        agent_name: str,
+        room_id: Optional[int],
+        agent_id: Optional[int],
+        world_id: Optional[int],
+        latency_ms: float,
+        cost_usd: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Buffer one response's usage (the ResultMessage ``usage`` dict).
+
+        Returns:
+            The buffered row, or None if accounting is disabled
+        """
+        if not self.enabled:
+            return None
+        row = {
+            "created_at": datetime.now(timezone.utc),
+            "world_id": world_id,
+            "room_id": room_id,
+            "agent_id": agent_id,
+            "agent_name": agent_name,
+            "turn": _usage_turn.get(),
+            "input_tokens": int(usage.get("input_tokens") or 0),
+            "output_tokens": int(usage.get("output_tokens") or 0),
+            "cache_read_tokens": int(usage.get("cache_read_input_tokens") or 0),
+            "cache_creation_tokens": int(usage.get("cache_creation_input_tokens") or 0),
+            "latency_ms": int(latency_ms),
+            "cost_usd": cost_usd,
+        }
+        self._buffer.append(row)
+        self._counters["recorded"] += 1
+        if len(self._buffer) >= self.max_buffered:
+            self._schedule_flush(0.0)
+        else:
+            self._schedule_flush(self.flush_delay)
+        return row
+
+    def _schedule_flush(self, delay: float) -> None:
+        pending = self._flush_task is not None and not self._flush_task.done()
+        if pending and delay > 0:
+            return  # The pending flush picks this row up
+        task = spawn_background(self._delayed_flush(delay), name="flush_token_usage")
+        if not pending:
+            self._flush_task = task
+
+    async def _delayed_flush(self, delay: float) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Write buffered rows now. Returns the number of rows written."""
+        async with self._lock:
+            rows, self._buffer = self._buffer, []
+            if not rows:
+                return 0
+            import crud
+            from infrastructure.database.connection import background_session
+
+            try:
+                async with background_session() as db:
+                    written = await crud.record_token_usage(db, rows)
+            except Exception as e:
+                self._counters["failed"] += len(rows)
+                logger.warning(f"Failed to write {len(rows)} token usage rows: {e}")
+                return 0
+            self._counters["written"] += written
+            self._counters["batches"] += 1
+            return written
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Recorder counters and the number of rows waiting to be written."""
+        return {"enabled": self.enabled, "buffered": len(self._buffer), **self._counters}
+
+
+# Global singleton
+_usage_recorder: Optional[UsageRecorder] = None
+
+
+def get_usage_recorder() -> UsageRecorder:
+    """Get or create the global usage recorder, configured from settings."""
+    global _usage_recorder
+    if _usage_recorder is None:
+        from core import get_settings
+
+        _usage_recorder = UsageRecorder(enabled=get_settings().usage_accounting_enabled)
+    return _usage_recorder
@@ -59,6 +59,7 @@ DB_FIXTURE_FILES = {
 # Files that use Claude Agent SDK (may spawn subprocesses, very memory intensive)
 SDK_FIXTURE_FILES = {
     "test_client_pool.py",
+    "test_mcp_registry.py",
     "test_sdk_manager.py",
     "test_sdk_tools.py",
     "test_stream_parser.py",
@@ -172,6 +173,11 @@ async def test_db(test_engine, test_session_factory) -> "AsyncGenerator[AsyncSes
         # Rollback the transaction (cleanup all test data)
         await conn.rollback()
 
+    # Room counters seeded from rolled-back data would leak into the next test
+    from infrastructure.room_state import get_room_state
+
+    get_room_state().clear()
+
 
 # ============================================================================
 # App/Client fixtures (only loaded when needed)
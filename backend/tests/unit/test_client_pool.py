@@ -445,3 +445,125 @@ async def test_keys_method_returns_pool_keys(client_pool, mock_options):
         assert task1 in keys
         assert task2 in keys
         assert len(list(keys)) == 2
+
+
+@pytest.fixture
+def pool_metrics(monkeypatch):
+    """Fresh pool metrics for counting reconnects."""
+    from sdk.client import client_pool as client_pool_module
+
+    metrics = client_pool_module.PoolMetrics()
+    monkeypatch.setattr(client_pool_module, "_pool_metrics", metrics)
+    return metrics
+
+
+def _options(resume=None):
+    options = Mock()
+    options.resume = resume
+    return options
+
+
+@pytest.mark.asyncio
+async def test_earlier_session_in_lineage_reuses_client(client_pool, pool_metrics):
+    """A request resuming a session the pooled client already continues is not a reconnect."""
+    task_id = TaskIdentifier(room_id=1, agent_id=2)
+
+    with patch("sdk.client.client_pool.ClaudeSDKClient", side_effect=lambda **_: AsyncMock()):
+        pooled, _, _ = await client_pool.get_or_create(task_id, _options("sess_1"), config_hash="cfg")
+        pooled.adopt_session("sess_2")  # e.g. a summarizer query that isn't persisted
+        pooled.adopt_session("sess_3")
+
+        reused, is_new, _ = await client_pool.get_or_create(task_id, _options("sess_2"), config_hash="cfg")
+
+    assert is_new is False and reused is pooled
+    assert pooled.session_id == "sess_3"
+    assert pool_metrics.session_affinity_reuses == 1
+    assert pool_metrics.get_reconnect_stats()["session"] == 0
+
+
+@pytest.mark.asyncio
+async def test_reconnect_causes_are_counted_separately(client_pool, pool_metrics):
+    """Session resets, config changes and evictions each count under their own cause."""
+    task_id = TaskIdentifier(room_id=1, agent_id=2)
+
+    with (
+        patch("sdk.client.client_pool.ClaudeSDKClient", side_effect=lambda **_: AsyncMock()),
+        patch("sdk.client.client_pool.asyncio.sleep", new=AsyncMock()),
+    ):
+        pooled, _, _ = await client_pool.get_or_create(task_id, _options(), config_hash="cfg")
+        pooled.adopt_session("sess_1")
+
+        # Unknown session
+        _, is_new, _ = await client_pool.get_or_create(task_id, _options("sess_other"), config_hash="cfg")
+        assert is_new is True
+        # Deliberate fresh start while the pooled client has a session
+        client_pool.pool[task_id].adopt_session("sess_2")
+        _, is_new, _ = await client_pool.get_or_create(task_id, _options(), config_hash="cfg")
+        assert is_new is True
+        # Config change
+        _, is_new, _ = await client_pool.get_or_create(task_id, _options(), config_hash="cfg2")
+        assert is_new is True
+        # Eviction
+        await client_pool.cleanup(task_id)
+        _, is_new, _ = await client_pool.get_or_create(task_id, _options(), config_hash="cfg2")
+        assert is_new is True
+        await asyncio.gather(*client_pool._cleanup_tasks, return_exceptions=True)
+
+    assert pool_metrics.get_reconnect_stats() == {
+        "session": 2,
+        "config": 1,
+        "eviction": 1,
+        "session_affinity_reuses": 0,
+        "avoided": 0,
+    }
+
+
+def test_session_lineage_is_bounded(monkeypatch):
+    """Only the most recent sessions are remembered."""
+    monkeypatch.setattr("sdk.client.client_pool.SESSION_LINEAGE_MAX", 3)
+    pooled = PooledClient(client=Mock(), config_hash="cfg", session_id="sess_0")
+
+    for i in range(1, 5):
+        pooled.adopt_session(f"sess_{i}")
+
+    assert list(pooled.lineage) == ["sess_2", "sess_3", "sess_4"]
+    assert not pooled.continues("sess_0") and pooled.continues("sess_2")
+    assert not pooled.continues(None)
+
+
+def test_cost_delta_turns_running_total_into_per_response_cost():
+    """ResultMessage.total_cost_usd accumulates over the CLI process; each response costs the difference."""
+    pooled = PooledClient(client=Mock(), config_hash="cfg")
+
+    assert pooled.cost_delta(0.02) == pytest.approx(0.02)
+    assert pooled.cost_delta(0.05) == pytest.approx(0.03)
+    assert pooled.cost_delta(None) is None
+    assert pooled.cost_delta(0.01) == pytest.approx(0.01)
+
+
+@pytest.mark.asyncio
+async def test_queued_warmup_is_promoted_by_a_turn_for_the_same_task(client_pool, monkeypatch):
+    """A turn waiting on the task lock behind a queued warm-up lifts it out of the shed budget."""
+    from sdk.client import connection_admission
+    from sdk.client.connection_admission import ConnectionAdmission, ConnectionPriority
+
+    monkeypatch.setitem(connection_admission.WAIT_BUDGETS_S, ConnectionPriority.WARMUP, 0.05)
+    client_pool.admission = ConnectionAdmission(max_limit=1, memory_reader=lambda: None)
+    await client_pool.admission.acquire(ConnectionPriority.REACTION)  # Another task is connecting
+    task_id = TaskIdentifier(room_id=1, agent_id=2)
+
+    with patch("sdk.client.client_pool.ClaudeSDKClient", side_effect=lambda **_: AsyncMock()):
+        warmup = asyncio.create_task(client_pool.get_or_create(task_id, _options(), priority=ConnectionPriority.WARMUP))
+        await asyncio.sleep(0)
+        turn = asyncio.create_task(
+            client_pool.get_or_create(task_id, _options(), priority=ConnectionPriority.ACTION_MANAGER)
+        )
+        await asyncio.sleep(0.1)
+        assert not warmup.done()
+
+        client_pool.admission.release()
+        (warmed, is_new, _), (reused, reused_is_new, _) = await asyncio.gather(warmup, turn)
+
+    assert (is_new, reused_is_new) == (True, False)
+    assert reused is warmed
+    assert client_pool.admission.get_stats()["classes"]["warmup"]["shed"] == 0
@@ -5,10 +5,12 @@ Tests YAML configuration loading, caching, and hot-reloading.
 """
 
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import PropertyMock, patch
 
 import pytest
+import yaml
 from core.settings import Settings, reset_settings
 from sdk.loaders import (
     _config_cache,
@@ -152,6 +154,33 @@ class TestCachedConfig:
         finally:
             tmp_path.unlink()
 
+    @pytest.mark.unit
+    def test_failed_load_is_not_cached(self, tmp_path):
+        """Test that a file that fails to parse is retried on the next call."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("test: [unclosed\n")
+
+        assert _get_cached_config(config_path) == {}
+        assert str(config_path) not in _config_cache
+
+        config_path.write_text("test: value\n")
+        assert _get_cached_config(config_path) == {"test": "value"}
+
+    @pytest.mark.unit
+    def test_concurrent_loads_from_threads(self, tmp_path):
+        """Test that worker threads parsing at once each get the full config."""
+        expected = {f"section_{i}": {"text": f"line {i}\n" * 20, "items": list(range(10))} for i in range(50)}
+        paths = []
+        for i in range(8):
+            path = tmp_path / f"config_{i}.yaml"
+            path.write_text(yaml.safe_dump(expected))
+            paths.append(path)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda path: _get_cached_config(path, force_reload=True), paths * 5))
+
+        assert all(result == expected for result in results)
+
 
 class TestGetDebugConfig:
     """Tests for get_debug_config function."""
@@ -10,7 +10,13 @@ from pathlib import Path
 
 import pytest
 from domain.entities.agent_config import AgentConfigData
-from sdk.parsing.agent_parser import _parse_folder_config, parse_agent_config
+from sdk.parsing.agent_parser import (
+    _parse_folder_config,
+    get_agent_config_cache_stats,
+    invalidate_agent_config_cache,
+    parse_agent_config,
+)
+from sdk.parsing.memory_parser import parse_long_term_memory_text
 
 
 class TestAgentConfigData:
@@ -310,3 +316,79 @@ Content of memory 2
         assert config.long_term_memory_subtitles is not None
         assert "'Memory 1'" in config.long_term_memory_subtitles
         assert "'Memory 2'" in config.long_term_memory_subtitles
+
+
+class TestParsedConfigCache:
+    """Tests for the per-folder parsed-config cache."""
+
+    @pytest.fixture
+    def agent_dir(self, tmp_path):
+        agent_dir = tmp_path / "agents" / "cached_agent"
+        agent_dir.mkdir(parents=True)
+        (agent_dir / "in_a_nutshell.md").write_text("Brief")
+        (agent_dir / "characteristics.md").write_text("Calm")
+        (agent_dir / "recent_events.md").write_text("- first")
+        (agent_dir / "consolidated_memory.md").write_text("## [Old]\nold memory\n")
+        yield agent_dir
+        invalidate_agent_config_cache()
+
+    @pytest.mark.unit
+    def test_unchanged_folder_is_not_reread(self, agent_dir):
+        """Second parse of an unchanged folder reads no files."""
+        parse_agent_config(str(agent_dir))
+        reads_before = get_agent_config_cache_stats()["file_reads"]
+
+        config = parse_agent_config(str(agent_dir))
+
+        assert config.in_a_nutshell == "Brief"
+        assert get_agent_config_cache_stats()["file_reads"] == reads_before
+
+    @pytest.mark.unit
+    def test_only_changed_file_is_reread(self, agent_dir):
+        """Appending to recent_events re-reads that file alone."""
+        parse_agent_config(str(agent_dir))
+        reads_before = get_agent_config_cache_stats()["file_reads"]
+
+        (agent_dir / "recent_events.md").write_text("- first\n- second")
+        config = parse_agent_config(str(agent_dir))
+
+        assert config.recent_events == "- first\n- second"
+        assert get_agent_config_cache_stats()["file_reads"] == reads_before + 1
+
+    @pytest.mark.unit
+    def test_returned_memory_index_is_a_copy(self, agent_dir):
+        """Mutating a returned config must not corrupt the cache."""
+        first = parse_agent_config(str(agent_dir))
+        first.long_term_memory_index["Injected"] = "x"
+
+        second = parse_agent_config(str(agent_dir))
+
+        assert second.long_term_memory_index == {"Old": "old memory"}
+
+    @pytest.mark.unit
+    def test_invalidate_forces_reparse(self, agent_dir):
+        parse_agent_config(str(agent_dir))
+
+        assert invalidate_agent_config_cache(str(agent_dir)) == 1
+        reads_before = get_agent_config_cache_stats()["file_reads"]
+        parse_agent_config(str(agent_dir))
+
+        assert get_agent_config_cache_stats()["file_reads"] > reads_before
+
+
+class TestParseLongTermMemoryText:
+    """Tests for single-pass memory parsing."""
+
+    @pytest.mark.unit
+    def test_header_trailing_text_and_body_lines(self):
+        content = "preamble\n## [A] ignored tail\nline 1\nline 2\n\n##[B]\nbody b\n## not a header\n"
+
+        assert parse_long_term_memory_text(content) == {
+            "A": "line 1\nline 2",
+            "B": "body b\n## not a header",
+        }
+
+    @pytest.mark.unit
+    def test_empty_body_and_no_headers(self):
+        assert parse_long_term_memory_text("## [Only]") == {"Only": ""}
+        assert parse_long_term_memory_text("no headers here") == {}
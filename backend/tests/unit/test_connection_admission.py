@@ -0,0 +1,163 @@
+"""
+Unit tests for priority admission of new SDK client connections.
+"""
+
+import asyncio
+
+import pytest
+from sdk.client import connection_admission
+from sdk.client.connection_admission import (
+    ConnectionAdmission,
+    ConnectionPriority,
+    ConnectionShedError,
+    connection_priority,
+    resolve_priority,
+)
+
+AM = ConnectionPriority.ACTION_MANAGER
+REACTION = ConnectionPriority.REACTION
+WARMUP = ConnectionPriority.WARMUP
+BACKGROUND = ConnectionPriority.BACKGROUND
+
+
+def _admission(max_limit: int = 4, available_mb=None) -> ConnectionAdmission:
+    return ConnectionAdmission(max_limit=max_limit, memory_reader=lambda: available_mb)
+
+
+async def _fill(admission: ConnectionAdmission, slots: int) -> None:
+    for _ in range(slots):
+        await admission.acquire(AM)
+
+
+class TestConnectionPriority:
+    """Tests for resolving a connection's priority class."""
+
+    @pytest.mark.unit
+    def test_context_priority_wins_over_agent_name(self):
+        assert resolve_priority("Action_Manager") == AM
+        assert resolve_priority("Narrator") == REACTION
+        with connection_priority(BACKGROUND):
+            assert resolve_priority("Action_Manager") == BACKGROUND
+        assert resolve_priority() == REACTION
+
+
+class TestAdmissionQueue:
+    """Tests for ordering, deferring and shedding waiters."""
+
+    @pytest.mark.unit
+    async def test_free_slot_goes_to_most_urgent_waiter(self):
+        admission = _admission(max_limit=2)
+        await _fill(admission, 2)
+        order = []
+
+        async def wait(priority, name):
+            await admission.acquire(priority)
+            order.append(name)
+
+        tasks = [
+            asyncio.create_task(wait(REACTION, "reaction")),
+            asyncio.create_task(wait(AM, "action_manager")),
+        ]
+        await asyncio.sleep(0)
+        admission.release()
+        admission.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["action_manager", "reaction"]
+        assert admission.get_stats()["classes"]["reaction"]["admitted"] == 1
+
+    @pytest.mark.unit
+    async def test_background_is_deferred_while_slots_are_reserved(self):
+        admission = _admission(max_limit=4)
+        await _fill(admission, 2)
+
+        # Two free slots are reserved for more urgent classes
+        background = asyncio.create_task(admission.acquire(BACKGROUND))
+        await asyncio.sleep(0)
+        assert not background.done()
+        await admission.acquire(REACTION)
+
+        admission.release()
+        admission.release()
+        await asyncio.wait_for(background, timeout=1.0)
+        assert admission.in_use == 2
+
+    @pytest.mark.unit
+    async def test_waiter_is_shed_when_its_budget_runs_out(self, monkeypatch):
+        monkeypatch.setitem(connection_admission.WAIT_BUDGETS_S, WARMUP, 0.05)
+        admission = _admission(max_limit=2)
+        await _fill(admission, 2)
+
+        with pytest.raises(ConnectionShedError) as exc_info:
+            await admission.acquire(WARMUP)
+
+        assert exc_info.value.reason == "wait_budget"
+        stats = admission.get_stats()
+        assert stats["classes"]["warmup"]["shed"] == 1
+        assert stats["classes"]["warmup"]["queued"] == 0
+
+    @pytest.mark.unit
+    async def test_promoted_waiter_is_not_shed(self, monkeypatch):
+        monkeypatch.setitem(connection_admission.WAIT_BUDGETS_S, WARMUP, 0.05)
+        admission = _admission(max_limit=2)
+        await _fill(admission, 2)
+
+        warmup = asyncio.create_task(admission.acquire(WARMUP, key="task"))
+        await asyncio.sleep(0)
+        admission.promote("task", AM)
+        await asyncio.sleep(0.1)
+        assert not warmup.done()
+
+        admission.release()
+        await asyncio.wait_for(warmup, timeout=1.0)
+        assert admission.get_stats()["classes"]["action_manager"]["admitted"] == 3
+
+    @pytest.mark.unit
+    async def test_cancelled_waiter_leaves_the_queue(self):
+        admission = _admission(max_limit=1)
+        await _fill(admission, 1)
+
+        waiter = asyncio.create_task(admission.acquire(REACTION))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        admission.release()
+        assert (admission.in_use, admission.get_stats()["classes"]["reaction"]["queued"]) == (0, 0)
+
+
+class TestAdaptiveLimit:
+    """Tests for adapting the limit to connect latency and host memory."""
+
+    @pytest.mark.unit
+    def test_slow_connects_lower_the_limit_and_fast_ones_raise_it(self, monkeypatch):
+        monkeypatch.setattr(connection_admission, "ADJUST_INTERVAL_S", 0.0)
+        admission = _admission(max_limit=4)
+
+        for _ in range(3):
+            admission.record_connect(10_000)
+        assert admission.limit == 2  # MIN_LIMIT
+
+        for _ in range(10):
+            admission.record_connect(100)
+        assert admission.limit == 4
+
+    @pytest.mark.unit
+    async def test_low_memory_caps_the_limit_and_sheds_warmups(self):
+        admission = _admission(max_limit=10, available_mb=256)
+
+        with pytest.raises(ConnectionShedError) as exc_info:
+            await admission.acquire(WARMUP)
+        assert exc_info.value.reason == "memory_pressure"
+
+        await admission.acquire(AM)
+        stats = admission.get_stats()
+        assert (stats["limit"], stats["memory_pressure"], stats["in_use"]) == (2, True, 1)
+
+    @pytest.mark.unit
+    async def test_memory_headroom_bounds_the_limit(self):
+        admission = _admission(max_limit=10, available_mb=512 + 4 * 256)
+        await admission.acquire(REACTION)
+
+        assert admission.limit == 4
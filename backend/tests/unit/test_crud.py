@@ -77,6 +77,81 @@ class TestRoomCRUD:
         assert result is False
 
 
+class TestRoomLimits:
+    """Tests for in-memory room pause/limit tracking."""
+
+    @staticmethod
+    def _agent_message(agent_id: int) -> schemas.MessageCreate:
+        return schemas.MessageCreate(content="Hello", role="assistant", agent_id=agent_id)
+
+    @pytest.mark.crud
+    async def test_seeded_once_then_counted_incrementally(self, sample_room, sample_agent, test_db, monkeypatch):
+        """Test that limits are seeded from the DB once and then updated by create_message."""
+        await crud.create_message(test_db, sample_room.id, self._agent_message(sample_agent.id))
+        await crud.update_room(test_db, sample_room.id, schemas.RoomUpdate(max_interactions=3))
+
+        limits = await crud.get_room_limits(test_db, sample_room.id)
+        assert limits.interaction_count == 1
+        assert limits.max_interactions == 3
+        assert not limits.limit_reached
+
+        async def no_count(*args, **kwargs):
+            raise AssertionError("count query after seeding")
+
+        monkeypatch.setattr("crud.rooms.count_agent_messages", no_count)
+        user_message = schemas.MessageCreate(content="Hi", role="user", participant_type="user")
+        await crud.create_message(test_db, sample_room.id, user_message)
+        for _ in range(2):
+            await crud.create_message(test_db, sample_room.id, self._agent_message(sample_agent.id))
+
+        limits = await crud.get_room_limits(test_db, sample_room.id)
+        assert limits.interaction_count == 3
+        assert limits.limit_reached
+        assert limits.interaction_count == await crud.count_agent_messages(test_db, sample_room.id)
+
+    @pytest.mark.crud
+    async def test_pause_change_is_applied(self, sample_room, test_db):
+        """Test that update_room notifies tracked state of pause changes."""
+        assert not (await crud.get_room_limits(test_db, sample_room.id)).is_paused
+
+        await crud.update_room(test_db, sample_room.id, schemas.RoomUpdate(is_paused=True))
+        assert (await crud.get_room_limits(test_db, sample_room.id)).is_paused
+
+        await crud.update_room(test_db, sample_room.id, schemas.RoomUpdate(is_paused=False))
+        assert not (await crud.get_room_limits(test_db, sample_room.id)).is_paused
+
+    @pytest.mark.crud
+    async def test_delete_messages_reseeds(self, sample_room, sample_agent, test_db):
+        """Test that clearing a room's messages resets its count."""
+        await crud.create_message(test_db, sample_room.id, self._agent_message(sample_agent.id))
+        assert (await crud.get_room_limits(test_db, sample_room.id)).interaction_count == 1
+
+        await crud.delete_room_messages(test_db, sample_room.id)
+        assert (await crud.get_room_limits(test_db, sample_room.id)).interaction_count == 0
+
+    @pytest.mark.crud
+    async def test_delete_location_forgets_its_room(self, test_db):
+        """Test that deleting a location stops tracking its room."""
+        from crud.locations import delete_location
+
+        world = await crud.create_world(test_db, schemas.WorldCreate(name="limits_world"), owner_id="admin")
+        location = await crud.create_location(
+            test_db,
+            world.id,
+            schemas.LocationCreate(name="tavern", display_name="Tavern", description="", position_x=0, position_y=0),
+        )
+        room_id = location.room_id
+        assert await crud.get_room_limits(test_db, room_id) is not None
+
+        await delete_location(test_db, location.id)
+        assert await crud.get_room_limits(test_db, room_id) is None
+
+    @pytest.mark.crud
+    async def test_missing_room(self, test_db):
+        """Test that an unknown room has no limits."""
+        assert await crud.get_room_limits(test_db, 999) is None
+
+
 class TestAgentCRUD:
     """Tests for Agent CRUD operations."""
 
@@ -473,3 +548,61 @@ class TestReloadAgentFromConfig:
         # Should raise ValueError for non-existent config
         with pytest.raises(ValueError, match="Failed to load config"):
             await AgentFactory.reload_from_config(test_db, sample_agent.id)
+
+
+class TestSeedAgentsFromConfigs:
+    """Tests for batched startup seeding via AgentFactory."""
+
+    @pytest.mark.crud
+    async def test_seed_skips_existing_and_bulk_inserts_missing(self, sample_agent, test_db, tmp_path):
+        """Existing names are skipped; missing agents are created in one batch."""
+        from unittest.mock import patch
+
+        from services import AgentFactory
+
+        configs = {}
+        for name in (sample_agent.name, "seed_a", "seed_b"):
+            agent_dir = tmp_path / "agents" / name
+            agent_dir.mkdir(parents=True)
+            (agent_dir / "in_a_nutshell.md").write_text(f"{name} nutshell")
+            (agent_dir / "characteristics.md").write_text("Calm")
+            configs[name] = {"path": str(agent_dir), "group": None}
+
+        with (
+            patch("sdk.parsing.list_available_configs", return_value=configs),
+            patch("crud.create_agents_bulk", wraps=crud.create_agents_bulk) as bulk,
+        ):
+            created = await AgentFactory.seed_from_configs(test_db)
+
+        assert set(created) == {"seed_a", "seed_b"}
+        assert created["seed_a"].id is not None
+        assert created["seed_a"].in_a_nutshell == "seed_a nutshell"
+        assert bulk.await_count == 1
+        assert await crud.get_agent_names(test_db) == {sample_agent.name, "seed_a", "seed_b"}
+
+    @pytest.mark.crud
+    async def test_concurrent_seed_renders_every_prompt(self, test_db):
+        """The shipped configs, parsed by several worker threads at once, all get their guidelines."""
+        from sdk.loaders import clear_cache, get_group_config
+        from sdk.parsing import list_available_configs
+        from services import AgentFactory
+        from services.agent_factory import _prepare_agent_fields
+
+        configs = list_available_configs()
+        assert len(configs) > 1
+
+        # Cold config cache, so the worker threads parse the shared YAML files together
+        clear_cache()
+        created = await AgentFactory.seed_from_configs(test_db)
+
+        assert set(created) == set(configs)
+        for name, info in configs.items():
+            expected = _prepare_agent_fields(name, info["path"], info["group"])
+            assert created[name].system_prompt == expected["system_prompt"]
+            assert created[name].priority == expected["priority"]
+        assert all(get_group_config(info["group"]) for info in configs.values() if info["group"])
+
+    @pytest.mark.crud
+    async def test_create_agents_bulk_empty(self, test_db):
+        """An empty batch is a no-op."""
+        assert await crud.create_agents_bulk(test_db, []) == []
@@ -273,3 +273,74 @@ class TestPlayerStateCRUD:
         updated_location = await crud.get_location(test_db, location.id)
         assert updated_location.is_current is True
         assert updated_location.is_discovered is True
+
+
+class TestTurnAdmission:
+    """Tests for single-transaction turn admission."""
+
+    @staticmethod
+    def _message(text: str) -> schemas.MessageCreate:
+        return schemas.MessageCreate(content=text, role="user", participant_type="user")
+
+    @pytest.mark.crud
+    async def test_admit_turn(self, test_db):
+        """Test that one admission records the turn, history, message and timestamp."""
+        world = await crud.create_world(test_db, schemas.WorldCreate(name="test_world"), owner_id="admin")
+        room_id = world.onboarding_room_id
+
+        admission = await crud.admit_turn(test_db, world.id, room_id, "look around", self._message("look around"))
+
+        assert admission.turn == 1
+        assert admission.message_id is not None
+        player_state = await crud.get_player_state(test_db, world.id)
+        assert player_state.turn_count == 1
+        assert '"result": "Processing..."' in player_state.action_history
+        refreshed = await crud.get_world(test_db, world.id)
+        assert refreshed.last_played_at is not None
+        messages = await crud.get_messages(test_db, room_id)
+        assert [m.content for m in messages] == ["look around"]
+
+        second = await crud.admit_turn(test_db, world.id, room_id, "walk", self._message("walk"))
+        assert second.turn == 2
+
+    @pytest.mark.crud
+    async def test_admit_turn_commits_once(self, test_db, monkeypatch):
+        """Test that all admission writes share a single commit."""
+        world = await crud.create_world(test_db, schemas.WorldCreate(name="test_world"), owner_id="admin")
+        commits = 0
+        original_commit = test_db.commit
+
+        async def counting_commit():
+            nonlocal commits
+            commits += 1
+            await original_commit()
+
+        monkeypatch.setattr(test_db, "commit", counting_commit)
+        await crud.admit_turn(test_db, world.id, world.onboarding_room_id, "act", self._message("act"))
+
+        assert commits == 1
+
+    @pytest.mark.crud
+    async def test_admit_turn_adds_missing_gameplay_agents(self, test_db):
+        """Test that gameplay agents missing from the room are added in the same transaction."""
+        from infrastructure.database import models
+
+        for name in ("Action_Manager", "Narrator"):
+            test_db.add(models.Agent(name=name, group="gameplay", system_prompt=f"You are {name}."))
+        await test_db.commit()
+        world = await crud.create_world(test_db, schemas.WorldCreate(name="test_world"), owner_id="admin")
+        room_id = world.onboarding_room_id
+
+        first = await crud.admit_turn(test_db, world.id, room_id, "act", self._message("act"))
+        second = await crud.admit_turn(test_db, world.id, room_id, "act", self._message("act"))
+
+        assert first.agents_added == 2
+        assert second.agents_added == 0
+        agents = await crud.get_agents(test_db, room_id)
+        assert {a.name for a in agents} >= {"Action_Manager", "Narrator"}
+
+    @pytest.mark.crud
+    async def test_admit_turn_world_not_found(self, test_db):
+        """Test that admitting a turn for a missing world raises ValueError."""
+        with pytest.raises(ValueError):
+            await crud.admit_turn(test_db, 999, 1, "act", self._message("act"))
@@ -0,0 +1,150 @@
+"""
+Unit tests for submitting player actions through the per-world turn queue.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import crud
+import pytest
+import schemas
+from core.dependencies import RequestIdentity
+from domain.value_objects.enums import UserRole, WorldPhase
+from orchestration.turn_scheduler import TurnScheduler
+from routers.game import actions
+
+IDENTITY = RequestIdentity(role=UserRole.ADMIN, user_id="admin")
+
+
+class _Orchestrator:
+    """Records the turns it is asked to run."""
+
+    def __init__(self):
+        self.turns = []
+
+    async def handle_player_action(self, db, room_id, action_text, agent_manager, world, turn):
+        self.turns.append(SimpleNamespace(room_id=room_id, action_text=action_text, world=world, turn=turn))
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    scheduler = TurnScheduler(max_depth=3)
+    monkeypatch.setattr(actions, "get_turn_scheduler", lambda: scheduler)
+    return scheduler
+
+
+@pytest.fixture
+def orchestrator(test_db, monkeypatch):
+    @asynccontextmanager
+    async def session():
+        yield test_db
+
+    orchestrator = _Orchestrator()
+    monkeypatch.setattr(actions, "get_trpg_orchestrator", lambda: orchestrator)
+    monkeypatch.setattr("infrastructure.database.connection.background_session", session)
+    return orchestrator
+
+
+async def _drained(scheduler: TurnScheduler, world_id: int) -> None:
+    for _ in range(200):
+        if world_id not in scheduler._queues:
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("turn queue did not drain")
+
+
+async def _submit(test_db, world_id: int, text: str) -> dict:
+    return await actions.submit_action(
+        world_id, schemas.PlayerAction(text=text), db=test_db, identity=IDENTITY, agent_manager=Mock()
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.db
+class TestSubmitAction:
+    """Tests for queueing regular TRPG actions."""
+
+    async def test_failure_after_reserve_releases_the_slot(self, test_db, scheduler, orchestrator, monkeypatch):
+        world = await crud.create_world(test_db, schemas.WorldCreate(name="action_world"), owner_id="admin")
+        get_agents = crud.get_agents_cached
+
+        async def failing(db, room_id):
+            raise RuntimeError("agent lookup failed")
+
+        monkeypatch.setattr(crud, "get_agents_cached", failing)
+        with pytest.raises(RuntimeError):
+            await _submit(test_db, world.id, "look around")
+        monkeypatch.setattr(crud, "get_agents_cached", get_agents)
+
+        response = await _submit(test_db, world.id, "walk north")
+        await _drained(scheduler, world.id)
+
+        assert response["queue_position"] == 0
+        assert [t.action_text for t in orchestrator.turns] == ["walk north"]
+        assert scheduler.get_metrics()["completed"] == 1
+
+    async def test_queued_turn_follows_the_player_after_travel(self, test_db, scheduler, orchestrator, monkeypatch):
+        world = await crud.create_world(test_db, schemas.WorldCreate(name="travel_world"), owner_id="admin")
+        tavern, square = [
+            await crud.create_location(
+                test_db,
+                world.id,
+                schemas.LocationCreate(
+                    name=name, display_name=name.title(), description="", position_x=0, position_y=0
+                ),
+            )
+            for name in ("tavern", "square")
+        ]
+        await crud.set_current_location(test_db, world.id, tavern.id)
+        world.phase = WorldPhase.ACTIVE
+        await test_db.commit()
+        monkeypatch.setattr(actions.PlayerService, "load_player_state", lambda world_name: None)
+
+        # The first turn travels to the square once the second action is queued behind it
+        queued = asyncio.Event()
+        record = orchestrator.handle_player_action
+
+        async def travel_first(db, room_id, action_text, agent_manager, world, turn):
+            await record(db, room_id, action_text, agent_manager, world, turn)
+            if action_text == "go to the square":
+                await queued.wait()
+                await crud.set_current_location(db, world.id, square.id)
+
+        monkeypatch.setattr(orchestrator, "handle_player_action", travel_first)
+        await _submit(test_db, world.id, "go to the square")
+        second = await _submit(test_db, world.id, "order a drink")
+        queued.set()
+        await _drained(scheduler, world.id)
+
+        first_turn, second_turn = orchestrator.turns
+        assert second["queue_position"] == 1
+        assert first_turn.room_id == tavern.room_id
+        assert (second_turn.room_id, second_turn.turn.location_id) == (square.room_id, square.id)
+        assert second_turn.turn.prepared is None
+        assert [m.content for m in await crud.get_messages(test_db, tavern.room_id)] == ["go to the square"]
+        assert [m.content for m in await crud.get_messages(test_db, square.room_id)] == ["order a drink"]
+
+    async def test_queued_turn_is_skipped_when_the_world_is_deleted(
+        self, test_db, scheduler, orchestrator, monkeypatch
+    ):
+        world = await crud.create_world(test_db, schemas.WorldCreate(name="doomed_world"), owner_id="admin")
+        world_id = world.id
+
+        # The first turn deletes the world once the second action is queued behind it
+        queued = asyncio.Event()
+        record = orchestrator.handle_player_action
+
+        async def delete_first(db, room_id, action_text, agent_manager, world, turn):
+            await record(db, room_id, action_text, agent_manager, world, turn)
+            await queued.wait()
+            await crud.delete_world(db, world_id)
+
+        monkeypatch.setattr(orchestrator, "handle_player_action", delete_first)
+        await _submit(test_db, world_id, "look around")
+        await _submit(test_db, world_id, "walk north")
+        queued.set()
+        await _drained(scheduler, world_id)
+
+        assert [t.action_text for t in orchestrator.turns] == ["look around"]
@@ -6,7 +6,7 @@ whether a word ends with a consonant (받침) or vowel.
 """
 
 import pytest
-from i18n.korean import format_with_particles, has_final_consonant
+from i18n.korean import compile_template, format_with_particles, has_final_consonant, render_template
 
 
 class TestHasFinalConsonant:
@@ -151,3 +151,27 @@ class TestFormatWithParticles:
 
         result = format_with_particles("{name:은는} 강하다", name="Bob")
         assert result == "Bob은 강하다"
+
+
+class TestCompileTemplate:
+    """Tests for compile_template / render_template."""
+
+    @pytest.mark.unit
+    def test_compiled_render_matches_format(self):
+        template = "{name:이가} {name:을를} 봤다. {name}!"
+        compiled = compile_template(template, ("name",))
+
+        assert render_template(compiled, name="프리렌") == "프리렌이 프리렌을 봤다. 프리렌!"
+        assert render_template(compiled, name="히메") == "히메가 히메를 봤다. 히메!"
+
+    @pytest.mark.unit
+    def test_unknown_placeholders_stay_literal(self):
+        compiled = compile_template('{"json": {other}} {name:xyz} {name}', ("name",))
+
+        assert render_template(compiled, name="A") == '{"json": {other}} {name:xyz} A'
+
+    @pytest.mark.unit
+    def test_compile_is_cached(self):
+        template = "{agent_name:은는} cached"
+
+        assert compile_template(template, ("agent_name",)) is compile_template(template, ("agent_name",))
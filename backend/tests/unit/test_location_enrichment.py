@@ -0,0 +1,169 @@
+"""
+Unit tests for background enrichment of draft locations.
+"""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import crud
+import pytest
+import yaml
+from domain.entities.world_models import LocationConfig
+from domain.value_objects import TaskIdentifier
+from orchestration.location_enrichment import LocationEnricher, rank_enrichment_candidates
+from services.location_storage import LocationStorage
+
+
+def _location(name: str, position=(0, 0), adjacent=None, is_draft=True, description="") -> LocationConfig:
+    return LocationConfig(
+        name=name,
+        display_name=name.replace("_", " ").title(),
+        label=None,
+        position=position,
+        is_discovered=True,
+        adjacent=adjacent or [],
+        description=description,
+        is_draft=is_draft,
+    )
+
+
+class TestRankEnrichmentCandidates:
+    """Tests for ranking drafts by likelihood of travel."""
+
+    @pytest.mark.unit
+    def test_only_adjacent_drafts(self):
+        harbor = _location("harbor", adjacent=["smugglers_cove", "lighthouse"], is_draft=False)
+        locations = {
+            "harbor": harbor,
+            "smugglers_cove": _location("smugglers_cove"),
+            "lighthouse": _location("lighthouse", is_draft=False),
+            "old_mill": _location("old_mill"),  # draft, but not adjacent
+            "fish_market": _location("fish_market", adjacent=["harbor"]),  # adjacent the other way
+        }
+
+        ranked = [name for name, _ in rank_enrichment_candidates(harbor, locations, [])]
+
+        assert sorted(ranked) == ["fish_market", "smugglers_cove"]
+
+    @pytest.mark.unit
+    def test_suggestions_then_description_then_distance(self):
+        harbor = _location(
+            "harbor",
+            adjacent=["near_dock", "far_dock", "smugglers_cove", "lighthouse"],
+            is_draft=False,
+            description="Gulls circle the old Lighthouse.",
+        )
+        locations = {
+            "harbor": harbor,
+            "near_dock": _location("near_dock", position=(1, 0)),
+            "far_dock": _location("far_dock", position=(5, 0)),
+            "smugglers_cove": _location("smugglers_cove", position=(9, 9)),
+            "lighthouse": _location("lighthouse", position=(9, 9)),
+        }
+
+        ranked = rank_enrichment_candidates(harbor, locations, ["Sneak toward the smugglers cove", "Wait"])
+
+        assert [name for name, _ in ranked] == ["smugglers_cove", "lighthouse", "near_dock", "far_dock"]
+
+
+class TestLocationEnricher:
+    """Tests for scheduling, deferral and arrival counters."""
+
+    @pytest.mark.unit
+    def test_disabled_enricher_does_not_schedule(self):
+        assert LocationEnricher(enabled=False).schedule(1, "w", agent_manager=None) is False
+
+    @pytest.mark.unit
+    async def test_job_gives_up_while_world_stays_busy(self, monkeypatch):
+        class BusyScheduler:
+            def get_queue_status(self, world_id):
+                return {"world_id": world_id, "running": True, "pending": 0}
+
+        monkeypatch.setattr("orchestration.turn_scheduler.get_turn_scheduler", lambda: BusyScheduler())
+        enricher = LocationEnricher(enabled=True, max_defer=0.0)
+        enricher._in_flight.add((1, "smugglers_cove"))
+
+        await enricher._run_job(1, "w", _location("smugglers_cove"), _location("harbor"), agent_manager=None)
+
+        stats = enricher.get_stats()
+        assert stats["deferred_out"] == 1 and stats["enriched"] == 0
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.unit
+    async def test_job_does_not_touch_the_rooms_action_manager_client(self, monkeypatch):
+        @asynccontextmanager
+        async def session():
+            yield None
+
+        async def get_location_by_name(db, world_id, name):
+            return SimpleNamespace(room_id=7, is_draft=True)
+
+        async def get_agents_cached(db, room_id):
+            return [SimpleNamespace(id=3, name="Action_Manager")]
+
+        monkeypatch.setattr("orchestration.location_enrichment.background_session", session)
+        monkeypatch.setattr(crud, "get_location_by_name", get_location_by_name)
+        monkeypatch.setattr(crud, "get_agents_cached", get_agents_cached)
+
+        manager_key = TaskIdentifier(room_id=7, agent_id=3)
+        pool = {manager_key: "pre-connected by travel"}
+
+        class ClientPool:
+            async def cleanup(self, task_id):
+                pool.pop(task_id, None)
+
+        class Manager:
+            client_pool = ClientPool()
+
+            async def generate_sdk_response(self, context):
+                pool[context.task_id] = "enrichment job"
+                yield {"type": "stream_end"}
+
+        await LocationEnricher(enabled=True)._enrich(
+            1, "w", _location("smugglers_cove"), _location("harbor"), Manager()
+        )
+
+        assert pool == {manager_key: "pre-connected by travel"}
+
+    @pytest.mark.unit
+    def test_arrival_counters(self):
+        enricher = LocationEnricher(enabled=True)
+        enricher._enriched[1] = {"smugglers_cove"}
+
+        enricher.record_arrival(1, "smugglers_cove", is_draft=False)
+        enricher.record_arrival(1, "lighthouse", is_draft=True)
+        enricher.record_arrival(1, "harbor", is_draft=False)
+
+        stats = enricher.get_stats()
+        assert (stats["arrivals"], stats["arrivals_enriched"], stats["arrivals_draft"]) == (3, 1, 1)
+
+
+class TestEnrichLocationStorage:
+    """Tests for replacing a draft location's design on the filesystem."""
+
+    @pytest.mark.unit
+    def test_enrich_clears_draft_and_merges_adjacency(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("services.world_service._get_worlds_dir", lambda: tmp_path)
+        (tmp_path / "w" / "locations").mkdir(parents=True)
+        LocationStorage.create_location(
+            "w", "smugglers_cove", "Cove", "A placeholder.", (2, 3), adjacent=["harbor"], is_draft=True
+        )
+
+        assert LocationStorage.enrich_location(
+            "w", "smugglers_cove", "Smugglers' Cove", "Salt and tar.", (2, 4), adjacent=["harbor", "cliffs"]
+        )
+
+        location = LocationStorage.load_location("w", "smugglers_cove")
+        assert not location.is_draft
+        assert location.display_name == "Smugglers' Cove"
+        assert location.position == (2, 4)
+        assert location.adjacent == ["harbor", "cliffs"]
+        assert "Salt and tar." in location.description
+        index = yaml.safe_load((tmp_path / "w" / "locations" / "_index.yaml").read_text())
+        assert index["locations"]["smugglers_cove"]["is_draft"] is False
+
+    @pytest.mark.unit
+    def test_enrich_unknown_location(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("services.world_service._get_worlds_dir", lambda: tmp_path)
+
+        assert LocationStorage.enrich_location("w", "nowhere", "Nowhere", "-", (0, 0)) is False
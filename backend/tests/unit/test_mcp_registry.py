@@ -0,0 +1,169 @@
+"""
+Tests for MCPRegistry config caching.
+
+Covers the bounded LRU cache and per-agent invalidation: one agent's config
+write must not evict cached MCP configs for unrelated agents.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from domain.entities.agent_config import AgentConfigData
+from sdk.client.client_pool import get_pool_metrics
+from sdk.client.mcp_registry import MCPRegistry
+
+
+def _context(agent_name: str, config_file: str | None = None, room_id: int = 1) -> Mock:
+    """Build a minimal AgentResponseContext stand-in."""
+    return Mock(
+        agent_name=agent_name,
+        agent_id=hash(agent_name) % 1000,
+        group_name=None,
+        config=AgentConfigData(config_file=config_file),
+        world_name="world",
+        world_id=1,
+        room_id=room_id,
+        db=None,
+        npc_reactions=None,
+    )
+
+
+@pytest.fixture
+def registry():
+    """MCPRegistry with server creation stubbed out (no SDK servers built)."""
+    reg = MCPRegistry(settings=Mock(), max_size=3)
+    with (
+        patch.object(reg, "_create_mcp_servers", side_effect=lambda ctx, groups, am=None: {"guidelines": object()}),
+        patch.object(reg, "_get_agent_tool_config", return_value={}),
+    ):
+        yield reg
+
+
+class TestMCPRegistryCache:
+    """Tests for MCP config cache behaviour."""
+
+    def test_second_build_is_cache_hit(self, registry):
+        ctx = _context("Alice", "agents/Alice")
+
+        first = registry.build_mcp_config(ctx)
+        second = registry.build_mcp_config(ctx)
+
+        assert first is second
+        stats = registry.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_invalidate_by_config_file_keeps_other_agents(self, registry):
+        alice = registry.build_mcp_config(_context("Alice", "agents/Alice"))
+        bob = registry.build_mcp_config(_context("Bob", "agents/Bob"))
+
+        cleared = registry.invalidate_cache(config_file="agents/Alice")
+
+        assert cleared == 1
+        assert registry.build_mcp_config(_context("Bob", "agents/Bob")) is bob
+        rebuilt = registry.build_mcp_config(_context("Alice", "agents/Alice"))
+        assert rebuilt is not alice
+        # Same context -> same hash, so the pooled client would not reconnect
+        assert rebuilt.config_hash == alice.config_hash
+
+    def test_invalidate_by_config_file_covers_every_room(self, registry):
+        registry.build_mcp_config(_context("Alice", "agents/Alice", room_id=1))
+        registry.build_mcp_config(_context("Alice", "agents/Alice", room_id=2))
+
+        assert registry.invalidate_cache(config_file="agents/Alice") == 2
+        assert registry.get_stats()["size"] == 0
+
+    def test_lru_eviction_respects_max_size(self, registry):
+        for name in ("A", "B", "C"):
+            registry.build_mcp_config(_context(name, f"agents/{name}"))
+        # Touch A so B becomes least recently used
+        registry.build_mcp_config(_context("A", "agents/A"))
+        registry.build_mcp_config(_context("D", "agents/D"))
+
+        stats = registry.get_stats()
+        assert stats["size"] == 3
+        assert stats["evictions"] == 1
+        assert registry.invalidate_cache(config_file="agents/B") == 0
+        assert registry.invalidate_cache(config_file="agents/A") == 1
+
+    def test_clear_all(self, registry):
+        registry.build_mcp_config(_context("A", "agents/A"))
+        registry.build_mcp_config(_context("B"))
+
+        assert registry.invalidate_cache() == 2
+        assert registry.get_stats()["scopes"] == 0
+
+    def test_build_records_pool_metrics(self, registry):
+        metrics = get_pool_metrics()
+        misses_before = metrics.mcp_cache_misses
+        hits_before = metrics.mcp_cache_hits
+
+        ctx = _context("Metrics", "agents/Metrics")
+        registry.build_mcp_config(ctx)
+        registry.build_mcp_config(ctx)
+
+        assert metrics.mcp_cache_misses == misses_before + 1
+        assert metrics.mcp_cache_hits == hits_before + 1
+
+
+class TestMemoryStore:
+    """Tests for memory content kept out of the config hash."""
+
+    @pytest.fixture
+    def store(self, monkeypatch):
+        from sdk.handlers import memory_store
+
+        store = memory_store.MemoryIndexStore()
+        monkeypatch.setattr(memory_store, "_memory_store", store)
+        return store
+
+    def test_memory_update_keeps_config_hash(self, registry, store):
+        ctx = _context("Alice", "agents/Alice")
+        ctx.config = AgentConfigData(config_file="agents/Alice", long_term_memory_index={"Childhood": "A river"})
+        avoided_before = get_pool_metrics().reconnects_avoided
+
+        first = registry.build_mcp_config(ctx)
+        ctx.config = AgentConfigData(
+            config_file="agents/Alice", long_term_memory_index={"Childhood": "A river", "Exile": "The gate"}
+        )
+        second = registry.build_mcp_config(ctx)
+
+        assert second.config_hash == first.config_hash
+        assert store.get("Alice", ctx.agent_id).index["Exile"] == "The gate"
+        assert get_pool_metrics().reconnects_avoided == avoided_before + 1
+
+    def test_first_memory_changes_tool_surface(self, registry, store):
+        ctx = _context("Alice", "agents/Alice")
+        without = registry.build_mcp_config(ctx)
+        ctx.config = AgentConfigData(config_file="agents/Alice", long_term_memory_index={"Childhood": "A river"})
+
+        assert registry.build_mcp_config(ctx).config_hash != without.config_hash
+
+    @pytest.mark.asyncio
+    async def test_recall_reads_the_latest_index(self, store):
+        from sdk.handlers.action_tools import create_action_tools
+        from sdk.handlers.context import ToolContext
+
+        ctx = ToolContext(agent_name="Alice", agent_id=1, long_term_memory_index={"Childhood": "A river"})
+        with patch("sdk.handlers.action_tools.is_tool_enabled", side_effect=lambda name: name == "recall"):
+            [recall] = create_action_tools(ctx)
+        store.publish("Alice", 1, None, {"Childhood": "A river", "Exile": "The gate"})
+
+        result = await recall.handler({"subtitle": "Exile"})
+
+        assert "The gate" in result["content"][0]["text"]
+
+    @pytest.mark.asyncio
+    async def test_recall_miss_lists_current_subtitles(self, store):
+        from sdk.handlers.action_tools import create_action_tools
+        from sdk.handlers.context import ToolContext
+
+        ctx = ToolContext(agent_name="Alice", agent_id=1, long_term_memory_index={"Childhood": "A river"})
+        with patch("sdk.handlers.action_tools.is_tool_enabled", side_effect=lambda name: name == "recall"):
+            [recall] = create_action_tools(ctx)
+        store.publish("Alice", 1, None, {"Childhood": "A river", "Exile": "The gate"})
+
+        result = await recall.handler({"subtitle": "Wedding"})
+
+        assert "Childhood" not in recall.description
+        assert "'Childhood', 'Exile'" in result["content"][0]["text"]
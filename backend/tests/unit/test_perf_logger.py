@@ -0,0 +1,112 @@
+"""
+Tests for the buffered perf logger and its streaming latency histograms.
+"""
+
+import random
+
+import pytest
+from infrastructure.logging.perf_logger import LatencyHistogram, PerfLogger
+
+
+@pytest.fixture
+def perf(tmp_path):
+    logger = PerfLogger(enabled=True, log_path=tmp_path / "latency.log", buffer_size=100, echo=False)
+    yield logger
+    logger.close()
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    @pytest.mark.unit
+    def test_percentiles_within_relative_error(self):
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(4, 1.5) for _ in range(20000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for q in (50, 95, 99):
+            exact = values[int(len(values) * q / 100) - 1]
+            assert histogram.percentile(q) == pytest.approx(exact, rel=0.03)
+        assert histogram.percentile(100) == values[-1]
+        assert histogram.summary()["min_ms"] == round(values[0], 2)
+
+    @pytest.mark.unit
+    def test_memory_is_bounded_by_range_not_samples(self):
+        histogram = LatencyHistogram()
+        for i in range(100000):
+            histogram.record((i % 1000) + 0.5)
+
+        assert histogram.count == 100000
+        assert len(histogram._buckets) < 300
+
+    @pytest.mark.unit
+    def test_empty_and_zero(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(50) == 0.0
+        assert histogram.summary() == {"count": 0}
+
+        histogram.record(0.0)
+        assert histogram.percentile(99) == 0.0
+
+
+class TestPerfLogger:
+    """Tests for PerfLogger buffering and aggregation."""
+
+    @pytest.mark.unit
+    def test_log_sync_buffers_until_flush(self, perf, tmp_path):
+        header = (tmp_path / "latency.log").read_text() if (tmp_path / "latency.log").exists() else ""
+        perf.log_sync("pool_get_client", 12.5, "Narrator", 3, reused=True)
+
+        assert perf.flush() >= 1
+        content = (tmp_path / "latency.log").read_text()
+        assert content.startswith(header)
+        assert "pool_get_client" in content
+        assert "reused=True" in content
+
+    @pytest.mark.unit
+    def test_full_buffer_drops_oldest_lines(self, perf, tmp_path):
+        perf._stop.set()  # Keep the writer from draining mid-test
+        perf._wake.set()
+        perf._writer.join(timeout=2)
+        perf.flush()
+
+        for i in range(150):
+            perf.log_sync("tick", float(i))
+
+        stats = perf.get_stats()["buffer"]
+        assert stats["pending"] == 100
+        assert stats["dropped"] == 50
+        perf.flush()
+        lines = [line for line in (tmp_path / "latency.log").read_text().splitlines() if "tick" in line]
+        assert len(lines) == 100
+        assert lines[0].endswith("50.00ms")
+
+    @pytest.mark.unit
+    async def test_stats_per_phase_and_agent(self, perf):
+        for ms in (10, 20, 30, 40):
+            perf.log_sync("sdk_response_total", ms, "Narrator")
+        perf.log_sync("sdk_response_total", 1000, "Action_Manager")
+        await perf.log_async("turn_run", 500)
+
+        stats = perf.get_stats()
+        sdk = stats["phases"]["sdk_response_total"]
+        assert sdk["count"] == 5
+        assert sdk["max_ms"] == 1000
+        assert sdk["agents"]["Narrator"]["count"] == 4
+        assert sdk["agents"]["Narrator"]["p50_ms"] == pytest.approx(20, rel=0.03)
+        assert stats["phases"]["turn_run"]["agents"] == {}
+
+        summary = perf.get_summary()
+        assert summary["total_entries"] == 6
+        assert summary["phases"]["turn_run"]["p99_ms"] == 500
+
+    @pytest.mark.unit
+    def test_disabled_logger_records_nothing(self, tmp_path):
+        perf = PerfLogger(enabled=False, log_path=tmp_path / "latency.log")
+        perf.log_sync("tick", 1.0)
+
+        assert perf.get_summary() == {"total_entries": 0}
+        assert perf._writer is None
+        assert not (tmp_path / "latency.log").exists()
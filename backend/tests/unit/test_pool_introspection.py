@@ -0,0 +1,105 @@
+"""
+Unit tests for per-client pool introspection and its Prometheus exposition.
+"""
+
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from domain.value_objects.task_identifier import TaskIdentifier
+from sdk.client.client_pool import ClientPool, PooledClient, PoolMetrics
+from sdk.client.connection_admission import ConnectionAdmission
+from sdk.client.pool_introspection import describe_pool, read_process_stats, render_prometheus
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+
+
+@pytest.fixture
+def child():
+    process = subprocess.Popen(["sleep", "30"])
+    yield process
+    process.kill()
+    process.wait()
+
+
+def _pooled(process=None, idle_s: float = 0.0, age_s: float = 0.0) -> PooledClient:
+    """A pooled client whose transport wraps the given process, like MetricsTransport does."""
+    inner = SimpleNamespace(_process=process)
+    client = Mock(_transport=SimpleNamespace(_process=None, _inner=inner))
+    pooled = PooledClient(client=client, config_hash="abc123", session_id="sess_1")
+    now = time.monotonic()
+    pooled.created_at = now - age_s
+    pooled.last_used_at = now - idle_s
+    return pooled
+
+
+class TestDescribePool:
+    """Tests for listing pooled clients."""
+
+    @linux_only
+    @pytest.mark.unit
+    def test_clients_report_their_subprocess(self, child):
+        pool = ClientPool()
+        pool.pool[TaskIdentifier(room_id=1, agent_id=1)] = _pooled(child, idle_s=5, age_s=60)
+
+        snapshot = describe_pool(pool)
+
+        [client] = snapshot["clients"]
+        assert (client["task_id"], client["pid"], client["process_alive"]) == ("room_1_agent_1", child.pid, True)
+        assert client["rss_mb"] is not None and client["cpu_s"] is not None
+        assert (client["session_id"], client["queue_depth"], client["pump"]) == ("sess_1", 0, "none")
+        assert client["idle_s"] >= 5 and client["age_s"] >= 60
+        assert child.pid not in [p["pid"] for p in snapshot["unpooled_processes"]]
+
+    @linux_only
+    @pytest.mark.unit
+    def test_child_without_client_is_unpooled(self, child):
+        snapshot = describe_pool(ClientPool())
+
+        assert child.pid in [p["pid"] for p in snapshot["unpooled_processes"]]
+        assert read_process_stats(child.pid)["name"] == "sleep"
+
+    @pytest.mark.unit
+    def test_filters_and_sorting(self):
+        pool = ClientPool()
+        pool.pool[TaskIdentifier(room_id=1, agent_id=1)] = _pooled(idle_s=10)
+        pool.pool[TaskIdentifier(room_id=1, agent_id=2)] = _pooled(idle_s=300)
+        pool.pool[TaskIdentifier(room_id=2, agent_id=3)] = _pooled(idle_s=100)
+        pool.pool[TaskIdentifier(room_id=2, agent_id=3)].record_error("error_during_execution: overloaded")
+
+        by_idle = describe_pool(pool, sort="idle_s", descending=False)
+        assert [c["agent_id"] for c in by_idle["clients"]] == [1, 3, 2]
+        assert describe_pool(pool, room_id=1, min_idle_s=60)["matched"] == 1
+        [errored] = describe_pool(pool, has_error=True)["clients"]
+        assert errored["last_error"] == "error_during_execution: overloaded"
+        busy = describe_pool(pool, busy=True, active_task_ids={TaskIdentifier(room_id=1, agent_id=2)})
+        assert [c["agent_id"] for c in busy["clients"]] == [2]
+        assert len(describe_pool(pool, limit=2)["clients"]) == 2
+        with pytest.raises(ValueError):
+            describe_pool(pool, sort="pid")
+
+
+class TestPrometheusExposition:
+    """Tests for the text exposition."""
+
+    @pytest.mark.unit
+    def test_renders_clients_and_counters(self):
+        pool = ClientPool()
+        pool.pool[TaskIdentifier(room_id=4, agent_id=7)] = _pooled(idle_s=2)
+        metrics = PoolMetrics(pool_hits=3, reconnects_config=2)
+
+        admission = ConnectionAdmission(max_limit=10, memory_reader=lambda: None)
+        text = render_prometheus(describe_pool(pool), metrics, admission.get_stats())
+
+        assert "# TYPE claudeworld_pool_clients gauge" in text
+        assert "claudeworld_pool_clients 1" in text
+        assert 'claudeworld_pool_client_queue_depth{room_id="4",agent_id="7"} 0' in text
+        assert 'claudeworld_pool_reconnects_total{cause="config"} 2' in text
+        assert "claudeworld_pool_hits_total 3" in text
+        assert "claudeworld_pool_connection_slots_available 10" in text
+        assert 'claudeworld_pool_connection_shed_total{priority="warmup"} 0' in text
+        # No subprocess behind the client, so no process samples
+        assert "claudeworld_pool_client_process_rss_bytes{" not in text
@@ -0,0 +1,166 @@
+"""
+Tests for the memoized system prompt builder.
+
+Rendered sections are cached and must stay byte-identical across turns;
+changing any input must produce a fresh prompt.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from domain.entities.agent_config import AgentConfigData
+from orchestration.gameplay_context import ActionManagerContext, GameplayContextBuilder
+from services import prompt_builder
+from services.prompt_builder import (
+    build_runtime_system_prompt,
+    build_system_prompt,
+    get_prompt_cache_stats,
+    record_prompt_prefix,
+)
+
+BASE_TEMPLATE = "You are {agent_name}. {agent_name:은는} here. Keep {literal} braces."
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Isolate the module-level cache and stats per test."""
+    prompt_builder.clear_prompt_cache()
+    with (
+        patch.dict(prompt_builder._stats, {key: 0 for key in prompt_builder._stats}),
+        patch("services.prompt_builder.get_base_system_prompt", return_value=BASE_TEMPLATE),
+    ):
+        yield
+    prompt_builder.clear_prompt_cache()
+
+
+def _config(**overrides) -> AgentConfigData:
+    return AgentConfigData(in_a_nutshell="A wizard", characteristics="Calm", **overrides)
+
+
+class TestBuildSystemPrompt:
+    """Tests for build_system_prompt / build_runtime_system_prompt."""
+
+    @pytest.mark.unit
+    def test_output_matches_unmemoized_format(self):
+        prompt = build_system_prompt("프리렌", _config())
+
+        expected = "You are 프리렌. 프리렌은 here. Keep {literal} braces." + _config().to_system_prompt_markdown(
+            "프리렌"
+        )
+        assert prompt == expected
+
+    @pytest.mark.unit
+    def test_repeat_call_reuses_rendered_guideline(self):
+        first = build_system_prompt("프리렌", _config())
+        second = build_system_prompt("프리렌", _config())
+
+        assert first == second
+        stats = get_prompt_cache_stats()
+        # Only the template render is cached, not the concatenated prompt
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+    @pytest.mark.unit
+    def test_changed_template_rerenders(self):
+        build_system_prompt("프리렌", _config())
+        with patch("services.prompt_builder.get_base_system_prompt", return_value="Hi {agent_name}."):
+            prompt = build_system_prompt("프리렌", _config())
+
+        assert prompt.startswith("Hi 프리렌.")
+        assert get_prompt_cache_stats()["misses"] == 2
+
+    @pytest.mark.unit
+    def test_changed_config_rebuilds(self):
+        first = build_system_prompt("프리렌", _config())
+        second = build_system_prompt("프리렌", _config(recent_events="- met Himmel"))
+
+        assert first != second
+        assert "met Himmel" in second
+
+    @pytest.mark.unit
+    def test_runtime_prompt_places_lore_between_guideline_and_traits(self):
+        prompt = build_runtime_system_prompt("Alice", _config(), lore="  Ancient kingdom  ")
+
+        guideline_end = prompt.index("braces.")
+        lore_pos = prompt.index("# World Lore\n\nAncient kingdom")
+        traits_pos = prompt.index("## Alice in a nutshell")
+        assert guideline_end < lore_pos < traits_pos
+
+    @pytest.mark.unit
+    def test_runtime_prompt_keyed_on_lore(self):
+        with_lore = build_runtime_system_prompt("Alice", _config(), lore="Lore A")
+        other_lore = build_runtime_system_prompt("Alice", _config(), lore="Lore B")
+
+        assert with_lore != other_lore
+        assert build_runtime_system_prompt("Alice", _config(), lore="Lore A") == with_lore
+
+    @pytest.mark.unit
+    def test_cache_is_bounded(self):
+        with patch.object(prompt_builder, "PROMPT_CACHE_MAX_SIZE", 3):
+            for i in range(5):
+                build_system_prompt(f"Alice {i}", _config())
+
+        stats = get_prompt_cache_stats()
+        assert stats["size"] == 3
+        assert stats["evictions"] > 0
+
+
+class TestPromptPrefixTracking:
+    """Tests for record_prompt_prefix."""
+
+    @pytest.mark.unit
+    def test_stable_prefix_reported(self):
+        _, first_stable = record_prompt_prefix(1, "Alice", "prefix")
+        prefix_hash, second_stable = record_prompt_prefix(1, "Alice", "prefix")
+
+        assert first_stable is False
+        assert second_stable is True
+        assert len(prefix_hash) == 12
+
+    @pytest.mark.unit
+    def test_changed_prefix_and_rooms_are_separate(self):
+        record_prompt_prefix(1, "Alice", "prefix")
+        _, changed = record_prompt_prefix(1, "Alice", "prefix v2")
+        _, other_room = record_prompt_prefix(2, "Alice", "prefix v2")
+
+        assert changed is False
+        assert other_room is False
+        assert get_prompt_cache_stats()["prefix_changed"] == 3
+
+
+class TestActionManagerPromptParts:
+    """Tests for the static/dynamic split of the Action Manager prompt."""
+
+    def _context(self, **overrides) -> ActionManagerContext:
+        values = dict(
+            lore="Ancient kingdom",
+            user_name="Traveler",
+            location_name="tavern",
+            location_display_name="Tavern",
+            location_description="A cozy tavern",
+            adjacent_locations=["square"],
+            player_stats={"hp": 10},
+            world_history="The war ended",
+            game_time={"hour": 9, "minute": 5, "day": 2},
+        )
+        values.update(overrides)
+        return ActionManagerContext(**values)
+
+    @pytest.mark.unit
+    def test_static_section_is_stable_across_turns(self):
+        builder = GameplayContextBuilder("world")
+
+        static_1, dynamic_1 = builder.build_action_manager_system_prompt_parts(self._context())
+        static_2, dynamic_2 = builder.build_action_manager_system_prompt_parts(
+            self._context(player_stats={"hp": 3}, game_time={"hour": 10, "minute": 0, "day": 2})
+        )
+
+        assert static_1 == static_2
+        assert "Ancient kingdom" in static_1 and "The war ended" in static_1
+        assert "09:05" in dynamic_1 and "10:00" in dynamic_2
+        assert "- hp: 3" in dynamic_2
+
+    @pytest.mark.unit
+    def test_suffix_puts_dynamic_tail_last(self):
+        suffix = GameplayContextBuilder("world").build_action_manager_system_prompt(self._context())
+
+        assert suffix.index("# World Lore") < suffix.index("# Current Time") < suffix.index("# Player Stats")
@@ -0,0 +1,130 @@
+"""
+Tests for the scripted control-protocol transport.
+
+These run a real ClaudeSDKClient against ScriptedTransport, so tool calls go
+through the SDK's mcp_message and hook_callback handling.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient, HookMatcher, create_sdk_mcp_server, tool
+from claude_agent_sdk.types import AssistantMessage, ResultMessage, StreamEvent, ToolResultBlock, UserMessage
+from domain.value_objects.task_identifier import TaskIdentifier
+from sdk.client import transports
+from sdk.client.scripted_transport import ScriptedTransport, TransportScript, scripted_transport_factory
+
+
+def _options(calls: list, partial: bool = True) -> ClaudeAgentOptions:
+    @tool("echo", "Echo text back", {"text": str})
+    async def echo(args):
+        calls.append(("tool", args["text"]))
+        return {"content": [{"type": "text", "text": f"echoed {args['text']}"}]}
+
+    async def hook(input_data, tool_use_id, _ctx):
+        calls.append((input_data["hook_event_name"], input_data.get("tool_name"), tool_use_id))
+        return {}
+
+    return ClaudeAgentOptions(
+        mcp_servers={"demo": create_sdk_mcp_server("demo", tools=[echo])},
+        include_partial_messages=partial,
+        hooks={
+            "UserPromptSubmit": [HookMatcher(matcher=None, hooks=[hook])],
+            "PreToolUse": [HookMatcher(matcher="mcp__demo__echo|Task", hooks=[hook])],
+            "PostToolUse": [HookMatcher(matcher="mcp__demo__.*", hooks=[hook])],
+            "SubagentStop": [HookMatcher(matcher=None, hooks=[hook])],
+        },
+    )
+
+
+async def _run(options: ClaudeAgentOptions, script: TransportScript, prompts: int = 1) -> list:
+    messages = []
+    async with ClaudeSDKClient(options=options, transport=ScriptedTransport(options, script)) as client:
+        for i in range(prompts):
+            await client.query(f"prompt {i}")
+            messages.extend([m async for m in client.receive_response()])
+    return messages
+
+
+class TestScriptedTransport:
+    """Tests for ScriptedTransport."""
+
+    @pytest.mark.unit
+    async def test_sdk_mcp_tool_runs_with_hooks(self):
+        calls = []
+        script = TransportScript(
+            turns=[
+                [
+                    {"type": "text", "text": "Looking around the square"},
+                    {"type": "tool_use", "name": "mcp__demo__echo", "input": {"text": "hi"}},
+                ]
+            ]
+        )
+
+        messages = await _run(_options(calls), script)
+
+        assert calls == [
+            ("UserPromptSubmit", None, None),
+            ("PreToolUse", "mcp__demo__echo", "toolu_scripted_1"),
+            ("tool", "hi"),
+            ("PostToolUse", "mcp__demo__echo", "toolu_scripted_1"),
+        ]
+        result_block = next(m for m in messages if isinstance(m, UserMessage)).content[0]
+        assert isinstance(result_block, ToolResultBlock)
+        assert result_block.content == [{"type": "text", "text": "echoed hi"}]
+        assert any(isinstance(m, StreamEvent) for m in messages)
+        result = messages[-1]
+        assert isinstance(result, ResultMessage) and not result.is_error
+        assert result.usage["output_tokens"] > 0
+
+    @pytest.mark.unit
+    async def test_other_tools_get_synthetic_results(self):
+        calls = []
+        script = TransportScript(
+            turns=[[{"type": "tool_use", "name": "Task", "input": {"subagent_type": "item_designer"}}]]
+        )
+
+        messages = await _run(_options(calls, partial=False), script)
+
+        assert [c[0] for c in calls] == ["UserPromptSubmit", "PreToolUse", "SubagentStop"]
+        assert not any(isinstance(m, StreamEvent) for m in messages)
+        tool_result = next(m for m in messages if isinstance(m, UserMessage)).content[0]
+        assert "Task completed" in tool_result.content[0]["text"]
+
+    @pytest.mark.unit
+    async def test_turns_cycle_per_query(self):
+        script = TransportScript(turns=[[{"type": "text", "text": "one"}], [{"type": "text", "text": "two"}]])
+
+        messages = await _run(_options([]), script, prompts=3)
+
+        texts = [m.content[0].text for m in messages if isinstance(m, AssistantMessage)]
+        assert texts == ["one", "two", "one"]
+        assert sum(isinstance(m, ResultMessage) for m in messages) == 3
+
+    @pytest.mark.unit
+    def test_script_round_trips_through_json(self, tmp_path):
+        script = TransportScript(turns=[[{"type": "think", "seconds": 0.5}]], tokens_per_second=40, think_time=1)
+        path = tmp_path / "script.json"
+        path.write_text(json.dumps(script.to_dict()))
+
+        assert TransportScript.load(path) == script
+
+
+class TestTransportFactoryOverride:
+    """Tests for set_transport_factory in build_transport."""
+
+    @pytest.mark.unit
+    def test_override_replaces_cli_transport(self):
+        script = TransportScript()
+        transports.set_transport_factory(scripted_transport_factory(script))
+        try:
+            with patch("infrastructure.logging.perf_logger.is_perf_logging_enabled", return_value=False):
+                transport = transports.build_transport(ClaudeAgentOptions(), TaskIdentifier(room_id=1, agent_id=2))
+            assert isinstance(transport, ScriptedTransport)
+
+            with patch("infrastructure.logging.perf_logger.is_perf_logging_enabled", return_value=True):
+                transport = transports.build_transport(ClaudeAgentOptions(), TaskIdentifier(room_id=1, agent_id=2))
+            assert isinstance(transport, transports.MetricsTransport)
+        finally:
+            transports.set_transport_factory(None)
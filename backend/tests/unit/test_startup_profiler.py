@@ -0,0 +1,90 @@
+"""
+Tests for the startup profiler.
+
+Covers import timing via the meta path finder (inclusive vs self time),
+startup step timing, and enabling via env var / --profile-startup flag.
+"""
+
+import sys
+
+import pytest
+from infrastructure.logging import startup_profiler
+from infrastructure.logging.startup_profiler import (
+    StartupProfiler,
+    is_startup_profiling_requested,
+    startup_step,
+)
+
+
+@pytest.fixture
+def module_dir(tmp_path, monkeypatch):
+    """A sys.path entry with a parent module that imports a slow child."""
+    (tmp_path / "sp_parent_mod.py").write_text("import sp_child_mod\n")
+    (tmp_path / "sp_child_mod.py").write_text("import time\ntime.sleep(0.02)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    for name in ("sp_parent_mod", "sp_child_mod"):
+        sys.modules.pop(name, None)
+
+
+class TestStartupProfiler:
+    """Tests for StartupProfiler."""
+
+    def test_times_imports_with_self_and_inclusive(self, module_dir):
+        profiler = StartupProfiler()
+        profiler.install()
+        try:
+            import sp_parent_mod  # noqa: F401
+        finally:
+            profiler.finish()
+
+        parent = profiler.modules["sp_parent_mod"]
+        child = profiler.modules["sp_child_mod"]
+        assert child.inclusive_ms >= 15
+        assert parent.inclusive_ms >= child.inclusive_ms
+        # The child's sleep is not counted against the parent's self time
+        assert parent.self_ms < child.inclusive_ms
+
+    def test_finish_removes_finder(self, module_dir):
+        profiler = StartupProfiler()
+        profiler.install()
+        profiler.finish()
+
+        import sp_parent_mod  # noqa: F401
+
+        assert profiler.modules == {}
+        assert not any(isinstance(f, startup_profiler._TimingFinder) for f in sys.meta_path)
+
+    def test_steps_and_report(self, module_dir):
+        profiler = StartupProfiler()
+        profiler.install()
+        with profiler.step("init_db"):
+            import sp_parent_mod  # noqa: F401
+        profiler.finish()
+
+        report = profiler.get_report()
+        assert report["complete"] is True
+        assert [s["name"] for s in report["steps"]] == ["init_db"]
+        assert {p["name"] for p in report["packages"]} >= {"sp_parent_mod", "sp_child_mod"}
+        assert "init_db" in profiler.format_report()
+
+    def test_startup_step_is_noop_when_disabled(self, monkeypatch):
+        monkeypatch.setattr(startup_profiler, "_profiler", None)
+
+        with startup_step("anything"):
+            pass
+
+        assert startup_profiler.get_startup_profiler() is None
+
+
+class TestProfilingRequested:
+    """Tests for enabling the profiler."""
+
+    def test_flag(self, monkeypatch):
+        monkeypatch.delenv("PROFILE_STARTUP", raising=False)
+        assert is_startup_profiling_requested(["launcher.py", "--profile-startup"])
+        assert not is_startup_profiling_requested(["launcher.py"])
+
+    def test_env_var(self, monkeypatch):
+        monkeypatch.setenv("PROFILE_STARTUP", "true")
+        assert is_startup_profiling_requested([])
@@ -0,0 +1,212 @@
+"""
+Unit tests for the designer sub-agent result cache.
+"""
+
+import pytest
+from domain.entities.world_models import LocationConfig
+from sdk.agent.hooks import create_pre_task_subagent_hook
+from services import subagent_cache
+from services.subagent_cache import (
+    ITEMS,
+    LOCATIONS,
+    SubagentResultCache,
+    design_target,
+    normalize_prompt,
+    tool_response_text,
+)
+
+
+def _location(name: str, is_draft: bool) -> LocationConfig:
+    return LocationConfig(
+        name=name,
+        display_name=name.replace("_", " ").title(),
+        label=None,
+        position=(0, 0),
+        is_discovered=True,
+        description=f"# {name}\n\nSalt and tar.",
+        is_draft=is_draft,
+    )
+
+
+@pytest.fixture
+def world_state(monkeypatch):
+    """Item templates and locations of a fake world, without touching disk."""
+    monkeypatch.setattr(
+        subagent_cache.ItemService,
+        "load_all_item_templates",
+        classmethod(lambda cls, world: {"rusty_key": {"name": "Rusty Key"}}),
+    )
+    monkeypatch.setattr(
+        subagent_cache.LocationStorage,
+        "load_all_locations",
+        classmethod(
+            lambda cls, world: {
+                "harbor": _location("harbor", is_draft=False),
+                "smugglers_cove": _location("smugglers_cove", is_draft=True),
+            }
+        ),
+    )
+
+
+class TestSubagentCacheLookup:
+    """Tests for hits against existing world state and memoized results."""
+
+    @pytest.mark.unit
+    def test_existing_item_template_by_id_or_name(self, world_state):
+        cache = SubagentResultCache()
+
+        by_id = cache.lookup("w", "item_designer", 'Create item "rusty_key" for the cellar')
+        by_name = cache.lookup("w", "item_designer", "Design the “Rusty Key” please")
+
+        assert by_id.source == "existing" and "item_id 'rusty_key'" in by_id.result
+        assert by_name is not None and by_name.source == "existing"
+        assert cache.lookup("w", "item_designer", 'Create item "golden_key"') is None
+
+    @pytest.mark.unit
+    def test_only_enriched_locations_hit(self, world_state):
+        cache = SubagentResultCache()
+
+        hit = cache.lookup("w", "location_designer", 'Create location "Harbor"')
+
+        assert hit.source == "existing" and "Salt and tar." in hit.result
+        assert cache.lookup("w", "location_designer", 'Enrich location "smugglers_cove"') is None
+
+    @pytest.mark.unit
+    def test_only_the_design_target_hits(self, world_state):
+        cache = SubagentResultCache()
+
+        # The prompt shape the Action Manager is told to use quotes the adjacent location too
+        adjacent = 'Create location "smugglers_cove" — a hidden cove adjacent to "harbor".'
+        assert cache.lookup("w", "location_designer", adjacent) is None
+        assert cache.lookup("w", "location_designer", 'Create location "lighthouse" near "harbor"') is None
+        assert cache.lookup("w", "item_designer", 'Create item "golden_key" that opens the "rusty_key" lock') is None
+
+        hit = cache.lookup("w", "location_designer", 'Describe "harbor" as seen from "smugglers_cove"')
+        assert hit is not None and "'harbor'" in hit.result
+
+    @pytest.mark.unit
+    def test_request_for_something_new_skips_existing(self, world_state):
+        cache = SubagentResultCache()
+
+        assert cache.lookup("w", "item_designer", 'Create a new item "Rusty Key", rustier than the last') is None
+        assert cache.lookup("w", "location_designer", 'Create another location "harbor" up the coast') is None
+
+    @pytest.mark.unit
+    def test_memo_hit_until_version_bump(self, world_state):
+        cache = SubagentResultCache()
+        prompt = "Create a new item: a glowing mushroom."
+        cache.store("w", "item_designer", prompt, "Created glowing_mushroom")
+
+        hit = cache.lookup("w", "item_designer", "create a NEW item  a glowing mushroom")
+        assert hit.source == "memo" and hit.result.endswith("Created glowing_mushroom")
+        assert cache.lookup("other", "item_designer", prompt) is None
+
+        cache.bump("w", ITEMS)
+        assert cache.lookup("w", "item_designer", prompt) is None
+        # A location change doesn't invalidate item results
+        cache.store("w", "item_designer", prompt, "Created glowing_mushroom")
+        cache.bump("w", LOCATIONS)
+        assert cache.lookup("w", "item_designer", prompt) is not None
+
+    @pytest.mark.unit
+    def test_memo_expires_after_ttl(self, world_state):
+        cache = SubagentResultCache(ttl_seconds=0.0)
+        cache.store("w", "item_designer", "a mushroom", "Created mushroom")
+
+        assert cache.lookup("w", "item_designer", "a mushroom") is None
+        assert cache.get_stats()["size"] == 0
+
+    @pytest.mark.unit
+    def test_character_results_are_not_memoized(self, world_state):
+        cache = SubagentResultCache()
+        cache.store("w", "character_designer", "a city guard", "Created Guard")
+
+        assert cache.get_stats()["size"] == 0
+
+    @pytest.mark.unit
+    def test_disabled_and_non_designer_lookups_are_ignored(self, world_state):
+        assert SubagentResultCache(enabled=False).lookup("w", "item_designer", '"rusty_key"') is None
+        cache = SubagentResultCache()
+        assert cache.lookup("w", "general-purpose", '"rusty_key"') is None
+        assert cache.get_stats()["lookups"] == 0
+
+    @pytest.mark.unit
+    def test_clear_world(self, world_state):
+        cache = SubagentResultCache()
+        cache.store("w", "item_designer", "a mushroom", "Created mushroom")
+        cache.bump("w", ITEMS)
+        cache.store("w", "item_designer", "a mushroom", "Created mushroom")
+
+        cache.clear_world("w")
+
+        assert cache.get_stats()["size"] == 0
+        assert cache.version("w", ITEMS) == 0
+
+
+class TestSubagentCacheStats:
+    """Tests for hit rate reporting."""
+
+    @pytest.mark.unit
+    def test_hit_rates_overall_and_per_type(self, world_state):
+        cache = SubagentResultCache()
+        cache.lookup("w", "item_designer", '"rusty_key"')
+        cache.lookup("w", "item_designer", "something new")
+        cache.lookup("w", "location_designer", "somewhere new")
+
+        stats = cache.get_stats()
+
+        assert stats["lookups"] == 3 and stats["hits"] == 1
+        assert stats["hit_rate"] == 33.33
+        assert stats["subagents"]["item_designer"]["hit_rate"] == 50.0
+        assert stats["subagents"]["item_designer"]["hits_existing"] == 1
+        assert stats["subagents"]["location_designer"]["misses"] == 1
+
+
+class TestHelpers:
+    """Tests for prompt normalization and tool response parsing."""
+
+    @pytest.mark.unit
+    def test_design_target(self):
+        assert design_target('Create location "smugglers_cove" adjacent to "harbor"') == "smugglers_cove"
+        assert design_target('Near "harbor", create the “Old Pier”') == "Old Pier"
+        assert design_target('Give "harbor" more detail') == "harbor"
+        assert design_target('Create a new character "City Guard"') is None
+        assert design_target("Create a gruff blacksmith") is None
+
+    @pytest.mark.unit
+    def test_normalize_prompt(self):
+        assert normalize_prompt('  Create:  a "Rusty Key"!\n') == 'create a "rusty key"'
+
+    @pytest.mark.unit
+    def test_tool_response_text(self):
+        assert tool_response_text("done") == "done"
+        blocks = [{"type": "text", "text": "a"}, {"type": "image"}, {"type": "text", "text": "b"}]
+        assert tool_response_text(blocks) == "a\nb"
+        assert tool_response_text({"content": [{"type": "text", "text": "c"}]}) == "c"
+        assert tool_response_text(None) == ""
+
+
+class TestPreTaskHook:
+    """Tests for the PreToolUse hook short-circuiting cached Tasks."""
+
+    @pytest.mark.unit
+    async def test_cache_hit_denies_task_with_result(self, world_state, monkeypatch):
+        monkeypatch.setattr(subagent_cache, "_subagent_cache", SubagentResultCache())
+
+        class Context:
+            agent_name = "Action_Manager"
+            room_id = 1
+            world_id = 1
+            world_name = "w"
+
+        hook = create_pre_task_subagent_hook(Context())
+        tool_input = {"subagent_type": "item_designer", "prompt": 'Create "rusty_key"'}
+
+        output = await hook({"tool_name": "Task", "tool_input": tool_input}, "toolu_1", {})
+
+        decision = output["hookSpecificOutput"]
+        assert decision["permissionDecision"] == "deny"
+        assert "rusty_key" in decision["permissionDecisionReason"]
+
+        tool_input["prompt"] = 'Create "golden_key"'
+        assert await hook({"tool_name": "Task", "tool_input": tool_input}, "toolu_2", {}) == {"continue_": True}
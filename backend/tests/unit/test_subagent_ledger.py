@@ -0,0 +1,196 @@
+"""
+Unit tests for the per-turn sub-agent ledger and sub-agent stats.
+"""
+
+import pytest
+from infrastructure.logging import tracing
+from infrastructure.logging.tracing import Tracer
+from sdk.agent import subagent_ledger
+from sdk.agent.hooks import build_hooks
+from sdk.agent.subagent_ledger import SubagentLedger, SubagentStats, task_usage
+
+
+class FakeTime:
+    """Stands in for the time module inside the ledger."""
+
+    now = 100.0
+
+    @classmethod
+    def perf_counter(cls) -> float:
+        return cls.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    monkeypatch.setattr(FakeTime, "now", 100.0)
+    monkeypatch.setattr(subagent_ledger, "time", FakeTime)
+    return FakeTime
+
+
+@pytest.fixture
+def stats(monkeypatch):
+    stats = SubagentStats()
+    monkeypatch.setattr(subagent_ledger, "_subagent_stats", stats)
+    return stats
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    tracer = Tracer(enabled=True)
+    monkeypatch.setattr(tracing, "_tracer", tracer)
+    return tracer
+
+
+def _by_id(ledger: SubagentLedger) -> dict:
+    return {run["tool_use_id"]: run for run in ledger.runs()}
+
+
+class TestSubagentLedger:
+    """Tests for matching sub-agent events to Task calls."""
+
+    @pytest.mark.unit
+    def test_concurrent_runs_of_one_type_keep_their_own_timings(self, clock, stats):
+        ledger = SubagentLedger("Action_Manager", room_id=1)
+        ledger.begin_turn()
+        ledger.task_requested("toolu_a", "location_designer", background=False)
+        ledger.task_requested("toolu_b", "location_designer", background=False)
+        clock.now = 101.0
+        ledger.subagent_started("agent_a", "location_designer")
+        clock.now = 102.0
+        ledger.subagent_started("agent_b", "location_designer")
+        clock.now = 103.0
+        ledger.subagent_stopped("agent_b", "location_designer")
+        ledger.task_finished("toolu_b", {"content": []}, "b done")
+        clock.now = 110.0
+        ledger.subagent_stopped("agent_a", "location_designer")
+        ledger.task_finished("toolu_a", {"content": []}, "a result")
+
+        runs = _by_id(ledger)
+        assert (runs["toolu_a"]["agent_id"], runs["toolu_b"]["agent_id"]) == ("agent_a", "agent_b")
+        assert (runs["toolu_a"]["queue_ms"], runs["toolu_a"]["run_ms"]) == (1000.0, 9000.0)
+        assert (runs["toolu_b"]["queue_ms"], runs["toolu_b"]["run_ms"]) == (2000.0, 1000.0)
+        assert runs["toolu_a"]["result_chars"] == len("a result")
+        assert stats.get_stats()["location_designer"]["runs"] == 2
+
+    @pytest.mark.unit
+    def test_tool_calls_are_attributed_by_agent_id(self, clock, stats, tracer):
+        ledger = SubagentLedger("Action_Manager", room_id=1)
+        ledger.task_requested("toolu_a", "item_designer", background=False)
+        ledger.task_requested("toolu_b", "location_designer", background=False)
+        ledger.subagent_started("agent_a", "item_designer")
+        ledger.subagent_started("agent_b", "location_designer")
+
+        ledger.tool_started("agent_b", "toolu_b1", "persist_location_design")
+        ledger.tool_started("agent_a", "toolu_a1", "persist_item_design")
+        clock.now = 100.5
+        ledger.tool_finished("agent_a", "toolu_a1")
+        clock.now = 102.0
+        ledger.tool_finished("agent_b", "toolu_b1")
+        ledger.tool_finished("agent_b", "toolu_unknown")
+
+        runs = _by_id(ledger)
+        assert runs["toolu_a"]["tool_ms"] == {"persist_item_design": 500.0}
+        assert runs["toolu_b"]["tool_ms"] == {"persist_location_design": 2000.0}
+
+        run = ledger._runs["toolu_b"]
+        ledger.subagent_stopped("agent_b", "location_designer")
+        ledger.task_finished("toolu_b", None, "ok")
+        spans = {s.name: s for s in tracer._traces[run.span.trace_id].spans}
+        assert spans["subagent_run"].parent_id == run.span.span_id
+        assert spans["subagent_tool:persist_location_design"].parent_id == spans["subagent_run"].span_id
+        assert spans["subagent:location_designer"].attrs["tool_calls"] == 1
+
+    @pytest.mark.unit
+    def test_new_turn_abandons_unfinished_foreground_runs(self, clock, stats):
+        ledger = SubagentLedger("Action_Manager", room_id=1)
+        ledger.begin_turn()
+        ledger.task_requested("toolu_a", "character_designer", background=False)
+        ledger.subagent_started("agent_a", "character_designer")
+
+        ledger.begin_turn()
+
+        assert ledger.runs() == []
+        entry = stats.get_stats()["character_designer"]
+        assert (entry["runs"], entry["abandoned"]) == (1, 1)
+        assert entry["run"] == {"count": 0}
+        # A late stop for the abandoned run no longer matches anything
+        assert ledger.subagent_stopped("agent_a", "character_designer") is None
+
+    @pytest.mark.unit
+    def test_background_run_finishes_at_subagent_stop(self, clock, stats):
+        ledger = SubagentLedger("Action_Manager", room_id=1)
+        ledger.task_requested("toolu_a", "item_designer", background=True)
+        ledger.task_finished("toolu_a", {"status": "async_launched"}, "launched")
+        assert not ledger._runs["toolu_a"].finished
+
+        ledger.begin_turn()  # background runs survive the turn boundary
+        ledger.subagent_started("agent_a", "item_designer")
+        clock.now = 104.0
+        ledger.subagent_stopped("agent_a", "item_designer")
+
+        entry = stats.get_stats()["item_designer"]
+        assert (entry["runs"], entry["background"]) == (1, 1)
+        assert entry["total"]["max_ms"] == pytest.approx(4000.0, rel=0.05)
+
+    @pytest.mark.unit
+    def test_task_usage(self):
+        response = {
+            "content": [],
+            "totalTokens": 1500,
+            "usage": {"input_tokens": 1000, "output_tokens": 200, "cache_read_input_tokens": 300},
+        }
+
+        usage = task_usage(response)
+
+        assert usage["input_tokens"] == 1000 and usage["cache_creation_input_tokens"] == 0
+        assert usage["total_tokens"] == 1500
+        assert task_usage("text") == {}
+
+
+class TestSubagentHooks:
+    """Tests for the sub-agent hooks sharing one ledger."""
+
+    class Context:
+        agent_name = "Action_Manager"
+        room_id = 1
+        world_id = 1
+        world_name = "w"
+
+    @staticmethod
+    async def _fire(hooks: dict, event: str, input_data: dict, tool_use_id=None) -> None:
+        for matcher in hooks[event]:
+            if matcher.matcher in (None, input_data.get("tool_name")):
+                for hook in matcher.hooks:
+                    await hook({"hook_event_name": event, **input_data}, tool_use_id, {})
+
+    @pytest.mark.unit
+    async def test_task_lifecycle_through_hooks(self, clock, stats, monkeypatch):
+        monkeypatch.setattr("sdk.agent.hooks.get_subagent_cache", lambda: _NoCache())
+        hooks = build_hooks(self.Context())
+        task = {"tool_name": "Task", "tool_input": {"subagent_type": "item_designer", "prompt": "Create a key"}}
+        inner = {"tool_name": "mcp__subagent__persist_item_design", "tool_input": {}, "agent_id": "agent_a"}
+
+        await self._fire(hooks, "UserPromptSubmit", {"prompt": "open the door"})
+        await self._fire(hooks, "PreToolUse", task, "toolu_a")
+        clock.now = 101.0
+        await self._fire(hooks, "SubagentStart", {"agent_id": "agent_a", "agent_type": "item_designer"})
+        await self._fire(hooks, "PreToolUse", inner, "toolu_inner")
+        clock.now = 102.0
+        await self._fire(hooks, "PostToolUse", {**inner, "tool_response": "saved"}, "toolu_inner")
+        await self._fire(hooks, "SubagentStop", {"agent_id": "agent_a", "agent_type": "item_designer"})
+        response = {"content": [{"type": "text", "text": "Rusty key"}], "usage": {"output_tokens": 40}}
+        await self._fire(hooks, "PostToolUse", {**task, "tool_response": response}, "toolu_a")
+
+        entry = stats.get_stats()["item_designer"]
+        assert (entry["runs"], entry["tool_calls"], entry["output_tokens"]) == (1, 1, 40)
+        assert entry["result_chars"] == len("Rusty key")
+        assert entry["queue"]["count"] == 1
+        assert "mcp__subagent__persist_item_design" in entry["tools"]
+
+
+class _NoCache:
+    def lookup(self, *_args):
+        return None
+
+    def store(self, *_args):
+        pass
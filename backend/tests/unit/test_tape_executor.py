@@ -0,0 +1,143 @@
+"""
+Tests for TapeExecutor concurrent cells and the chat mode tape builder.
+
+Agent responses are replaced with timed fakes so these tests measure only the
+executor's scheduling: fan-out limit, per-cell timeout and result ordering.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from domain.value_objects.contexts import OrchestrationContext
+from orchestration.chat_mode_orchestrator import create_chat_mode_tape
+from orchestration.tape import TapeExecutor
+from orchestration.tape.models import CellType, TurnCell
+
+
+def _agents(delays: dict) -> list:
+    return [SimpleNamespace(id=agent_id, name=f"npc_{agent_id}") for agent_id in delays]
+
+
+def _executor(delays: dict, running: list, **kwargs) -> TapeExecutor:
+    """Executor whose agents each take delays[agent.id] seconds and react with their name."""
+    active = 0
+
+    async def generate_response(orch_context, agent, user_message_content, hidden):
+        nonlocal active
+        active += 1
+        running.append(active)
+        try:
+            await asyncio.sleep(delays[agent.id])
+        finally:
+            active -= 1
+        return True, agent.name
+
+    response_generator = Mock()
+    response_generator.generate_response = generate_response
+    agents = _agents(delays)
+    return TapeExecutor(response_generator, {a.id: a for a in agents}, **kwargs)
+
+
+def _context() -> OrchestrationContext:
+    return OrchestrationContext(db=Mock(), room_id=1, agent_manager=Mock())
+
+
+def _reaction_cell(agent_ids: list) -> TurnCell:
+    return TurnCell(cell_type=CellType.CONCURRENT, agent_ids=agent_ids, hidden=True, is_reaction=True)
+
+
+class TestConcurrentCells:
+    """Tests for TapeExecutor._execute_concurrent."""
+
+    @pytest.mark.unit
+    async def test_wall_time_tracks_slowest_agent(self):
+        delays = {1: 0.05, 2: 0.1, 3: 0.05}
+        executor = _executor(delays, [], max_concurrent_agents=3)
+        agents = _agents(delays)
+
+        start = time.perf_counter()
+        result = await executor._execute_concurrent(agents, _context(), "hello", _reaction_cell([1, 2, 3]))
+        elapsed = time.perf_counter() - start
+
+        assert result.responses == 3
+        assert elapsed < sum(delays.values()) * 0.8
+
+    @pytest.mark.unit
+    async def test_reactions_follow_cell_order_not_completion_order(self):
+        delays = {1: 0.06, 2: 0.0, 3: 0.03}
+        executor = _executor(delays, [], max_concurrent_agents=3)
+
+        result = await executor._execute_concurrent(_agents(delays), _context(), None, _reaction_cell([1, 2, 3]))
+
+        assert [r["agent_name"] for r in result.reactions] == ["npc_1", "npc_2", "npc_3"]
+
+    @pytest.mark.unit
+    async def test_fan_out_limit(self):
+        delays = {i: 0.02 for i in range(1, 7)}
+        running = []
+        executor = _executor(delays, running, max_concurrent_agents=2)
+
+        result = await executor._execute_concurrent(_agents(delays), _context(), None, _reaction_cell(list(delays)))
+
+        assert result.responses == 6
+        assert max(running) == 2
+
+    @pytest.mark.unit
+    async def test_cell_timeout_cancels_stragglers(self):
+        delays = {1: 0.0, 2: 10.0}
+        executor = _executor(delays, [], max_concurrent_agents=2, cell_timeout=0.05)
+
+        result = await asyncio.wait_for(
+            executor._execute_concurrent(_agents(delays), _context(), None, _reaction_cell([1, 2])),
+            timeout=2,
+        )
+
+        assert result.responses == 1
+        assert result.skips == 0
+        assert [r["agent_name"] for r in result.reactions] == ["npc_1"]
+
+    @pytest.mark.unit
+    async def test_agents_get_their_own_db_session(self):
+        sessions = []
+
+        async def generate_response(orch_context, agent, user_message_content, hidden):
+            sessions.append(orch_context.db)
+            return True
+
+        response_generator = Mock()
+        response_generator.generate_response = generate_response
+        agents = _agents({1: 0, 2: 0})
+        executor = TapeExecutor(response_generator, {a.id: a for a in agents})
+        context = _context()
+
+        await executor._execute_concurrent(agents, context, None, TurnCell(CellType.CONCURRENT, [1, 2]))
+
+        assert len(set(map(id, sessions))) == 2
+        assert context.db not in sessions
+
+
+class TestChatModeTape:
+    """Tests for create_chat_mode_tape."""
+
+    @staticmethod
+    def _npc(agent_id: int, priority: int = 0, interrupt: bool = False):
+        return SimpleNamespace(id=agent_id, priority=priority, interrupt_every_turn=interrupt)
+
+    @pytest.mark.unit
+    def test_sequential_by_default(self):
+        tape = create_chat_mode_tape([self._npc(1), self._npc(2, priority=5)])
+
+        assert [c.cell_type for c in tape.cells] == [CellType.SEQUENTIAL, CellType.SEQUENTIAL]
+        assert [c.agent_ids for c in tape.cells] == [[2], [1]]
+
+    @pytest.mark.unit
+    def test_parallel_groups_regular_npcs(self):
+        npcs = [self._npc(1), self._npc(2, priority=5), self._npc(3, interrupt=True)]
+        tape = create_chat_mode_tape(npcs, parallel=True)
+
+        assert [c.cell_type for c in tape.cells] == [CellType.CONCURRENT, CellType.INTERRUPT]
+        assert tape.cells[0].agent_ids == [2, 1]
+        assert tape.cells[0].is_concurrent
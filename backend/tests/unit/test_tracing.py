@@ -0,0 +1,116 @@
+"""
+Tests for hierarchical trace spans and the Chrome trace export.
+"""
+
+import asyncio
+import json
+
+import pytest
+from infrastructure.logging import tracing
+from infrastructure.logging.perf_logger import track_perf
+from infrastructure.logging.tracing import Tracer
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    tracer = Tracer(enabled=True)
+    monkeypatch.setattr(tracing, "_tracer", tracer)
+    return tracer
+
+
+def _spans(tracer: Tracer, trace_id: int) -> dict:
+    events = tracer.export_chrome_trace(trace_ids=[trace_id])["traceEvents"]
+    return {e["name"]: e for e in events if e["ph"] == "X"}
+
+
+class TestTracer:
+    """Tests for Tracer."""
+
+    @pytest.mark.unit
+    def test_disabled_tracer_records_nothing(self):
+        tracer = Tracer(enabled=False)
+
+        with tracer.span("turn", room_id=1) as span:
+            assert span is None
+        assert tracer.start_span("tool") is None
+        assert tracer.list_traces() == []
+
+    @pytest.mark.unit
+    async def test_spans_nest_across_tasks_and_inherit_attributes(self, tracer):
+        async def cell(agent_name):
+            with tracer.span("sdk_query", agent_name=agent_name):
+                await asyncio.sleep(0)
+
+        with tracer.span("turn", room_id=5, world_id=2, turn=3) as turn:
+            with tracer.span("cell:concurrent") as cell_span:
+                await asyncio.gather(cell("Innkeeper"), cell("Guard"))
+
+        spans = tracer._traces[turn.trace_id].spans
+        queries = [s for s in spans if s.name == "sdk_query"]
+        assert len(queries) == 2
+        assert all(q.parent_id == cell_span.span_id for q in queries)
+        assert all(q.attrs["room_id"] == 5 and q.attrs["world_id"] == 2 for q in queries)
+        assert {q.attrs["agent_name"] for q in queries} == {"Innkeeper", "Guard"}
+        assert cell_span.parent_id == turn.span_id
+
+    @pytest.mark.unit
+    async def test_callbacks_outside_the_context_attach_to_anchor(self, tracer):
+        query_started = asyncio.Event()
+        tool_done = asyncio.Event()
+
+        async def reader_task():
+            # Like the SDK client's reader task: created before the turn
+            await query_started.wait()
+            with tracer.span("tool:travel", room_id=5, agent_name="Action_Manager"):
+                pass
+            tool_done.set()
+
+        reader = asyncio.create_task(reader_task())
+        with tracer.span("turn", room_id=5) as turn:
+            with tracer.span("sdk_query", anchor=True, agent_name="Action_Manager") as query:
+                query_started.set()
+                await tool_done.wait()
+        await reader
+
+        tool = next(s for s in tracer._traces[turn.trace_id].spans if s.name == "tool:travel")
+        assert tool.parent_id == query.span_id
+        assert tracer._anchors == {}
+
+    @pytest.mark.unit
+    async def test_track_perf_records_tool_span(self, tracer):
+        @track_perf("tool:list_inventory", room_id=lambda: 5, agent_name=lambda: "Action_Manager")
+        async def list_inventory():
+            return "ok"
+
+        with tracer.span("turn", room_id=5) as turn:
+            assert await list_inventory() == "ok"
+
+        assert "tool:list_inventory" in _spans(tracer, turn.trace_id)
+
+    @pytest.mark.unit
+    def test_chrome_trace_export(self, tracer):
+        with tracer.span("turn", room_id=5, world_id=2) as turn:
+            with tracer.span("cell:sequential"):
+                pass
+        with tracer.span("turn", room_id=6, world_id=3):
+            pass
+
+        export = tracer.export_chrome_trace(world_id=2)
+        json.dumps(export)  # Must be serializable as-is
+
+        events = export["traceEvents"]
+        assert {e["pid"] for e in events} == {turn.trace_id}
+        spans = {e["name"]: e for e in events if e["ph"] == "X"}
+        assert spans["cell:sequential"]["args"]["parent_id"] == turn.span_id
+        assert spans["turn"]["dur"] >= spans["cell:sequential"]["dur"]
+        assert any(e["ph"] == "M" and e["name"] == "process_name" for e in events)
+
+    @pytest.mark.unit
+    def test_trace_retention_is_bounded(self):
+        tracer = Tracer(enabled=True, max_traces=3)
+
+        for room_id in range(5):
+            with tracer.span("turn", room_id=room_id):
+                pass
+
+        assert [t["room_id"] for t in tracer.list_traces()] == [4, 3, 2]
@@ -0,0 +1,210 @@
+"""
+Tests for replaying JSONL transport logs through ScriptedTransport.
+"""
+
+import json
+
+import pytest
+from benchmarks.replay import compare, recorded_servers
+from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient, HookMatcher, create_sdk_mcp_server, tool
+from claude_agent_sdk.types import AssistantMessage, ResultMessage
+from sdk.client.scripted_transport import ScriptedTransport, load_transport_log
+
+
+def _write(f, ts: str, **event) -> None:
+    f.write(json.dumps({"ts": f"2026-01-05T10:00:{ts}", **event}) + "\n")
+
+
+def _control_request(request_id: str, request: dict) -> dict:
+    return {"type": "control_request", "request_id": request_id, "request": request}
+
+
+@pytest.fixture
+def transport_log(tmp_path):
+    """A log of one Action-Manager-like turn: hook, tool call, text, result."""
+    path = tmp_path / "transport_room1_agent2_20260105.jsonl"
+    initialize = _control_request(
+        "req_1",
+        {
+            "subtype": "initialize",
+            "hooks": {
+                "UserPromptSubmit": [{"matcher": None, "hookCallbackIds": ["hook_0"]}],
+                "PreToolUse": [{"matcher": "mcp__demo__.*", "hookCallbackIds": ["hook_1"]}],
+            },
+        },
+    )
+    tool_call = {
+        "subtype": "mcp_message",
+        "server_name": "demo",
+        "message": {
+            "jsonrpc": "2.0",
+            "id": 7,
+            "method": "tools/call",
+            "params": {"name": "echo", "arguments": {"text": "hi"}},
+        },
+    }
+    with open(path, "w") as f:
+        _write(f, "00.000", event="connect")
+        _write(f, "00.001", direction="write", payload=json.dumps(initialize))
+        _write(f, "00.002", direction="read", message={"type": "control_response", "response": {"request_id": "req_1"}})
+        _write(
+            f,
+            "00.010",
+            direction="write",
+            payload=json.dumps({"type": "user", "message": {"role": "user", "content": "x" * 20}})[:30]
+            + "…(truncated)",
+        )
+        _write(f, "00.020", direction="read", message={"type": "system", "subtype": "init", "session_id": "old"})
+        hook = {
+            "subtype": "hook_callback",
+            "callback_id": "hook_1",
+            "input": {"hook_event_name": "PreToolUse", "tool_name": "mcp__demo__echo"},
+            "tool_use_id": "toolu_1",
+        }
+        _write(f, "00.030", direction="read", message=_control_request("cli_1", hook))
+        _write(f, "00.530", direction="read", message=_control_request("cli_2", tool_call))
+        _write(f, "00.540", direction="write", payload='{"type": "control_response", "response": {}}')
+        assistant = {
+            "type": "assistant",
+            "message": {"role": "assistant", "model": "m", "content": [{"type": "text", "text": "done"}]},
+            "parent_tool_use_id": None,
+            "session_id": "old",
+        }
+        _write(f, "00.600", direction="read", message=assistant)
+        result = {
+            "type": "result",
+            "subtype": "success",
+            "duration_ms": 600,
+            "duration_api_ms": 500,
+            "is_error": False,
+            "num_turns": 2,
+            "session_id": "old",
+            "total_cost_usd": 0.01,
+        }
+        _write(f, "00.610", direction="read", message=result)
+        _write(f, "01.000", event="close")
+    return path
+
+
+def _options(calls: list) -> ClaudeAgentOptions:
+    @tool("echo", "Echo text back", {"text": str})
+    async def echo(args):
+        calls.append(("tool", args["text"]))
+        return {"content": [{"type": "text", "text": f"echoed {args['text']}"}]}
+
+    async def hook(input_data, tool_use_id, _ctx):
+        calls.append((input_data["hook_event_name"], tool_use_id))
+        return {}
+
+    async def other(input_data, tool_use_id, _ctx):
+        calls.append(("other", tool_use_id))
+        return {}
+
+    # Registered in a different order than recorded, so callback ids differ
+    return ClaudeAgentOptions(
+        mcp_servers={"demo": create_sdk_mcp_server("demo", tools=[echo])},
+        hooks={
+            "PreToolUse": [HookMatcher(matcher="mcp__demo__.*", hooks=[hook])],
+            "UserPromptSubmit": [HookMatcher(matcher=None, hooks=[other])],
+        },
+    )
+
+
+class TestLoadTransportLog:
+    """Tests for load_transport_log."""
+
+    @pytest.mark.unit
+    def test_turns_from_user_writes(self, transport_log):
+        script = load_transport_log(transport_log)
+
+        assert script.recorded
+        assert len(script.turns) == 1
+        steps = script.turns[0]
+        assert [s["type"] for s in steps] == ["message", "control_request", "control_request", "message", "message"]
+        assert steps[1]["hook"] == {"event": "PreToolUse", "matcher": "mcp__demo__.*", "index": 0}
+        assert "hook" not in steps[2]
+        assert recorded_servers(script) == ["demo"]
+
+    @pytest.mark.unit
+    def test_keep_timing_inserts_recorded_gaps(self, transport_log):
+        steps = load_transport_log(transport_log, keep_timing=True).turns[0]
+
+        thinks = [s["seconds"] for s in steps if s["type"] == "think"]
+        assert thinks[0] == pytest.approx(0.01)
+        assert 0.5 in thinks
+
+    @pytest.mark.unit
+    def test_log_without_reads_is_rejected(self, tmp_path):
+        path = tmp_path / "writes_only.jsonl"
+        with open(path, "w") as f:
+            _write(f, "00.000", direction="write", payload='{"type": "user", "message": {}}')
+
+        with pytest.raises(ValueError, match="include_reads"):
+            load_transport_log(path)
+
+    @pytest.mark.unit
+    async def test_replay_runs_tools_and_retargets_hooks(self, transport_log):
+        calls = []
+        options = _options(calls)
+        transport = ScriptedTransport(options, load_transport_log(transport_log))
+
+        async with ClaudeSDKClient(options=options, transport=transport) as client:
+            await client.query("replayed prompt")
+            messages = [m async for m in client.receive_response()]
+
+        assert calls == [("PreToolUse", "toolu_1"), ("tool", "hi")]
+        assert transport.tool_calls == [
+            {
+                "server": "demo",
+                "tool": "echo",
+                "arguments": {"text": "hi"},
+                "content": [{"type": "text", "text": "echoed hi"}],
+                "is_error": False,
+            }
+        ]
+        assert [m.content[0].text for m in messages if isinstance(m, AssistantMessage)] == ["done"]
+        results = [m for m in messages if isinstance(m, ResultMessage)]
+        assert len(results) == 1 and results[0].duration_ms == 600
+        assert results[0].session_id == transport.session_id
+
+
+class TestCompare:
+    """Tests for comparing a replay with a fixture's expectations."""
+
+    @pytest.mark.unit
+    def test_matching_observation_has_no_diffs(self):
+        observed = {
+            "tool_calls": [{"server": "am", "tool": "narration", "arguments": {}, "content": [], "is_error": False}],
+            "db_writes": {"INSERT messages": 2},
+            "sse_events": {"stream_start": 1},
+            "messages": [[{"role": "assistant", "content": "hi"}]],
+        }
+
+        assert compare(observed, json.loads(json.dumps(observed))) == []
+
+    @pytest.mark.unit
+    def test_reports_each_difference(self):
+        expected = {
+            "tool_calls": [
+                {"server": "am", "tool": "narration", "arguments": {"n": 1}, "content": [], "is_error": False}
+            ],
+            "db_writes": {"INSERT messages": 2},
+            "sse_events": {},
+            "messages": [[{"role": "assistant", "content": "hi"}]],
+        }
+        observed = {
+            "tool_calls": [
+                {"server": "am", "tool": "narration", "arguments": {"n": 1}, "content": [], "is_error": True}
+            ],
+            "db_writes": {"INSERT messages": 3, "UPDATE rooms": 1},
+            "sse_events": {},
+            "messages": [],
+        }
+
+        diffs = compare(expected, observed)
+
+        assert len(diffs) == 4
+        assert diffs[0].startswith("tool call 0 (narration): is_error")
+        assert "db_writes INSERT messages: expected 2, got 3" in diffs
+        assert "db_writes UPDATE rooms: expected 0, got 1" in diffs
+        assert diffs[3].startswith("turn 0 messages")
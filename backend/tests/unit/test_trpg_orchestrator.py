@@ -0,0 +1,178 @@
+"""
+Tests for TRPGOrchestrator turn isolation across concurrent worlds.
+
+Turn execution (tape building and SDK calls) is replaced with a fake that
+blocks on a per-world gate, so these tests check the orchestrator's own
+scheduling by ordering rather than by elapsed time: the per-room context
+registry and the global turn limit. Throughput is measured by
+``benchmarks.turn_throughput`` instead.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from domain.value_objects.contexts import TurnContext
+from orchestration.trpg_orchestrator import TRPGOrchestrator
+
+
+def _turn_args(world_id: int) -> dict:
+    room_id = 100 + world_id
+    world = SimpleNamespace(id=world_id, name=f"world_{world_id}", phase="active")
+    turn = TurnContext(
+        world_id=world_id,
+        world_name=world.name,
+        room_id=room_id,
+        location_id=None,
+        turn=1,
+        message_id=1,
+        agents=[Mock(id=1)],
+        npcs=[],
+    )
+    return {
+        "db": Mock(),
+        "room_id": room_id,
+        "action_text": "look around",
+        "agent_manager": Mock(),
+        "world": world,
+        "turn": turn,
+    }
+
+
+class _GatedTurns:
+    """Fake tape that holds each world's turn until its gate is opened."""
+
+    def __init__(self, orchestrator: TRPGOrchestrator, worlds: int):
+        self.orchestrator = orchestrator
+        self.gates = {world_id: asyncio.Event() for world_id in range(1, worlds + 1)}
+        self.started: list[int] = []
+        self.finished: list[int] = []
+        self.seen: dict[int, object] = {}
+        orchestrator._run_tape = self.run_tape
+
+    async def run_tape(self, db, room_id, action_text, agent_manager, world, turn, all_agents, orch_context):
+        self.started.append(world.id)
+        await self.gates[world.id].wait()
+        # A tool running now (e.g. travel's memory round) must see its own turn
+        self.seen[world.id] = self.orchestrator.get_turn_context(room_id=room_id)
+        self.finished.append(world.id)
+        return True
+
+    def run(self) -> asyncio.Future:
+        return asyncio.gather(
+            *(self.orchestrator.handle_player_action(**_turn_args(world_id)) for world_id in self.gates)
+        )
+
+
+async def _until(predicate) -> None:
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+class TestConcurrentWorlds:
+    """Tests for running turns of several worlds at once."""
+
+    @pytest.mark.unit
+    async def test_turn_context_is_scoped_per_room(self):
+        orchestrator = TRPGOrchestrator(max_concurrent_turns=4)
+        turns = _GatedTurns(orchestrator, 4)
+        results = turns.run()
+
+        # All four turns are in flight at once, each registered under its own room
+        await _until(lambda: len(turns.started) == 4)
+        assert {w: orchestrator.get_turn_context(room_id=100 + w).world_id for w in turns.gates} == {
+            1: 1,
+            2: 2,
+            3: 3,
+            4: 4,
+        }
+
+        # Finishing one world's turn leaves the others' contexts in place
+        turns.gates[2].set()
+        await _until(lambda: turns.finished == [2])
+        assert orchestrator.get_turn_context(room_id=102) is None
+        assert [orchestrator.get_turn_context(room_id=100 + w).world_id for w in (1, 3, 4)] == [1, 3, 4]
+
+        for gate in turns.gates.values():
+            gate.set()
+        assert all(await results)
+        assert {w: (ctx.world_id, ctx.room_id) for w, ctx in turns.seen.items()} == {
+            w: (w, 100 + w) for w in turns.gates
+        }
+        assert orchestrator.running_turn_count == 0
+        assert orchestrator.get_turn_context(room_id=101) is None
+
+    @pytest.mark.unit
+    async def test_get_turn_context_falls_back_to_world(self):
+        orchestrator = TRPGOrchestrator()
+        orch_context = SimpleNamespace(world_id=7, room_id=5)
+        orchestrator._turn_contexts[5] = orch_context
+
+        assert orchestrator.get_turn_context(room_id=99, world_id=7) is orch_context
+        assert orchestrator.get_turn_context(room_id=99, world_id=8) is None
+
+    @pytest.mark.unit
+    async def test_global_turn_limit(self):
+        orchestrator = TRPGOrchestrator(max_concurrent_turns=2)
+        turns = _GatedTurns(orchestrator, 4)
+        results = turns.run()
+
+        await _until(lambda: len(turns.started) == 2)
+        assert (turns.started, orchestrator.running_turn_count) == ([1, 2], 2)
+        assert orchestrator.get_turn_context(room_id=103) is None
+
+        # A finished turn hands its slot to the next waiting world, in arrival order
+        turns.gates[2].set()
+        await _until(lambda: len(turns.started) == 3)
+        assert (turns.started, orchestrator.running_turn_count) == ([1, 2, 3], 2)
+
+        turns.gates[1].set()
+        await _until(lambda: len(turns.started) == 4)
+        turns.gates[3].set()
+        turns.gates[4].set()
+
+        assert all(await results)
+        assert turns.finished == [2, 1, 3, 4]
+        assert orchestrator.running_turn_count == 0
+
+
+class TestNpcWarmup:
+    """Tests for NPC pre-connect running off the turn's critical path."""
+
+    @pytest.mark.unit
+    async def test_warmup_runs_in_background_and_is_cancelled_with_turn(self):
+        orchestrator = TRPGOrchestrator()
+        warmup_started = asyncio.Event()
+        warmup_cancelled = asyncio.Event()
+        tape_started_after_warmup = []
+
+        async def slow_pre_connect(npcs, room_id, world, agent_manager):
+            warmup_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                warmup_cancelled.set()
+                raise
+
+        async def execute_tape(executor, tape, orch_context, action_text):
+            await asyncio.sleep(0)
+            tape_started_after_warmup.append(warmup_started.is_set())
+            return SimpleNamespace(total_responses=1, total_skips=0)
+
+        orchestrator._pre_connect_npcs = slow_pre_connect
+        orchestrator._execute_tape = execute_tape
+
+        args = _turn_args(1)
+        npc = SimpleNamespace(id=2, name="Innkeeper", group="npcs", config_file=None)
+        args["turn"].agents = [SimpleNamespace(id=1, name="Action_Manager", group="gameplay"), npc]
+        args["turn"].npcs = [npc]
+
+        result = await asyncio.wait_for(orchestrator.handle_player_action(**args), timeout=2)
+        await asyncio.wait_for(warmup_cancelled.wait(), timeout=1)
+
+        assert result is True
+        assert tape_started_after_warmup == [True]
@@ -0,0 +1,118 @@
+"""
+Tests for speculative Action Manager preparation.
+
+World file loading and the SDK client are replaced with fakes; these tests
+cover the prepare/take lifecycle: validity key, TTL and single use.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from orchestration import turn_preparation
+from orchestration.turn_preparation import TurnPreparer, stats_version
+
+VERSION = stats_version({"hp": 10}, {"hour": 8, "minute": 0, "day": 1})
+
+
+class _FakeBuilder:
+    def __init__(self, world_name):
+        self.world_name = world_name
+
+    def build_action_manager_context(self):
+        return SimpleNamespace(world=self.world_name)
+
+    def build_action_manager_system_prompt_parts(self, context):
+        return "static", "dynamic"
+
+
+@pytest.fixture
+def fake_builder(monkeypatch):
+    monkeypatch.setattr(turn_preparation, "GameplayContextBuilder", _FakeBuilder)
+
+
+def _agents():
+    return [
+        SimpleNamespace(id=1, name="Action_Manager", config_file=None, group="gameplay"),
+        SimpleNamespace(id=2, name="Innkeeper", config_file=None, group="npcs"),
+    ]
+
+
+async def _prepare(preparer: TurnPreparer, agent_manager=None, turn: int = 5) -> str:
+    world = SimpleNamespace(id=1, name="test_world")
+    agent_manager = agent_manager or Mock(pre_connect=AsyncMock(return_value=True))
+    status = preparer.request(world, 10, turn, 3, VERSION, _agents(), agent_manager)
+    await asyncio.wait_for(preparer._tasks[1], timeout=2)
+    return status
+
+
+class TestTurnPreparer:
+    """Tests for TurnPreparer."""
+
+    @pytest.mark.unit
+    def test_stats_version_is_order_independent(self):
+        assert stats_version({"hp": 1, "mp": 2}, None) == stats_version({"mp": 2, "hp": 1}, {})
+        assert stats_version({"hp": 1}, None) != stats_version({"hp": 2}, None)
+
+    @pytest.mark.unit
+    async def test_prepared_turn_is_used_once(self, fake_builder):
+        preparer = TurnPreparer(ttl=30)
+        agent_manager = Mock(pre_connect=AsyncMock(return_value=True))
+
+        assert await _prepare(preparer, agent_manager) == "preparing"
+        agent_manager.pre_connect.assert_awaited_once()
+        assert agent_manager.pre_connect.call_args.kwargs["agent_id"] == 1
+
+        prepared = preparer.take(1, 5, 3, VERSION)
+        assert prepared is not None
+        assert prepared.client_ready
+        assert (prepared.static_section, prepared.dynamic_section) == ("static", "dynamic")
+        assert preparer.take(1, 5, 3, VERSION) is None
+        assert preparer.get_stats()["used"] == 1
+
+    @pytest.mark.unit
+    async def test_matching_request_reports_ready(self, fake_builder):
+        preparer = TurnPreparer(ttl=30)
+        await _prepare(preparer)
+
+        world = SimpleNamespace(id=1, name="test_world")
+        assert preparer.request(world, 10, 5, 3, VERSION, _agents(), Mock()) == "ready"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "turn,location_id,version",
+        [(6, 3, VERSION), (5, 4, VERSION), (5, 3, stats_version({"hp": 9}, None))],
+    )
+    async def test_stale_preparation_is_discarded(self, fake_builder, turn, location_id, version):
+        preparer = TurnPreparer(ttl=30)
+        await _prepare(preparer)
+
+        assert preparer.take(1, turn, location_id, version) is None
+        assert preparer.get_stats()["stale"] == 1
+        assert preparer.get_stats()["held"] == 0
+
+    @pytest.mark.unit
+    async def test_expired_preparation_is_discarded(self, fake_builder):
+        preparer = TurnPreparer(ttl=0)
+        await _prepare(preparer)
+
+        assert preparer.take(1, 5, 3, VERSION) is None
+        assert preparer.get_stats()["expired"] == 1
+
+    @pytest.mark.unit
+    async def test_room_without_action_manager_is_skipped(self):
+        preparer = TurnPreparer()
+        world = SimpleNamespace(id=1, name="test_world")
+
+        assert preparer.request(world, 10, 5, 3, VERSION, _agents()[1:], Mock()) == "skipped"
+
+    @pytest.mark.unit
+    async def test_failed_preparation_falls_back(self, fake_builder):
+        preparer = TurnPreparer()
+        agent_manager = Mock(pre_connect=AsyncMock(side_effect=RuntimeError("boom")))
+
+        await _prepare(preparer, agent_manager)
+
+        assert preparer.take(1, 5, 3, VERSION) is None
+        assert preparer.get_stats()["failed"] == 1
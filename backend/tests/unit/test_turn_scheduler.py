@@ -0,0 +1,126 @@
+"""
+Tests for the per-world turn scheduler.
+
+Covers FIFO ordering, backpressure when the queue is full, "latest wins"
+coalescing, slot release, and metrics.
+"""
+
+import asyncio
+
+import pytest
+from orchestration.turn_scheduler import TurnQueueFullError, TurnScheduler, TurnState
+
+
+async def _settle(scheduler: TurnScheduler, world_id: int) -> None:
+    """Wait until the world's worker has drained its queue."""
+    for _ in range(200):
+        if world_id not in scheduler._queues:
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("turn queue did not drain")
+
+
+class TestTurnScheduler:
+    """Tests for TurnScheduler."""
+
+    @pytest.mark.unit
+    async def test_turns_run_in_order_one_at_a_time(self):
+        scheduler = TurnScheduler(max_depth=5)
+        order, running = [], 0
+
+        def job(n):
+            async def run():
+                nonlocal running
+                running += 1
+                assert running == 1
+                await asyncio.sleep(0.01)
+                order.append(n)
+                running -= 1
+
+            return run
+
+        tickets = [scheduler.reserve(1) for _ in range(3)]
+        for n, ticket in reversed(list(enumerate(tickets))):
+            scheduler.submit(ticket, job(n))
+        await _settle(scheduler, 1)
+
+        assert order == [0, 1, 2]
+        assert [t.position for t in tickets] == [0, 1, 2]
+        assert all(t.state == TurnState.DONE for t in tickets)
+
+    @pytest.mark.unit
+    async def test_full_queue_rejects_with_position(self):
+        scheduler = TurnScheduler(max_depth=1)
+        gate = asyncio.Event()
+
+        first = scheduler.reserve(1)
+        scheduler.submit(first, gate.wait)
+        await asyncio.sleep(0)  # first turn starts running
+        scheduler.reserve(1)
+
+        with pytest.raises(TurnQueueFullError) as exc_info:
+            scheduler.reserve(1)
+        assert exc_info.value.position == 3
+        assert exc_info.value.depth == 1
+
+        # Other worlds are unaffected
+        scheduler.release(scheduler.reserve(2))
+        assert scheduler.get_metrics()["rejected"] == 1
+        gate.set()
+
+    @pytest.mark.unit
+    async def test_coalesce_supersedes_queued_turns(self):
+        scheduler = TurnScheduler(max_depth=1, coalesce=True)
+        gate = asyncio.Event()
+        ran = []
+
+        first = scheduler.reserve(1)
+        scheduler.submit(first, gate.wait)
+        await asyncio.sleep(0)
+
+        second = scheduler.reserve(1)
+        scheduler.submit(second, lambda: asyncio.sleep(0, ran.append("second")))
+        third = scheduler.reserve(1)
+        scheduler.submit(third, lambda: asyncio.sleep(0, ran.append("third")))
+
+        gate.set()
+        await _settle(scheduler, 1)
+
+        assert second.state == TurnState.COALESCED
+        assert ran == ["third"]
+        assert scheduler.get_metrics()["coalesced"] == 1
+
+    @pytest.mark.unit
+    async def test_release_frees_slot_and_unblocks_worker(self):
+        scheduler = TurnScheduler(max_depth=1)
+        ran = []
+
+        ticket = scheduler.reserve(1)
+        scheduler.release(ticket)
+        await _settle(scheduler, 1)
+        assert ticket.state == TurnState.RELEASED
+
+        scheduler.submit(scheduler.reserve(1), lambda: asyncio.sleep(0, ran.append(1)))
+        await _settle(scheduler, 1)
+        assert ran == [1]
+
+    @pytest.mark.unit
+    async def test_failed_turn_does_not_stop_queue(self):
+        scheduler = TurnScheduler(max_depth=2)
+        ran = []
+
+        async def boom():
+            raise RuntimeError("turn failed")
+
+        bad, good = scheduler.reserve(1), scheduler.reserve(1)
+        scheduler.submit(bad, boom)
+        scheduler.submit(good, lambda: asyncio.sleep(0, ran.append("good")))
+        await _settle(scheduler, 1)
+
+        assert bad.state == TurnState.FAILED
+        assert ran == ["good"]
+        metrics = scheduler.get_metrics()
+        assert metrics["failed"] == 1
+        assert metrics["completed"] == 1
+        assert metrics["queue_wait"]["count"] == 2
+        assert metrics["turn_run"]["count"] == 2
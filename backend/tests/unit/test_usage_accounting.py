@@ -0,0 +1,135 @@
+"""
+Unit tests for token usage accounting and its per-turn/daily rollups.
+"""
+
+from contextlib import asynccontextmanager
+
+import crud
+import pytest
+import schemas
+from crud.usage import cache_hit_ratio
+from services.usage_accounting import UsageRecorder, usage_turn
+
+
+def _usage(input_tokens=100, output_tokens=50, cache_read=0, cache_creation=0) -> dict:
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "cache_read_input_tokens": cache_read,
+        "cache_creation_input_tokens": cache_creation,
+    }
+
+
+@pytest.fixture
+def recorder(test_db, monkeypatch):
+    @asynccontextmanager
+    async def session():
+        yield test_db
+
+    monkeypatch.setattr("infrastructure.database.connection.background_session", session)
+    return UsageRecorder(enabled=True, flush_delay=60.0)
+
+
+def _record(recorder: UsageRecorder, world_id, agent_name: str, usage: dict, latency_ms=1000.0, cost_usd=0.01):
+    return recorder.record(
+        usage,
+        agent_name=agent_name,
+        room_id=1,
+        agent_id=None,
+        world_id=world_id,
+        latency_ms=latency_ms,
+        cost_usd=cost_usd,
+    )
+
+
+class TestUsageRecorder:
+    """Tests for buffering and writing usage rows."""
+
+    @pytest.mark.unit
+    def test_disabled_recorder_records_nothing(self):
+        recorder = UsageRecorder(enabled=False)
+
+        assert recorder.record(_usage(), agent_name="Narrator", room_id=1, agent_id=1, world_id=1, latency_ms=1) is None
+        assert recorder.get_stats()["recorded"] == 0
+
+    @pytest.mark.unit
+    async def test_rows_carry_the_turn_of_their_context(self):
+        recorder = UsageRecorder(enabled=True, flush_delay=60.0)
+
+        with usage_turn(7):
+            row = _record(recorder, 1, "Action_Manager", _usage(cache_read=300))
+        outside = _record(recorder, 1, "Action_Manager", _usage())
+
+        assert (row["turn"], outside["turn"]) == (7, None)
+        assert row["cache_read_tokens"] == 300
+        assert recorder.get_stats()["buffered"] == 2
+
+    @pytest.mark.unit
+    def test_cache_hit_ratio(self):
+        assert cache_hit_ratio(100, 300, 100) == 0.6
+        assert cache_hit_ratio(0, 0, 0) == 0.0
+
+
+@pytest.mark.unit
+@pytest.mark.db
+class TestUsageRollups:
+    """Tests for per-turn and daily rollups of written usage rows."""
+
+    async def test_turn_rollup_with_agent_breakdown(self, test_db, recorder):
+        world = await crud.create_world(test_db, schemas.WorldCreate(name="usage_world"), owner_id="admin")
+        with usage_turn(1):
+            _record(recorder, world.id, "Action_Manager", _usage(100, 40, cache_read=900), latency_ms=3000)
+            _record(recorder, world.id, "Narrator", _usage(100, 60), latency_ms=1000)
+        with usage_turn(2):
+            _record(recorder, world.id, "Action_Manager", _usage(50, 10, cache_read=950))
+
+        assert await recorder.flush() == 3
+        turns = await crud.get_turn_usage(test_db, world.id, limit=10)
+
+        assert [t["turn"] for t in turns] == [2, 1]
+        first = turns[1]
+        assert (first["responses"], first["input_tokens"], first["output_tokens"]) == (2, 200, 100)
+        assert first["cache_hit_ratio"] == round(900 / 1100, 3)
+        assert (first["avg_latency_ms"], first["max_latency_ms"]) == (2000.0, 3000)
+        assert first["cost_usd"] == pytest.approx(0.02)
+        assert [a["agent_name"] for a in first["agents"]] == ["Action_Manager", "Narrator"]
+        assert [t["turn"] for t in await crud.get_turn_usage(test_db, world.id, limit=1)] == [2]
+        schemas.TurnTokenUsage(**first)
+
+    async def test_reset_keeps_old_turns_out_of_the_turn_rollup(self, test_db, recorder):
+        world = await crud.create_world(test_db, schemas.WorldCreate(name="usage_world_reset"), owner_id="admin")
+        with usage_turn(1):
+            _record(recorder, world.id, "Action_Manager", _usage(100, 40))
+        await recorder.flush()
+
+        assert await crud.detach_turn_usage(test_db, world.id) == 1
+        with usage_turn(1):
+            _record(recorder, world.id, "Action_Manager", _usage(10, 5))
+        await recorder.flush()
+
+        [turn] = await crud.get_turn_usage(test_db, world.id)
+        assert (turn["turn"], turn["responses"], turn["input_tokens"]) == (1, 1, 10)
+        [day] = await crud.get_daily_usage(test_db, world.id)
+        assert (day["responses"], day["input_tokens"]) == (2, 110)
+
+    async def test_daily_rollup_per_world_and_agent(self, test_db, recorder):
+        world = await crud.create_world(test_db, schemas.WorldCreate(name="usage_world_a"), owner_id="admin")
+        other = await crud.create_world(test_db, schemas.WorldCreate(name="usage_world_b"), owner_id="admin")
+        _record(recorder, world.id, "Action_Manager", _usage(100, 10))
+        _record(recorder, other.id, "Narrator", _usage(200, 20))
+        _record(recorder, None, "Chat_Agent", _usage(300, 30))
+        await recorder.flush()
+
+        [today] = await crud.get_daily_usage(test_db, world.id, days=1)
+        assert (today["input_tokens"], today["output_tokens"]) == (100, 10)
+        assert [a["agent_name"] for a in today["agents"]] == ["Action_Manager"]
+        assert "worlds" not in today
+
+        [everywhere] = await crud.get_daily_usage(test_db, days=1)
+        assert everywhere["responses"] == 3
+        assert {w["world_id"]: w["input_tokens"] for w in everywhere["worlds"]} == {
+            world.id: 100,
+            other.id: 200,
+            None: 300,
+        }
+        schemas.DailyTokenUsage(**everywhere)
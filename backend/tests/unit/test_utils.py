@@ -3,6 +3,7 @@ Unit tests for utility functions (serializers, helpers, timezone).
 """
 
 from datetime import datetime, timezone
+from unittest.mock import Mock
 
 import pytest
 from i18n.serializers import serialize_bool, serialize_utc_datetime
@@ -239,3 +240,111 @@ Random stuff here.
         memory = get_memory_by_subtitle(memory_file, "DoesNotExist")
 
         assert memory is None
+
+
+def _encode_image(size, fmt, mode="RGB"):
+    """Build a base64-encoded test image."""
+    import base64
+    import io
+
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new(mode, size, color="red" if mode == "RGB" else None).save(buffer, format=fmt)
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+class TestImageCompression:
+    """Tests for image compression fast paths and the async wrapper."""
+
+    @pytest.mark.unit
+    def test_large_image_is_downscaled_to_webp(self):
+        from utils.images import compress_image
+
+        result = compress_image(_encode_image((3000, 1500), "PNG"), "image/png", max_dimension=1024)
+
+        assert result.media_type == "image/webp"
+        assert result.output_size == (1024, 512)
+        assert result.original_size == (3000, 1500)
+        assert result.skipped is None
+        assert result.method == 6  # 0.5 MP after downscaling
+
+    @pytest.mark.unit
+    def test_small_webp_and_jpeg_pass_through(self):
+        from utils.images import compress_image
+
+        for fmt, media_type in (("WEBP", "image/webp"), ("JPEG", "image/jpeg")):
+            data = _encode_image((200, 100), fmt)
+            result = compress_image(data, media_type)
+
+            assert result.skipped == "small"
+            assert result.data == data
+            assert result.media_type == media_type
+
+    @pytest.mark.unit
+    def test_small_png_is_still_converted(self):
+        from utils.images import compress_image
+
+        result = compress_image(_encode_image((200, 100), "PNG", mode="P"), "image/png")
+
+        assert result.media_type == "image/webp"
+        assert result.skipped is None
+
+    @pytest.mark.unit
+    def test_webp_method_scales_with_pixels(self):
+        from utils.images import webp_method_for
+
+        assert webp_method_for(800 * 600) == 6
+        assert webp_method_for(2048 * 1536) == 4
+        assert webp_method_for(4000 * 3000) == 2
+
+    @pytest.mark.unit
+    async def test_try_compress_image_off_loop(self, monkeypatch):
+        from utils import images
+
+        monkeypatch.setattr(images.ImageCompressionConfig, "WORKERS", 0)  # thread instead of processes
+
+        data, media_type = await images.try_compress_image(_encode_image((300, 300), "PNG"), "image/png")
+
+        assert media_type == "image/webp"
+        assert data
+
+    @pytest.mark.unit
+    async def test_try_compress_image_keeps_original_on_failure(self, monkeypatch):
+        from utils import images
+
+        monkeypatch.setattr(images.ImageCompressionConfig, "WORKERS", 0)
+
+        assert await images.try_compress_image("bm90IGFuIGltYWdl", "image/png") == ("bm90IGFuIGltYWdl", "image/png")
+        assert await images.try_compress_image(None, None) == (None, None)
+
+    @pytest.mark.unit
+    def test_pool_workers_are_spawned(self, monkeypatch):
+        from utils import images
+
+        created = Mock()
+        monkeypatch.setattr(images, "ProcessPoolExecutor", created)
+        monkeypatch.setattr(images, "_executor", None)
+        monkeypatch.setattr(images.ImageCompressionConfig, "WORKERS", 2)
+
+        assert images._get_executor() is created.return_value
+        assert created.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+
+    @pytest.mark.unit
+    async def test_broken_pool_is_shut_down_and_replaced(self, monkeypatch):
+        from concurrent.futures import Future
+        from concurrent.futures.process import BrokenProcessPool
+
+        from utils import images
+
+        broken = Future()
+        broken.set_exception(BrokenProcessPool("worker died"))
+        executor = Mock(submit=Mock(return_value=broken))
+        monkeypatch.setattr(images, "_executor", executor)
+        monkeypatch.setattr(images.ImageCompressionConfig, "WORKERS", 2)
+
+        result = await images._run_compression(_encode_image((100, 100), "PNG"), "image/png", 80)
+
+        assert result.media_type == "image/webp"  # Compressed in a thread instead
+        executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        assert images._executor is None
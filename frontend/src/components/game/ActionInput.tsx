@@ -11,6 +11,7 @@ import {
 import { useTranslation } from "react-i18next";
 import { useGame } from "../../contexts/GameContext";
 import { useToast } from "../../contexts/ToastContext";
+import * as gameService from "../../services/gameService";
 import { Button } from "../ui/button";
 import { LoadingDots } from "../shared/LoadingDots";
 import { cn } from "@/utils/cn";
@@ -35,6 +36,9 @@ const SLASH_COMMANDS: SlashCommand[] = [
   },
 ];
 
+// Min interval between turn preparation requests while typing
+const PREPARE_INTERVAL_MS = 5000;
+
 interface ActionInputProps {
   placeholder?: string;
   disabled?: boolean;
@@ -42,7 +46,8 @@ interface ActionInputProps {
 
 export function ActionInput({ placeholder, disabled }: ActionInputProps) {
   const { t } = useTranslation();
-  const { submitAction, messages, phase, isChatMode, isClauding } = useGame();
+  const { world, submitAction, messages, phase, isChatMode, isClauding } =
+    useGame();
   const { addToast } = useToast();
 
   // Combined disabled state: explicit prop OR agents are processing
@@ -54,6 +59,16 @@ export function ActionInput({ placeholder, disabled }: ActionInputProps) {
   const textareaRef = useRef<HTMLTextAreaElement>(null);
   const commandListRef = useRef<HTMLDivElement>(null);
   const fileInputRef = useRef<HTMLInputElement>(null);
+  const lastPrepareRef = useRef(0);
+
+  // Warm up the next turn on the backend while the player is typing
+  const requestPrepare = () => {
+    if (!world || isDisabled || phase !== "active" || isChatMode) return;
+    const now = Date.now();
+    if (now - lastPrepareRef.current < PREPARE_INTERVAL_MS) return;
+    lastPrepareRef.current = now;
+    void gameService.prepareAction(world.id);
+  };
 
   // Handle file selection
   const handleFileSelect = async (file: File) => {
@@ -415,7 +430,11 @@ export function ActionInput({ placeholder, disabled }: ActionInputProps) {
           <textarea
             ref={textareaRef}
             value={input}
-            onChange={(e) => setInput(e.target.value)}
+            onChange={(e) => {
+              setInput(e.target.value);
+              if (e.target.value.trim()) requestPrepare();
+            }}
+            onFocus={requestPrepare}
             onKeyDown={handleKeyDown}
             onPaste={handlePaste}
             placeholder={
@@ -181,11 +181,28 @@ export async function submitAction(
     const error = await response
       .json()
       .catch(() => ({ detail: "Failed to submit action" }));
-    throw new Error(error.detail || "Failed to submit action");
+    // 429 (turn queue full) carries { message, queue_position, queue_depth }
+    const detail =
+      typeof error.detail === "string" ? error.detail : error.detail?.message;
+    throw new Error(detail || "Failed to submit action");
   }
   return response.json();
 }
 
+/**
+ * Ask the backend to prepare the next turn while the player is typing.
+ * Best-effort: failures are ignored and the turn runs on the normal path.
+ */
+export async function prepareAction(worldId: number): Promise<void> {
+  try {
+    await fetch(`${API_BASE}/${worldId}/action/prepare`, {
+      ...getFetchOptions({ method: "POST" }),
+    });
+  } catch {
+    // Preparation is an optimization only
+  }
+}
+
 export async function getActionSuggestions(worldId: number): Promise<string[]> {
   try {
     const response = await fetch(